@@ -7,13 +7,20 @@ Simple approach to just list all memory records without semantic search
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, field_validator
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Iterable, TypeVar
+import asyncio
+import functools
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
 from bedrock_agentcore.memory import MemoryClient
 from dotenv import load_dotenv
 
+from event_index import EventIndex
+from response_cache import MemoryPage, ResponseCache
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -64,10 +71,138 @@ def clean_aws_error_message(error_message: str) -> str:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# MemoryClient is synchronous (boto3). Its calls run on this bounded pool so a
+# slow AWS call never blocks the event loop, and concurrent requests are capped
+# at SDK_MAX_WORKERS in-flight AWS calls.
+SDK_MAX_WORKERS = int(os.getenv("AGENTCORE_SDK_MAX_WORKERS", "16"))
+# Per-request fan-out limit for per-namespace lookups
+NAMESPACE_LOOKUP_CONCURRENCY = int(os.getenv("NAMESPACE_LOOKUP_CONCURRENCY", "8"))
+
+sdk_executor = ThreadPoolExecutor(
+    max_workers=SDK_MAX_WORKERS, thread_name_prefix="agentcore-sdk"
+)
+
+# Read-through cache for AgentCore pages, keyed by memory ID, actor/namespace,
+# session, page size and page token. A TTL of 0 disables it.
+MEMORY_CACHE_TTL_SECONDS = float(os.getenv("MEMORY_CACHE_TTL_SECONDS", "60"))
+MEMORY_CACHE_MAX_MB = int(os.getenv("MEMORY_CACHE_MAX_MB", "64"))
+response_cache = ResponseCache(
+    ttl_seconds=MEMORY_CACHE_TTL_SECONDS, max_bytes=MEMORY_CACHE_MAX_MB * 1024 * 1024
+)
+
+# Largest page AgentCore returns for ListEvents / ListMemoryRecords
+MAX_PAGE_SIZE = 100
+# Most records a RetrieveMemoryRecords search returns across all its pages
+SEARCH_TOP_K = 100
+
+# eventId -> (actor, session, timestamp) index used by searchEventById; an
+# empty EVENT_INDEX_PATH keeps it in memory only
+EVENT_INDEX_PATH = os.getenv("EVENT_INDEX_PATH", "event_index.jsonl")
+# Sessions scanned in parallel, and pages read per session, on an index miss
+EVENT_SCAN_CONCURRENCY = int(os.getenv("EVENT_SCAN_CONCURRENCY", "8"))
+EVENT_SCAN_MAX_PAGES = int(os.getenv("EVENT_SCAN_MAX_PAGES", "20"))
+event_index = EventIndex(EVENT_INDEX_PATH or None)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def call_sdk(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking MemoryClient call on the SDK executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        sdk_executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+async def map_concurrently(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int = NAMESPACE_LOOKUP_CONCURRENCY,
+) -> List[R]:
+    """Await func(item) for every item, at most `limit` at a time, keeping order."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(run(item) for item in items))
+
+
+def list_events_page(
+    memory_id: str,
+    actor_id: str,
+    session_id: str,
+    max_results: int,
+    next_token: Optional[str] = None,
+):
+    """One ListEvents page and its nextToken (MemoryClient.list_events hides it)."""
+    params = {
+        "memoryId": memory_id,
+        "actorId": actor_id,
+        "sessionId": session_id,
+        "maxResults": max_results,
+        "includePayloads": True,
+    }
+    if next_token:
+        params["nextToken"] = next_token
+    response = memory_client.gmdp_client.list_events(**params)
+    return response.get("events", []), response.get("nextToken")
+
+
+def get_event(memory_id: str, actor_id: str, session_id: str, event_id: str):
+    """Fetch one event directly once its actor and session are known."""
+    response = memory_client.gmdp_client.get_event(
+        memoryId=memory_id, actorId=actor_id, sessionId=session_id, eventId=event_id
+    )
+    return response.get("event")
+
+
+def retrieve_memory_records_page(
+    memory_id: str,
+    namespace: str,
+    search_query: str,
+    max_results: int,
+    next_token: Optional[str] = None,
+    top_k: int = SEARCH_TOP_K,
+):
+    """One RetrieveMemoryRecords page and its nextToken.
+
+    top_k bounds the whole search and must stay the same across the pages of
+    one search; max_results is the page size.
+    """
+    if "{" in namespace:
+        # Unresolved template namespace, as MemoryClient.retrieve_memories skips
+        logger.warning(f"Namespace '{namespace}' contains placeholders, skipping")
+        return [], None
+    params = {
+        "memoryId": memory_id,
+        "namespace": namespace,
+        "searchCriteria": {"searchQuery": search_query, "topK": top_k},
+        "maxResults": max_results,
+    }
+    if next_token:
+        params["nextToken"] = next_token
+    response = memory_client.gmdp_client.retrieve_memory_records(**params)
+    return response.get("memoryRecordSummaries", []), response.get("nextToken")
+
+
+def page_size(max_results: Optional[int], default: int = 20) -> int:
+    return max(1, min(max_results or default, MAX_PAGE_SIZE))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    sdk_executor.shutdown(wait=False, cancel_futures=True)
+
+
 app = FastAPI(
     title="AgentCore Memory Dashboard API - List Only",
     description="Simple backend to list all memory records",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS for React frontend
@@ -157,6 +292,10 @@ class MemoryQuery(BaseModel):
     namespace: Optional[str] = None
     max_results: Optional[int] = 50
     memory_id: Optional[str] = None
+    # Pagination cursor from a previous response's next_token
+    next_token: Optional[str] = None
+    # Bypass the cache and fetch from AgentCore again
+    refresh: bool = False
 
 
 @app.get("/health")
@@ -169,6 +308,8 @@ async def health_check():
         "region": AWS_REGION,
         "region_source": "auto-detected from AWS configuration",
         "requires_memory_id": MEMORY_ID is None,
+        "cache": response_cache.stats(),
+        "event_index": event_index.stats(),
         "timestamp": datetime.now().isoformat() + "Z",
     }
 
@@ -185,6 +326,10 @@ class ShortTermMemoryQuery(BaseModel):
     sort_order: Optional[str] = "desc"
     # Essential filters only
     content_search: Optional[str] = None
+    # Pagination cursor from a previous response's next_token
+    next_token: Optional[str] = None
+    # Bypass the cache and fetch from AgentCore again
+    refresh: bool = False
 
 
 class LongTermMemoryQuery(BaseModel):
@@ -194,6 +339,10 @@ class LongTermMemoryQuery(BaseModel):
     content_type: Optional[str] = "all"
     sort_by: Optional[str] = "timestamp"
     sort_order: Optional[str] = "desc"
+    # Pagination cursor from a previous response's next_token
+    next_token: Optional[str] = None
+    # Bypass the cache and fetch from AgentCore again
+    refresh: bool = False
 
     @field_validator("namespace")
     @classmethod
@@ -204,16 +353,24 @@ class LongTermMemoryQuery(BaseModel):
 
 
 def apply_short_term_filters(
-    memories: List[Dict[str, Any]], query: ShortTermMemoryQuery
+    memories: List[Dict[str, Any]],
+    query: ShortTermMemoryQuery,
+    search_text: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
-    """Apply client-side filters to short-term memory results"""
+    """Apply client-side filters to short-term memory results
+
+    search_text, when given, is each memory's content already lowercased
+    (see MemoryPage) so the content search doesn't redo it per request.
+    """
     filtered_memories = memories.copy()
 
     # Content search filtering
     if query.content_search and query.content_search.strip():
         search_term = query.content_search.strip().lower()
+        if search_text is None:
+            search_text = [m.get("content", "").lower() for m in memories]
         filtered_memories = [
-            m for m in filtered_memories if search_term in m.get("content", "").lower()
+            m for m, text in zip(memories, search_text) if search_term in text
         ]
 
     # Role filtering (existing)
@@ -264,212 +421,267 @@ async def get_short_term_memory(query: ShortTermMemoryQuery):
                 detail="Memory ID is required. Please provide memory_id in request or set AGENTCORE_MEMORY_ID environment variable.",
             )
 
-        short_term_memories = []
-
-        logger.info(
-            f"Fetching short-term memory for actor_id='{query.actor_id}', session_id='{query.session_id}'"
+        events_page_size = page_size(query.max_results)
+        cache_key = (
+            "short_term",
+            memory_id,
+            query.actor_id,
+            query.session_id,
+            events_page_size,
+            query.next_token,
         )
-        logger.info(f"📋 Memory ID: {memory_id}")
-        logger.info(f"📋 Max results: {query.max_results}")
 
-        # Method 1: Try ListEvents API
-        try:
-            logger.info("📞 Using ListEvents API")
-            events = memory_client.list_events(
-                memory_id=memory_id,
-                actor_id=query.actor_id,
-                session_id=query.session_id,
-                max_results=query.max_results,
+        async def load_page() -> MemoryPage:
+            short_term_memories = []
+
+            logger.info(
+                f"Fetching short-term memory for actor_id='{query.actor_id}', session_id='{query.session_id}'"
             )
+            logger.info(f"📋 Memory ID: {memory_id}")
+            logger.info(f"📋 Max results: {query.max_results}")
+
+            # ListEvents and get_last_k_turns are independent; issue them together
+            logger.info("📞 Using ListEvents and get_last_k_turns APIs")
+            fetches = [
+                call_sdk(
+                    list_events_page,
+                    memory_id=memory_id,
+                    actor_id=query.actor_id,
+                    session_id=query.session_id,
+                    max_results=events_page_size,
+                    next_token=query.next_token,
+                )
+            ]
+            if not query.next_token:
+                # The most recent turns only accompany the first page
+                fetches.append(
+                    call_sdk(
+                        memory_client.get_last_k_turns,
+                        memory_id=memory_id,
+                        actor_id=query.actor_id,
+                        session_id=query.session_id,
+                        k=query.max_results or 10,
+                    )
+                )
+            results = await asyncio.gather(*fetches, return_exceptions=True)
+            events_result = results[0]
+            turns_result = results[1] if len(results) > 1 else []
+            next_token = None
 
-            if events:
-                logger.info(f"✅ Found {len(events)} events")
-
-                for event_idx, event in enumerate(events):
-                    payload = event.get("payload", {})
-                    content_text = ""
-
-                    # Handle the actual payload structure from MemoryClient.list_events
-                    if isinstance(payload, list) and len(payload) > 0:
-                        # Payload is a list, get first item
-                        first_item = payload[0]
-                        if isinstance(first_item, dict):
-                            # Look for conversational content
-                            if "conversational" in first_item:
-                                conversational = first_item["conversational"]
-                                if isinstance(conversational, dict):
-                                    content = conversational.get("content", {})
-                                    if isinstance(content, dict) and "text" in content:
-                                        content_text = content["text"]
+            # Method 1: ListEvents API
+            try:
+                if isinstance(events_result, Exception):
+                    raise events_result
+                events, next_token = events_result
+                event_index.record_events(
+                    memory_id, query.actor_id, query.session_id, events
+                )
+
+                if events:
+                    logger.info(f"✅ Found {len(events)} events")
+
+                    for event_idx, event in enumerate(events):
+                        payload = event.get("payload", {})
+                        content_text = ""
+
+                        # Handle the actual payload structure from MemoryClient.list_events
+                        if isinstance(payload, list) and len(payload) > 0:
+                            # Payload is a list, get first item
+                            first_item = payload[0]
+                            if isinstance(first_item, dict):
+                                # Look for conversational content
+                                if "conversational" in first_item:
+                                    conversational = first_item["conversational"]
+                                    if isinstance(conversational, dict):
+                                        content = conversational.get("content", {})
+                                        if (
+                                            isinstance(content, dict)
+                                            and "text" in content
+                                        ):
+                                            content_text = content["text"]
+                                        else:
+                                            content_text = str(conversational)
+                                else:
+                                    # Fallback to any content field
+                                    if "content" in first_item:
+                                        content = first_item["content"]
+                                        if (
+                                            isinstance(content, dict)
+                                            and "text" in content
+                                        ):
+                                            content_text = content["text"]
+                                        else:
+                                            content_text = str(content)
                                     else:
-                                        content_text = str(conversational)
+                                        content_text = str(first_item)
                             else:
-                                # Fallback to any content field
-                                if "content" in first_item:
-                                    content = first_item["content"]
-                                    if isinstance(content, dict) and "text" in content:
-                                        content_text = content["text"]
-                                    else:
-                                        content_text = str(content)
+                                content_text = str(first_item)
+                        elif isinstance(payload, dict):
+                            # Handle dict payload
+                            if "content" in payload:
+                                content = payload["content"]
+                                if isinstance(content, dict) and "text" in content:
+                                    content_text = content["text"]
                                 else:
-                                    content_text = str(first_item)
-                        else:
-                            content_text = str(first_item)
-                    elif isinstance(payload, dict):
-                        # Handle dict payload
-                        if "content" in payload:
-                            content = payload["content"]
-                            if isinstance(content, dict) and "text" in content:
-                                content_text = content["text"]
+                                    content_text = str(content)
+                            elif "message" in payload:
+                                content_text = str(payload["message"])
                             else:
-                                content_text = str(content)
-                        elif "message" in payload:
-                            content_text = str(payload["message"])
+                                content_text = str(payload)
                         else:
                             content_text = str(payload)
-                    else:
-                        content_text = str(payload)
-
-                    memory_entry = {
-                        "id": f"event-{event_idx}",
-                        "content": content_text,
-                        "type": "event",
-                        "memory_type": "SHORT_TERM",
-                        "actor_id": query.actor_id,
-                        "session_id": query.session_id,
-                        "event_id": event.get("eventId", f"event-{event_idx}"),
-                        "event_type": event.get("eventType", "unknown"),
-                        "timestamp": str(
-                            event.get(
-                                "eventTimestamp", datetime.now().isoformat() + "Z"
-                            )
-                        ),
-                        "size": len(content_text),
-                    }
-                    short_term_memories.append(memory_entry)
-
-        except Exception as e:
-            error_msg = str(e).lower()
-            logger.warning(
-                f"ListEvents failed for {query.actor_id}/{query.session_id}: {e}"
-            )
-            logger.warning(f"ListEvents error type: {type(e).__name__}")
-
-            # Clean the error message to remove ARNs and sensitive info
-            clean_error = clean_aws_error_message(str(e))
-
-            # Check for specific Memory ID not found errors
-            if any(
-                keyword in error_msg
-                for keyword in [
-                    "not found",
-                    "does not exist",
-                    "invalid memory",
-                    "memory id",
-                    "resourcenotfoundexception",
-                ]
-            ):
-                logger.error(f"❌ Memory ID '{memory_id}' not found or inaccessible")
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Memory ID '{memory_id}' not found. Please verify the Memory ID exists and you have access permissions.",
-                )
-            elif any(
-                keyword in error_msg
-                for keyword in [
-                    "access denied",
-                    "unauthorized",
-                    "permission",
-                    "accessdeniedexception",
-                ]
-            ):
-                logger.error(f"❌ Access denied for Memory ID '{memory_id}'")
-                raise HTTPException(status_code=403, detail=clean_error)
-
-        # Method 2: Try get_last_k_turns
-        try:
-            logger.info("🔄 Using get_last_k_turns API")
-            recent_turns = memory_client.get_last_k_turns(
-                memory_id=memory_id,
-                actor_id=query.actor_id,
-                session_id=query.session_id,
-                k=query.max_results or 10,
-            )
-
-            if recent_turns:
-                logger.info(f"✅ Found {len(recent_turns)} conversation turns")
-
-                for turn_idx, turn in enumerate(recent_turns):
-                    for message_idx, message in enumerate(turn):
-                        content = message.get("content", {})
-                        if isinstance(content, dict):
-                            content_text = content.get("text", str(content))
-                        else:
-                            content_text = str(content)
 
                         memory_entry = {
-                            "id": f"turn-{turn_idx}-{message_idx}",
+                            "id": event.get("eventId", f"event-{event_idx}"),
                             "content": content_text,
-                            "type": "conversation",
+                            "type": "event",
                             "memory_type": "SHORT_TERM",
                             "actor_id": query.actor_id,
                             "session_id": query.session_id,
-                            "role": message.get("role", "unknown"),
-                            "turn_index": turn_idx,
-                            "message_index": message_idx,
-                            "timestamp": datetime.now().isoformat() + "Z",
+                            "event_id": event.get("eventId", f"event-{event_idx}"),
+                            "event_type": event.get("eventType", "unknown"),
+                            "timestamp": str(
+                                event.get(
+                                    "eventTimestamp", datetime.now().isoformat() + "Z"
+                                )
+                            ),
                             "size": len(content_text),
                         }
                         short_term_memories.append(memory_entry)
 
-        except Exception as e:
-            error_msg = str(e).lower()
-            logger.warning(
-                f"get_last_k_turns failed for {query.actor_id}/{query.session_id}: {e}"
-            )
-            logger.warning(f"get_last_k_turns error type: {type(e).__name__}")
+            except Exception as e:
+                error_msg = str(e).lower()
+                logger.warning(
+                    f"ListEvents failed for {query.actor_id}/{query.session_id}: {e}"
+                )
+                logger.warning(f"ListEvents error type: {type(e).__name__}")
 
-            # Clean the error message to remove ARNs and sensitive info
-            clean_error = clean_aws_error_message(str(e))
+                # Clean the error message to remove ARNs and sensitive info
+                clean_error = clean_aws_error_message(str(e))
 
-            # Check for specific Memory ID not found errors
-            if any(
-                keyword in error_msg
-                for keyword in [
-                    "not found",
-                    "does not exist",
-                    "invalid memory",
-                    "memory id",
-                    "resourcenotfoundexception",
-                ]
-            ):
-                logger.error(f"❌ Memory ID '{memory_id}' not found or inaccessible")
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Memory ID '{memory_id}' not found. Please verify the Memory ID exists and you have access permissions.",
+                # Check for specific Memory ID not found errors
+                if any(
+                    keyword in error_msg
+                    for keyword in [
+                        "not found",
+                        "does not exist",
+                        "invalid memory",
+                        "memory id",
+                        "resourcenotfoundexception",
+                    ]
+                ):
+                    logger.error(
+                        f"❌ Memory ID '{memory_id}' not found or inaccessible"
+                    )
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Memory ID '{memory_id}' not found. Please verify the Memory ID exists and you have access permissions.",
+                    )
+                elif any(
+                    keyword in error_msg
+                    for keyword in [
+                        "access denied",
+                        "unauthorized",
+                        "permission",
+                        "accessdeniedexception",
+                    ]
+                ):
+                    logger.error(f"❌ Access denied for Memory ID '{memory_id}'")
+                    raise HTTPException(status_code=403, detail=clean_error)
+
+            # Method 2: get_last_k_turns
+            try:
+                if isinstance(turns_result, Exception):
+                    raise turns_result
+                recent_turns = turns_result
+
+                if recent_turns:
+                    logger.info(f"✅ Found {len(recent_turns)} conversation turns")
+
+                    for turn_idx, turn in enumerate(recent_turns):
+                        for message_idx, message in enumerate(turn):
+                            content = message.get("content", {})
+                            if isinstance(content, dict):
+                                content_text = content.get("text", str(content))
+                            else:
+                                content_text = str(content)
+
+                            memory_entry = {
+                                "id": f"turn-{turn_idx}-{message_idx}",
+                                "content": content_text,
+                                "type": "conversation",
+                                "memory_type": "SHORT_TERM",
+                                "actor_id": query.actor_id,
+                                "session_id": query.session_id,
+                                "role": message.get("role", "unknown"),
+                                "turn_index": turn_idx,
+                                "message_index": message_idx,
+                                "timestamp": datetime.now().isoformat() + "Z",
+                                "size": len(content_text),
+                            }
+                            short_term_memories.append(memory_entry)
+
+            except Exception as e:
+                error_msg = str(e).lower()
+                logger.warning(
+                    f"get_last_k_turns failed for {query.actor_id}/{query.session_id}: {e}"
                 )
-            elif any(
-                keyword in error_msg
-                for keyword in [
-                    "access denied",
-                    "unauthorized",
-                    "permission",
-                    "accessdeniedexception",
-                ]
-            ):
-                logger.error(f"❌ Access denied for Memory ID '{memory_id}'")
-                raise HTTPException(status_code=403, detail=clean_error)
+                logger.warning(f"get_last_k_turns error type: {type(e).__name__}")
+
+                # Clean the error message to remove ARNs and sensitive info
+                clean_error = clean_aws_error_message(str(e))
+
+                # Check for specific Memory ID not found errors
+                if any(
+                    keyword in error_msg
+                    for keyword in [
+                        "not found",
+                        "does not exist",
+                        "invalid memory",
+                        "memory id",
+                        "resourcenotfoundexception",
+                    ]
+                ):
+                    logger.error(
+                        f"❌ Memory ID '{memory_id}' not found or inaccessible"
+                    )
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Memory ID '{memory_id}' not found. Please verify the Memory ID exists and you have access permissions.",
+                    )
+                elif any(
+                    keyword in error_msg
+                    for keyword in [
+                        "access denied",
+                        "unauthorized",
+                        "permission",
+                        "accessdeniedexception",
+                    ]
+                ):
+                    logger.error(f"❌ Access denied for Memory ID '{memory_id}'")
+                    raise HTTPException(status_code=403, detail=clean_error)
+
+            return MemoryPage(short_term_memories, next_token=next_token)
+
+        page, cached = await response_cache.get_or_load(
+            cache_key, load_page, refresh=query.refresh
+        )
+        short_term_memories = page.memories
 
         logger.info(f"✅ Total short-term memories found: {len(short_term_memories)}")
 
         # Apply filters
-        filtered_memories = apply_short_term_filters(short_term_memories, query)
+        filtered_memories = apply_short_term_filters(
+            short_term_memories, query, page.search_text
+        )
         logger.info(f"🔍 After filtering: {len(filtered_memories)} memories remain")
 
         return {
             "memories": filtered_memories,
             "total_count": len(filtered_memories),
             "raw_count": len(short_term_memories),
+            "next_token": page.next_token,
+            "cached": cached,
             "source": "short_term_memory",
             "actor_id": query.actor_id,
             "session_id": query.session_id,
@@ -503,6 +715,42 @@ class EventSearchQuery(BaseModel):
     # Search parameters to find the event
     search_all_sessions: bool = False
     known_actor_ids: Optional[List[str]] = None
+    known_session_ids: Optional[List[str]] = None
+
+
+def event_search_result(
+    memory_id: str,
+    event_id: str,
+    event: Dict[str, Any],
+    actor_id: str,
+    session_id: str,
+    source: str,
+) -> Dict[str, Any]:
+    payload = event.get("payload", {})
+    content_text = str(payload)  # Simplified for now
+
+    event_data = {
+        "id": event_id,
+        "content": content_text,
+        "type": "event",
+        "memory_type": "SHORT_TERM",
+        "event_id": event.get("eventId", event_id),
+        "event_type": event.get("eventType", "unknown"),
+        "actor_id": actor_id,
+        "session_id": session_id,
+        "timestamp": str(event.get("eventTimestamp", datetime.now().isoformat() + "Z")),
+        "size": len(content_text),
+        "found_in": f"{actor_id}/{session_id}",
+    }
+
+    return {
+        "event": event_data,
+        "found": True,
+        "memory_id": memory_id,
+        "event_id": event_id,
+        "search_location": f"{actor_id}/{session_id}",
+        "source": source,
+    }
 
 
 @app.post("/api/agentcore/searchEventById")
@@ -519,74 +767,103 @@ async def search_event_by_id(query: EventSearchQuery):
         logger.info(f"🔍 Searching for event ID: {query.event_id}")
         logger.info(f"📋 Memory ID: {memory_id}")
 
-        # Common actor IDs to try (only if provided by user)
+        # Indexed events are fetched directly, without scanning sessions
+        indexed = event_index.lookup(memory_id, query.event_id)
+        if indexed:
+            try:
+                event = await call_sdk(
+                    get_event,
+                    memory_id,
+                    indexed.actor_id,
+                    indexed.session_id,
+                    query.event_id,
+                )
+                if event:
+                    logger.info(
+                        f"✅ Found event {query.event_id} via index in {indexed.actor_id}/{indexed.session_id}"
+                    )
+                    return event_search_result(
+                        memory_id,
+                        query.event_id,
+                        event,
+                        indexed.actor_id,
+                        indexed.session_id,
+                        source="index",
+                    )
+            except Exception as e:
+                if "resourcenotfound" not in str(e).lower():
+                    raise
+            logger.info(f"📇 Indexed event {query.event_id} no longer exists")
+            event_index.forget(memory_id, query.event_id)
+
+        # Index miss: scan candidate sessions, indexing every page read
         actor_ids_to_try = query.known_actor_ids or []
+        session_ids_to_try = query.known_session_ids or []
+        candidates = [
+            (actor_id, session_id)
+            for actor_id in actor_ids_to_try
+            for session_id in session_ids_to_try
+        ]
+        for actor_id, session_id in event_index.sessions(memory_id):
+            if query.search_all_sessions or actor_id in actor_ids_to_try:
+                candidates.append((actor_id, session_id))
+        candidates = list(dict.fromkeys(candidates))
 
-        # Session IDs must be provided by user - no hardcoded defaults
-        session_ids_to_try = []
+        found = asyncio.Event()
 
-        for actor_id in actor_ids_to_try:
-            for session_id in session_ids_to_try:
-                try:
+        async def scan_session(candidate):
+            actor_id, session_id = candidate
+            next_token = None
+            try:
+                for _ in range(EVENT_SCAN_MAX_PAGES):
+                    if found.is_set():
+                        return None
                     logger.info(
                         f"🔍 Searching in actor_id={actor_id}, session_id={session_id}"
                     )
-
-                    events = memory_client.list_events(
-                        memory_id=memory_id,
-                        actor_id=actor_id,
-                        session_id=session_id,
-                        max_results=100,  # Search more events
+                    events, next_token = await call_sdk(
+                        list_events_page,
+                        memory_id,
+                        actor_id,
+                        session_id,
+                        MAX_PAGE_SIZE,
+                        next_token,
                     )
-
-                    # Look for the specific event ID
+                    event_index.record_events(memory_id, actor_id, session_id, events)
                     for event in events:
                         if event.get("eventId") == query.event_id:
-                            logger.info(
-                                f"✅ Found event {query.event_id} in {actor_id}/{session_id}"
-                            )
-
-                            # Process the event (same logic as before)
-                            payload = event.get("payload", {})
-                            content_text = str(payload)  # Simplified for now
-
-                            event_data = {
-                                "id": query.event_id,
-                                "content": content_text,
-                                "type": "event",
-                                "memory_type": "SHORT_TERM",
-                                "event_id": event.get("eventId", query.event_id),
-                                "event_type": event.get("eventType", "unknown"),
-                                "actor_id": actor_id,
-                                "session_id": session_id,
-                                "timestamp": str(
-                                    event.get(
-                                        "eventTimestamp",
-                                        datetime.now().isoformat() + "Z",
-                                    )
-                                ),
-                                "size": len(content_text),
-                                "found_in": f"{actor_id}/{session_id}",
-                            }
-
-                            return {
-                                "event": event_data,
-                                "found": True,
-                                "memory_id": memory_id,
-                                "event_id": query.event_id,
-                                "search_location": f"{actor_id}/{session_id}",
-                            }
+                            found.set()
+                            return actor_id, session_id, event
+                    if not next_token:
+                        return None
+            except Exception as e:
+                logger.warning(f"Search failed for {actor_id}/{session_id}: {e}")
+            return None
 
-                except Exception as e:
-                    logger.warning(f"Search failed for {actor_id}/{session_id}: {e}")
-                    continue
+        matches = await map_concurrently(
+            scan_session, candidates, limit=EVENT_SCAN_CONCURRENCY
+        )
+        for match in matches:
+            if match:
+                actor_id, session_id, event = match
+                logger.info(
+                    f"✅ Found event {query.event_id} in {actor_id}/{session_id}"
+                )
+                return event_search_result(
+                    memory_id,
+                    query.event_id,
+                    event,
+                    actor_id,
+                    session_id,
+                    source="scan",
+                )
 
         return {
             "event": None,
             "found": False,
             "event_id": query.event_id,
             "error": f"Event {query.event_id} not found in searched sessions",
-            "searched_combinations": len(actor_ids_to_try) * len(session_ids_to_try),
+            "searched_combinations": len(candidates),
         }
 
     except Exception as e:
@@ -615,8 +892,8 @@ async def get_event_by_id(query: EventQuery):
         try:
             # Note: This assumes there's a get_event method in the memory client
             # You may need to check the actual AgentCore Memory client API
-            event = memory_client.get_event(
-                memory_id=memory_id, event_id=query.event_id
+            event = await call_sdk(
+                memory_client.get_event, memory_id=memory_id, event_id=query.event_id
             )
 
             if event:
@@ -744,7 +1021,7 @@ async def list_namespaces_old(query: MemoryQuery):
 
         # Get memory strategies to discover namespaces
         try:
-            strategies = memory_client.get_memory_strategies(memory_id)
+            strategies = await call_sdk(memory_client.get_memory_strategies, memory_id)
             logger.info(f"✅ Found {len(strategies)} memory strategies")
 
             namespaces = []
@@ -818,6 +1095,22 @@ async def list_namespaces_old(query: MemoryQuery):
         )
 
 
+def matches_content_type(
+    memory: Dict[str, Any], search_text: str, content_type: Optional[str]
+) -> bool:
+    """Long-term content type filter; search_text is the lowercased content."""
+    namespace_str = memory.get("namespace") or ""
+    if content_type == "facts":
+        return "facts" in namespace_str
+    if content_type == "preferences":
+        return "preferences" in namespace_str
+    if content_type == "summaries":
+        return any(word in search_text for word in ["summary", "topic", "conversation"])
+    if content_type == "context":
+        return "context" in namespace_str
+    return True
+
+
 @app.post("/api/agentcore/getLongTermMemory")
 async def get_long_term_memory(query: LongTermMemoryQuery):
     """Get long-term memory (facts, preferences, summaries) from AgentCore Memory"""
@@ -836,145 +1129,142 @@ async def get_long_term_memory(query: LongTermMemoryQuery):
                 detail="Memory ID is required. Please provide memory_id in request or set AGENTCORE_MEMORY_ID environment variable.",
             )
 
-        long_term_memories = []
-
-        logger.info(
-            f"Fetching long-term memory with namespace='{query.namespace}', max_results={query.max_results}"
-        )
-        logger.info(f"📋 Memory ID: {memory_id}")
-        logger.info(
-            f"📋 Filters: content_type={query.content_type}, sort_by={query.sort_by}, sort_order={query.sort_order}"
+        records_page_size = page_size(query.max_results)
+        cache_key = (
+            "long_term",
+            memory_id,
+            query.namespace,
+            records_page_size,
+            query.next_token,
         )
 
-        # Use retrieve_memories to get long-term memory directly from AgentCore
-        try:
-            logger.info("📚 Using retrieve_memories API")
-
-            # Use retrieve_memories for semantic search
-            memory_results = memory_client.retrieve_memories(
-                memory_id=memory_id,
-                namespace=query.namespace,
-                query="*",  # Get all content - could be made configurable
-                top_k=query.max_results,
+        async def load_page() -> MemoryPage:
+            long_term_memories = []
+
+            logger.info(
+                f"Fetching long-term memory with namespace='{query.namespace}', max_results={query.max_results}"
+            )
+            logger.info(f"📋 Memory ID: {memory_id}")
+            logger.info(
+                f"📋 Filters: content_type={query.content_type}, sort_by={query.sort_by}, sort_order={query.sort_order}"
             )
 
-            if (
-                isinstance(memory_results, dict)
-                and "memoryRecordSummaries" in memory_results
-            ):
-                memory_records = memory_results["memoryRecordSummaries"]
-            else:
-                memory_records = (
-                    memory_results if isinstance(memory_results, list) else []
+            # Use retrieve_memories to get long-term memory directly from AgentCore
+            next_token = None
+            try:
+                logger.info("📚 Using retrieve_memories API")
+
+                # Use retrieve_memories for semantic search
+                memory_records, next_token = await call_sdk(
+                    retrieve_memory_records_page,
+                    memory_id=memory_id,
+                    namespace=query.namespace,
+                    search_query="*",  # Get all content - could be made configurable
+                    max_results=records_page_size,
+                    next_token=query.next_token,
                 )
 
-            if memory_records:
-                logger.info(f"✅ Found {len(memory_records)} memory records")
+                if memory_records:
+                    logger.info(f"✅ Found {len(memory_records)} memory records")
 
-                for memory_idx, memory in enumerate(memory_records):
-                    # Debug: log the raw memory structure
-                    logger.info(f"📋 Raw memory record {memory_idx}: {memory}")
+                    for memory_idx, memory in enumerate(memory_records):
+                        # Debug: log the raw memory structure
+                        logger.info(f"📋 Raw memory record {memory_idx}: {memory}")
 
-                    content = memory.get("content", {})
-                    if isinstance(content, dict):
-                        content_text = content.get("text", str(content))
-                    else:
-                        content_text = str(content)
+                        content = memory.get("content", {})
+                        if isinstance(content, dict):
+                            content_text = content.get("text", str(content))
+                        else:
+                            content_text = str(content)
 
-                    # Apply content type filter
-                    memory_namespaces = memory.get("namespaces", [])
-                    namespace_str = (
-                        memory_namespaces[0] if memory_namespaces else query.namespace
-                    )
+                        memory_namespaces = memory.get("namespaces", [])
+                        namespace_str = (
+                            memory_namespaces[0]
+                            if memory_namespaces
+                            else query.namespace
+                        )
 
-                    if query.content_type != "all":
-                        if (
-                            query.content_type == "facts"
-                            and "facts" not in namespace_str
-                        ):
-                            continue
-                        elif (
-                            query.content_type == "preferences"
-                            and "preferences" not in namespace_str
-                        ):
-                            continue
-                        elif query.content_type == "summaries" and not any(
-                            word in content_text.lower()
-                            for word in ["summary", "topic", "conversation"]
-                        ):
-                            continue
-                        elif (
-                            query.content_type == "context"
-                            and "context" not in namespace_str
-                        ):
-                            continue
+                        memory_entry = {
+                            "id": memory.get("memoryRecordId", f"memory-{memory_idx}"),
+                            "content": content_text,
+                            "type": "record",
+                            "memory_type": "LONG_TERM",
+                            "namespace": namespace_str,
+                            "strategyId": memory.get("memoryStrategyId", ""),
+                            "score": memory.get("score", 0),
+                            "timestamp": str(
+                                memory.get(
+                                    "createdAt", datetime.now().isoformat() + "Z"
+                                )
+                            ),
+                            "size": len(content_text),
+                        }
+                        long_term_memories.append(memory_entry)
+                else:
+                    logger.info("❌ No memory records found")
 
-                    memory_entry = {
-                        "id": memory.get("memoryRecordId", f"memory-{memory_idx}"),
-                        "content": content_text,
-                        "type": "record",
-                        "memory_type": "LONG_TERM",
-                        "namespace": namespace_str,
-                        "strategyId": memory.get("memoryStrategyId", ""),
-                        "score": memory.get("score", 0),
-                        "timestamp": str(
-                            memory.get("createdAt", datetime.now().isoformat() + "Z")
-                        ),
-                        "size": len(content_text),
-                    }
-                    long_term_memories.append(memory_entry)
-            else:
-                logger.info("❌ No memory records found")
+            except Exception as e:
+                error_msg = str(e).lower()
+                logger.error(f"retrieve_memories failed: {e}")
 
-        except Exception as e:
-            error_msg = str(e).lower()
-            logger.error(f"retrieve_memories failed: {e}")
+                # Clean the error message to remove ARNs and sensitive info
+                clean_error = clean_aws_error_message(str(e))
 
-            # Clean the error message to remove ARNs and sensitive info
-            clean_error = clean_aws_error_message(str(e))
+                # Check for specific Memory ID not found errors
+                if any(
+                    keyword in error_msg
+                    for keyword in [
+                        "not found",
+                        "does not exist",
+                        "invalid memory",
+                        "memory id",
+                        "resourcenotfoundexception",
+                    ]
+                ):
+                    logger.error(
+                        f"❌ Memory ID '{memory_id}' not found or inaccessible"
+                    )
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Memory ID '{memory_id}' not found. Please verify the Memory ID exists and you have access permissions.",
+                    )
+                elif any(
+                    keyword in error_msg
+                    for keyword in [
+                        "access denied",
+                        "unauthorized",
+                        "permission",
+                        "accessdeniedexception",
+                    ]
+                ):
+                    logger.error(f"❌ Access denied for Memory ID '{memory_id}'")
+                    raise HTTPException(status_code=403, detail=clean_error)
+                elif "namespace" in error_msg and (
+                    "not found" in error_msg or "invalid" in error_msg
+                ):
+                    logger.error(
+                        f"❌ Namespace '{query.namespace}' not found in Memory ID '{memory_id}'"
+                    )
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Namespace '{query.namespace}' not found in Memory ID '{memory_id}'. Please verify the namespace exists.",
+                    )
+                else:
+                    raise HTTPException(
+                        status_code=500,
+                        detail=f"Failed to retrieve memories from AgentCore: {clean_error}",
+                    )
 
-            # Check for specific Memory ID not found errors
-            if any(
-                keyword in error_msg
-                for keyword in [
-                    "not found",
-                    "does not exist",
-                    "invalid memory",
-                    "memory id",
-                    "resourcenotfoundexception",
-                ]
-            ):
-                logger.error(f"❌ Memory ID '{memory_id}' not found or inaccessible")
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Memory ID '{memory_id}' not found. Please verify the Memory ID exists and you have access permissions.",
-                )
-            elif any(
-                keyword in error_msg
-                for keyword in [
-                    "access denied",
-                    "unauthorized",
-                    "permission",
-                    "accessdeniedexception",
-                ]
-            ):
-                logger.error(f"❌ Access denied for Memory ID '{memory_id}'")
-                raise HTTPException(status_code=403, detail=clean_error)
-            elif "namespace" in error_msg and (
-                "not found" in error_msg or "invalid" in error_msg
-            ):
-                logger.error(
-                    f"❌ Namespace '{query.namespace}' not found in Memory ID '{memory_id}'"
-                )
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Namespace '{query.namespace}' not found in Memory ID '{memory_id}'. Please verify the namespace exists.",
-                )
-            else:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Failed to retrieve memories from AgentCore: {clean_error}",
-                )
+            return MemoryPage(long_term_memories, next_token=next_token)
+
+        page, cached = await response_cache.get_or_load(
+            cache_key, load_page, refresh=query.refresh
+        )
+        long_term_memories = [
+            memory
+            for memory, text in zip(page.memories, page.search_text)
+            if matches_content_type(memory, text, query.content_type)
+        ]
 
         # Apply sorting
         if query.sort_by == "timestamp":
@@ -995,6 +1285,8 @@ async def get_long_term_memory(query: LongTermMemoryQuery):
         return {
             "memories": long_term_memories,
             "total_count": len(long_term_memories),
+            "next_token": page.next_token,
+            "cached": cached,
             "source": "long_term_memory",
             "namespace": query.namespace,
             "memory_id": memory_id,
@@ -1026,8 +1318,6 @@ async def get_memory_entries(query: MemoryQuery):
                 detail="Memory ID is required. Please provide memory_id in request or set AGENTCORE_MEMORY_ID environment variable.",
             )
 
-        all_memories = []
-
         # Use ListMemoryRecords operation to browse all records without semantic search
         logger.info("🔍 Listing memory records using ListMemoryRecords operation")
         logger.info(f"📋 Memory ID: {memory_id}")
@@ -1046,19 +1336,31 @@ async def get_memory_entries(query: MemoryQuery):
                 "message": "No namespace provided. AgentCore Memory requires a namespace to query data efficiently. Please provide a namespace in your request.",
             }
 
-        # Try listing memory records with provided namespace
-        try:
-            logger.info(f"📋 Listing memory records from namespace: {query.namespace}")
+        records_page_size = page_size(query.max_results, default=50)
+        cache_key = (
+            "records",
+            memory_id,
+            query.namespace,
+            records_page_size,
+            query.next_token,
+        )
 
-            memories = memory_client.list_memory_records(
-                memoryId=memory_id,
-                namespace=query.namespace,
-                maxResults=query.max_results or 50,
-            )
+        async def load_page() -> MemoryPage:
+            all_memories = []
+            params = {
+                "memoryId": memory_id,
+                "namespace": query.namespace,
+                "maxResults": records_page_size,
+            }
+            if query.next_token:
+                params["nextToken"] = query.next_token
+            memories = await call_sdk(memory_client.list_memory_records, **params)
 
             # Handle the actual response structure
+            next_token = None
             if isinstance(memories, dict) and "memoryRecordSummaries" in memories:
                 memory_records = memories["memoryRecordSummaries"]
+                next_token = memories.get("nextToken")
                 logger.info(
                     f"📋 Processing {len(memory_records)} actual memory records"
                 )
@@ -1103,6 +1405,15 @@ async def get_memory_entries(query: MemoryQuery):
 
                 all_memories.append(memory_entry)
 
+            return MemoryPage(all_memories, next_token=next_token)
+
+        # Try listing memory records with provided namespace
+        try:
+            logger.info(f"📋 Listing memory records from namespace: {query.namespace}")
+
+            page, cached = await response_cache.get_or_load(
+                cache_key, load_page, refresh=query.refresh
+            )
         except Exception as e:
             logger.warning(
                 f"Could not list memory records from namespace '{query.namespace}': {e}"
@@ -1116,11 +1427,14 @@ async def get_memory_entries(query: MemoryQuery):
                 "error": f"Failed to access namespace '{query.namespace}': {clean_error}",
             }
 
+        all_memories = page.memories
         logger.info(f"✅ Total memory records found: {len(all_memories)}")
 
         return {
             "memories": all_memories,
             "total_count": len(all_memories),
+            "next_token": page.next_token,
+            "cached": cached,
             "source": "list_memory_records",
             "memory_id": memory_id,
         }
@@ -1140,6 +1454,8 @@ class MemoryIdValidationQuery(BaseModel):
 class ListNamespacesQuery(BaseModel):
     memory_id: str
     max_results: Optional[int] = 100
+    # Bypass the cache and rediscover namespaces
+    refresh: bool = False
 
 
 @app.post("/api/agentcore/listNamespacesV2")
@@ -1157,30 +1473,37 @@ async def list_namespaces_v2(query: ListNamespacesQuery):
 
         logger.info(f"🔍 Listing namespaces for memory ID: {memory_id}")
 
-        # Use the correct AgentCore Memory SDK approach to get namespaces
-        try:
-            logger.info("📋 Getting memory strategies to discover namespaces...")
+        async def discover_namespaces() -> Dict[str, Any]:
+            # Use the correct AgentCore Memory SDK approach to get namespaces
+            try:
+                logger.info("📋 Getting memory strategies to discover namespaces...")
 
-            # Get memory strategies which contain namespace information
-            strategies = memory_client.get_memory_strategies(memory_id)
-            logger.info(f"✅ Found {len(strategies)} memory strategies")
+                # Get memory strategies which contain namespace information
+                strategies = await call_sdk(
+                    memory_client.get_memory_strategies, memory_id
+                )
+                logger.info(f"✅ Found {len(strategies)} memory strategies")
 
-            found_namespaces = []
+                # Extract namespaces from strategies
+                strategy_namespaces = []
+                for strategy in strategies:
+                    strategy_type = strategy.get("type", "unknown")
+                    namespaces = strategy.get("namespaces", [])
 
-            # Extract namespaces from strategies
-            for strategy in strategies:
-                strategy_type = strategy.get("type", "unknown")
-                namespaces = strategy.get("namespaces", [])
-
-                logger.info(
-                    f"📋 Strategy '{strategy_type}' has namespaces: {namespaces}"
-                )
+                    logger.info(
+                        f"📋 Strategy '{strategy_type}' has namespaces: {namespaces}"
+                    )
+                    strategy_namespaces.extend(
+                        (strategy_type, namespace) for namespace in namespaces
+                    )
 
-                for namespace in namespaces:
+                async def describe_namespace(entry):
+                    strategy_type, namespace = entry
                     # Try to get a sample of records from this namespace to count them
                     try:
                         # Use retrieve_memories to get sample content
-                        sample_memories = memory_client.retrieve_memories(
+                        sample_memories = await call_sdk(
+                            memory_client.retrieve_memories,
                             memory_id=memory_id,
                             namespace=namespace,
                             query="*",  # Generic query to get any content
@@ -1198,122 +1521,136 @@ async def list_namespaces_v2(query: ListNamespacesQuery):
                             else:
                                 sample_content = str(content)[:100] + "..."
 
-                        found_namespaces.append(
-                            {
-                                "namespace": namespace,
-                                "type": strategy_type,
-                                "count": len(sample_memories) if sample_memories else 0,
-                                "sample_content": sample_content,
-                            }
-                        )
-
                         logger.info(
                             f"✅ Found namespace: {namespace} (type: {strategy_type}) with {len(sample_memories) if sample_memories else 0} sample records"
                         )
+                        return {
+                            "namespace": namespace,
+                            "type": strategy_type,
+                            "count": len(sample_memories) if sample_memories else 0,
+                            "sample_content": sample_content,
+                        }
 
                     except Exception as e:
                         # Still add the namespace even if we can't get samples
-                        found_namespaces.append(
-                            {
-                                "namespace": namespace,
-                                "type": strategy_type,
-                                "count": 0,
-                                "sample_content": f"Unable to retrieve sample: {clean_aws_error_message(str(e))}",
-                            }
-                        )
                         logger.warning(
                             f"⚠️ Found namespace: {namespace} (type: {strategy_type}) but couldn't retrieve samples: {e}"
                         )
+                        return {
+                            "namespace": namespace,
+                            "type": strategy_type,
+                            "count": 0,
+                            "sample_content": f"Unable to retrieve sample: {clean_aws_error_message(str(e))}",
+                        }
 
-            # Remove duplicates based on namespace
-            unique_namespaces = []
-            seen_namespaces = set()
-            for ns in found_namespaces:
-                if ns["namespace"] not in seen_namespaces:
-                    unique_namespaces.append(ns)
-                    seen_namespaces.add(ns["namespace"])
-
-            return {
-                "memory_id": memory_id,
-                "namespaces": unique_namespaces,
-                "total_found": len(unique_namespaces),
-                "strategies_found": len(strategies),
-                "message": f"Found {len(unique_namespaces)} namespaces from {len(strategies)} memory strategies"
-                if unique_namespaces
-                else "No namespaces found in memory strategies",
-            }
+                # Look up every namespace concurrently
+                found_namespaces = await map_concurrently(
+                    describe_namespace, strategy_namespaces
+                )
 
-        except Exception as e:
-            logger.warning(f"Failed to get memory strategies: {e}")
+                # Remove duplicates based on namespace
+                unique_namespaces = []
+                seen_namespaces = set()
+                for ns in found_namespaces:
+                    if ns["namespace"] not in seen_namespaces:
+                        unique_namespaces.append(ns)
+                        seen_namespaces.add(ns["namespace"])
 
-            # Fallback to the old pattern-based approach
-            logger.info("🔄 Falling back to pattern-based namespace discovery...")
+                return {
+                    "memory_id": memory_id,
+                    "namespaces": unique_namespaces,
+                    "total_found": len(unique_namespaces),
+                    "strategies_found": len(strategies),
+                    "message": (
+                        f"Found {len(unique_namespaces)} namespaces from {len(strategies)} memory strategies"
+                        if unique_namespaces
+                        else "No namespaces found in memory strategies"
+                    ),
+                }
 
-            try:
-                # Common namespace patterns for AgentCore Memory
-                namespace_patterns = [
-                    "support/user/DEFAULT",
-                    "support/user/DEFAULT/facts",
-                    "support/user/DEFAULT/preferences",
-                    "support/user/DEFAULT/context",
-                    "support/user/DEFAULT/summaries",
-                    "facts",
-                    "preferences",
-                    "context",
-                    "summaries",
-                ]
+            except Exception as e:
+                logger.warning(f"Failed to get memory strategies: {e}")
 
-                found_namespaces = []
+                # Fallback to the old pattern-based approach
+                logger.info("🔄 Falling back to pattern-based namespace discovery...")
 
-                for pattern in namespace_patterns:
-                    try:
-                        # Use list_memory_records to test namespace existence
-                        memories = memory_client.list_memory_records(
-                            memoryId=memory_id, namespace=pattern, maxResults=1
-                        )
+                try:
+                    # Common namespace patterns for AgentCore Memory
+                    namespace_patterns = [
+                        "support/user/DEFAULT",
+                        "support/user/DEFAULT/facts",
+                        "support/user/DEFAULT/preferences",
+                        "support/user/DEFAULT/context",
+                        "support/user/DEFAULT/summaries",
+                        "facts",
+                        "preferences",
+                        "context",
+                        "summaries",
+                    ]
+
+                    async def probe_namespace(pattern):
+                        try:
+                            # Use list_memory_records to test namespace existence
+                            memories = await call_sdk(
+                                memory_client.list_memory_records,
+                                memoryId=memory_id,
+                                namespace=pattern,
+                                maxResults=1,
+                            )
 
-                        if memories and len(memories) > 0:
-                            sample_content = ""
-                            if memories[0].get("content"):
-                                content = memories[0]["content"]
-                                if isinstance(content, dict):
-                                    sample_content = (
-                                        content.get("text", str(content))[:100] + "..."
-                                    )
-                                else:
-                                    sample_content = str(content)[:100] + "..."
+                            if memories and len(memories) > 0:
+                                sample_content = ""
+                                if memories[0].get("content"):
+                                    content = memories[0]["content"]
+                                    if isinstance(content, dict):
+                                        sample_content = (
+                                            content.get("text", str(content))[:100]
+                                            + "..."
+                                        )
+                                    else:
+                                        sample_content = str(content)[:100] + "..."
 
-                            found_namespaces.append(
-                                {
+                                logger.info(
+                                    f"✅ Found namespace: {pattern} (fallback method)"
+                                )
+                                return {
                                     "namespace": pattern,
                                     "type": "unknown",
                                     "count": 1,  # We only queried for 1 record
                                     "sample_content": sample_content,
                                 }
-                            )
-                            logger.info(
-                                f"✅ Found namespace: {pattern} (fallback method)"
-                            )
 
-                    except Exception as e2:
-                        logger.debug(f"❌ Namespace {pattern} not accessible: {e2}")
-                        continue
+                        except Exception as e2:
+                            logger.debug(f"❌ Namespace {pattern} not accessible: {e2}")
+                        return None
 
-                return {
-                    "memory_id": memory_id,
-                    "namespaces": found_namespaces,
-                    "total_found": len(found_namespaces),
-                    "method": "fallback_pattern_based",
-                    "message": f"Found {len(found_namespaces)} namespaces using fallback method (get_memory_strategies failed: {clean_aws_error_message(str(e))})",
-                }
+                    probed = await map_concurrently(probe_namespace, namespace_patterns)
+                    found_namespaces = [ns for ns in probed if ns is not None]
 
-            except Exception as e2:
-                logger.warning(f"Fallback method also failed: {e2}")
-                return {
-                    "namespaces": [],
-                    "total_found": 0,
-                    "error": f"Both get_memory_strategies and fallback failed: {clean_aws_error_message(str(e))} / {clean_aws_error_message(str(e2))}",
-                }
+                    return {
+                        "memory_id": memory_id,
+                        "namespaces": found_namespaces,
+                        "total_found": len(found_namespaces),
+                        "method": "fallback_pattern_based",
+                        "message": f"Found {len(found_namespaces)} namespaces using fallback method (get_memory_strategies failed: {clean_aws_error_message(str(e))})",
+                    }
+
+                except Exception as e2:
+                    logger.warning(f"Fallback method also failed: {e2}")
+                    return {
+                        "namespaces": [],
+                        "total_found": 0,
+                        "error": f"Both get_memory_strategies and fallback failed: {clean_aws_error_message(str(e))} / {clean_aws_error_message(str(e2))}",
+                    }
+
+        result, cached = await response_cache.get_or_load(
+            ("namespaces", memory_id),
+            discover_namespaces,
+            refresh=query.refresh,
+            # Fallback and error answers are retried on the next request
+            cacheable=lambda result: "strategies_found" in result,
+        )
+        return {**result, "cached": cached}
 
     except Exception as e:
         logger.error(f"Error listing namespaces: {e}")
@@ -1336,7 +1673,8 @@ async def validate_memory_id(query: MemoryIdValidationQuery):
 
         # Try to list memory records to validate the memory ID
         try:
-            _ = memory_client.list_memory_records(
+            _ = await call_sdk(
+                memory_client.list_memory_records,
                 memoryId=query.memory_id,
                 maxResults=1,  # Just check if we can access it
             )
@@ -1442,60 +1780,64 @@ async def list_namespaces(request: dict):
 
         try:
             # Get memory strategies to discover namespaces
-            strategies = memory_client.get_memory_strategies(memory_id)
+            strategies = await call_sdk(memory_client.get_memory_strategies, memory_id)
             logger.info(f"✅ Found {len(strategies)} memory strategies")
 
-            namespaces = []
-            for strategy in strategies:
-                strategy_type = strategy.get("type", "UNKNOWN")
-                strategy_namespaces = strategy.get("namespaces", [])
+            strategy_namespaces = [
+                (strategy.get("type", "UNKNOWN"), namespace)
+                for strategy in strategies
+                for namespace in strategy.get("namespaces", [])
+            ]
 
-                for namespace in strategy_namespaces:
-                    # Try to get a count of records in this namespace
-                    try:
-                        # Sample a few records to get count and sample content
-                        sample_memories = memory_client.retrieve_memories(
-                            memory_id=memory_id, namespace=namespace, query="*", top_k=5
+            async def describe_namespace(entry):
+                strategy_type, namespace = entry
+                # Try to get a count of records in this namespace
+                try:
+                    # Sample a few records to get count and sample content
+                    sample_memories = await call_sdk(
+                        memory_client.retrieve_memories,
+                        memory_id=memory_id,
+                        namespace=namespace,
+                        query="*",
+                        top_k=5,
+                    )
+
+                    if (
+                        isinstance(sample_memories, dict)
+                        and "memoryRecordSummaries" in sample_memories
+                    ):
+                        memory_records = sample_memories["memoryRecordSummaries"]
+                    else:
+                        memory_records = (
+                            sample_memories if isinstance(sample_memories, list) else []
                         )
 
-                        if (
-                            isinstance(sample_memories, dict)
-                            and "memoryRecordSummaries" in sample_memories
-                        ):
-                            memory_records = sample_memories["memoryRecordSummaries"]
+                    count = len(memory_records)
+                    sample_content = ""
+                    if memory_records:
+                        first_record = memory_records[0]
+                        content = first_record.get("content", {})
+                        if isinstance(content, dict):
+                            sample_content = content.get("text", str(content))
                         else:
-                            memory_records = (
-                                sample_memories
-                                if isinstance(sample_memories, list)
-                                else []
-                            )
+                            sample_content = str(content)
 
-                        count = len(memory_records)
-                        sample_content = ""
-                        if memory_records:
-                            first_record = memory_records[0]
-                            content = first_record.get("content", {})
-                            if isinstance(content, dict):
-                                sample_content = content.get("text", str(content))
-                            else:
-                                sample_content = str(content)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to get count for namespace {namespace}: {e}"
+                    )
+                    count = 0
+                    sample_content = ""
 
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to get count for namespace {namespace}: {e}"
-                        )
-                        count = 0
-                        sample_content = ""
+                return {
+                    "namespace": namespace,
+                    "type": strategy_type,
+                    "count": count,
+                    "sample_content": sample_content[:200] if sample_content else "",
+                }
 
-                    namespace_info = {
-                        "namespace": namespace,
-                        "type": strategy_type,
-                        "count": count,
-                        "sample_content": sample_content[:200]
-                        if sample_content
-                        else "",
-                    }
-                    namespaces.append(namespace_info)
+            # Look up every namespace concurrently
+            namespaces = await map_concurrently(describe_namespace, strategy_namespaces)
 
             logger.info(f"✅ Found {len(namespaces)} total namespaces")
 
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Local index of AgentCore Memory events.
+
+Maps (memory ID, event ID) to the actor, session and timestamp the event was
+listed under, so an event can be fetched directly instead of by scanning
+sessions. Entries are added whenever the backend lists events and appended to
+a JSON Lines file that is replayed on startup.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class IndexedEvent(NamedTuple):
+    actor_id: str
+    session_id: str
+    timestamp: str
+
+
+class EventIndex:
+    """eventId -> (actor, session, timestamp), persisted to `path`.
+
+    Only used from the event loop thread, so it needs no locking. Appends are
+    a few small lines per listed page, cheap enough to write inline.
+
+    Args:
+        path: JSON Lines file backing the index; None keeps it in memory only
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._events: Dict[Tuple[str, str], IndexedEvent] = {}
+        self._sessions: Dict[str, Set[Tuple[str, str]]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    memory_id, event_id = record["memory_id"], record["event_id"]
+                    if record.get("deleted"):
+                        self._events.pop((memory_id, event_id), None)
+                        continue
+                    self._add(
+                        memory_id,
+                        event_id,
+                        IndexedEvent(
+                            record["actor_id"],
+                            record["session_id"],
+                            record.get("timestamp", ""),
+                        ),
+                    )
+                except (ValueError, KeyError):
+                    # A torn line from an interrupted write
+                    continue
+        logger.info(f"📇 Loaded {len(self._events)} indexed events from {self.path}")
+
+    def _add(self, memory_id: str, event_id: str, entry: IndexedEvent) -> bool:
+        key = (memory_id, event_id)
+        if self._events.get(key) == entry:
+            return False
+        self._events[key] = entry
+        self._sessions.setdefault(memory_id, set()).add(
+            (entry.actor_id, entry.session_id)
+        )
+        return True
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        if not records or not self.path:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(record) + "\n" for record in records)
+        except OSError as e:
+            logger.warning(f"Could not persist event index to {self.path}: {e}")
+
+    def lookup(self, memory_id: str, event_id: str) -> Optional[IndexedEvent]:
+        return self._events.get((memory_id, event_id))
+
+    def sessions(self, memory_id: str) -> List[Tuple[str, str]]:
+        """(actor_id, session_id) pairs seen for a memory."""
+        return sorted(self._sessions.get(memory_id, ()))
+
+    def record_events(
+        self,
+        memory_id: str,
+        actor_id: str,
+        session_id: str,
+        events: Iterable[Dict[str, Any]],
+    ) -> int:
+        """Index the events of one ListEvents page; returns how many were new."""
+        records = []
+        for event in events:
+            event_id = event.get("eventId") if isinstance(event, dict) else None
+            if not event_id:
+                continue
+            entry = IndexedEvent(
+                actor_id, session_id, str(event.get("eventTimestamp", ""))
+            )
+            if self._add(memory_id, event_id, entry):
+                records.append(
+                    {"memory_id": memory_id, "event_id": event_id, **entry._asdict()}
+                )
+        self._append(records)
+        return len(records)
+
+    def forget(self, memory_id: str, event_id: str) -> None:
+        """Drop an entry whose event no longer exists."""
+        if self._events.pop((memory_id, event_id), None) is not None:
+            self._append(
+                [{"memory_id": memory_id, "event_id": event_id, "deleted": True}]
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "events": len(self._events),
+            "sessions": sum(len(pairs) for pairs in self._sessions.values()),
+            "path": str(self.path) if self.path else None,
+        }
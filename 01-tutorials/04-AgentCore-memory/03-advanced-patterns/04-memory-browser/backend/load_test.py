@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Load test for the memory browser backend.
+
+Sends batches of concurrent requests at increasing concurrency and reports
+throughput and latency, showing how request handling scales now that
+MemoryClient calls run off the event loop. Each scenario runs once with
+refresh=true (every request goes to AgentCore) and once served from the
+response cache.
+
+By default the app is driven in-process with a simulated MemoryClient whose
+calls block for --latency seconds (like a real boto3 call), so no AWS access
+is needed. Pass --url to load test a running backend against real AgentCore
+Memory instead.
+
+Usage:
+    python load_test.py [--latency 0.2] [--concurrency 1 2 4 8 16 32]
+    python load_test.py --url http://127.0.0.1:8000 --memory-id <id> \\
+        --actor-id <actor> --session-id <session>
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+
+
+def _page(items: List, max_results: int, next_token=None):
+    """Slice `items` like an AgentCore paginated API."""
+    start = int(next_token or 0)
+    end = start + max_results
+    return items[start:end], (str(end) if end < len(items) else None)
+
+
+class SimulatedDataPlaneClient:
+    """boto3-style data plane calls used for paginated reads."""
+
+    def __init__(self, owner: "SimulatedMemoryClient"):
+        self.owner = owner
+
+    def list_events(
+        self, memoryId, actorId, sessionId, maxResults, nextToken=None, **kwargs
+    ):
+        self.owner._wait()
+        events = [
+            {
+                "eventId": f"event-{i}",
+                "eventTimestamp": f"2025-01-01T00:00:{i % 60:02d}Z",
+                "payload": [{"conversational": {"content": {"text": f"message {i}"}}}],
+            }
+            for i in range(self.owner.events)
+        ]
+        page, token = _page(events, maxResults, nextToken)
+        return {"events": page, "nextToken": token}
+
+    def retrieve_memory_records(
+        self, memoryId, namespace, searchCriteria, maxResults, nextToken=None, **kwargs
+    ):
+        self.owner._wait()
+        records = [
+            {
+                "memoryRecordId": f"record-{i}",
+                "content": {"text": f"{namespace} record {i}"},
+            }
+            for i in range(self.owner.events)
+        ]
+        page, token = _page(records, maxResults, nextToken)
+        return {"memoryRecordSummaries": page, "nextToken": token}
+
+
+class SimulatedMemoryClient:
+    """Blocking stand-in for MemoryClient with a fixed per-call latency."""
+
+    def __init__(self, latency: float, namespaces: int = 6, events: int = 50):
+        self.latency = latency
+        self.namespaces = namespaces
+        self.events = events
+        self.gmdp_client = SimulatedDataPlaneClient(self)
+
+    def _wait(self):
+        time.sleep(self.latency)
+
+    def get_last_k_turns(self, memory_id, actor_id, session_id, k=10, **kwargs):
+        self._wait()
+        return [[{"role": "USER", "content": {"text": f"turn {i}"}}] for i in range(k)]
+
+    def get_memory_strategies(self, memory_id):
+        self._wait()
+        return [
+            {"type": "SEMANTIC", "namespaces": [f"support/user/{i}/facts"]}
+            for i in range(self.namespaces)
+        ]
+
+    def retrieve_memories(self, memory_id, namespace, query, top_k=3, **kwargs):
+        self._wait()
+        return [{"content": {"text": f"{namespace} record {i}"}} for i in range(top_k)]
+
+
+async def run_level(
+    client: httpx.AsyncClient, path: str, body: Dict, concurrency: int, rounds: int
+) -> Dict[str, float]:
+    """Send `rounds` waves of `concurrency` simultaneous requests."""
+    latencies: List[float] = []
+    errors = 0
+
+    async def one():
+        nonlocal errors
+        started = time.perf_counter()
+        response = await client.post(path, json=body)
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors += 1
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(one() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "max_ms": max(latencies) * 1000,
+        "errors": errors,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    if args.url:
+        transport = None
+        base_url = args.url
+    else:
+        import app as backend
+
+        backend.memory_client = SimulatedMemoryClient(args.latency)
+        transport = httpx.ASGITransport(app=backend.app)
+        base_url = "http://memory-browser"
+        print(
+            f"In-process run, simulated SDK latency {args.latency * 1000:.0f} ms, "
+            f"{backend.SDK_MAX_WORKERS} SDK workers, "
+            f"namespace fan-out {backend.NAMESPACE_LOOKUP_CONCURRENCY}"
+        )
+
+    memory_id = args.memory_id or "simulated-memory"
+    short_term = {
+        "memory_id": memory_id,
+        "actor_id": args.actor_id,
+        "session_id": args.session_id,
+        "max_results": 20,
+    }
+    scenarios = [
+        ("/api/agentcore/getShortTermMemory", {**short_term, "refresh": True}),
+        ("/api/agentcore/getShortTermMemory", short_term),
+        ("/api/agentcore/listNamespaces", {"memory_id": memory_id}),
+        ("/api/agentcore/listNamespacesV2", {"memory_id": memory_id, "refresh": True}),
+        ("/api/agentcore/listNamespacesV2", {"memory_id": memory_id}),
+    ]
+
+    failures = 0
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, timeout=120
+    ) as client:
+        for path, body in scenarios:
+            mode = "refresh" if body.get("refresh") else "cached"
+            if path.endswith("listNamespaces"):
+                mode = "uncached endpoint"
+            print(f"\n{path} ({mode})")
+            print(
+                f"{'concurrency':>11} {'req/s':>9} {'p50 ms':>9} {'max ms':>9} {'errors':>7}"
+            )
+            for concurrency in args.concurrency:
+                result = await run_level(client, path, body, concurrency, args.rounds)
+                failures += result["errors"]
+                print(
+                    f"{concurrency:>11} {result['rps']:>9.1f} {result['p50_ms']:>9.1f} "
+                    f"{result['max_ms']:>9.1f} {result['errors']:>7}"
+                )
+    return 1 if failures else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Memory browser backend load test")
+    parser.add_argument("--url", help="Running backend to test (default: in-process)")
+    parser.add_argument("--memory-id")
+    parser.add_argument("--actor-id", default="load-test-actor")
+    parser.add_argument("--session-id", default="load-test-session")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.2,
+        help="Simulated seconds per SDK call (in-process mode)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32]
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="Request waves per concurrency level"
+    )
+    args = parser.parse_args()
+    if args.url and not args.memory_id:
+        parser.error("--memory-id is required with --url")
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Read-through cache for AgentCore Memory responses.
+
+Pages fetched from AgentCore are kept for a TTL and evicted least recently
+used once their estimated size exceeds a byte budget. Concurrent requests
+for the same uncached key share a single upstream fetch.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+# Rough per-entry overhead (dict, keys, metadata) added to content sizes
+_ENTRY_OVERHEAD_BYTES = 256
+
+
+@dataclass
+class MemoryPage:
+    """One upstream page of memories, normalised for the dashboard.
+
+    search_text holds each memory's content lowercased once when the page is
+    cached, so text filters don't re-lowercase it on every request.
+    """
+
+    memories: List[Dict[str, Any]]
+    next_token: Optional[str] = None
+    search_text: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.search_text:
+            self.search_text = [
+                str(memory.get("content", "")).lower() for memory in self.memories
+            ]
+
+    @property
+    def size(self) -> int:
+        return sum(_ENTRY_OVERHEAD_BYTES + 2 * len(text) for text in self.search_text)
+
+
+def _default_size(value: Any) -> int:
+    size = getattr(value, "size", None)
+    if isinstance(size, int):
+        return size
+    return _ENTRY_OVERHEAD_BYTES + len(str(value))
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    # Mark a failure retrieved so it isn't logged as unhandled when every
+    # request waiting on the load was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+class ResponseCache:
+    """TTL + size-bounded LRU cache with single-flight loading.
+
+    Only used from the event loop thread, so it needs no locking.
+
+    Args:
+        ttl_seconds: How long an entry is served; 0 disables caching
+        max_bytes: Budget for the estimated size of all entries
+    """
+
+    def __init__(self, ttl_seconds: float, max_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> None:
+        if not self.enabled:
+            return
+        size = _default_size(value) if size is None else size
+        if size > self.max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, size, value)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+    def invalidate(self, match: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key satisfies `match`."""
+        stale = [key for key in self._entries if match(key)]
+        for key in stale:
+            self._discard(key)
+        return len(stale)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        refresh: bool = False,
+        cacheable: Optional[Callable[[T], bool]] = None,
+    ) -> Tuple[T, bool]:
+        """Return (value, served_from_cache), loading and caching on a miss.
+
+        Args:
+            key: Cache key
+            loader: Coroutine factory that fetches the value upstream
+            refresh: Skip the cached value and reload it
+            cacheable: Optional predicate; values failing it are not cached
+        """
+        if not refresh:
+            value = self.get(key)
+            if value is not None:
+                self.hits += 1
+                return value, True
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self.hits += 1
+                return await asyncio.shield(inflight), True
+
+        self.misses += 1
+        # The load runs as its own task so that cancelling the request that
+        # started it doesn't cancel the fetch other requests are waiting on
+        task = asyncio.ensure_future(self._load(key, loader, cacheable))
+        task.add_done_callback(_retrieve_exception)
+        self._inflight[key] = task
+        return await asyncio.shield(task), False
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        cacheable: Optional[Callable[[T], bool]],
+    ) -> T:
+        task = asyncio.current_task()
+        try:
+            value = await loader()
+        finally:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+        if cacheable is None or cacheable(value):
+            self.put(key, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -4,6 +4,11 @@ Session Replay Viewer for Bedrock Agentcore Browser Sessions
 
 Views session recordings stored in standard rrweb-{timestamp}-{sessionid} format.
 Supports both local sample recordings and S3 streaming.
+
+Recordings are streamed to the player as NDJSON, one gzipped batch at a time,
+so playback starts after the first batch and the server never holds a whole
+recording in memory. A per-batch timestamp index lets the player seek without
+downloading earlier batches.
 """
 
 import os
@@ -15,11 +20,14 @@ import threading
 import webbrowser
 import socket
 import signal
-import shutil
 import gzip
+import hashlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, unquote
 import mimetypes
 from datetime import datetime
 
@@ -31,76 +39,103 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# Gzipped NDJSON batch files written by the recorder
+BATCH_SUFFIXES = (".ndjson.gz", ".jsonl.gz")
+
+# rrweb EventType.Meta, emitted right before every full snapshot; playback
+# can only start at one of these
+META_EVENT_TYPE = 4
+
+# Streamed responses are written in chunks of about this size
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Downloaded S3 batches are kept here, keyed by bucket, key and ETag
+REPLAY_CACHE_DIR = os.getenv(
+    "REPLAY_CACHE_DIR", str(Path.home() / ".cache" / "bedrock_agentcore_replay")
+)
+REPLAY_CACHE_MAX_MB = int(
+    os.getenv("REPLAY_CACHE_MAX_MB", "1024")
+)  # 0 disables the cache
+REPLAY_FETCH_WORKERS = int(os.getenv("REPLAY_FETCH_WORKERS", "8"))
+
 
 class SessionReplayHandler(BaseHTTPRequestHandler):
     """HTTP request handler for session replay viewer"""
-    
+
     def __init__(self, data_source, viewer_path, *args, **kwargs):
         self.data_source = data_source
         self.viewer_path = viewer_path
         super().__init__(*args, **kwargs)
-    
+
     def log_message(self, format, *args):
         """Override to reduce server logging noise"""
         pass
-    
+
     def do_GET(self):
         """Handle GET requests"""
         try:
-            path = self.path.split('?')[0]
-            
-            if path == '/':
-                self.serve_file('index.html')
-            elif path == '/api/recordings':
+            parsed = urlparse(self.path)
+            path = parsed.path
+
+            if path == "/":
+                self.serve_file("index.html")
+            elif path == "/api/recordings":
                 self.serve_recordings_list()
-            elif path.startswith('/api/download/'):
-                recording_id = path.split('/')[-1]
+            elif path.startswith("/api/recordings/") and path.endswith("/index"):
+                recording_id = unquote(path.split("/")[-2])
+                self.serve_recording_index(recording_id)
+            elif path.startswith("/api/stream/"):
+                recording_id = unquote(path.split("/")[-1])
+                self.stream_recording(recording_id, parse_qs(parsed.query))
+            elif path.startswith("/api/download/"):
+                recording_id = path.split("/")[-1]
                 self.download_and_serve_recording(recording_id)
             else:
-                self.serve_file(path.lstrip('/'))
-                
+                self.serve_file(path.lstrip("/"))
+
         except Exception as e:
             console.print(f"[red]Error handling request: {e}[/red]")
             self.send_error(500, str(e))
-    
+
     def serve_file(self, file_path):
         """Serve static files"""
         full_path = self.viewer_path / file_path
-        
+
         if not full_path.exists():
             # Create index.html on the fly
-            if file_path == 'index.html':
+            if file_path == "index.html":
                 self._create_index_html(full_path)
             else:
                 self.send_error(404, f"File not found: {file_path}")
                 return
-        
+
         content_type, _ = mimetypes.guess_type(str(full_path))
         if content_type is None:
-            content_type = 'application/octet-stream'
-        
-        with open(full_path, 'rb') as f:
+            content_type = "application/octet-stream"
+
+        with open(full_path, "rb") as f:
             content = f.read()
-        
+
         self.send_response(200)
-        self.send_header('Content-Type', content_type)
-        self.send_header('Content-Length', str(len(content)))
-        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
         self.wfile.write(content)
-    
+
     def _create_index_html(self, path):
         """Create the viewer HTML interface"""
         import os
+
         print(f"\n======= DEBUGGING =======")
         print(f"Creating index.html at: {path}")
         print(f"Path exists: {os.path.exists(path)}")
         print(f"Parent directory exists: {os.path.exists(path.parent)}")
-        
+
         # Ensure the directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
-        
-        html_content = r'''<!DOCTYPE html>
+
+        html_content = r"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -247,6 +282,19 @@ class SessionReplayHandler(BaseHTTPRequestHandler):
             border-radius: 4px;
             margin: 20px;
         }
+        
+        .seek-bar {
+            display: none;
+            align-items: center;
+            gap: 10px;
+            padding: 0 20px 15px;
+            font-size: 13px;
+            color: #495057;
+        }
+        
+        .seek-bar input {
+            flex: 1;
+        }
     </style>
 </head>
 <body>
@@ -277,6 +325,11 @@ class SessionReplayHandler(BaseHTTPRequestHandler):
                     </div>
                 </div>
             </div>
+            <div class="seek-bar" id="seekBar">
+                <span>Jump to</span>
+                <input type="range" id="seekInput" min="0" max="0" value="0" step="1000">
+                <span id="seekLabel">0s</span>
+            </div>
         </div>
     </div>
     
@@ -351,82 +404,243 @@ class SessionReplayHandler(BaseHTTPRequestHandler):
             }
         }
         
+        // Streaming state for the selected recording
+        let currentRecordingId = null;
+        let currentStream = null;
+        let currentIndex = null;
+        let loadedStart = null;
+        let loadedEnd = null;
+        let pendingSeek = null;
+        
+        function destroyPlayer() {
+            // Safely dispose of the existing player first
+            if (currentPlayer) {
+                try {
+                    if (typeof currentPlayer.destroy === 'function') {
+                        currentPlayer.destroy();
+                    } else {
+                        console.warn('Current player does not have a destroy method');
+                    }
+                } catch (e) {
+                    console.error('Error destroying player:', e);
+                }
+                currentPlayer = null;
+            }
+            loadedStart = null;
+            loadedEnd = null;
+        }
+        
+        function createPlayer(events) {
+            const playerEl = document.getElementById('player');
+            playerEl.innerHTML = '';
+            
+            if (typeof rrwebPlayer !== 'function') {
+                throw new Error('rrwebPlayer not found - make sure the library is loaded');
+            }
+            
+            const width = Math.min(playerEl.offsetWidth, 1200);
+            const height = Math.min(playerEl.offsetHeight, 800);
+            
+            console.log('Creating player with dimensions ' + width + 'x' + height + ' and ' + events.length + ' events');
+            
+            currentPlayer = new rrwebPlayer({
+                target: playerEl,
+                props: {
+                    events: events,
+                    width: width,
+                    height: height,
+                    autoPlay: true,
+                    showController: true
+                }
+            });
+            loadedStart = events[0].timestamp;
+            loadedEnd = events[events.length - 1].timestamp;
+        }
+        
+        function applyPendingSeek() {
+            // Jump once the events around the seek target have arrived
+            if (pendingSeek !== null && currentPlayer && loadedEnd >= pendingSeek) {
+                currentPlayer.goto(Math.max(0, pendingSeek - loadedStart), true);
+                pendingSeek = null;
+            }
+        }
+        
+        async function loadFullRecording(recordingId) {
+            // Data sources without streaming support return the whole recording at once
+            const response = await fetch('/api/download/' + recordingId);
+            const result = await response.json();
+            
+            if (!result.success || !result.data) {
+                throw new Error(result.error || 'Failed to download recording');
+            }
+            
+            const { events } = result.data;
+            
+            if (!events || events.length === 0) {
+                throw new Error('Recording contains no events');
+            }
+            
+            console.log('Loaded ' + events.length + ' events. First event type: ' + events[0].type);
+            createPlayer(events);
+        }
+        
+        async function streamRecording(recordingId, fromTimestamp) {
+            if (currentStream) {
+                currentStream.abort();
+            }
+            const controller = new AbortController();
+            currentStream = controller;
+            
+            let url = '/api/stream/' + encodeURIComponent(recordingId);
+            if (fromTimestamp !== null) {
+                url += '?from=' + fromTimestamp;
+            }
+            
+            const response = await fetch(url, { signal: controller.signal });
+            if (response.status === 501) {
+                return loadFullRecording(recordingId);
+            }
+            if (!response.ok) {
+                const result = await response.json().catch(() => ({}));
+                throw new Error(result.error || 'Failed to stream recording');
+            }
+            
+            // Start playback as soon as a full snapshot (type 2) has arrived,
+            // then append events as further batches are decompressed
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffered = '';
+            let pending = [];
+            let received = 0;
+            
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) {
+                    break;
+                }
+                buffered += decoder.decode(value, { stream: true });
+                const lines = buffered.split('\n');
+                buffered = lines.pop();
+                
+                for (const line of lines) {
+                    if (!line.trim()) {
+                        continue;
+                    }
+                    const event = JSON.parse(line);
+                    if (event.error) {
+                        throw new Error(event.error);
+                    }
+                    received++;
+                    
+                    if (currentPlayer) {
+                        currentPlayer.addEvent(event);
+                        loadedEnd = Math.max(loadedEnd, event.timestamp);
+                    } else {
+                        pending.push(event);
+                        if (pending.length >= 2 && pending.some(e => e.type === 2)) {
+                            createPlayer(pending);
+                            pending = [];
+                        }
+                    }
+                }
+                applyPendingSeek();
+            }
+            
+            if (!currentPlayer) {
+                if (pending.length === 0) {
+                    throw new Error('Recording contains no events');
+                }
+                createPlayer(pending);
+            }
+            applyPendingSeek();
+            console.log('Streamed ' + received + ' events');
+        }
+        
+        async function loadIndex(recordingId) {
+            const seekBar = document.getElementById('seekBar');
+            seekBar.style.display = 'none';
+            
+            try {
+                const response = await fetch('/api/recordings/' + encodeURIComponent(recordingId) + '/index');
+                const result = await response.json();
+                if (!result.success || recordingId !== currentRecordingId || result.data.startTime === null) {
+                    return;
+                }
+                currentIndex = result.data;
+                
+                const seekInput = document.getElementById('seekInput');
+                seekInput.max = currentIndex.endTime - currentIndex.startTime;
+                seekInput.value = 0;
+                document.getElementById('seekLabel').textContent = formatDuration(0);
+                seekBar.style.display = 'flex';
+            } catch (e) {
+                console.warn('Seeking unavailable:', e);
+            }
+        }
+        
+        async function seekTo(offset) {
+            if (!currentIndex) {
+                return;
+            }
+            const target = currentIndex.startTime + offset;
+            
+            if (currentPlayer && loadedStart !== null && target >= loadedStart && target <= loadedEnd) {
+                currentPlayer.goto(target - loadedStart, true);
+                return;
+            }
+            
+            // Not loaded yet: restart the stream at the closest keyframe before the target
+            const playerEl = document.getElementById('player');
+            destroyPlayer();
+            playerEl.innerHTML = '<div class="empty-state"><div class="loading"></div>Seeking...</div>';
+            pendingSeek = target;
+            
+            try {
+                await streamRecording(currentRecordingId, target);
+            } catch (e) {
+                if (e.name === 'AbortError') {
+                    return;
+                }
+                console.error('Failed to seek:', e);
+                playerEl.innerHTML = '<div class="error">Error: ' + e.message + '</div>';
+            }
+        }
+        
         async function loadRecording(index) {
             const recording = recordings[index];
             
             document.querySelectorAll('.recording-item').forEach(el => {
                 el.classList.remove('active');
             });
-            // CHANGED: Use string concatenation
             document.querySelector('[data-index="' + index + '"]').classList.add('active');
             
             const playerEl = document.getElementById('player');
             playerEl.innerHTML = '<div class="empty-state"><div class="loading"></div>Downloading recording...</div>';
             
+            destroyPlayer();
+            currentRecordingId = recording.id;
+            currentIndex = null;
+            pendingSeek = null;
+            loadIndex(recording.id);
+            
             try {
-                // Safely dispose of the existing player first
-                if (currentPlayer) {
-                    try {
-                        if (typeof currentPlayer.destroy === 'function') {
-                            currentPlayer.destroy();
-                        } else {
-                            console.warn('Current player does not have a destroy method');
-                        }
-                    } catch (e) {
-                        console.error('Error destroying player:', e);
-                    }
-                    currentPlayer = null;
-                }
-                
-                // CHANGED: Use string concatenation
-                const response = await fetch('/api/download/' + recording.id);
-                const result = await response.json();
-                
-                if (!result.success || !result.data) {
-                    throw new Error(result.error || 'Failed to download recording');
-                }
-                
-                const { events } = result.data;
-                
-                if (!events || events.length === 0) {
-                    throw new Error('Recording contains no events');
-                }
-                
-                // CHANGED: Use string concatenation for logging
-                console.log('Loaded ' + events.length + ' events. First event type: ' + events[0].type);
-                
-                playerEl.innerHTML = '';
-                
-                if (typeof rrwebPlayer !== 'function') {
-                    throw new Error('rrwebPlayer not found - make sure the library is loaded');
-                }
-                
-                const width = Math.min(playerEl.offsetWidth, 1200);
-                const height = Math.min(playerEl.offsetHeight, 800);
-                
-                // CHANGED: Use string concatenation
-                console.log('Creating player with dimensions ' + width + 'x' + height);
-                
-                currentPlayer = new rrwebPlayer({
-                    target: playerEl,
-                    props: {
-                        events: events,
-                        width: width,
-                        height: height,
-                        autoPlay: true,
-                        showController: true
-                    }
-                });
-                
-                console.log('Player created:', currentPlayer);
-                
+                await streamRecording(recording.id, null);
             } catch (e) {
+                if (e.name === 'AbortError') {
+                    return;
+                }
                 console.error('Failed to load recording:', e);
-                // CHANGED: Use string concatenation
                 playerEl.innerHTML = '<div class="error">Error: ' + e.message + '</div>';
             }
         }
         
+        document.getElementById('seekInput').addEventListener('input', function(e) {
+            document.getElementById('seekLabel').textContent = formatDuration(Number(e.target.value));
+        });
+        document.getElementById('seekInput').addEventListener('change', function(e) {
+            seekTo(Number(e.target.value));
+        });
+        
         // Initialize
         document.addEventListener('DOMContentLoaded', function() {
             console.log('Session Replay Viewer loaded');
@@ -437,314 +651,697 @@ class SessionReplayHandler(BaseHTTPRequestHandler):
         setInterval(loadRecordings, 30000);
     </script>
 </body>
-</html>'''
-        
+</html>"""
+
         print(f"Original content length: {len(html_content)}")
         print(f"Contains 'DOLLAR': {'DOLLAR' in html_content}")
-        
+
         # Try to replace DOLLAR with $ just in case
-        if 'DOLLAR' in html_content:
-            html_content = html_content.replace('DOLLAR', '$')
+        if "DOLLAR" in html_content:
+            html_content = html_content.replace("DOLLAR", "$")
             print(f"After replacement, contains 'DOLLAR': {'DOLLAR' in html_content}")
-        
+
         print(f"Writing to file: {path}")
-        
+
         try:
-            with open(path, 'w') as f:
+            with open(path, "w") as f:
                 f.write(html_content)
-            
+
             # Verify the file was written correctly
             file_size = os.path.getsize(path)
             print(f"File written successfully, size: {file_size} bytes")
-            
+
             # Verify content in file
-            with open(path, 'r') as f:
+            with open(path, "r") as f:
                 first_100 = f.read(100)
             print(f"First 100 chars of file: {first_100}")
-            
+
         except Exception as e:
             print(f"ERROR writing file: {e}")
-        
+
         print("======= END DEBUGGING =======\n")
-    
+
     def serve_recordings_list(self):
         """Return list of recordings with proper headers"""
         try:
             recordings = self.data_source.list_recordings()
             response = json.dumps(recordings)
-            
+
             self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Content-Length', str(len(response)))
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-            self.send_header('Access-Control-Allow-Headers', '*')
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+            self.send_header("Access-Control-Allow-Headers", "*")
             self.end_headers()
-            
-            self.wfile.write(response.encode('utf-8'))
-            
+
+            self.wfile.write(response.encode("utf-8"))
+
         except Exception as e:
             console.print(f"[red]Error in serve_recordings_list: {e}[/red]")
-            
+
             error_response = json.dumps({"error": str(e), "recordings": []})
             self.send_response(200)  # Use 200 to ensure client gets the error
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Content-Length', str(len(error_response)))
-            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(error_response)))
+            self.send_header("Access-Control-Allow-Origin", "*")
             self.end_headers()
-            self.wfile.write(error_response.encode('utf-8'))
+            self.wfile.write(error_response.encode("utf-8"))
 
     def download_and_serve_recording(self, recording_id):
         """Download recording and serve it with proper headers"""
         try:
             recording_data = self.data_source.download_recording(recording_id)
-            
+
             if recording_data:
-                response = json.dumps({
-                    'success': True,
-                    'data': recording_data
-                })
-                
+                response = json.dumps({"success": True, "data": recording_data})
+
                 self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Content-Length', str(len(response)))
-                self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.send_header("Access-Control-Allow-Origin", "*")
                 self.end_headers()
-                self.wfile.write(response.encode('utf-8'))
+                self.wfile.write(response.encode("utf-8"))
             else:
-                error_response = json.dumps({
-                    'success': False,
-                    'error': 'Recording not found'
-                })
+                error_response = json.dumps(
+                    {"success": False, "error": "Recording not found"}
+                )
                 self.send_response(404)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Content-Length', str(len(error_response)))
-                self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(error_response)))
+                self.send_header("Access-Control-Allow-Origin", "*")
                 self.end_headers()
-                self.wfile.write(error_response.encode('utf-8'))
-                
+                self.wfile.write(error_response.encode("utf-8"))
+
         except Exception as e:
             console.print(f"[red]Error in download_and_serve_recording: {e}[/red]")
             import traceback
+
             traceback.print_exc()
-            
-            error_response = json.dumps({
-                'success': False,
-                'error': str(e)
-            })
+
+            error_response = json.dumps({"success": False, "error": str(e)})
             self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Content-Length', str(len(error_response)))
-            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(error_response)))
+            self.send_header("Access-Control-Allow-Origin", "*")
             self.end_headers()
-            self.wfile.write(error_response.encode('utf-8'))
+            self.wfile.write(error_response.encode("utf-8"))
+
+    def _send_json(self, status, payload):
+        """Send a complete JSON response"""
+        response = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(response)
+
+    def serve_recording_index(self, recording_id):
+        """Serve the per-batch timestamp index used for seeking"""
+        if not hasattr(self.data_source, "batch_index"):
+            self._send_json(
+                501,
+                {
+                    "success": False,
+                    "error": "Seeking not supported by this data source",
+                },
+            )
+            return
+
+        try:
+            index = self.data_source.batch_index(recording_id)
+            if index is None:
+                self._send_json(404, {"success": False, "error": "Recording not found"})
+                return
+            self._send_json(200, {"success": True, "data": index.to_dict()})
+        except Exception as e:
+            console.print(f"[red]Error in serve_recording_index: {e}[/red]")
+            self._send_json(500, {"success": False, "error": str(e)})
+
+    def stream_recording(self, recording_id, query):
+        """Stream recording events as NDJSON while batches are decompressed.
+
+        ?from=<epoch ms> starts playback at the last keyframe at or before
+        that time, skipping earlier batches.
+        """
+        if not hasattr(self.data_source, "open_stream"):
+            self._send_json(
+                501,
+                {
+                    "success": False,
+                    "error": "Streaming not supported by this data source",
+                },
+            )
+            return
+
+        from_timestamp = query.get("from", [None])[0]
+        if from_timestamp is not None:
+            try:
+                from_timestamp = int(float(from_timestamp))
+            except ValueError:
+                self._send_json(
+                    400,
+                    {
+                        "success": False,
+                        "error": f"Invalid from timestamp: {from_timestamp}",
+                    },
+                )
+                return
+
+        try:
+            stream = self.data_source.open_stream(recording_id, from_timestamp)
+        except Exception as e:
+            console.print(f"[red]Error opening stream for {recording_id}: {e}[/red]")
+            self._send_json(500, {"success": False, "error": str(e)})
+            return
+        if stream is None:
+            self._send_json(404, {"success": False, "error": "Recording not found"})
+            return
+
+        # No Content-Length: the response ends when the connection closes
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        with closing(stream):
+            try:
+                for chunk in stream:
+                    self.wfile.write(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                console.print(f"[dim]Player stopped streaming {recording_id}[/dim]")
+            except Exception as e:
+                console.print(f"[red]Error streaming {recording_id}: {e}[/red]")
+                try:
+                    self.wfile.write(
+                        (json.dumps({"error": str(e)}) + "\n").encode("utf-8")
+                    )
+                except OSError:
+                    pass
 
     def do_OPTIONS(self):
         """Handle OPTIONS requests for CORS preflight"""
         self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', '*')
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "*")
         self.end_headers()
 
 
+class RecordingIndex:
+    """Timestamp range and keyframes of each batch of a recording"""
+
+    def __init__(self, recording_id, batch_refs, batches):
+        self.recording_id = recording_id
+        self.batch_refs = batch_refs  # What open_batch() takes, in playback order
+        self.batches = batches  # One summary dict per batch, see DataSource._summarize
+
+    def start_for(self, timestamp):
+        """(batch position, keyframe timestamp) to start playback from for a seek to timestamp"""
+        start = (0, None)
+        for position, batch in enumerate(self.batches):
+            if batch["startTime"] is not None and batch["startTime"] > timestamp:
+                break
+            keyframes = [k for k in batch["keyframes"] if k <= timestamp]
+            if keyframes:
+                start = (position, keyframes[-1])
+        return start
+
+    def to_dict(self):
+        starts = [b["startTime"] for b in self.batches if b["startTime"] is not None]
+        ends = [b["endTime"] for b in self.batches if b["endTime"] is not None]
+        return {
+            "recordingId": self.recording_id,
+            "startTime": min(starts) if starts else None,
+            "endTime": max(ends) if ends else None,
+            "events": sum(b["events"] for b in self.batches),
+            "batches": self.batches,
+        }
+
+
 class DataSource:
-    """Base class for data sources"""
-    
+    """Base class for data sources
+
+    Sources that implement list_batches() and open_batch() can be streamed
+    batch by batch and seeked through a RecordingIndex.
+    """
+
+    def __init__(self):
+        self._indexes = {}
+        self._index_lock = threading.Lock()
+
     def list_recordings(self):
         raise NotImplementedError
-    
+
     def download_recording(self, recording_id):
         raise NotImplementedError
 
+    def list_batches(self, recording_id):
+        """Batch references in playback order, or None if the recording doesn't exist"""
+        raise NotImplementedError
+
+    def open_batch(self, batch_ref):
+        """Binary file object with the gzipped content of one batch"""
+        raise NotImplementedError
+
+    def fetch_batches(self, batch_refs):
+        """Yield batch_refs in order as each becomes ready to open.
+
+        Remote sources override this to download ahead of the reader, so a
+        batch is decompressed while the following ones are still downloading.
+        """
+        return iter(batch_refs)
+
+    def iter_batch(self, batch_ref):
+        """Yield (event, raw line) for each rrweb event of a batch, decompressing as it reads"""
+        with closing(self.open_batch(batch_ref)) as raw, gzip.open(raw, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    console.print(
+                        f"[yellow]Warning: Invalid JSON in line: {line[:50]}...[/yellow]"
+                    )
+                    continue
+                # Validate event structure for rrweb
+                if isinstance(event, dict) and "type" in event and "timestamp" in event:
+                    yield event, line
+
+    @staticmethod
+    def _summarize(position, batch_ref):
+        return {
+            "batch": position,
+            "name": str(batch_ref).split("/")[-1],
+            "startTime": None,
+            "endTime": None,
+            "events": 0,
+            "keyframes": [],
+        }
+
+    @staticmethod
+    def _count(summary, event):
+        timestamp = event["timestamp"]
+        if summary["startTime"] is None or timestamp < summary["startTime"]:
+            summary["startTime"] = timestamp
+        if summary["endTime"] is None or timestamp > summary["endTime"]:
+            summary["endTime"] = timestamp
+        summary["events"] += 1
+        if event["type"] == META_EVENT_TYPE:
+            summary["keyframes"].append(timestamp)
+
+    def batch_index(self, recording_id):
+        """RecordingIndex for a recording, scanning its batches once if it isn't cached"""
+        with self._index_lock:
+            index = self._indexes.get(recording_id)
+        if index is not None:
+            return index
+
+        batch_refs = self.list_batches(recording_id)
+        if batch_refs is None:
+            return None
+        batches = []
+        for position, batch_ref in enumerate(self.fetch_batches(batch_refs)):
+            summary = self._summarize(position, batch_ref)
+            for event, _ in self.iter_batch(batch_ref):
+                self._count(summary, event)
+            batches.append(summary)
+
+        index = RecordingIndex(recording_id, batch_refs, batches)
+        with self._index_lock:
+            self._indexes[recording_id] = index
+        return index
+
+    def open_stream(self, recording_id, from_timestamp=None):
+        """Generator of NDJSON byte chunks for a recording, or None if it doesn't exist.
+
+        Streaming from the start also builds the recording's index. With
+        from_timestamp, batches before the closest preceding keyframe are skipped.
+        """
+        if from_timestamp is not None:
+            index = self.batch_index(recording_id)
+            if index is None:
+                return None
+            position, keyframe = index.start_for(from_timestamp)
+            return self._stream(recording_id, index.batch_refs, position, keyframe)
+
+        batch_refs = self.list_batches(recording_id)
+        if batch_refs is None:
+            return None
+        return self._stream(recording_id, batch_refs, 0, None)
+
+    def _stream(self, recording_id, batch_refs, start_position, keyframe):
+        build_index = start_position == 0 and keyframe is None
+        batches = []
+        fetched = self.fetch_batches(batch_refs[start_position:])
+        for position, batch_ref in enumerate(fetched, start_position):
+            summary = self._summarize(position, batch_ref)
+            chunk, size = [], 0
+            for event, line in self.iter_batch(batch_ref):
+                self._count(summary, event)
+                if keyframe is not None and event["timestamp"] < keyframe:
+                    continue
+                keyframe = None
+                chunk.append(line)
+                size += len(line) + 1
+                if size >= STREAM_CHUNK_BYTES:
+                    yield b"\n".join(chunk) + b"\n"
+                    chunk, size = [], 0
+            # Flush at every batch boundary so the player isn't kept waiting
+            if chunk:
+                yield b"\n".join(chunk) + b"\n"
+            batches.append(summary)
+
+        if build_index:
+            with self._index_lock:
+                self._indexes[recording_id] = RecordingIndex(
+                    recording_id, batch_refs, batches
+                )
+
 
 class LocalDataSource(DataSource):
     """Local file system data source"""
-    
+
     def __init__(self, recordings_dir):
+        super().__init__()
         self.recordings_dir = Path(recordings_dir)
-        console.print(f"[cyan]Using local recordings from:[/cyan] {self.recordings_dir}")
-    
+        console.print(
+            f"[cyan]Using local recordings from:[/cyan] {self.recordings_dir}"
+        )
+
     def list_recordings(self):
         """List local recordings"""
         recordings = []
-        
+
         if not self.recordings_dir.exists():
             return recordings
-        
+
         # Look for rrweb-* directories
         for item in self.recordings_dir.iterdir():
-            if item.is_dir() and item.name.startswith('rrweb-'):
+            if item.is_dir() and item.name.startswith("rrweb-"):
                 recording_id = item.name
-                
+
                 # Parse recording ID
-                parts = recording_id.split('-')
+                parts = recording_id.split("-")
                 if len(parts) >= 3:
                     timestamp = parts[1]
-                    session_id = '-'.join(parts[2:])
-                    
+                    session_id = "-".join(parts[2:])
+
                     # Try to get metadata
                     metadata = {}
-                    metadata_file = item / 'metadata.json'
+                    metadata_file = item / "metadata.json"
                     if metadata_file.exists():
-                        with open(metadata_file, 'r') as f:
+                        with open(metadata_file, "r") as f:
                             metadata = json.load(f)
-                    
-                    recordings.append({
-                        'id': recording_id,
-                        'sessionId': session_id,
-                        'timestamp': timestamp,
-                        'date': datetime.fromtimestamp(
-                            int(timestamp) / 1000
-                        ).strftime('%Y-%m-%d %H:%M:%S'),
-                        'events': metadata.get('totalEvents', 0),
-                        'duration': metadata.get('duration', 0)
-                    })
-        
-        recordings.sort(key=lambda x: x['timestamp'], reverse=True)
+
+                    recordings.append(
+                        {
+                            "id": recording_id,
+                            "sessionId": session_id,
+                            "timestamp": timestamp,
+                            "date": datetime.fromtimestamp(
+                                int(timestamp) / 1000
+                            ).strftime("%Y-%m-%d %H:%M:%S"),
+                            "events": metadata.get("totalEvents", 0),
+                            "duration": metadata.get("duration", 0),
+                        }
+                    )
+
+        recordings.sort(key=lambda x: x["timestamp"], reverse=True)
         return recordings
-    
+
     def download_recording(self, recording_id):
         """Load recording from local files"""
         recording_dir = self.recordings_dir / recording_id
-        
+
         if not recording_dir.exists():
             return None
-        
+
         all_events = []
         metadata = {}
-        
+
         # Load metadata if exists
-        metadata_file = recording_dir / 'metadata.json'
+        metadata_file = recording_dir / "metadata.json"
         if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
+            with open(metadata_file, "r") as f:
                 metadata = json.load(f)
-        
+
         # Load batch files
-        batch_files = sorted(recording_dir.glob('batch-*.ndjson.gz'))
-        
+        batch_files = sorted(recording_dir.glob("batch-*.ndjson.gz"))
+
         for batch_file in batch_files:
-            with gzip.open(batch_file, 'rt') as f:
+            with gzip.open(batch_file, "rt") as f:
                 for line in f:
                     if line.strip():
                         all_events.append(json.loads(line))
-        
-        return {
-            'metadata': metadata,
-            'events': all_events
-        }
+
+        return {"metadata": metadata, "events": all_events}
+
+    def list_batches(self, recording_id):
+        """Local batch files in name order"""
+        recording_dir = self.recordings_dir / recording_id
+        if not recording_dir.is_dir():
+            return None
+        return sorted(
+            path
+            for path in recording_dir.glob("batch-*")
+            if path.name.endswith(BATCH_SUFFIXES)
+        )
+
+    def open_batch(self, batch_ref):
+        return open(batch_ref, "rb")
+
+
+class BatchCache:
+    """Downloaded batch files on disk, evicted least recently used beyond max_bytes.
+
+    Files are named by the sha256 of (bucket, key, ETag), so a changed object
+    is never served from a stale copy and identical keys share one file.
+    """
+
+    def __init__(self, root, max_bytes):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # file name -> size, least recently used first
+        self.total_bytes = 0
+
+        for path in self.root.glob("*.part"):
+            path.unlink(missing_ok=True)  # Left over from an interrupted download
+        for path in sorted(self.root.glob("*.gz"), key=lambda p: p.stat().st_mtime):
+            size = path.stat().st_size
+            self._entries[path.name] = size
+            self.total_bytes += size
+
+    @staticmethod
+    def _name(bucket, key, etag):
+        return (
+            hashlib.sha256(f"{bucket}\0{key}\0{etag}".encode("utf-8")).hexdigest()
+            + ".gz"
+        )
+
+    def get(self, bucket, key, etag):
+        """Path of the cached copy, or None"""
+        name = self._name(bucket, key, etag)
+        with self._lock:
+            if name not in self._entries:
+                return None
+            self._entries.move_to_end(name)
+        path = self.root / name
+        try:
+            os.utime(path)  # Recency survives restarts
+        except FileNotFoundError:
+            with self._lock:
+                self.total_bytes -= self._entries.pop(name, 0)
+            return None
+        return path
+
+    def temp_path(self):
+        """Path to download into before put()"""
+        fd, path = tempfile.mkstemp(dir=self.root, suffix=".part")
+        os.close(fd)
+        return Path(path)
+
+    def put(self, bucket, key, etag, temp_path):
+        """Move a finished download into the cache and evict beyond the size cap"""
+        name = self._name(bucket, key, etag)
+        path = self.root / name
+        size = temp_path.stat().st_size
+        os.replace(temp_path, path)
+
+        evicted = []
+        with self._lock:
+            self.total_bytes -= self._entries.pop(name, 0)
+            self._entries[name] = size
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                oldest, oldest_size = self._entries.popitem(last=False)
+                self.total_bytes -= oldest_size
+                evicted.append(oldest)
+        for oldest in evicted:
+            (self.root / oldest).unlink(missing_ok=True)
+        return path
 
 
 class S3DataSource(DataSource):
-    """S3 data source"""
-    
-    def __init__(self, bucket, prefix=''):
-        self.s3_client = boto3.client('s3')
+    """S3 data source
+
+    Batches are downloaded by a pool of fetch_workers threads into a
+    BatchCache, so reopening a recording only lists or HEADs its objects.
+    """
+
+    def __init__(
+        self,
+        bucket,
+        prefix="",
+        cache_dir=REPLAY_CACHE_DIR,
+        cache_max_mb=REPLAY_CACHE_MAX_MB,
+        fetch_workers=REPLAY_FETCH_WORKERS,
+    ):
+        super().__init__()
+        self.s3_client = boto3.client("s3")
         self.bucket = bucket
-        self.prefix = prefix.rstrip('/')
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="bedrock_agentcore_replay_"))
-        
+        self.prefix = prefix.rstrip("/")
+        self.cache = (
+            BatchCache(cache_dir, cache_max_mb * 1024 * 1024)
+            if cache_max_mb > 0
+            else None
+        )
+        self.fetch_workers = max(1, fetch_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.fetch_workers, thread_name_prefix="replay-fetch"
+        )
+        self._etags = {}  # S3 key -> ETag from the latest listing or HEAD
+        self._inflight = {}  # S3 key -> Future of its download
+        self._fetch_lock = threading.Lock()
+        self._etags_lock = threading.Lock()
+        self.downloads = 0
+
         console.print(f"[cyan]Using S3 location:[/cyan]")
         console.print(f"  Bucket: {bucket}")
         console.print(f"  Prefix: {prefix}")
-    
+        if self.cache:
+            console.print(f"  Cache: {self.cache.root} (max {cache_max_mb} MB)")
+
     def cleanup(self):
-        """Clean up temp files"""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
+        """Stop background downloads"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def list_recordings(self):
         """List recordings from S3"""
         recordings = []
-        
+
         try:
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+
             # Look for any directories (not just rrweb-*)
             for page in paginator.paginate(
-                Bucket=self.bucket, 
-                Prefix=self.prefix,
-                Delimiter='/'
+                Bucket=self.bucket, Prefix=self.prefix, Delimiter="/"
             ):
-                if 'CommonPrefixes' in page:
-                    console.print(f"Found {len(page['CommonPrefixes'])} directories in prefix {self.prefix}")
-                    
-                    for prefix_info in page['CommonPrefixes']:
-                        prefix = prefix_info['Prefix']
-                        recording_id = prefix.rstrip('/').split('/')[-1]
-                        
+                if "CommonPrefixes" in page:
+                    console.print(
+                        f"Found {len(page['CommonPrefixes'])} directories in prefix {self.prefix}"
+                    )
+
+                    for prefix_info in page["CommonPrefixes"]:
+                        prefix = prefix_info["Prefix"]
+                        recording_id = prefix.rstrip("/").split("/")[-1]
+
                         # Check if it's a recording directory by looking for metadata.json
                         metadata = self._get_metadata(recording_id)
                         if metadata:
                             # This is a valid recording directory
-                            session_id = recording_id  # Use the folder name as the session ID
-                            timestamp = int(metadata.get('startTime', time.time() * 1000))
-                            
-                            recordings.append({
-                                'id': recording_id,
-                                'sessionId': session_id,
-                                'timestamp': timestamp,
-                                'date': datetime.fromtimestamp(
-                                    timestamp / 1000
-                                ).strftime('%Y-%m-%d %H:%M:%S'),
-                                'events': metadata.get('eventCount', 0),
-                                'duration': metadata.get('duration', 0)
-                            })
+                            session_id = (
+                                recording_id  # Use the folder name as the session ID
+                            )
+                            timestamp = int(
+                                metadata.get("startTime", time.time() * 1000)
+                            )
+
+                            recordings.append(
+                                {
+                                    "id": recording_id,
+                                    "sessionId": session_id,
+                                    "timestamp": timestamp,
+                                    "date": datetime.fromtimestamp(
+                                        timestamp / 1000
+                                    ).strftime("%Y-%m-%d %H:%M:%S"),
+                                    "events": metadata.get("eventCount", 0),
+                                    "duration": metadata.get("duration", 0),
+                                }
+                            )
                             console.print(f"✅ Found recording: {recording_id}")
                         else:
-                            console.print(f"⚠️ Directory without metadata: {recording_id}")
-                
-                recordings.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
+                            console.print(
+                                f"⚠️ Directory without metadata: {recording_id}"
+                            )
+
+                recordings.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
                 console.print(f"[green]Found {len(recordings)} recordings[/green]")
-                
+
             # If no recordings found with CommonPrefixes, try a direct list
             if not recordings:
                 console.print("Trying alternative method to find recordings...")
-                
+
                 # Get a flat list of all objects
                 all_objects = []
                 for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
-                    if 'Contents' in page:
-                        all_objects.extend(page['Contents'])
-                
+                    if "Contents" in page:
+                        all_objects.extend(page["Contents"])
+
                 # Extract unique directory names
                 dirs = set()
                 for obj in all_objects:
-                    key = obj['Key']
-                    if '/' in key[len(self.prefix):]:
-                        dir_name = key.split('/', 1)[0] if not self.prefix else key[len(self.prefix):].split('/', 1)[0]
+                    key = obj["Key"]
+                    if "/" in key[len(self.prefix) :]:
+                        dir_name = (
+                            key.split("/", 1)[0]
+                            if not self.prefix
+                            else key[len(self.prefix) :].split("/", 1)[0]
+                        )
                         dirs.add(dir_name)
-                
+
                 console.print(f"Found directories: {dirs}")
-                
+
                 # Check each directory for metadata
                 for dir_name in dirs:
                     metadata = self._get_metadata(dir_name)
                     if metadata:
                         session_id = dir_name
-                        timestamp = int(metadata.get('startTime', time.time() * 1000))
-                        
-                        recordings.append({
-                            'id': dir_name,
-                            'sessionId': session_id,
-                            'timestamp': timestamp,
-                            'date': datetime.fromtimestamp(
-                                timestamp / 1000
-                            ).strftime('%Y-%m-%d %H:%M:%S'),
-                            'events': metadata.get('eventCount', 0),
-                            'duration': metadata.get('duration', 0)
-                        })
-                
-                recordings.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
-                console.print(f"[green]Found {len(recordings)} recordings with alternative method[/green]")
-                
+                        timestamp = int(metadata.get("startTime", time.time() * 1000))
+
+                        recordings.append(
+                            {
+                                "id": dir_name,
+                                "sessionId": session_id,
+                                "timestamp": timestamp,
+                                "date": datetime.fromtimestamp(
+                                    timestamp / 1000
+                                ).strftime("%Y-%m-%d %H:%M:%S"),
+                                "events": metadata.get("eventCount", 0),
+                                "duration": metadata.get("duration", 0),
+                            }
+                        )
+
+                recordings.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
+                console.print(
+                    f"[green]Found {len(recordings)} recordings with alternative method[/green]"
+                )
+
         except Exception as e:
             console.print(f"[red]Error listing recordings: {e}[/red]")
             import traceback
+
             traceback.print_exc()
-        
+
         return recordings
-    
+
     def _get_metadata(self, recording_id):
         """Get metadata for a recording"""
         try:
@@ -752,102 +1349,90 @@ class S3DataSource(DataSource):
             keys_to_try = [
                 f"{self.prefix}/{recording_id}/metadata.json",
                 f"{recording_id}/metadata.json",
-                f"{self.prefix}{recording_id}/metadata.json"
+                f"{self.prefix}{recording_id}/metadata.json",
             ]
-            
+
             for key in keys_to_try:
                 try:
                     console.print(f"[dim]Trying metadata path: {key}[/dim]")
                     response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
-                    data = json.loads(response['Body'].read().decode('utf-8'))
+                    data = json.loads(response["Body"].read().decode("utf-8"))
                     console.print(f"[dim]Found metadata at: {key}[/dim]")
                     return data
                 except Exception as e:
                     console.print(f"[dim]No metadata at: {key} ({str(e)})[/dim]")
                     continue
-            
+
             return {}
         except Exception as e:
             console.print(f"[dim]Error getting metadata: {e}[/dim]")
             return {}
-    
+
     def download_recording(self, recording_id):
         """Download recording from S3"""
         console.print(f"[cyan]Downloading recording: {recording_id}[/cyan]")
-        
-        recording_dir = self.temp_dir / recording_id
-        recording_dir.mkdir(exist_ok=True)
-        
+
         try:
+            metadata = {}
+            batch_keys = self.list_batches(recording_id) or []
+            all_events = []
+            downloads_before = self.downloads
+
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
-                console=console
+                console=console,
             ) as progress:
-                
-                # List files for this recording
-                prefix = f"{self.prefix}/{recording_id}/" if self.prefix else f"{recording_id}/"
-                console.print(f"Looking for files with prefix: {prefix}")
-                
-                paginator = self.s3_client.get_paginator('list_objects_v2')
-                
-                files_to_download = []
-                for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
-                    if 'Contents' in page:
-                        for obj in page['Contents']:
-                            files_to_download.append(obj['Key'])
-                
-                # Download files
-                console.print(f"Downloading {len(files_to_download)} files")
-                task = progress.add_task(f"Downloading {len(files_to_download)} files...", total=len(files_to_download))
-                
-                all_events = []
-                metadata = {}
-                
-                for key in files_to_download:
-                    filename = key.split('/')[-1]
-                    local_path = recording_dir / filename
-                    
-                    self.s3_client.download_file(self.bucket, key, str(local_path))
+                metadata = self._get_metadata(recording_id)
+
+                # Batches download in parallel; each is decompressed as soon
+                # as it arrives, in order, while later ones are still fetched
+                console.print(f"Fetching {len(batch_keys)} batch files")
+                task = progress.add_task(
+                    f"Fetching {len(batch_keys)} batch files...", total=len(batch_keys)
+                )
+
+                for key in self.fetch_batches(batch_keys):
+                    try:
+                        for event, _ in self.iter_batch(key):
+                            all_events.append(event)
+                    except Exception as e:
+                        console.print(
+                            f"[yellow]Warning: Error processing batch file {key}: {e}[/yellow]"
+                        )
                     progress.advance(task)
-                    
-                    # Process file
-                    if filename == 'metadata.json':
-                        with open(local_path, 'r') as f:
-                            metadata = json.load(f)
-                    elif filename.startswith('batch-') and (filename.endswith('.ndjson.gz') or filename.endswith('.jsonl.gz')):
-                        try:
-                            with gzip.open(local_path, 'rt') as f:
-                                for line in f:
-                                    if line.strip():
-                                        try:
-                                            event_data = json.loads(line)
-                                            # Validate event structure for rrweb
-                                            if 'type' in event_data and 'timestamp' in event_data:
-                                                all_events.append(event_data)
-                                            else:
-                                                console.print(f"[yellow]Skipping invalid event: missing required fields[/yellow]")
-                                        except json.JSONDecodeError as e:
-                                            console.print(f"[yellow]Warning: Invalid JSON in line: {line[:50]}...[/yellow]")
-                        except Exception as e:
-                            console.print(f"[yellow]Warning: Error processing batch file {filename}: {e}[/yellow]")
-            
-            console.print(f"[green]✓ Downloaded {len(all_events)} events[/green]")
-            
+
+            if self.cache:
+                downloaded = self.downloads - downloads_before
+                console.print(
+                    f"[green]✓ Downloaded {len(all_events)} events "
+                    f"({len(batch_keys) - downloaded} of {len(batch_keys)} batches from cache)[/green]"
+                )
+            else:
+                console.print(f"[green]✓ Downloaded {len(all_events)} events[/green]")
+
             # If no events were parsed, check the files
             if len(all_events) == 0:
-                console.print("[yellow]Warning: No events were parsed from the batch files[/yellow]")
-                
+                console.print(
+                    "[yellow]Warning: No events were parsed from the batch files[/yellow]"
+                )
+
                 # Create sample events to prevent viewer from breaking
-                console.print("[yellow]Creating sample events to allow viewer to function[/yellow]")
+                console.print(
+                    "[yellow]Creating sample events to allow viewer to function[/yellow]"
+                )
                 timestamp = int(time.time() * 1000)
-                
+
                 # Create a minimal set of events for rrweb
                 all_events = [
                     {
                         "type": 2,  # Meta event
                         "timestamp": timestamp,
-                        "data": {"href": "https://example.com", "width": 1280, "height": 720}
+                        "data": {
+                            "href": "https://example.com",
+                            "width": 1280,
+                            "height": 720,
+                        },
                     },
                     {
                         "type": 4,  # DOM snapshot
@@ -868,98 +1453,210 @@ class S3DataSource(DataSource):
                                                 "childNodes": [
                                                     {
                                                         "type": 3,
-                                                        "textContent": "No recording data found - placeholder content"
+                                                        "textContent": "No recording data found - placeholder content",
                                                     }
-                                                ]
+                                                ],
                                             }
-                                        ]
+                                        ],
                                     }
-                                ]
+                                ],
                             }
-                        }
-                    }
+                        },
+                    },
                 ]
-                
-                # List downloaded files for debugging
-                console.print("Downloaded files:")
-                for path in recording_dir.iterdir():
-                    console.print(f"  - {path.name} ({path.stat().st_size} bytes)")
-            
-            return {
-                'metadata': metadata,
-                'events': all_events
-            }
-            
+
+                # List batch files for debugging
+                console.print("Batch files:")
+                for key in batch_keys:
+                    console.print(f"  - {key}")
+
+            return {"metadata": metadata, "events": all_events}
+
         except Exception as e:
             console.print(f"[red]Error downloading recording: {e}[/red]")
             import traceback
+
             traceback.print_exc()
             return None
 
+    def list_batches(self, recording_id):
+        """S3 keys of the recording's batch files in key order"""
+        prefix = f"{self.prefix}/{recording_id}/" if self.prefix else f"{recording_id}/"
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+
+        found = False
+        batch_keys = []
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                found = True
+                filename = obj["Key"].split("/")[-1]
+                if filename.startswith("batch-") and filename.endswith(BATCH_SUFFIXES):
+                    batch_keys.append(obj["Key"])
+                    if "ETag" in obj:
+                        self._set_etag(obj["Key"], obj["ETag"])
+        return sorted(batch_keys) if found else None
+
+    def open_batch(self, batch_ref):
+        """Cached copy of the batch, downloading it first if needed"""
+        if self.cache is None:
+            # Read straight from S3 as the body is decompressed
+            return self.s3_client.get_object(Bucket=self.bucket, Key=batch_ref)["Body"]
+
+        etag = self._get_etag(batch_ref)
+        path = self.cache.get(self.bucket, batch_ref, etag) if etag else None
+        if path is None:
+            path = self._fetch(batch_ref).result()
+        return open(path, "rb")
+
+    def fetch_batches(self, batch_refs):
+        """Yield batch keys in order once cached, downloading up to 2 * fetch_workers ahead"""
+        if self.cache is None:
+            yield from batch_refs
+            return
+
+        pending = iter(batch_refs)
+        window = deque()
+        for key in pending:
+            window.append((key, self._fetch(key)))
+            if len(window) >= 2 * self.fetch_workers:
+                break
+
+        while window:
+            key, future = window.popleft()
+            next_key = next(pending, None)
+            if next_key is not None:
+                window.append((next_key, self._fetch(next_key)))
+            try:
+                future.result()
+            except Exception as e:
+                console.print(
+                    f"[yellow]Warning: Could not download batch file {key}: {e}[/yellow]"
+                )
+                continue
+            yield key
+
+    def _fetch(self, key):
+        """Future for the cached path of key; concurrent requests share one download"""
+        with self._fetch_lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._executor.submit(self._download, key)
+                self._inflight[key] = future
+                future.add_done_callback(lambda done: self._forget_fetch(key, done))
+            return future
+
+    def _forget_fetch(self, key, future):
+        # May run inside _fetch while it holds the lock, so don't take it here
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    def _get_etag(self, key):
+        with self._etags_lock:
+            return self._etags.get(key)
+
+    def _set_etag(self, key, etag):
+        """Record key's ETag; listings and fetch workers update it concurrently"""
+        with self._etags_lock:
+            if etag is None:
+                self._etags.pop(key, None)
+            else:
+                self._etags[key] = etag
+
+    def _download(self, key):
+        etag = self._get_etag(key)
+        if etag is None:
+            # Not from a listing; a HEAD tells whether the cached copy is current
+            etag = self.s3_client.head_object(Bucket=self.bucket, Key=key)["ETag"]
+            self._set_etag(key, etag)
+        path = self.cache.get(self.bucket, key, etag)
+        if path is not None:
+            return path
+
+        temp_path = self.cache.temp_path()
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
+            with open(temp_path, "wb") as f:
+                for chunk in iter(lambda: response["Body"].read(1024 * 1024), b""):
+                    f.write(chunk)
+            # Key the copy by the ETag of what was actually downloaded
+            etag = response.get("ETag", etag)
+            self._set_etag(key, etag)
+            with self._fetch_lock:
+                self.downloads += 1
+            return self.cache.put(self.bucket, key, etag, temp_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
 
 class SessionReplayViewer:
     """Main session replay viewer"""
-    
+
     def __init__(self, data_source, port=8080):
         self.data_source = data_source
         self.port = port
         self.viewer_path = Path(__file__).parent.parent / "static" / "replay-viewer"
         self.server = None
-    
+
     def find_available_port(self):
         """Find an available port"""
         for port in range(self.port, self.port + 100):
             try:
                 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind(('127.0.0.1', port))
+                    s.bind(("127.0.0.1", port))
                     return port
             except OSError:
                 continue
         raise RuntimeError("No available ports found")
-    
+
     def start(self):
         """Start the replay viewer server"""
         # Ensure viewer directory exists
         self.viewer_path.mkdir(parents=True, exist_ok=True)
-        
+
         # Find available port
         port = self.find_available_port()
-        
+
         # Create request handler
         def handler_factory(*args, **kwargs):
-            return SessionReplayHandler(self.data_source, self.viewer_path, *args, **kwargs)
-        
-        # Start server
-        self.server = HTTPServer(('', port), handler_factory)
-        
+            return SessionReplayHandler(
+                self.data_source, self.viewer_path, *args, **kwargs
+            )
+
+        # Start server; each request gets its own thread so a long stream
+        # doesn't block the recordings list or other players
+        self.server = ThreadingHTTPServer(("", port), handler_factory)
+
         # Start in thread
         server_thread = threading.Thread(target=self.server.serve_forever)
         server_thread.daemon = True
         server_thread.start()
-        
+
         url = f"http://localhost:{port}"
-        
-        console.print(Panel(
-            f"[bold cyan]Session Replay Viewer Running[/bold cyan]\n\n"
-            f"URL: [link]{url}[/link]\n\n"
-            f"[yellow]Press Ctrl+C to stop[/yellow]",
-            title="Ready",
-            border_style="green"
-        ))
-        
+
+        console.print(
+            Panel(
+                f"[bold cyan]Session Replay Viewer Running[/bold cyan]\n\n"
+                f"URL: [link]{url}[/link]\n\n"
+                f"[yellow]Press Ctrl+C to stop[/yellow]",
+                title="Ready",
+                border_style="green",
+            )
+        )
+
         # Open browser
         webbrowser.open(url)
-        
+
         # Handle shutdown
         def signal_handler(sig, frame):
             console.print("\n[yellow]Shutting down...[/yellow]")
             self.server.shutdown()
-            if hasattr(self.data_source, 'cleanup'):
+            if hasattr(self.data_source, "cleanup"):
                 self.data_source.cleanup()
             sys.exit(0)
-        
+
         signal.signal(signal.SIGINT, signal_handler)
-        
+
         # Keep running
         try:
             while True:
@@ -967,56 +1664,47 @@ class SessionReplayViewer:
         except KeyboardInterrupt:
             console.print("\n[yellow]Shutting down...[/yellow]")
             self.server.shutdown()
-            if hasattr(self.data_source, 'cleanup'):
+            if hasattr(self.data_source, "cleanup"):
                 self.data_source.cleanup()
 
 
 def main():
     """Main entry point"""
     import argparse
-    
+
     parser = argparse.ArgumentParser(
         description="Session Replay Viewer - View browser session recordings"
     )
-    
+
     group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument(
-        '--local',
-        help='Path to local recordings directory'
-    )
-    group.add_argument(
-        '--s3',
-        help='S3 path to recordings (e.g., s3://bucket/prefix/)'
-    )
-    
+    group.add_argument("--local", help="Path to local recordings directory")
+    group.add_argument("--s3", help="S3 path to recordings (e.g., s3://bucket/prefix/)")
+
     parser.add_argument(
-        '--port',
-        type=int,
-        default=8080,
-        help='Port to run server on (default: 8080)'
+        "--port", type=int, default=8080, help="Port to run server on (default: 8080)"
     )
-    
+
     args = parser.parse_args()
-    
+
     # Create data source
     if args.local:
         data_source = LocalDataSource(args.local)
     else:
         # Parse S3 path
-        if not args.s3.startswith('s3://'):
+        if not args.s3.startswith("s3://"):
             console.print("[red]S3 path must start with s3://[/red]")
             sys.exit(1)
-        
-        path_parts = args.s3[5:].split('/', 1)
+
+        path_parts = args.s3[5:].split("/", 1)
         bucket = path_parts[0]
-        prefix = path_parts[1] if len(path_parts) > 1 else ''
-        
+        prefix = path_parts[1] if len(path_parts) > 1 else ""
+
         data_source = S3DataSource(bucket, prefix)
-    
+
     # Start viewer
     viewer = SessionReplayViewer(data_source, port=args.port)
     viewer.start()
 
 
-if __name__ == '__main__':
+if __name__ == "__main__":
     main()
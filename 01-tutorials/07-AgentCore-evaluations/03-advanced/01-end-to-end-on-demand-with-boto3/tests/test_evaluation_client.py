@@ -0,0 +1,229 @@
+"""Tests for retries and resume in EvaluationClient batch evaluation."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from botocore.exceptions import (  # noqa: E402
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
+
+from utils import evaluation_client  # noqa: E402
+from utils.evaluation_client import EvaluationClient  # noqa: E402
+from utils.models import EvaluationResult, EvaluationResults  # noqa: E402
+from utils.throttling import AdaptiveRateLimiter  # noqa: E402
+
+ENDPOINT = "https://bedrock-agentcore.us-east-1.amazonaws.com"
+SUCCESS = {"evaluationResults": [{"evaluatorId": "Builtin.Helpfulness", "value": 1.0}]}
+
+
+def client_error(code, status):
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": f"{code} message"},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        },
+        "Evaluate",
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(evaluation_client, "backoff_delay", lambda attempt: 0)
+
+
+@pytest.fixture
+def boto_client():
+    return Mock()
+
+
+@pytest.fixture
+def client(boto_client):
+    return EvaluationClient(region="us-east-1", boto_client=boto_client)
+
+
+def evaluate(client, max_retries=3, limiter=None, on_retry=None):
+    return client._evaluate_with_retry(
+        "Builtin.Helpfulness",
+        [],
+        None,
+        limiter=limiter or AdaptiveRateLimiter(max_rate=1000),
+        max_retries=max_retries,
+        on_retry=on_retry,
+    )
+
+
+class TestEvaluateWithRetry:
+    def test_throttling_is_retried_and_slows_the_limiter(self, client, boto_client):
+        boto_client.evaluate.side_effect = [
+            client_error("ThrottlingException", 400),
+            SUCCESS,
+        ]
+        limiter = AdaptiveRateLimiter(max_rate=1000)
+        on_retry = Mock()
+
+        assert evaluate(client, limiter=limiter, on_retry=on_retry) == SUCCESS
+        assert boto_client.evaluate.call_count == 2
+        assert limiter.throttled == 1
+        on_retry.assert_called_once()
+
+    def test_server_errors_are_retried(self, client, boto_client):
+        boto_client.evaluate.side_effect = [
+            client_error("InternalServerException", 500),
+            client_error("SomethingWentWrong", 503),
+            SUCCESS,
+        ]
+
+        assert evaluate(client) == SUCCESS
+        assert boto_client.evaluate.call_count == 3
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            EndpointConnectionError(endpoint_url=ENDPOINT),
+            ConnectTimeoutError(endpoint_url=ENDPOINT),
+            ReadTimeoutError(endpoint_url=ENDPOINT),
+            ConnectionClosedError(endpoint_url=ENDPOINT),
+        ],
+    )
+    def test_connection_errors_are_retried(self, client, boto_client, error):
+        boto_client.evaluate.side_effect = [error, SUCCESS]
+        limiter = AdaptiveRateLimiter(max_rate=1000)
+
+        assert evaluate(client, limiter=limiter) == SUCCESS
+        assert boto_client.evaluate.call_count == 2
+        assert limiter.throttled == 0
+
+    def test_connection_errors_fail_once_retries_run_out(self, client, boto_client):
+        boto_client.evaluate.side_effect = ReadTimeoutError(endpoint_url=ENDPOINT)
+
+        with pytest.raises(RuntimeError, match="connection error"):
+            evaluate(client, max_retries=2)
+        assert boto_client.evaluate.call_count == 3
+
+    def test_client_errors_are_not_retried(self, client, boto_client):
+        boto_client.evaluate.side_effect = client_error("ValidationException", 400)
+
+        with pytest.raises(RuntimeError, match="ValidationException"):
+            evaluate(client)
+        assert boto_client.evaluate.call_count == 1
+
+    def test_throttling_fails_once_retries_run_out(self, client, boto_client):
+        boto_client.evaluate.side_effect = client_error("ThrottlingException", 429)
+
+        with pytest.raises(RuntimeError, match="ThrottlingException"):
+            evaluate(client, max_retries=1)
+        assert boto_client.evaluate.call_count == 2
+
+
+def result_line(session_id, evaluator_id, value=1.0, error=None):
+    result = EvaluationResult(
+        evaluator_id=evaluator_id,
+        evaluator_name=evaluator_id,
+        evaluator_arn="",
+        explanation="",
+        context={"spanContext": {"sessionId": session_id}},
+        value=value,
+        error=error,
+    )
+    record = {
+        "session_id": session_id,
+        "requested_evaluator_id": evaluator_id,
+        **result.to_dict(),
+    }
+    return json.dumps(record) + "\n"
+
+
+def load(path, session_ids):
+    results = {
+        session_id: EvaluationResults(session_id=session_id)
+        for session_id in session_ids
+    }
+    completed = EvaluationClient._load_batch_results(path, results)
+    return completed, results
+
+
+class TestLoadBatchResults:
+    def test_missing_file_has_nothing_completed(self, tmp_path):
+        completed, results = load(tmp_path / "batch.jsonl", ["s1"])
+
+        assert completed == set()
+        assert results["s1"].results == []
+
+    def test_successful_pairs_are_loaded(self, tmp_path):
+        path = tmp_path / "batch.jsonl"
+        path.write_text(
+            result_line("s1", "Builtin.Helpfulness", 0.5)
+            + result_line("s1", "Builtin.Correctness", 0.7)
+            + result_line("s2", "Builtin.Helpfulness", error="boom")
+        )
+
+        completed, results = load(path, ["s1", "s2"])
+
+        assert completed == {
+            ("s1", "Builtin.Helpfulness"),
+            ("s1", "Builtin.Correctness"),
+        }
+        assert [r.value for r in results["s1"].results] == [0.5, 0.7]
+        assert results["s2"].results == []
+
+    def test_error_followed_by_success_is_completed(self, tmp_path):
+        path = tmp_path / "batch.jsonl"
+        path.write_text(
+            result_line("s1", "Builtin.Helpfulness", error="throttled")
+            + result_line("s2", "Builtin.Helpfulness", 0.9)
+            + result_line("s1", "Builtin.Helpfulness", 0.4)
+        )
+
+        completed, results = load(path, ["s1", "s2"])
+
+        assert ("s1", "Builtin.Helpfulness") in completed
+        assert [r.value for r in results["s1"].results] == [0.4]
+        assert all(r.error is None for r in results["s1"].results)
+
+    def test_success_followed_by_error_is_run_again(self, tmp_path):
+        path = tmp_path / "batch.jsonl"
+        path.write_text(
+            result_line("s1", "Builtin.Helpfulness", 0.4)
+            + result_line("s2", "Builtin.Helpfulness", 0.9)
+            + result_line("s1", "Builtin.Helpfulness", error="boom")
+        )
+
+        completed, results = load(path, ["s1", "s2"])
+
+        assert completed == {("s2", "Builtin.Helpfulness")}
+        assert results["s1"].results == []
+
+    def test_all_results_of_the_last_attempt_are_loaded(self, tmp_path):
+        path = tmp_path / "batch.jsonl"
+        path.write_text(
+            result_line("s1", "Builtin.ToolSelection", error="boom")
+            + result_line("s2", "Builtin.ToolSelection", 1.0)
+            + result_line("s1", "Builtin.ToolSelection", 0.1)
+            + result_line("s1", "Builtin.ToolSelection", 0.2)
+        )
+
+        completed, results = load(path, ["s1", "s2"])
+
+        assert ("s1", "Builtin.ToolSelection") in completed
+        assert [r.value for r in results["s1"].results] == [0.1, 0.2]
+
+    def test_truncated_line_and_unknown_sessions_are_skipped(self, tmp_path):
+        path = tmp_path / "batch.jsonl"
+        path.write_text(
+            result_line("other", "Builtin.Helpfulness", 1.0)
+            + result_line("s1", "Builtin.Helpfulness", 0.3)
+            + result_line("s1", "Builtin.Correctness", 0.6)[:25]
+        )
+
+        completed, results = load(path, ["s1"])
+
+        assert completed == {("s1", "Builtin.Helpfulness")}
+        assert [r.value for r in results["s1"].results] == [0.3]
@@ -0,0 +1,102 @@
+"""Tests for the batch evaluation rate limiter and retry backoff."""
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from utils import throttling  # noqa: E402
+from utils.constants import RETRY_BASE_DELAY_SECONDS, RETRY_MAX_DELAY_SECONDS  # noqa: E402
+from utils.throttling import AdaptiveRateLimiter, backoff_delay  # noqa: E402
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so pacing is deterministic."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(throttling.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(throttling.time, "sleep", fake.sleep)
+    return fake
+
+
+class TestAdaptiveRateLimiter:
+    def test_requests_are_spaced_at_the_rate(self, clock):
+        limiter = AdaptiveRateLimiter(max_rate=10)
+
+        for _ in range(4):
+            limiter.acquire()
+
+        assert clock.sleeps == pytest.approx([0.1, 0.1, 0.1])
+
+    def test_idle_time_does_not_build_up_a_burst(self, clock):
+        limiter = AdaptiveRateLimiter(max_rate=10)
+        limiter.acquire()
+        clock.now += 5
+
+        limiter.acquire()
+        limiter.acquire()
+
+        assert clock.sleeps == pytest.approx([0.1])
+
+    def test_throttle_halves_the_rate_down_to_min_rate(self):
+        limiter = AdaptiveRateLimiter(max_rate=8, min_rate=1)
+
+        limiter.on_throttle()
+        assert limiter.rate == 4
+        for _ in range(5):
+            limiter.on_throttle()
+
+        assert limiter.rate == 1
+        assert limiter.throttled == 6
+
+    def test_success_recovers_the_rate_up_to_max_rate(self):
+        limiter = AdaptiveRateLimiter(max_rate=10)
+        limiter.on_throttle()
+
+        limiter.on_success()
+        assert limiter.rate == pytest.approx(5.5)
+        for _ in range(20):
+            limiter.on_success()
+
+        assert limiter.rate == 10
+
+    def test_min_rate_never_exceeds_max_rate(self):
+        limiter = AdaptiveRateLimiter(max_rate=0.1, min_rate=0.2)
+
+        limiter.on_throttle()
+
+        assert limiter.rate == 0.1
+
+
+class TestBackoffDelay:
+    def test_delay_grows_exponentially_until_the_cap(self, monkeypatch):
+        monkeypatch.setattr(throttling.random, "uniform", lambda low, high: high)
+
+        delays = [backoff_delay(attempt) for attempt in range(12)]
+
+        assert delays[:3] == [
+            RETRY_BASE_DELAY_SECONDS,
+            2 * RETRY_BASE_DELAY_SECONDS,
+            4 * RETRY_BASE_DELAY_SECONDS,
+        ]
+        assert delays[-1] == RETRY_MAX_DELAY_SECONDS
+        assert delays == sorted(delays)
+
+    def test_delay_is_jittered_from_zero(self):
+        delays = [backoff_delay(3) for _ in range(200)]
+
+        assert all(0 <= delay <= 8 * RETRY_BASE_DELAY_SECONDS for delay in delays)
+        assert len(set(delays)) > 1
@@ -8,6 +8,28 @@ MAX_SPAN_IDS_IN_CONTEXT = int(os.getenv("AGENTCORE_MAX_SPAN_IDS", "20"))
 
 DEFAULT_RUNTIME_SUFFIX = "DEFAULT"
 
+# Batch Evaluation Configuration
+BATCH_MAX_WORKERS = int(os.getenv("AGENTCORE_EVAL_MAX_WORKERS", "16"))
+BATCH_FETCH_WORKERS = int(os.getenv("AGENTCORE_EVAL_FETCH_WORKERS", "4"))
+BATCH_REQUESTS_PER_SECOND = float(os.getenv("AGENTCORE_EVAL_MAX_RPS", "10"))
+BATCH_MAX_RETRIES = int(os.getenv("AGENTCORE_EVAL_MAX_RETRIES", "6"))
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 30.0
+
+# Errors worth retrying; throttling errors also slow the request rate down
+THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "ServiceQuotaExceededException",
+}
+TRANSIENT_ERROR_CODES = {
+    "InternalServerException",
+    "ServiceUnavailableException",
+    "RequestTimeout",
+    "RequestTimeoutException",
+}
+
 # Dashboard Configuration
 EVALUATION_OUTPUT_DIR = "evaluation_output"
 EVALUATION_INPUT_DIR = "evaluation_input"
@@ -47,4 +69,5 @@ FLEXIBLE_SCOPED_EVALUATORS = {
 
 class AttributePrefixes:
     """OpenTelemetry attribute prefixes."""
-    GEN_AI = "gen_ai"
\ No newline at end of file
+
+    GEN_AI = "gen_ai"
@@ -1,17 +1,33 @@
 """Client for AgentCore Evaluation DataPlane API."""
 
 import json
+import math
 import os
+import threading
+import time
 import webbrowser
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import (
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
 
 from .cloudwatch_client import ObservabilityClient
 from .constants import (
+    BATCH_FETCH_WORKERS,
+    BATCH_MAX_RETRIES,
+    BATCH_MAX_WORKERS,
+    BATCH_REQUESTS_PER_SECOND,
     DASHBOARD_DATA_FILE,
     DASHBOARD_HTML_FILE,
     DEFAULT_FILE_ENCODING,
@@ -21,8 +37,19 @@ from .constants import (
     EVALUATION_OUTPUT_PATTERN,
     SESSION_SCOPED_EVALUATORS,
     SPAN_SCOPED_EVALUATORS,
+    THROTTLING_ERROR_CODES,
+    TRANSIENT_ERROR_CODES,
 )
 from .models import EvaluationRequest, EvaluationResult, EvaluationResults, TraceData
+from .throttling import AdaptiveRateLimiter, backoff_delay
+
+# Requests that got no response from the service; retried like transient errors
+CONNECTION_ERRORS = (
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
 
 
 class EvaluationClient:
@@ -30,9 +57,7 @@ class EvaluationClient:
 
     DEFAULT_REGION = "us-east-1"
 
-    def __init__(
-        self, region: Optional[str] = None, boto_client: Optional[Any] = None
-    ):
+    def __init__(self, region: Optional[str] = None, boto_client: Optional[Any] = None):
         """Initialize evaluation client.
 
         Args:
@@ -40,7 +65,7 @@ class EvaluationClient:
             boto_client: Optional pre-configured boto3 client for testing
         """
         self.region = region or os.getenv("AGENTCORE_EVAL_REGION", self.DEFAULT_REGION)
-        
+
         if boto_client:
             self.client = boto_client
         else:
@@ -67,19 +92,30 @@ class EvaluationClient:
 
         elif scope == "trace":
             if evaluator_id in SESSION_SCOPED_EVALUATORS:
-                raise ValueError(f"{evaluator_id} requires session scope (cannot use trace scope)")
+                raise ValueError(
+                    f"{evaluator_id} requires session scope (cannot use trace scope)"
+                )
             if evaluator_id in SPAN_SCOPED_EVALUATORS:
-                raise ValueError(f"{evaluator_id} requires span scope (cannot use trace scope)")
+                raise ValueError(
+                    f"{evaluator_id} requires span scope (cannot use trace scope)"
+                )
 
         elif scope == "session":
             if evaluator_id in SPAN_SCOPED_EVALUATORS:
-                raise ValueError(f"{evaluator_id} requires span scope (cannot use session scope)")
+                raise ValueError(
+                    f"{evaluator_id} requires span scope (cannot use session scope)"
+                )
 
         else:
-            raise ValueError(f"Invalid scope: {scope}. Must be 'session', 'trace', or 'span'")
+            raise ValueError(
+                f"Invalid scope: {scope}. Must be 'session', 'trace', or 'span'"
+            )
 
     def _build_evaluation_target(
-        self, scope: str, trace_id: Optional[str] = None, span_ids: Optional[List[str]] = None
+        self,
+        scope: str,
+        trace_id: Optional[str] = None,
+        span_ids: Optional[List[str]] = None,
     ) -> Optional[Dict[str, Any]]:
         """Build evaluationTarget based on scope.
 
@@ -108,7 +144,9 @@ class EvaluationClient:
             return {"spanIds": span_ids}
 
         else:
-            raise ValueError(f"Invalid scope: {scope}. Must be 'session', 'trace', or 'span'")
+            raise ValueError(
+                f"Invalid scope: {scope}. Must be 'session', 'trace', or 'span'"
+            )
 
     def _extract_raw_spans(self, trace_data: TraceData) -> List[Dict[str, Any]]:
         """Extract raw span documents from TraceData.
@@ -131,7 +169,9 @@ class EvaluationClient:
 
         return raw_spans
 
-    def _filter_relevant_spans(self, raw_spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _filter_relevant_spans(
+        self, raw_spans: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """Filter to only high-signal spans for evaluation.
 
         Keeps only:
@@ -177,19 +217,28 @@ class EvaluationClient:
         relevant_spans = self._filter_relevant_spans(raw_spans)
 
         def get_timestamp(span_doc):
-            return span_doc.get("startTimeUnixNano") or span_doc.get("timeUnixNano") or 0
+            return (
+                span_doc.get("startTimeUnixNano") or span_doc.get("timeUnixNano") or 0
+            )
 
         relevant_spans.sort(key=get_timestamp, reverse=True)
 
         return relevant_spans[:max_items]
 
-    def _fetch_session_data(self, session_id: str, agent_id: str, region: str) -> TraceData:
+    def _fetch_session_data(
+        self,
+        session_id: str,
+        agent_id: str,
+        region: str,
+        obs_client: Optional[ObservabilityClient] = None,
+    ) -> TraceData:
         """Fetch session data from CloudWatch.
 
         Args:
             session_id: Session ID to fetch
             agent_id: Agent ID for filtering
             region: AWS region
+            obs_client: Optional ObservabilityClient to reuse (e.g. shared across batch threads)
 
         Returns:
             TraceData with session spans and logs
@@ -197,7 +246,12 @@ class EvaluationClient:
         Raises:
             RuntimeError: If session data cannot be fetched
         """
-        obs_client = ObservabilityClient(region_name=region, agent_id=agent_id, runtime_suffix=DEFAULT_RUNTIME_SUFFIX)
+        if obs_client is None:
+            obs_client = ObservabilityClient(
+                region_name=region,
+                agent_id=agent_id,
+                runtime_suffix=DEFAULT_RUNTIME_SUFFIX,
+            )
 
         end_time = datetime.now()
         start_time = end_time - timedelta(days=7)
@@ -206,7 +260,10 @@ class EvaluationClient:
 
         try:
             trace_data = obs_client.get_session_data(
-                session_id=session_id, start_time_ms=start_time_ms, end_time_ms=end_time_ms, include_runtime_logs=True
+                session_id=session_id,
+                start_time_ms=start_time_ms,
+                end_time_ms=end_time_ms,
+                include_runtime_logs=True,
             )
         except Exception as e:
             raise RuntimeError(f"Failed to fetch session data: {e}") from e
@@ -225,12 +282,17 @@ class EvaluationClient:
         Returns:
             Tuple of (spans_count, logs_count, genai_spans_count)
         """
-        spans_count = sum(1 for item in raw_spans if "spanId" in item and "startTimeUnixNano" in item)
-        logs_count = sum(1 for item in raw_spans if "body" in item and "timeUnixNano" in item)
+        spans_count = sum(
+            1 for item in raw_spans if "spanId" in item and "startTimeUnixNano" in item
+        )
+        logs_count = sum(
+            1 for item in raw_spans if "body" in item and "timeUnixNano" in item
+        )
         genai_spans = sum(
             1
             for span in raw_spans
-            if "spanId" in span and any(k.startswith("gen_ai") for k in span.get("attributes", {}).keys())
+            if "spanId" in span
+            and any(k.startswith("gen_ai") for k in span.get("attributes", {}).keys())
         )
         return spans_count, logs_count, genai_spans
 
@@ -251,6 +313,7 @@ class EvaluationClient:
             Path to saved file
         """
         from .constants import EVALUATION_INPUT_DIR
+
         os.makedirs(EVALUATION_INPUT_DIR, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -276,7 +339,11 @@ class EvaluationClient:
         os.makedirs(EVALUATION_OUTPUT_DIR, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        session_short = results.session_id[:16] if len(results.session_id) > 16 else results.session_id
+        session_short = (
+            results.session_id[:16]
+            if len(results.session_id) > 16
+            else results.session_id
+        )
         filename = f"{EVALUATION_OUTPUT_DIR}/output_{session_short}_{timestamp}.json"
 
         with open(filename, "w", encoding=DEFAULT_FILE_ENCODING) as f:
@@ -297,7 +364,9 @@ class EvaluationClient:
         output_dir = Path.cwd() / EVALUATION_OUTPUT_DIR
 
         if not output_dir.exists():
-            raise FileNotFoundError(f"Directory '{EVALUATION_OUTPUT_DIR}' does not exist")
+            raise FileNotFoundError(
+                f"Directory '{EVALUATION_OUTPUT_DIR}' does not exist"
+            )
 
         if not output_dir.is_dir():
             raise NotADirectoryError(f"'{EVALUATION_OUTPUT_DIR}' is not a directory")
@@ -317,6 +386,7 @@ class EvaluationClient:
             List of Path objects for input JSON files found
         """
         from .constants import EVALUATION_INPUT_DIR
+
         input_dir = Path.cwd() / EVALUATION_INPUT_DIR
 
         if not input_dir.exists() or not input_dir.is_dir():
@@ -324,7 +394,9 @@ class EvaluationClient:
 
         return list(input_dir.glob("input_*.json"))
 
-    def _extract_trace_data_from_input(self, input_file: Path) -> Optional[Dict[str, Any]]:
+    def _extract_trace_data_from_input(
+        self, input_file: Path
+    ) -> Optional[Dict[str, Any]]:
         """Parse input file and extract trace-level information.
 
         Args:
@@ -383,10 +455,17 @@ class EvaluationClient:
                             if "toolUse" in message_str:
                                 try:
                                     # Content might be double-encoded JSON
-                                    parsed = json.loads(message_str) if message_str.startswith("[") else None
+                                    parsed = (
+                                        json.loads(message_str)
+                                        if message_str.startswith("[")
+                                        else None
+                                    )
                                     if isinstance(parsed, list):
                                         for item in parsed:
-                                            if isinstance(item, dict) and "toolUse" in item:
+                                            if (
+                                                isinstance(item, dict)
+                                                and "toolUse" in item
+                                            ):
                                                 tool_name = item["toolUse"].get("name")
                                                 if tool_name:
                                                     tools_used.append(tool_name)
@@ -399,7 +478,9 @@ class EvaluationClient:
                 tools_with_counts[tool] = tools_with_counts.get(tool, 0) + 1
 
             # Get timestamps for this trace
-            timestamps = [span.get("timeUnixNano") for span in spans if span.get("timeUnixNano")]
+            timestamps = [
+                span.get("timeUnixNano") for span in spans if span.get("timeUnixNano")
+            ]
             min_timestamp = min(timestamps) if timestamps else None
             max_timestamp = max(timestamps) if timestamps else None
 
@@ -415,7 +496,9 @@ class EvaluationClient:
             # Calculate latency in milliseconds if timestamps available
             latency_ms = None
             if min_timestamp and max_timestamp:
-                latency_ms = (max_timestamp - min_timestamp) / 1_000_000  # Convert nanoseconds to milliseconds
+                latency_ms = (
+                    max_timestamp - min_timestamp
+                ) / 1_000_000  # Convert nanoseconds to milliseconds
 
             return {
                 "session_id": session_id,
@@ -440,9 +523,7 @@ class EvaluationClient:
             return None
 
     def _match_input_output_files(
-        self,
-        output_files: List[Path],
-        input_files: List[Path]
+        self, output_files: List[Path], input_files: List[Path]
     ) -> Dict[str, Optional[Dict[str, Any]]]:
         """Match output files to their input files and extract trace data.
 
@@ -464,7 +545,9 @@ class EvaluationClient:
 
         return trace_data_map
 
-    def _aggregate_evaluation_data(self, json_files: List[Path]) -> List[Dict[str, Any]]:
+    def _aggregate_evaluation_data(
+        self, json_files: List[Path]
+    ) -> List[Dict[str, Any]]:
         """Aggregate evaluation data from JSON files by session_id with trace-level detail.
 
         Args:
@@ -499,7 +582,7 @@ class EvaluationClient:
                             "metadata": data.get("metadata", {}),
                             "source_files": [],
                             "evaluation_runs": 0,
-                            "traces": {}  # New: map of trace_id to trace data
+                            "traces": {},  # New: map of trace_id to trace data
                         }
 
                     # Only increment if there are actual results
@@ -531,19 +614,29 @@ class EvaluationClient:
                                         "span_count": trace_data.get("span_count", 0),
                                         "timestamp": trace_data.get("timestamp"),
                                         "latency_ms": trace_data.get("latency_ms"),
-                                        "input_tokens": trace_data.get("input_tokens", 0),
-                                        "output_tokens": trace_data.get("output_tokens", 0),
-                                        "total_tokens": trace_data.get("total_tokens", 0),
+                                        "input_tokens": trace_data.get(
+                                            "input_tokens", 0
+                                        ),
+                                        "output_tokens": trace_data.get(
+                                            "output_tokens", 0
+                                        ),
+                                        "total_tokens": trace_data.get(
+                                            "total_tokens", 0
+                                        ),
                                     }
 
                                 # Add result to this trace
-                                sessions_map[session_id]["traces"][trace_id]["results"].append(result)
+                                sessions_map[session_id]["traces"][trace_id][
+                                    "results"
+                                ].append(result)
 
                     sessions_map[session_id]["source_files"].append(json_file.name)
 
                     # Merge metadata (later files override earlier ones)
                     if data.get("metadata"):
-                        sessions_map[session_id]["metadata"].update(data.get("metadata", {}))
+                        sessions_map[session_id]["metadata"].update(
+                            data.get("metadata", {})
+                        )
 
             except json.JSONDecodeError as e:
                 skipped_files.append((json_file.name, f"JSON decode error: {e}"))
@@ -594,7 +687,9 @@ if (typeof window !== 'undefined') {{
             with open(dashboard_data_path, "w", encoding=DEFAULT_FILE_ENCODING) as f:
                 f.write(js_content)
         except PermissionError as e:
-            raise IOError(f"Permission denied writing to {DASHBOARD_DATA_FILE}: {e}") from e
+            raise IOError(
+                f"Permission denied writing to {DASHBOARD_DATA_FILE}: {e}"
+            ) from e
         except Exception as e:
             raise IOError(f"Failed to write {DASHBOARD_DATA_FILE}: {e}") from e
 
@@ -665,9 +760,12 @@ if (typeof window !== 'undefined') {{
             # Step 3: Write dashboard data file
             dashboard_data_path = self._write_dashboard_data(evaluation_data)
 
-            total_evaluations = sum(len(session.get("results", [])) for session in evaluation_data)
+            total_evaluations = sum(
+                len(session.get("results", [])) for session in evaluation_data
+            )
             print(
-                f"Dashboard data generated: {len(evaluation_data)} session(s), " f"{total_evaluations} evaluation(s)"
+                f"Dashboard data generated: {len(evaluation_data)} session(s), "
+                f"{total_evaluations} evaluation(s)"
             )
 
             # Step 4: Open dashboard in browser
@@ -683,7 +781,10 @@ if (typeof window !== 'undefined') {{
             print(f"Unexpected error creating dashboard: {e}")
 
     def evaluate(
-        self, evaluator_id: str, session_spans: List[Dict[str, Any]], evaluation_target: Optional[Dict[str, Any]] = None
+        self,
+        evaluator_id: str,
+        session_spans: List[Dict[str, Any]],
+        evaluation_target: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Call evaluation API with transformed spans.
 
@@ -698,19 +799,226 @@ if (typeof window !== 'undefined') {{
         Raises:
             RuntimeError: If API call fails
         """
+        try:
+            return self._call_evaluate_api(
+                evaluator_id, session_spans, evaluation_target
+            )
+        except ClientError as e:
+            raise self._api_error(e) from e
+
+    def _call_evaluate_api(
+        self,
+        evaluator_id: str,
+        session_spans: List[Dict[str, Any]],
+        evaluation_target: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Send one evaluate request; ClientError propagates."""
         request = EvaluationRequest(
-            evaluator_id=evaluator_id, session_spans=session_spans, evaluation_target=evaluation_target
+            evaluator_id=evaluator_id,
+            session_spans=session_spans,
+            evaluation_target=evaluation_target,
         )
 
         evaluator_id_param, request_body = request.to_api_request()
+        return self.client.evaluate(evaluatorId=evaluator_id_param, **request_body)
+
+    @staticmethod
+    def _api_error(error: ClientError) -> RuntimeError:
+        error_code = error.response.get("Error", {}).get("Code", "Unknown")
+        error_msg = error.response.get("Error", {}).get("Message", str(error))
+        return RuntimeError(f"Evaluation API error ({error_code}): {error_msg}")
+
+    def _evaluate_with_retry(
+        self,
+        evaluator_id: str,
+        session_spans: List[Dict[str, Any]],
+        evaluation_target: Optional[Dict[str, Any]],
+        limiter: AdaptiveRateLimiter,
+        max_retries: int,
+        on_retry: Optional[Callable[[], None]] = None,
+    ) -> Dict[str, Any]:
+        """Call evaluation API through a shared rate limiter, retrying throttling, transient and connection errors.
+
+        Args:
+            evaluator_id: Single evaluator identifier
+            session_spans: List of OpenTelemetry-formatted span documents
+            evaluation_target: Optional dict with spanIds or traceIds to evaluate
+            limiter: Rate limiter shared by all concurrent calls
+            max_retries: Retries after the first attempt
+            on_retry: Called before each retry
+
+        Returns:
+            Raw API response with evaluationResults
+
+        Raises:
+            RuntimeError: If the call fails with a non-retryable error or retries run out
+        """
+        for attempt in range(max_retries + 1):
+            limiter.acquire()
+            try:
+                response = self._call_evaluate_api(
+                    evaluator_id, session_spans, evaluation_target
+                )
+                limiter.on_success()
+                return response
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+                if error_code in THROTTLING_ERROR_CODES or status == 429:
+                    limiter.on_throttle()
+                elif error_code not in TRANSIENT_ERROR_CODES and status < 500:
+                    raise self._api_error(e) from e
+                if attempt == max_retries:
+                    raise self._api_error(e) from e
+            except CONNECTION_ERRORS as e:
+                if attempt == max_retries:
+                    raise RuntimeError(f"Evaluation API connection error: {e}") from e
+            if on_retry:
+                on_retry()
+            time.sleep(backoff_delay(attempt))
+
+    def _prepare_session(
+        self,
+        session_id: str,
+        agent_id: str,
+        region: str,
+        scope: str,
+        trace_id: Optional[str] = None,
+        span_filter: Optional[Dict[str, str]] = None,
+        obs_client: Optional[ObservabilityClient] = None,
+        verbose: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Fetch a session once and build the spans and target shared by all evaluators.
+
+        Args:
+            session_id: Session ID to evaluate
+            agent_id: Agent ID for fetching session data
+            region: AWS region for ObservabilityClient
+            scope: Evaluation scope - "session", "trace", or "span"
+            trace_id: Trace ID for trace scope (optional)
+            span_filter: Filter for span scope (optional dict, e.g., {"tool_name": "calculate_bmi"})
+            obs_client: Optional ObservabilityClient to reuse
+            verbose: If False, skip the per-session progress output
+
+        Returns:
+            Tuple of (otel_spans, evaluation_target)
+
+        Raises:
+            RuntimeError: If session data cannot be fetched
+            ValueError: If no tool execution spans are found for span scope
+        """
+        log = print if verbose else (lambda *args, **kwargs: None)
+
+        trace_data = self._fetch_session_data(
+            session_id, agent_id, region, obs_client=obs_client
+        )
+
+        num_traces = len(trace_data.get_trace_ids())
+        num_spans = len(trace_data.spans)
+        log(f"Found {num_spans} spans across {num_traces} traces in session")
+
+        # Auto-discover span IDs if scope is "span"
+        span_ids = None
+        if scope == "span":
+            tool_name_filter = (span_filter or {}).get("tool_name")
+            span_ids = trace_data.get_tool_execution_spans(
+                tool_name_filter=tool_name_filter
+            )
+
+            if not span_ids:
+                filter_msg = (
+                    f" (filter: tool_name={tool_name_filter})"
+                    if tool_name_filter
+                    else ""
+                )
+                raise ValueError(
+                    f"No tool execution spans found in session{filter_msg}"
+                )
+
+            log(f"Found {len(span_ids)} tool execution spans for evaluation")
+
+        # Build evaluation target based on scope
+        evaluation_target = self._build_evaluation_target(
+            scope=scope, trace_id=trace_id, span_ids=span_ids
+        )
+
+        if evaluation_target:
+            target_type = "traceIds" if "traceIds" in evaluation_target else "spanIds"
+            target_ids = evaluation_target[target_type]
+            log(f"Evaluation target: {target_type} = {target_ids}")
+
+        log(f"Collecting most recent {DEFAULT_MAX_EVALUATION_ITEMS} relevant items")
+        otel_spans = self._get_most_recent_session_spans(
+            trace_data, max_items=DEFAULT_MAX_EVALUATION_ITEMS
+        )
+
+        if not otel_spans:
+            print(
+                f"Warning: No relevant items found after filtering for session {session_id}"
+            )
+
+        spans_count, logs_count, genai_spans = self._count_span_types(otel_spans)
+        log(
+            f"Sending {len(otel_spans)} items "
+            f"({spans_count} spans [{genai_spans} with gen_ai attrs], "
+            f"{logs_count} log events) to evaluation API"
+        )
 
+        return otel_spans, evaluation_target
+
+    @staticmethod
+    def _error_result(
+        session_id: str, evaluator_id: str, error: Exception
+    ) -> EvaluationResult:
+        """Build the result recorded when an evaluator could not be run for a session."""
+        return EvaluationResult(
+            evaluator_id=evaluator_id,
+            evaluator_name=evaluator_id,
+            evaluator_arn="",
+            explanation=f"Evaluation failed: {str(error)}",
+            context={"spanContext": {"sessionId": session_id}},
+            error=str(error),
+        )
+
+    def _run_evaluator(
+        self,
+        session_id: str,
+        evaluator_id: str,
+        otel_spans: List[Dict[str, Any]],
+        evaluation_target: Optional[Dict[str, Any]],
+        evaluate_fn: Callable[..., Dict[str, Any]],
+    ) -> List[EvaluationResult]:
+        """Run one evaluator on prepared spans; failures become error results instead of raising.
+
+        Args:
+            session_id: Session ID being evaluated
+            evaluator_id: Single evaluator identifier
+            otel_spans: Spans to send to the API
+            evaluation_target: Optional dict with spanIds or traceIds to evaluate
+            evaluate_fn: Callable with the signature of evaluate()
+
+        Returns:
+            List of EvaluationResult, one per API result
+        """
         try:
-            response = self.client.evaluate(evaluatorId=evaluator_id_param, **request_body)
-            return response
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_msg = e.response.get("Error", {}).get("Message", str(e))
-            raise RuntimeError(f"Evaluation API error ({error_code}): {error_msg}") from e
+            response = evaluate_fn(
+                evaluator_id=evaluator_id,
+                session_spans=otel_spans,
+                evaluation_target=evaluation_target,
+            )
+
+            api_results = response.get("evaluationResults", [])
+
+            if not api_results:
+                print(f"Warning: Evaluator {evaluator_id} returned no results")
+
+            return [
+                EvaluationResult.from_api_response(api_result)
+                for api_result in api_results
+            ]
+
+        except Exception as e:
+            return [self._error_result(session_id, evaluator_id, e)]
 
     def evaluate_session(
         self,
@@ -758,43 +1066,13 @@ if (typeof window !== 'undefined') {{
         for evaluator_id in evaluator_ids:
             self._validate_scope_compatibility(evaluator_id, scope)
 
-        trace_data = self._fetch_session_data(session_id, agent_id, region)
-
-        num_traces = len(trace_data.get_trace_ids())
-        num_spans = len(trace_data.spans)
-        print(f"Found {num_spans} spans across {num_traces} traces in session")
-
-        # Auto-discover span IDs if scope is "span"
-        span_ids = None
-        if scope == "span":
-            tool_name_filter = (span_filter or {}).get("tool_name")
-            span_ids = trace_data.get_tool_execution_spans(tool_name_filter=tool_name_filter)
-
-            if not span_ids:
-                filter_msg = f" (filter: tool_name={tool_name_filter})" if tool_name_filter else ""
-                raise ValueError(f"No tool execution spans found in session{filter_msg}")
-
-            print(f"Found {len(span_ids)} tool execution spans for evaluation")
-
-        # Build evaluation target based on scope
-        evaluation_target = self._build_evaluation_target(scope=scope, trace_id=trace_id, span_ids=span_ids)
-
-        if evaluation_target:
-            target_type = "traceIds" if "traceIds" in evaluation_target else "spanIds"
-            target_ids = evaluation_target[target_type]
-            print(f"Evaluation target: {target_type} = {target_ids}")
-
-        print(f"Collecting most recent {DEFAULT_MAX_EVALUATION_ITEMS} relevant items")
-        otel_spans = self._get_most_recent_session_spans(trace_data, max_items=DEFAULT_MAX_EVALUATION_ITEMS)
-
-        if not otel_spans:
-            print("Warning: No relevant items found after filtering")
-
-        spans_count, logs_count, genai_spans = self._count_span_types(otel_spans)
-        print(
-            f"Sending {len(otel_spans)} items "
-            f"({spans_count} spans [{genai_spans} with gen_ai attrs], "
-            f"{logs_count} log events) to evaluation API"
+        otel_spans, evaluation_target = self._prepare_session(
+            session_id,
+            agent_id,
+            region,
+            scope,
+            trace_id=trace_id,
+            span_filter=span_filter,
         )
 
         # Save input if requested (only the spans sent to API)
@@ -804,30 +1082,10 @@ if (typeof window !== 'undefined') {{
         results = EvaluationResults(session_id=session_id, metadata=metadata)
 
         for evaluator_id in evaluator_ids:
-            try:
-                response = self.evaluate(
-                    evaluator_id=evaluator_id, session_spans=otel_spans, evaluation_target=evaluation_target
-                )
-
-                api_results = response.get("evaluationResults", [])
-
-                if not api_results:
-                    print(f"Warning: Evaluator {evaluator_id} returned no results")
-
-                for api_result in api_results:
-                    result = EvaluationResult.from_api_response(api_result)
-                    results.add_result(result)
-
-            except Exception as e:
-                error_result = EvaluationResult(
-                    evaluator_id=evaluator_id,
-                    evaluator_name=evaluator_id,
-                    evaluator_arn="",
-                    explanation=f"Evaluation failed: {str(e)}",
-                    context={"spanContext": {"sessionId": session_id}},
-                    error=str(e),
-                )
-                results.add_result(error_result)
+            for result in self._run_evaluator(
+                session_id, evaluator_id, otel_spans, evaluation_target, self.evaluate
+            ):
+                results.add_result(result)
 
         # results.input_data = {"spans": otel_spans} # commenting out, will think later if this is meaningful to add
 
@@ -841,6 +1099,296 @@ if (typeof window !== 'undefined') {{
                 self._create_dashboard()
             else:
                 print("Warning: auto_create_dashboard requires auto_save_output=True")
-                print("Dashboard not created. Set auto_save_output=True to enable dashboard generation.")
+                print(
+                    "Dashboard not created. Set auto_save_output=True to enable dashboard generation."
+                )
+
+        return results
+
+    @staticmethod
+    def _load_batch_results(
+        results_path: Path, results: Dict[str, EvaluationResults]
+    ) -> set:
+        """Load successful results from an earlier run of the same batch file.
+
+        A pair's results are written as consecutive lines, and a failed pair is
+        appended again when it is retried, so only a pair's last block of lines
+        counts: it is complete if none of them is an error.
+
+        Args:
+            results_path: JSONL file written by evaluate_sessions
+            results: Per-session results to add the loaded results to
+
+        Returns:
+            Set of (session_id, evaluator_id) pairs that already succeeded
+        """
+        completed = set()
+        if not results_path.exists():
+            return completed
+
+        attempts: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        previous = None
+        with open(results_path, "r", encoding=DEFAULT_FILE_ENCODING) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Last line may be cut short if the previous run was killed mid-write
+                    previous = None
+                    continue
+                pair = (record.get("session_id"), record.get("requested_evaluator_id"))
+                if pair != previous:
+                    attempts[pair] = []
+                attempts[pair].append(record)
+                previous = pair
+
+        for (session_id, evaluator_id), records in attempts.items():
+            if session_id not in results or not evaluator_id:
+                continue
+            if any(record.get("error") for record in records):
+                continue
+            for record in records:
+                results[session_id].add_result(EvaluationResult.from_dict(record))
+            completed.add((session_id, evaluator_id))
+        return completed
+
+    @staticmethod
+    def _append_batch_results(
+        out, session_id: str, evaluator_id: str, results: List[EvaluationResult]
+    ) -> None:
+        """Write results for one (session, evaluator) pair as JSONL lines and flush them to disk."""
+        for result in results:
+            record = {
+                "session_id": session_id,
+                "requested_evaluator_id": evaluator_id,
+                **result.to_dict(),
+            }
+            out.write(json.dumps(record) + "\n")
+        out.flush()
+
+    def evaluate_sessions(
+        self,
+        session_ids: Iterable[str],
+        evaluator_ids: List[str],
+        agent_id: str,
+        region: str,
+        scope: str,
+        trace_ids: Optional[Dict[str, str]] = None,
+        span_filter: Optional[Dict[str, str]] = None,
+        max_workers: int = BATCH_MAX_WORKERS,
+        fetch_workers: int = BATCH_FETCH_WORKERS,
+        max_requests_per_second: float = BATCH_REQUESTS_PER_SECOND,
+        max_retries: int = BATCH_MAX_RETRIES,
+        results_path: Optional[str] = None,
+        resume: bool = True,
+        auto_save_output: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, EvaluationResults]:
+        """Evaluate many sessions with many evaluators concurrently.
+
+        Each session is fetched from CloudWatch once and its spans are shared by
+        all evaluators. Evaluate calls run on a thread pool behind a shared rate
+        limiter that backs off when the service throttles, and throttled or
+        transient failures are retried with jittered exponential backoff. Every
+        result is appended to a JSONL file as soon as it finishes, so a re-run
+        with the same results_path skips pairs that already succeeded.
+
+        Args:
+            session_ids: Session IDs to evaluate
+            evaluator_ids: List of evaluator identifiers (e.g., ["Builtin.Helpfulness"])
+            agent_id: Agent ID for fetching session data
+            region: AWS region for ObservabilityClient
+            scope: Evaluation scope - "session", "trace", or "span"
+            trace_ids: Mapping of session ID to trace ID, required for trace scope
+            span_filter: Filter for span scope (optional dict, e.g., {"tool_name": "calculate_bmi"})
+            max_workers: Evaluate calls in flight at once
+            fetch_workers: CloudWatch session fetches in flight at once
+            max_requests_per_second: Upper bound on the evaluate call rate
+            max_retries: Retries per evaluate call for throttling and transient errors
+            results_path: JSONL file results are streamed to
+                (defaults to evaluation_output/batch_<timestamp>.jsonl)
+            resume: If True and results_path exists, skip pairs that already succeeded
+            auto_save_output: If True, also saves each session to evaluation_output/
+                in the same format as evaluate_session once all its evaluators finish
+            metadata: Optional metadata dict attached to every session's results
+
+        Returns:
+            Dict mapping session ID to its EvaluationResults
+
+        Raises:
+            ValueError: If scope-evaluator combination is invalid or required IDs are missing
+        """
+        if not evaluator_ids:
+            raise ValueError("evaluator_ids cannot be empty")
+
+        for evaluator_id in evaluator_ids:
+            self._validate_scope_compatibility(evaluator_id, scope)
+
+        session_ids = list(dict.fromkeys(session_ids))
+        trace_ids = trace_ids or {}
+        if scope == "trace":
+            missing = [
+                session_id
+                for session_id in session_ids
+                if not trace_ids.get(session_id)
+            ]
+            if missing:
+                raise ValueError(
+                    f"trace_ids must include a trace ID for every session with trace scope: {missing}"
+                )
+
+        if results_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            results_path = f"{EVALUATION_OUTPUT_DIR}/batch_{timestamp}.jsonl"
+        output_file = Path(results_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        results = {
+            session_id: EvaluationResults(session_id=session_id, metadata=metadata)
+            for session_id in session_ids
+        }
+        completed = self._load_batch_results(output_file, results) if resume else set()
+        pending = {
+            session_id: [e for e in evaluator_ids if (session_id, e) not in completed]
+            for session_id in session_ids
+        }
+        queue = deque(session_id for session_id in session_ids if pending[session_id])
+
+        total_calls = sum(len(evaluators) for evaluators in pending.values())
+        print(
+            f"Evaluating {len(queue)} sessions x {len(evaluator_ids)} evaluators "
+            f"({total_calls} calls, {len(completed)} already done) with {max_workers} workers"
+        )
+        print(f"Streaming results to: {output_file}")
+
+        # Sessions held in memory at once: enough to keep every evaluate worker busy
+        # while the next sessions are being fetched
+        window = 2 * math.ceil(max_workers / len(evaluator_ids)) + fetch_workers
+
+        obs_client = ObservabilityClient(
+            region_name=region, agent_id=agent_id, runtime_suffix=DEFAULT_RUNTIME_SUFFIX
+        )
+        limiter = AdaptiveRateLimiter(max_requests_per_second)
+        retries = [0]
+        retries_lock = threading.Lock()
+
+        def count_retry():
+            with retries_lock:
+                retries[0] += 1
+
+        evaluate_fn = partial(
+            self._evaluate_with_retry,
+            limiter=limiter,
+            max_retries=max_retries,
+            on_retry=count_retry,
+        )
+
+        started = time.monotonic()
+        calls_done = 0
+        sessions_done = 0
+        failures = 0
+        progress_every = max(1, total_calls // 20)
+
+        with (
+            ThreadPoolExecutor(
+                fetch_workers, thread_name_prefix="eval-fetch"
+            ) as fetch_pool,
+            ThreadPoolExecutor(
+                max_workers, thread_name_prefix="eval-call"
+            ) as call_pool,
+            open(output_file, "a", encoding=DEFAULT_FILE_ENCODING) as out,
+        ):
+            futures: Dict[
+                Any, Tuple[str, Optional[str]]
+            ] = {}  # future -> (session_id, evaluator_id or None for fetch)
+            remaining: Dict[str, int] = {}  # session_id -> evaluators still running
+
+            def fetch_more():
+                while queue and len(remaining) < window:
+                    session_id = queue.popleft()
+                    remaining[session_id] = len(pending[session_id])
+                    future = fetch_pool.submit(
+                        self._prepare_session,
+                        session_id,
+                        agent_id,
+                        region,
+                        scope,
+                        trace_id=trace_ids.get(session_id),
+                        span_filter=span_filter,
+                        obs_client=obs_client,
+                        verbose=False,
+                    )
+                    futures[future] = (session_id, None)
+
+            def record(session_id, evaluator_id, evaluator_results):
+                nonlocal calls_done, sessions_done, failures
+                self._append_batch_results(
+                    out, session_id, evaluator_id, evaluator_results
+                )
+                for result in evaluator_results:
+                    results[session_id].add_result(result)
+                failures += any(result.error for result in evaluator_results)
+                calls_done += 1
+                remaining[session_id] -= 1
+                if remaining[session_id] == 0:
+                    del remaining[session_id]
+                    sessions_done += 1
+                    if auto_save_output:
+                        self._save_output(results[session_id])
+                if calls_done % progress_every == 0 or calls_done == total_calls:
+                    elapsed = time.monotonic() - started
+                    print(
+                        f"  {calls_done}/{total_calls} calls, {sessions_done} sessions done "
+                        f"({calls_done / elapsed:.1f} calls/s, {failures} failed, {limiter.throttled} throttled)"
+                    )
+
+            try:
+                fetch_more()
+                while futures:
+                    finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        session_id, evaluator_id = futures.pop(future)
+                        if evaluator_id is not None:
+                            record(session_id, evaluator_id, future.result())
+                            continue
+
+                        try:
+                            otel_spans, evaluation_target = future.result()
+                        except Exception as e:
+                            print(
+                                f"Warning: Could not prepare session {session_id}: {e}"
+                            )
+                            for evaluator_id in pending[session_id]:
+                                record(
+                                    session_id,
+                                    evaluator_id,
+                                    [self._error_result(session_id, evaluator_id, e)],
+                                )
+                            continue
+
+                        for evaluator_id in pending[session_id]:
+                            call = call_pool.submit(
+                                self._run_evaluator,
+                                session_id,
+                                evaluator_id,
+                                otel_spans,
+                                evaluation_target,
+                                evaluate_fn,
+                            )
+                            futures[call] = (session_id, evaluator_id)
+                    fetch_more()
+            except BaseException:
+                # Don't start queued work on Ctrl+C; finished results are already on disk
+                for future in futures:
+                    future.cancel()
+                raise
+
+        elapsed = time.monotonic() - started
+        print(
+            f"Batch complete: {calls_done} calls across {sessions_done} sessions in {elapsed:.1f}s "
+            f"({calls_done / elapsed if elapsed else 0:.1f} calls/s, {failures} failed, "
+            f"{retries[0]} retries, {limiter.throttled} throttled)"
+        )
+        print(f"Results saved to: {output_file}")
 
         return results
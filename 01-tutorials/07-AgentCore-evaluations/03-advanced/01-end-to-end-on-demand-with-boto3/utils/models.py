@@ -104,7 +104,9 @@ class TraceData:
         """Get all unique trace IDs from spans."""
         return list(set(span.trace_id for span in self.spans if span.trace_id))
 
-    def get_tool_execution_spans(self, tool_name_filter: Optional[str] = None) -> List[str]:
+    def get_tool_execution_spans(
+        self, tool_name_filter: Optional[str] = None
+    ) -> List[str]:
         """Get span IDs for tool execution spans.
 
         Args:
@@ -144,7 +146,7 @@ class EvaluationRequest:
         self,
         evaluator_id: str,
         session_spans: List[Dict[str, Any]],
-        evaluation_target: Optional[Dict[str, Any]] = None
+        evaluation_target: Optional[Dict[str, Any]] = None,
     ):
         self.evaluator_id = evaluator_id
         self.session_spans = session_spans
@@ -193,6 +195,35 @@ class EvaluationResult:
             error=None,
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "evaluator_id": self.evaluator_id,
+            "evaluator_name": self.evaluator_name,
+            "evaluator_arn": self.evaluator_arn,
+            "value": self.value,
+            "label": self.label,
+            "explanation": self.explanation,
+            "context": self.context,
+            "token_usage": self.token_usage,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EvaluationResult":
+        """Create EvaluationResult from its to_dict() form."""
+        return cls(
+            evaluator_id=data.get("evaluator_id", ""),
+            evaluator_name=data.get("evaluator_name", ""),
+            evaluator_arn=data.get("evaluator_arn", ""),
+            explanation=data.get("explanation", ""),
+            context=data.get("context", {}),
+            value=data.get("value"),
+            label=data.get("label"),
+            token_usage=data.get("token_usage"),
+            error=data.get("error"),
+        )
+
 
 @dataclass
 class EvaluationResults:
@@ -211,20 +242,7 @@ class EvaluationResults:
         """Convert to dictionary for JSON serialization."""
         output = {
             "session_id": self.session_id,
-            "results": [
-                {
-                    "evaluator_id": r.evaluator_id,
-                    "evaluator_name": r.evaluator_name,
-                    "evaluator_arn": r.evaluator_arn,
-                    "value": r.value,
-                    "label": r.label,
-                    "explanation": r.explanation,
-                    "context": r.context,
-                    "token_usage": r.token_usage,
-                    "error": r.error,
-                }
-                for r in self.results
-            ],
+            "results": [r.to_dict() for r in self.results],
         }
         if self.metadata:
             output["metadata"] = self.metadata
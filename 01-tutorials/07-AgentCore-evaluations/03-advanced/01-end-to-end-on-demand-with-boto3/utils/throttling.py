@@ -0,0 +1,52 @@
+"""Client-side rate limiting and retry backoff for batch evaluation."""
+
+import random
+import threading
+import time
+
+from .constants import RETRY_BASE_DELAY_SECONDS, RETRY_MAX_DELAY_SECONDS
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe request pacing that backs off when the service throttles.
+
+    Requests are spaced evenly at the current rate. The rate halves on every
+    throttling error and recovers additively on success, up to max_rate.
+
+    Args:
+        max_rate: Highest request rate, in requests per second
+        min_rate: Lowest rate throttling can push the limiter down to
+    """
+
+    def __init__(self, max_rate: float, min_rate: float = 0.2):
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.rate = max_rate
+        self.throttled = 0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may send its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number attempt (0-based): exponential backoff with full jitter."""
+    return random.uniform(
+        0, min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2**attempt)
+    )
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the SQL splitter/validator used by the execute_query tool.
+
+Generates multi-megabyte batches mixing string literals, E'' strings,
+dollar-quoted bodies, quoted identifiers and nested comments, then checks
+that validation time grows linearly with input size and that a typical
+agent query validates in well under a few milliseconds.
+
+Usage:
+    python3 scripts/benchmark_sql_lexer.py [--sizes-mb 1 2 4 8]
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+
+from sql_lexer import lex_statements, validate_read_only_statements
+
+# Highest acceptable log-log slope of validation time against input size
+MAX_SCALING_EXPONENT = 1.3
+
+TYPICAL_AGENT_QUERY = """
+SELECT c.customer_id, c.name, count(o.order_id) AS orders, sum(o.total) AS revenue
+FROM customers c
+JOIN orders o ON o.customer_id = c.customer_id
+WHERE o.created_at > now() - interval '30 days' -- recent orders only
+  AND c.status <> 'deleted; really'
+GROUP BY c.customer_id, c.name
+ORDER BY revenue DESC
+LIMIT 20;
+SHOW work_mem;
+"""
+
+STATEMENT_TEMPLATES = [
+    "SELECT id, 'literal; with semicolon {n}' AS note FROM t{n} WHERE x = {n};",
+    'SELECT E\'escaped \\\' quote; {n}\' AS s, "Mixed""Case;Col" FROM "T{n}";',
+    "SELECT $body$ dollar ; quoted {n} $body$ AS d /* outer /* nested ; */ done */;",
+    "SELECT count(*) FROM orders WHERE status = 'open' -- trailing; comment {n}\n;",
+    "SELECT $$plain dollar {n};$$, $1::int AS param FROM generate_series(1, {n});",
+]
+
+
+def generate_batch(target_bytes, seed=42):
+    """Build a batch of read-only statements of roughly target_bytes"""
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    n = 0
+    while size < target_bytes:
+        stmt = rng.choice(STATEMENT_TEMPLATES).format(n=n) + "\n"
+        parts.append(stmt)
+        size += len(stmt)
+        n += 1
+    return "".join(parts), n
+
+
+def scaling_exponent(sizes, times):
+    """Least-squares slope of log(time) against log(size)"""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(t) for t in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if not spread:
+        return 1.0
+    return (
+        sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True)) / spread
+    )
+
+
+def time_call(func, *args, repeat=3):
+    """Return the best wall-clock time of func(*args) over repeat runs"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--typical-iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print("Typical agent query")
+    started = time.perf_counter()
+    for _ in range(args.typical_iterations):
+        validate_read_only_statements(TYPICAL_AGENT_QUERY)
+    per_call_ms = (time.perf_counter() - started) * 1000 / args.typical_iterations
+    print(f"  validate: {per_call_ms:.3f} ms per call")
+
+    print("\nGenerated batches")
+    print(
+        f"  {'size':>8} {'statements':>11} {'lex (s)':>9} {'validate (s)':>13} {'MB/s':>8}"
+    )
+    per_mb = []
+    validate_times = []
+    for size_mb in args.sizes_mb:
+        batch, expected = generate_batch(int(size_mb * 1024 * 1024))
+        lex_time, statements = time_call(lex_statements, batch)
+        validate_time, _ = time_call(validate_read_only_statements, batch)
+        if len(statements) != expected:
+            print(
+                f"  split mismatch: expected {expected} statements, got {len(statements)}"
+            )
+            return 1
+        per_mb.append(validate_time / size_mb)
+        validate_times.append(validate_time)
+        print(
+            f"  {size_mb:>6.1f}MB {len(statements):>11} {lex_time:>9.3f} "
+            f"{validate_time:>13.3f} {size_mb / validate_time:>8.1f}"
+        )
+
+    # Linear scaling: fit time = c * size^k on a log-log scale. A linear
+    # splitter gives k close to 1; the quadratic one it replaced gave k near 2
+    growth = max(per_mb) / min(per_mb)
+    exponent = scaling_exponent(args.sizes_mb, validate_times)
+    print(f"\nTime-per-MB spread across sizes: {growth:.2f}x")
+    print(f"Scaling exponent: {exponent:.2f} (1.0 = linear)")
+    if exponent > MAX_SCALING_EXPONENT:
+        print(
+            f"Validation does not scale linearly (exponent above {MAX_SCALING_EXPONENT})"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
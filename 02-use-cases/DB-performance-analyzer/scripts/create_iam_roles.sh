@@ -150,7 +150,14 @@ if [[ $LAMBDA_ROLE_EXISTS != "not_exists" ]]; then
             "secretsmanager:GetSecretValue",
             "secretsmanager:DescribeSecret"
           ],
-          "Resource": "arn:aws:secretsmanager:*:*:secret:*"
+          "Resource": "arn:aws:secretsmanager:*:*:secret:db-performance-analyzer-*"
+        },
+        {
+          "Effect": "Allow",
+          "Action": [
+            "secretsmanager:ListSecrets"
+          ],
+          "Resource": "*"
         }
       ]
     }'
@@ -210,7 +217,14 @@ else
             "secretsmanager:GetSecretValue",
             "secretsmanager:DescribeSecret"
           ],
-          "Resource": "arn:aws:secretsmanager:*:*:secret:*"
+          "Resource": "arn:aws:secretsmanager:*:*:secret:db-performance-analyzer-*"
+        },
+        {
+          "Effect": "Allow",
+          "Action": [
+            "secretsmanager:ListSecrets"
+          ],
+          "Resource": "*"
         }
       ]
     }'
@@ -11,6 +11,13 @@ source "$PROJECT_DIR/config/cognito_config.env"
 
 echo "Creating Lambda functions for DB Performance Analyzer..."
 
+# Shared connection pooling / credential caching module packaged with both functions
+DB_CONNECTION_PY_FILE="$SCRIPT_DIR/db_connection.py"
+if [ ! -f "$DB_CONNECTION_PY_FILE" ]; then
+    echo "Error: db_connection.py not found at $DB_CONNECTION_PY_FILE"
+    exit 1
+fi
+
 # Use the correct path to the pg_analyze_performance.py file
 PG_ANALYZE_PY_FILE="$SCRIPT_DIR/pg_analyze_performance.py"
 if [ -f "$PG_ANALYZE_PY_FILE" ]; then
@@ -24,6 +31,9 @@ fi
 LAMBDA_DIR=$(mktemp -d)
 echo "Creating Lambda package in $LAMBDA_DIR"
 cp "$PG_ANALYZE_PY_FILE" "$LAMBDA_DIR/lambda_function.py"
+cp "$DB_CONNECTION_PY_FILE" "$LAMBDA_DIR/db_connection.py"
+cp "$SCRIPT_DIR/sql_lexer.py" "$LAMBDA_DIR/sql_lexer.py"
+cp "$SCRIPT_DIR/plan_cache.py" "$LAMBDA_DIR/plan_cache.py"
 
 # Create a zip file for the Lambda function
 ZIP_FILE=$(mktemp).zip
@@ -156,6 +166,8 @@ fi
 PGSTAT_LAMBDA_DIR=$(mktemp -d)
 echo "Creating PGStat Lambda package in $PGSTAT_LAMBDA_DIR"
 cp "$PGSTAT_PY_FILE" "$PGSTAT_LAMBDA_DIR/lambda_function.py"
+cp "$DB_CONNECTION_PY_FILE" "$PGSTAT_LAMBDA_DIR/db_connection.py"
+cp "$SCRIPT_DIR/stat_sampler.py" "$PGSTAT_LAMBDA_DIR/stat_sampler.py"
 
 # Create a zip file for the Lambda function
 PGSTAT_ZIP_FILE=$(mktemp).zip
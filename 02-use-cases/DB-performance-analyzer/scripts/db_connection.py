@@ -0,0 +1,449 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+import boto3
+import psycopg2
+import psycopg2.extensions
+from botocore.exceptions import ClientError
+
+# Module-level state survives across warm Lambda invocations, so secrets,
+# SSM lookups and open connections are reused instead of re-created per call.
+SECRET_CACHE_TTL = int(os.environ.get("SECRET_CACHE_TTL_SECONDS", "300"))
+PARAMETER_CACHE_TTL = int(os.environ.get("PARAMETER_CACHE_TTL_SECONDS", "300"))
+POOL_MAX_IDLE = int(os.environ.get("DB_POOL_MAX_IDLE", "4"))
+POOL_MAX_CONNECTIONS = int(os.environ.get("DB_POOL_MAX_CONNECTIONS", "8"))
+HEALTH_CHECK_INTERVAL = int(os.environ.get("DB_HEALTH_CHECK_INTERVAL_SECONDS", "30"))
+CONNECT_TIMEOUT = int(os.environ.get("DB_CONNECT_TIMEOUT_SECONDS", "10"))
+# Optional JSON file of {secret name: secret} used instead of Secrets Manager,
+# e.g. to point the analyzer at local Postgres containers
+LOCAL_SECRETS_FILE = os.environ.get("LOCAL_SECRETS_FILE")
+ENVIRONMENTS = ("prod", "dev")
+# Secrets fleet analysis may open besides the dev/prod ones; the Lambda role's
+# GetSecretValue permission is scoped to the same prefix
+FLEET_SECRET_PREFIX = os.environ.get("FLEET_SECRET_PREFIX", "db-performance-analyzer-")
+
+_clients = {}
+_clients_lock = threading.Lock()
+_secret_cache = {}
+_parameter_cache = {}
+_cache_lock = threading.Lock()
+_tag_cache = {}
+_session_settings = threading.local()
+
+
+def _get_client(service_name):
+    """Return a boto3 client that is created once per container"""
+    with _clients_lock:
+        client = _clients.get(service_name)
+        if client is None:
+            client = boto3.session.Session().client(
+                service_name=service_name, region_name=os.environ.get("REGION")
+            )
+            _clients[service_name] = client
+        return client
+
+
+def _load_local_secrets():
+    with open(LOCAL_SECRETS_FILE) as f:
+        return json.load(f)
+
+
+def _get_local_secret_entry(secret_name):
+    secrets = _load_local_secrets()
+    if secret_name not in secrets:
+        raise Exception(
+            f"Failed to get secret: {secret_name} not found in {LOCAL_SECRETS_FILE}"
+        )
+    secret = dict(secrets[secret_name])
+    if "password" not in secret:
+        # Local secret files are committed without passwords
+        if not os.environ.get("LOCAL_PG_PASSWORD"):
+            raise Exception(
+                f"Failed to get secret: {secret_name} has no password; set LOCAL_PG_PASSWORD"
+            )
+        secret["password"] = os.environ["LOCAL_PG_PASSWORD"]
+    version_id = hashlib.sha1(
+        json.dumps(secret, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return secret, version_id
+
+
+def get_secret_entry(secret_name, force_refresh=False):
+    """
+    Get a secret from AWS Secrets Manager, served from a TTL cache when possible
+
+    Returns:
+        tuple: (secret dict, version id)
+    """
+    if LOCAL_SECRETS_FILE:
+        return _get_local_secret_entry(secret_name)
+
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _secret_cache.get(secret_name)
+        if (
+            cached
+            and not force_refresh
+            and now - cached["fetched_at"] < SECRET_CACHE_TTL
+        ):
+            return cached["secret"], cached["version_id"]
+
+    client = _get_client("secretsmanager")
+    try:
+        secret_value = client.get_secret_value(SecretId=secret_name)
+    except ClientError as e:
+        raise Exception(f"Failed to get secret: {str(e)}")
+
+    secret = json.loads(secret_value["SecretString"])
+    version_id = secret_value.get("VersionId")
+    with _cache_lock:
+        _secret_cache[secret_name] = {
+            "secret": secret,
+            "version_id": version_id,
+            "fetched_at": now,
+        }
+    return secret, version_id
+
+
+def get_secret(secret_name):
+    """Get secret from AWS Secrets Manager (cached)"""
+    secret, _ = get_secret_entry(secret_name)
+    return secret
+
+
+def invalidate_secret(secret_name):
+    """Drop a cached secret so the next lookup goes to Secrets Manager"""
+    with _cache_lock:
+        _secret_cache.pop(secret_name, None)
+
+
+def get_env_secret(environment):
+    """Retrieve the secret name for the specified environment (cached)"""
+    if environment not in ENVIRONMENTS:
+        print("environement does not exist")
+        raise ValueError(f"Unknown environment: {environment}")
+
+    parameter_name = f"/AuroraOps/{environment}"
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _parameter_cache.get(parameter_name)
+        if cached and now - cached["fetched_at"] < PARAMETER_CACHE_TTL:
+            return cached["value"]
+
+    ssm_client = _get_client("ssm")
+    try:
+        response = ssm_client.get_parameter(Name=parameter_name)
+    except ssm_client.exceptions.ParameterNotFound:
+        error_message = f"Parameter not found: {parameter_name}"
+        print(error_message)
+        raise Exception(error_message)
+    except Exception as e:
+        raise Exception(
+            f"Failed to get {environment} secret name from Parameter Store: {str(e)}"
+        )
+
+    value = response["Parameter"]["Value"]
+    with _cache_lock:
+        _parameter_cache[parameter_name] = {"value": value, "fetched_at": now}
+    return value
+
+
+def find_secrets_by_tags(tags):
+    """
+    Find database secrets whose tags match every key/value in tags (cached)
+
+    Args:
+        tags (dict): Tag key -> required value ('*' or '' matches any value)
+
+    Returns:
+        list: Matching secret names, sorted
+    """
+    if not tags:
+        raise ValueError("At least one tag is required to select targets")
+    cache_key = json.dumps(tags, sort_keys=True)
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _tag_cache.get(cache_key)
+        if cached and now - cached["fetched_at"] < PARAMETER_CACHE_TTL:
+            return cached["value"]
+
+    if LOCAL_SECRETS_FILE:
+        candidates = [
+            (name, secret.get("tags", {}))
+            for name, secret in _load_local_secrets().items()
+        ]
+    else:
+        client = _get_client("secretsmanager")
+        # The API filters tag keys and values independently, so it narrows by
+        # key only and the exact key/value pairs are checked below
+        filters = [
+            {"Key": "tag-key", "Values": list(tags)},
+            {"Key": "name", "Values": [FLEET_SECRET_PREFIX]},
+        ]
+        candidates = []
+        try:
+            for page in client.get_paginator("list_secrets").paginate(Filters=filters):
+                for entry in page["SecretList"]:
+                    entry_tags = {
+                        tag["Key"]: tag["Value"] for tag in entry.get("Tags", [])
+                    }
+                    candidates.append((entry["Name"], entry_tags))
+        except ClientError as e:
+            raise Exception(f"Failed to list secrets by tag: {str(e)}")
+
+    value = sorted(
+        name
+        for name, entry_tags in candidates
+        if name.startswith(FLEET_SECRET_PREFIX)
+        and all(
+            key in entry_tags and (expected in ("", "*") or entry_tags[key] == expected)
+            for key, expected in tags.items()
+        )
+    )
+    with _cache_lock:
+        _tag_cache[cache_key] = {"value": value, "fetched_at": now}
+    return value
+
+
+def resolve_target_secret(target):
+    """
+    Map a target (an environment name or a secret name) to a secret name
+
+    Secret names must start with FLEET_SECRET_PREFIX, so callers cannot point
+    the analyzer at arbitrary secrets in the account.
+    """
+    if target in ENVIRONMENTS:
+        return get_env_secret(target)
+    if not target.startswith(FLEET_SECRET_PREFIX):
+        raise ValueError(
+            f"Target '{target}' is not allowed: use an environment name "
+            f"({', '.join(ENVIRONMENTS)}) or a secret named {FLEET_SECRET_PREFIX}*"
+        )
+    return target
+
+
+@contextmanager
+def statement_timeout(seconds):
+    """
+    Apply a statement_timeout to every connection this thread acquires inside the block
+
+    The pool runs RESET ALL when a connection is released, so the setting
+    never leaks to the next user of the connection.
+    """
+    previous = getattr(_session_settings, "statement_timeout_ms", None)
+    _session_settings.statement_timeout_ms = int(seconds * 1000)
+    try:
+        yield
+    finally:
+        _session_settings.statement_timeout_ms = previous
+
+
+def _is_auth_error(error):
+    """Check whether a connection error was caused by rejected credentials"""
+    message = str(error).lower()
+    return (
+        "password authentication failed" in message
+        or "authentication failed" in message
+    )
+
+
+class PooledConnection(psycopg2.extensions.connection):
+    """psycopg2 connection that remembers which secret version opened it"""
+
+    pool_secret_name = None
+    pool_secret_version = None
+    pool_checked_at = 0.0
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections keyed by secret name.
+
+    Idle connections are health-checked before reuse and discarded when the
+    secret they were opened with has been rotated.
+    """
+
+    def __init__(self, max_idle=POOL_MAX_IDLE, max_connections=POOL_MAX_CONNECTIONS):
+        self.max_idle = max_idle
+        self.max_connections = max_connections
+        self._idle = {}
+        self._in_use = {}
+        self._condition = threading.Condition()
+        self.stats = {"created": 0, "reused": 0, "discarded": 0, "reconnects": 0}
+
+    def _open(self, secret_name):
+        """Open a new connection, refreshing the secret once if it was rotated"""
+        secret, version_id = get_secret_entry(secret_name)
+        try:
+            conn = self._connect(secret)
+        except psycopg2.OperationalError as e:
+            if not _is_auth_error(e):
+                raise Exception(f"Failed to connect to the database: {str(e)}")
+            print(f"Authentication failed for {secret_name}, refreshing rotated secret")
+            invalidate_secret(secret_name)
+            self.discard_all(secret_name)
+            secret, version_id = get_secret_entry(secret_name, force_refresh=True)
+            self._count("reconnects")
+            try:
+                conn = self._connect(secret)
+            except Exception as retry_error:
+                raise Exception(
+                    f"Failed to connect to the database: {str(retry_error)}"
+                )
+        except Exception as e:
+            raise Exception(f"Failed to connect to the database: {str(e)}")
+
+        conn.pool_secret_name = secret_name
+        conn.pool_secret_version = version_id
+        conn.pool_checked_at = time.monotonic()
+        self._count("created")
+        return conn
+
+    def _count(self, stat):
+        """Increment a stats counter from outside the pool lock"""
+        with self._condition:
+            self.stats[stat] += 1
+
+    @staticmethod
+    def _connect(secret):
+        return psycopg2.connect(
+            host=secret["host"],
+            database=secret["dbname"],
+            user=secret["username"],
+            password=secret["password"],
+            port=secret["port"],
+            connect_timeout=CONNECT_TIMEOUT,
+            connection_factory=PooledConnection,
+        )
+
+    @staticmethod
+    def _is_healthy(conn):
+        """Cheap liveness probe, skipped if the connection was checked recently"""
+        if conn.closed:
+            return False
+        if time.monotonic() - conn.pool_checked_at < HEALTH_CHECK_INTERVAL:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            conn.pool_checked_at = time.monotonic()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self, secret_name, timeout=30):
+        """Return a healthy connection for the secret, waiting if the pool is exhausted"""
+        _, current_version = get_secret_entry(secret_name)
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                idle = self._idle.setdefault(secret_name, [])
+                while idle:
+                    conn = idle.pop()
+                    if (
+                        conn.pool_secret_version != current_version
+                        or not self._is_healthy(conn)
+                    ):
+                        self.stats["discarded"] += 1
+                        self._close_quietly(conn)
+                        continue
+                    self._in_use[secret_name] = self._in_use.get(secret_name, 0) + 1
+                    self.stats["reused"] += 1
+                    return conn
+
+                if self._in_use.get(secret_name, 0) < self.max_connections:
+                    self._in_use[secret_name] = self._in_use.get(secret_name, 0) + 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Exception(
+                        f"Timed out waiting for a database connection for {secret_name}"
+                    )
+                self._condition.wait(remaining)
+
+        try:
+            return self._open(secret_name)
+        except Exception:
+            with self._condition:
+                self._in_use[secret_name] -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, conn):
+        """Return a connection to the pool, resetting any session state"""
+        secret_name = getattr(conn, "pool_secret_name", None)
+        if secret_name is None:
+            self._close_quietly(conn)
+            return
+
+        reusable = not conn.closed
+        if reusable:
+            try:
+                conn.rollback()
+                with conn.cursor() as cur:
+                    cur.execute("RESET ALL")
+                conn.commit()
+            except Exception:
+                reusable = False
+
+        with self._condition:
+            self._in_use[secret_name] = max(self._in_use.get(secret_name, 0) - 1, 0)
+            idle = self._idle.setdefault(secret_name, [])
+            if reusable and len(idle) < self.max_idle:
+                conn.pool_checked_at = time.monotonic()
+                idle.append(conn)
+            else:
+                self.stats["discarded"] += 1
+                self._close_quietly(conn)
+            self._condition.notify()
+
+    def discard_all(self, secret_name=None):
+        """Close idle connections for one secret, or for every secret"""
+        with self._condition:
+            names = [secret_name] if secret_name else list(self._idle)
+            for name in names:
+                for conn in self._idle.pop(name, []):
+                    self.stats["discarded"] += 1
+                    self._close_quietly(conn)
+
+
+_pool = ConnectionPool()
+
+
+def get_pool():
+    """Return the container-wide connection pool"""
+    return _pool
+
+
+def connect_to_db(secret_name):
+    """Get a pooled database connection; hand it back with release_connection"""
+    conn = _pool.acquire(secret_name)
+    timeout_ms = getattr(_session_settings, "statement_timeout_ms", None)
+    if timeout_ms:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SET statement_timeout = %s", (timeout_ms,))
+            conn.commit()
+        except Exception:
+            _pool.release(conn)
+            raise
+    return conn
+
+
+def release_connection(conn):
+    """Return a connection obtained from connect_to_db to the pool"""
+    if conn is not None:
+        _pool.release(conn)
@@ -2,15 +2,15 @@ import boto3
 import os
 
 agentcore_client = boto3.client(
-    'bedrock-agentcore-control', 
-    region_name=os.getenv('AWS_REGION', 'us-west-2'), 
-    endpoint_url=os.getenv('ENDPOINT_URL')
+    "bedrock-agentcore-control",
+    region_name=os.getenv("AWS_REGION", "us-west-2"),
+    endpoint_url=os.getenv("ENDPOINT_URL"),
 )
 
 lambda_target_config = {
     "mcp": {
         "lambda": {
-            "lambdaArn": os.getenv('LAMBDA_ARN'),
+            "lambdaArn": os.getenv("LAMBDA_ARN"),
             "toolSchema": {
                 "inlinePayload": [
                     {
@@ -19,205 +19,277 @@ lambda_target_config = {
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
-                                },
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'slow_query' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'slow_query' for this tool.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
+                            "required": ["environment", "action_type"],
                         },
-                        {
+                    },
+                    {
                         "name": "conn_issues",
                         "description": "Detects and analyzes database connection issues such as idle connections, connection leaks, and connection pool problems. Provide the environment (dev/prod) to analyze. Use action_type default value as connection_management_issues.",
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
-                                },
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'connection_management_issues' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'connection_management_issues' for this tool.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
+                            "required": ["environment", "action_type"],
                         },
-                        {
+                    },
+                    {
                         "name": "index_analysis",
                         "description": "Evaluates database index usage, identifies missing or unused indexes, and provides optimization recommendations. Provide the environment (dev/prod) to analyze indexes. Use action_type default value as index_analysis.",
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
-                                },
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'index_analysis' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'index_analysis' for this tool.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
+                            "required": ["environment", "action_type"],
                         },
-                        {
+                    },
+                    {
                         "name": "autovacuum_analysis",
                         "description": "Examines PostgreSQL autovacuum performance, dead tuple accumulation, and provides configuration recommendations. Provide the environment (dev/prod) to analyze autovacuum settings. Use action_type default value as autovacuum_analysis.",
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
-                                },
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'autovacuum_analysis' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'autovacuum_analysis' for this tool.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
+                            "required": ["environment", "action_type"],
                         },
-                        {
+                    },
+                    {
                         "name": "io_analysis",
                         "description": "Analyzes database I/O patterns, buffer usage, and checkpoint activity to identify performance bottlenecks. Provide the environment (dev/prod) to analyze I/O performance. Use action_type default value as io_analysis.",
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
-                                },
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'io_analysis' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'io_analysis' for this tool.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
+                            "required": ["environment", "action_type"],
                         },
-                        {
+                    },
+                    {
                         "name": "replication_analysis",
                         "description": "Monitors PostgreSQL replication status, lag, and health to ensure high availability. Provide the environment (dev/prod) to analyze replication performance. Use action_type default value as replication_analysis.",
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
-                                },
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'replication_analysis' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'replication_analysis' for this tool.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
+                            "required": ["environment", "action_type"],
                         },
-                        {
+                    },
+                    {
                         "name": "system_health",
                         "description": "Provides a comprehensive health check of your PostgreSQL database including cache hit ratios, deadlocks, and long-running transactions. Provide the environment (dev/prod) to analyze system health. Use action_type default value as system_health.",
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
-                                },
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'system_health' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'system_health' for this tool.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
+                            "required": ["environment", "action_type"],
                         },
-                        {
+                    },
+                    {
                         "name": "vacuum_progress",
                         "description": "Monitors current vacuum operations progress including phase, duration, and completion percentage. Based on comprehensive diagnostics from runbooks.py. Provide the environment (dev/prod) to analyze vacuum progress. Use action_type default value as vacuum_progress.",
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
-                                },
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'vacuum_progress' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'vacuum_progress' for this tool.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
+                            "required": ["environment", "action_type"],
                         },
-                        {
+                    },
+                    {
                         "name": "xid_analysis",
                         "description": "Analyzes transaction ID (XID) wraparound status, oldest XIDs across databases, and tables needing vacuum to prevent wraparound. Based on comprehensive diagnostics from runbooks.py. Provide the environment (dev/prod) to analyze XID status. Use action_type default value as xid_analysis.",
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
-                                },
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'xid_analysis' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'xid_analysis' for this tool.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
+                            "required": ["environment", "action_type"],
                         },
-                        {
+                    },
+                    {
                         "name": "bloat_analysis",
                         "description": "Identifies tables with significant bloat, calculates bloat percentages and wasted space. Based on comprehensive diagnostics from runbooks.py. Provide the environment (dev/prod) to analyze table bloat. Use action_type default value as bloat_analysis.",
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
-                                },
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'bloat_analysis' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'bloat_analysis' for this tool.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
+                            "required": ["environment", "action_type"],
                         },
-                        {
+                    },
+                    {
                         "name": "long_running_transactions",
                         "description": "Identifies long-running transactions that may be blocking vacuum operations or causing performance issues. Based on comprehensive diagnostics from runbooks.py. Provide the environment (dev/prod) to analyze long-running transactions. Use action_type default value as long_running_transactions.",
                         "inputSchema": {
                             "type": "object",
                             "properties": {
-                                "environment": {
-                                    "type": "string"
+                                "environment": {"type": "string"},
+                                "action_type": {
+                                    "type": "string",
+                                    "description": "The type of action to perform. Use 'long_running_transactions' for this tool.",
+                                },
+                            },
+                            "required": ["environment", "action_type"],
+                        },
+                    },
+                    {
+                        "name": "full_health_sweep",
+                        "description": "Runs several diagnostics (slow_query, connection_management_issues, index_analysis, autovacuum_analysis, io_analysis, replication_analysis, system_health, vacuum_progress, xid_analysis, bloat_analysis, long_running_transactions) concurrently and returns one combined report with per-section timings. Sections that fail are reported individually without failing the sweep. Provide the environment (dev/prod) and optionally the list of sections to run. Use action_type default value as full_health_sweep.",
+                        "inputSchema": {
+                            "type": "object",
+                            "properties": {
+                                "environment": {"type": "string"},
+                                "action_type": {
+                                    "type": "string",
+                                    "description": "The type of action to perform. Use 'full_health_sweep' for this tool.",
+                                },
+                                "sections": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                    "description": "Optional list of diagnostics to run. Defaults to all of them.",
                                 },
+                                "max_workers": {
+                                    "type": "integer",
+                                    "description": "Optional number of diagnostics to run in parallel. Defaults to 4.",
+                                },
+                            },
+                            "required": ["environment", "action_type"],
+                        },
+                    },
+                    {
+                        "name": "load_sample",
+                        "description": "Shows what is loading the database right now rather than lifetime totals. Takes snapshots of pg_stat_statements and pg_stat_io (or per-table I/O counters before PostgreSQL 16) a few seconds apart and ranks queries by their share of execution time in that window, with calls/s, mean time, shared block reads/s and temp bytes/s. Snapshots are kept between calls, so a later call can build on the previous one. Provide the environment (dev/prod). Use action_type default value as load_sample.",
+                        "inputSchema": {
+                            "type": "object",
+                            "properties": {
+                                "environment": {"type": "string"},
                                 "action_type": {
                                     "type": "string",
-                                    "description": "The type of action to perform. Use 'long_running_transactions' for this tool."
-                                }
+                                    "description": "The type of action to perform. Use 'load_sample' for this tool.",
+                                },
+                                "sample_count": {
+                                    "type": "integer",
+                                    "description": "Optional number of new snapshots to take. Defaults to 2 (1 is enough when a recent snapshot from an earlier call exists).",
+                                },
+                                "interval_seconds": {
+                                    "type": "number",
+                                    "description": "Optional seconds between snapshots. Defaults to 10.",
+                                },
+                                "use_baseline": {
+                                    "type": "boolean",
+                                    "description": "Optional. Start from the snapshot stored by an earlier call when it is recent. Defaults to true.",
+                                },
                             },
-                            "required": ["environment","action_type"]
-                            }
-                        }
+                            "required": ["environment", "action_type"],
+                        },
+                    },
+                    {
+                        "name": "fleet_analysis",
+                        "description": "Runs one diagnostic (slow_query, load_sample, bloat_analysis, long_running_transactions or any other single-database diagnostic) against many databases at once and merges the results into one report, e.g. the top 20 slowest queries across the fleet. Select databases with a list of targets (dev, prod or Secrets Manager secret names) and/or a tag selector on the database secrets. Each database has its own timeout and a failing database does not fail the report. Use action_type default value as fleet_analysis.",
+                        "inputSchema": {
+                            "type": "object",
+                            "properties": {
+                                "action_type": {
+                                    "type": "string",
+                                    "description": "The type of action to perform. Use 'fleet_analysis' for this tool.",
+                                },
+                                "diagnostic": {
+                                    "type": "string",
+                                    "description": "The diagnostic to run on every database, e.g. slow_query.",
+                                },
+                                "targets": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                    "description": "Optional environments (dev/prod) or secret names starting with db-performance-analyzer- to analyze.",
+                                },
+                                "tags": {
+                                    "type": "object",
+                                    "description": 'Optional tag selector matched against database secret tags, e.g. {"team": "payments"}. Use "*" to match any value.',
+                                },
+                                "max_workers": {
+                                    "type": "integer",
+                                    "description": "Optional number of databases analyzed in parallel. Defaults to 8.",
+                                },
+                                "target_timeout_seconds": {
+                                    "type": "integer",
+                                    "description": "Optional seconds allowed per database. Defaults to 60.",
+                                },
+                                "top_n": {
+                                    "type": "integer",
+                                    "description": "Optional number of rows in the merged ranking. Defaults to 20.",
+                                },
+                                "include_details": {
+                                    "type": "boolean",
+                                    "description": "Optional. Also include each database's full report.",
+                                },
+                            },
+                            "required": ["action_type", "diagnostic"],
+                        },
+                    },
                 ]
-            }
+            },
         }
     }
 }
 
-credential_config = [ 
-    {
-        "credentialProviderType" : "GATEWAY_IAM_ROLE"
-    }
-]
-  
+credential_config = [{"credentialProviderType": "GATEWAY_IAM_ROLE"}]
+
 
 response = agentcore_client.create_gateway_target(
-    gatewayIdentifier=os.getenv('GATEWAY_IDENTIFIER'), # Replace with your GatewayID
-    name=os.getenv('TARGET_NAME','pgstat-analyze-db'),
-    description=os.getenv('TARGET_DESCRIPTION', 'Enhanced PostgreSQL database performance analyzer with comprehensive diagnostics including slow queries, connection issues, I/O bottlenecks, index usage, autovacuum, replication, system health, vacuum progress monitoring, XID wraparound analysis, table bloat detection, and long-running transaction identification. Based on production-ready runbooks with deep diagnostic capabilities.'),
-    credentialProviderConfigurations=credential_config, 
-    targetConfiguration=lambda_target_config)
+    gatewayIdentifier=os.getenv("GATEWAY_IDENTIFIER"),  # Replace with your GatewayID
+    name=os.getenv("TARGET_NAME", "pgstat-analyze-db"),
+    description=os.getenv(
+        "TARGET_DESCRIPTION",
+        "Enhanced PostgreSQL database performance analyzer with comprehensive diagnostics including slow queries, connection issues, I/O bottlenecks, index usage, autovacuum, replication, system health, vacuum progress monitoring, XID wraparound analysis, table bloat detection, and long-running transaction identification. Based on production-ready runbooks with deep diagnostic capabilities.",
+    ),
+    credentialProviderConfigurations=credential_config,
+    targetConfiguration=lambda_target_config,
+)
 
 print(f"Target ID: {response['targetId']}")
@@ -1,306 +1,417 @@
+import copy
 import json
-import boto3
 import psycopg2
-import os
 import re
 import time
 import logging
+import uuid
 from datetime import datetime
-from botocore.exceptions import ClientError
+from decimal import Decimal
+from db_connection import connect_to_db, get_env_secret, release_connection
+from sql_lexer import fingerprint_query, validate_read_only_statements
+from plan_cache import diff_plans, flatten_plan, get_plan_cache, plan_relations
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
 class QueryComplexityError(Exception):
     """Custom exception for query complexity violations"""
+
     pass
 
+
 class QueryLimitError(Exception):
     """Custom exception for query limit violations"""
+
     pass
 
+
 def analyze_query_complexity(query):
     """
     Analyze query complexity and potential resource impact
-    
+
     Args:
         query (str): SQL query to analyze
-    
+
     Returns:
         dict: Complexity metrics
-        
+
     Raises:
         QueryComplexityError: If query is too complex
     """
     query_lower = query.lower()
     complexity_score = 0
     warnings = []
-    
+
     # Check for joins
-    join_count = sum(1 for join_type in ['join', 'inner join', 'left join', 'right join', 'full join'] 
-                    if join_type in query_lower)
+    join_count = sum(
+        1
+        for join_type in ["join", "inner join", "left join", "right join", "full join"]
+        if join_type in query_lower
+    )
     complexity_score += join_count * 2
     if join_count > 3:
         warnings.append(f"Query contains {join_count} joins - consider simplifying")
-    
+
     # Check for subqueries
-    subquery_count = query_lower.count('(select')
+    subquery_count = query_lower.count("(select")
     complexity_score += subquery_count * 3
     if subquery_count > 2:
-        warnings.append(f"Query contains {subquery_count} subqueries - consider restructuring")
-    
+        warnings.append(
+            f"Query contains {subquery_count} subqueries - consider restructuring"
+        )
+
     # Check for aggregations
-    agg_functions = ['count(', 'sum(', 'avg(', 'max(', 'min(']
+    agg_functions = ["count(", "sum(", "avg(", "max(", "min("]
     agg_count = sum(query_lower.count(func) for func in agg_functions)
     complexity_score += agg_count
-    
+
     # Check for window functions
-    if 'over(' in query_lower or 'partition by' in query_lower:
+    if "over(" in query_lower or "partition by" in query_lower:
         complexity_score += 3
         warnings.append("Query uses window functions - monitor performance")
-    
+
     # Check for complex WHERE conditions
-    where_pos = query_lower.find('where')
+    where_pos = query_lower.find("where")
     if where_pos != -1:
         where_clause = query_lower[where_pos:]
-        and_count = where_clause.count(' and ')
-        or_count = where_clause.count(' or ')
-        complexity_score += (and_count + or_count)
+        and_count = where_clause.count(" and ")
+        or_count = where_clause.count(" or ")
+        complexity_score += and_count + or_count
         if (and_count + or_count) > 5:
-            warnings.append(f"Complex WHERE clause with {and_count + or_count} conditions")
-    
+            warnings.append(
+                f"Complex WHERE clause with {and_count + or_count} conditions"
+            )
+
     return {
-        'complexity_score': complexity_score,
-        'warnings': warnings,
-        'join_count': join_count,
-        'subquery_count': subquery_count,
-        'aggregation_count': agg_count
+        "complexity_score": complexity_score,
+        "warnings": warnings,
+        "join_count": join_count,
+        "subquery_count": subquery_count,
+        "aggregation_count": agg_count,
     }
 
-def validate_and_execute_queries(secret_name, query, max_rows=20, 
-                               max_statements=5, max_total_rows=1000, 
-                               max_complexity=15):
+
+# Result streaming settings
+STREAM_BATCH_SIZE = 500
+MAX_SUMMARY_SCAN_ROWS = 100000
+
+
+class ColumnSummary:
+    """Running statistics for one result column, updated one value at a time"""
+
+    __slots__ = (
+        "count",
+        "nulls",
+        "minimum",
+        "maximum",
+        "total",
+        "numeric",
+        "comparable",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.nulls = 0
+        self.minimum = None
+        self.maximum = None
+        self.total = 0
+        self.numeric = True
+        self.comparable = True
+
+    def add(self, value):
+        if value is None:
+            self.nulls += 1
+            return
+        self.count += 1
+        if self.numeric and (
+            isinstance(value, bool) or not isinstance(value, (int, float, Decimal))
+        ):
+            self.numeric = False
+        if self.numeric:
+            self.total += value
+        if not self.comparable:
+            return
+        try:
+            if self.minimum is None or value < self.minimum:
+                self.minimum = value
+            if self.maximum is None or value > self.maximum:
+                self.maximum = value
+        except TypeError:
+            # Mixed or unorderable values (e.g. JSON documents)
+            self.comparable = False
+            self.minimum = self.maximum = None
+
+    def as_dict(self):
+        rows_seen = self.count + self.nulls
+        summary = {
+            "non_null": self.count,
+            "nulls": self.nulls,
+            "null_ratio": round(self.nulls / rows_seen, 4) if rows_seen else 0,
+        }
+        if self.comparable and self.count:
+            summary["min"] = self.minimum
+            summary["max"] = self.maximum
+        if self.numeric and self.count:
+            summary["mean"] = float(self.total) / self.count
+        return summary
+
+
+def stream_statement(
+    conn,
+    stmt,
+    row_budget,
+    summarize=False,
+    server_side=True,
+    max_scan_rows=MAX_SUMMARY_SCAN_ROWS,
+    batch_size=STREAM_BATCH_SIZE,
+):
+    """
+    Execute a statement and read its result in fetchmany batches
+
+    SELECTs run through a named (server-side) cursor, so rows stay on the
+    server until fetched. At most row_budget rows are kept for the response.
+    Without summarize, reading stops one row past the budget (to detect
+    truncation); with summarize, reading continues up to max_scan_rows while
+    per-column statistics are accumulated without keeping the rows.
+
+    Returns:
+        dict: columns, rows, rows_read, truncated, scan_complete and summary
+    """
+    result = {
+        "columns": [],
+        "rows": [],
+        "rows_read": 0,
+        "truncated": False,
+        "scan_complete": True,
+        "summary": None,
+    }
+    scan_limit = max(max_scan_rows, row_budget + 1) if summarize else row_budget + 1
+    cursor = (
+        conn.cursor(name=f"stream_{uuid.uuid4().hex[:16]}")
+        if server_side
+        else conn.cursor()
+    )
+
+    with cursor as cur:
+        if server_side:
+            cur.itersize = batch_size
+        cur.execute(stmt)
+        columns = None
+        summaries = None
+        rows = result["rows"]
+
+        while result["rows_read"] < scan_limit:
+            batch = cur.fetchmany(min(batch_size, scan_limit - result["rows_read"]))
+            if columns is None:
+                columns = (
+                    [desc[0] for desc in cur.description] if cur.description else []
+                )
+                result["columns"] = columns
+                if summarize:
+                    summaries = [ColumnSummary() for _ in columns]
+            if not batch:
+                break
+
+            for row in batch:
+                if len(rows) < row_budget:
+                    rows.append(dict(zip(columns, row, strict=True)))
+                if summaries:
+                    for summary, value in zip(summaries, row, strict=True):
+                        summary.add(value)
+            result["rows_read"] += len(batch)
+        else:
+            # Stopped at the scan limit; the server may hold more rows
+            result["scan_complete"] = False
+
+    result["truncated"] = (
+        result["rows_read"] > row_budget or not result["scan_complete"]
+    )
+    if summaries is not None:
+        result["summary"] = {
+            "rows_scanned": result["rows_read"],
+            "scan_complete": result["scan_complete"],
+            "columns": {
+                col: summary.as_dict()
+                for col, summary in zip(columns, summaries, strict=True)
+            },
+        }
+    return result
+
+
+def validate_and_execute_queries(
+    secret_name,
+    query,
+    max_rows=20,
+    max_statements=5,
+    max_total_rows=1000,
+    max_complexity=15,
+    summarize=False,
+):
     """
     Enhanced query validation and execution with additional controls
+
+    Rows are streamed through server-side cursors; with summarize=True each
+    SELECT is read past max_rows (up to MAX_SUMMARY_SCAN_ROWS) to compute
+    per-column statistics without holding the full result in memory.
     """
     response = {
-        'results': [],
-        'performance_metrics': None,
-        'warnings': [],
-        'optimization_suggestions': []
+        "results": [],
+        "performance_metrics": None,
+        "warnings": [],
+        "optimization_suggestions": [],
     }
-    
+
     start_time = time.time()
     conn = None
     total_rows = 0
-    
+
     try:
         # Validate and split queries
         statements = validate_query(query)
-        
+
         # Check number of statements
         if len(statements) > max_statements:
             raise QueryLimitError(
                 f"Too many statements ({len(statements)}). Maximum allowed is {max_statements}"
             )
-        
+
         # Connect to database
         conn = connect_to_db(secret_name)
-        
+
         with conn.cursor() as cur:
             # Set session parameters
             cur.execute("SET TRANSACTION READ ONLY")
             cur.execute("SET statement_timeout = '30s'")
             cur.execute("SET idle_in_transaction_session_timeout = '60s'")
-            
+
             # Execute each statement
-            for stmt_index, stmt in enumerate(statements, 1):
+            for stmt_index, parsed in enumerate(statements, 1):
+                stmt = parsed.text
+
                 # Analyze query complexity
                 complexity_metrics = analyze_query_complexity(stmt)
-                if complexity_metrics['complexity_score'] > max_complexity:
+                if complexity_metrics["complexity_score"] > max_complexity:
                     raise QueryComplexityError(
                         f"Statement {stmt_index} is too complex (score: {complexity_metrics['complexity_score']})"
                     )
-                
+
                 # Add complexity warnings to response
-                response['warnings'].extend(
+                response["warnings"].extend(
                     f"Statement {stmt_index}: {warning}"
-                    for warning in complexity_metrics['warnings']
+                    for warning in complexity_metrics["warnings"]
                 )
-                
+
                 stmt_response = {
-                    'columns': [],
-                    'rows': [],
-                    'truncated': False,
-                    'message': '',
-                    'row_count': 0,
-                    'query': stmt,
-                    'complexity_metrics': complexity_metrics
+                    "columns": [],
+                    "rows": [],
+                    "truncated": False,
+                    "message": "",
+                    "row_count": 0,
+                    "query": stmt,
+                    "complexity_metrics": complexity_metrics,
                 }
-                
-                stmt_lower = stmt.lower().strip()
-                
+
+                is_select = parsed.command == "select"
+                remaining_rows = max_total_rows - total_rows
+                row_budget = min(max_rows, remaining_rows)
+
                 # Only add LIMIT for SELECT queries
-                if stmt_lower.startswith('select') and 'limit' not in stmt_lower:
-                    remaining_rows = max_total_rows - total_rows
-                    limit_rows = min(max_rows, remaining_rows)
-                    stmt = f"{stmt} LIMIT {limit_rows + 1}"
-                
+                limited_stmt = stmt
+                if is_select and "limit" not in parsed.keywords:
+                    limited_stmt = f"{stmt} LIMIT {row_budget + 1}"
+
                 # Execute with explain plan first for SELECT queries
-                if stmt_lower.startswith('select'):
-                    #cur.execute(f"EXPLAIN (FORMAT JSON) {stmt}")
-                    #explain_plan = cur.fetchone()[0]
-                    
+                if is_select:
                     # Analyze plan for potential issues
-                    optimization_suggestions = analyze_query_performance(secret_name, stmt)
+                    optimization_suggestions = analyze_query_performance(
+                        secret_name, limited_stmt
+                    )
                     if optimization_suggestions:
-                        response['optimization_suggestions'].extend(
+                        response["optimization_suggestions"].extend(
                             f"Statement {stmt_index}: {suggestion}"
                             for suggestion in optimization_suggestions
                         )
-                
-                # Execute actual query
-                cur.execute(stmt)
-                
-                # Get column names
-                stmt_response['columns'] = [desc[0] for desc in cur.description]
-                
-                # Fetch results
-                rows = cur.fetchall()
-                row_count = len(rows)
-                
-                # Check total row limit
-                total_rows += row_count
-                if total_rows > max_total_rows:
-                    stmt_response['truncated'] = True
-                    excess_rows = total_rows - max_total_rows
-                    rows = rows[:-excess_rows]
-                    stmt_response['message'] = (
-                        f"Results truncated. Maximum total rows ({max_total_rows}) reached"
-                    )
-                    total_rows = max_total_rows
-                
-                # Check individual statement limit
-                elif row_count > max_rows:
-                    stmt_response['truncated'] = True
-                    rows = rows[:max_rows]
-                    stmt_response['message'] = (
-                        f"Results truncated to {max_rows} rows"
-                    )
-                
-                stmt_response['row_count'] = len(rows)
-                stmt_response['rows'] = [
-                    dict(zip(stmt_response['columns'], row))
-                    for row in rows
-                ]
-                
-                response['results'].append(stmt_response)
-            
+
+                # Execute actual query, streaming rows from a server-side cursor.
+                # Summaries need the unlimited statement so they cover the full result.
+                streamed = stream_statement(
+                    conn,
+                    stmt if (is_select and summarize) else limited_stmt,
+                    row_budget,
+                    summarize=is_select and summarize,
+                    server_side=is_select,
+                )
+
+                stmt_response["columns"] = streamed["columns"]
+                stmt_response["rows"] = streamed["rows"]
+                stmt_response["row_count"] = len(streamed["rows"])
+                stmt_response["rows_read"] = streamed["rows_read"]
+                if streamed["summary"]:
+                    stmt_response["summary"] = streamed["summary"]
+                total_rows += stmt_response["row_count"]
+
+                if streamed["truncated"]:
+                    stmt_response["truncated"] = True
+                    if row_budget < max_rows:
+                        # Check total row limit
+                        stmt_response["message"] = (
+                            f"Results truncated. Maximum total rows ({max_total_rows}) reached"
+                        )
+                    else:
+                        # Check individual statement limit
+                        stmt_response["message"] = (
+                            f"Results truncated to {max_rows} rows"
+                        )
+
+                response["results"].append(stmt_response)
+
             # Add overall performance metrics
             total_time = time.time() - start_time
-            response['performance_metrics'] = {
-                'execution_time': total_time,
-                'statements_executed': len(statements),
-                'total_rows': total_rows,
-                'timestamp': datetime.utcnow().isoformat(),
-                'needs_analysis': total_time > 5,
-                'performance_message': (
+            response["performance_metrics"] = {
+                "execution_time": total_time,
+                "statements_executed": len(statements),
+                "total_rows": total_rows,
+                "timestamp": datetime.utcnow().isoformat(),
+                "needs_analysis": total_time > 5,
+                "performance_message": (
                     f"Executed {len(statements)} statements in {total_time:.2f} seconds"
-                )
+                ),
             }
-            
+
             # Add performance recommendations if needed
             if total_time > 5:
-                response['warnings'].append(
+                response["warnings"].append(
                     "Query execution time exceeded 5 seconds. Consider optimization."
                 )
-            
+
             return response
-                
+
     except (QueryComplexityError, QueryLimitError) as e:
         error_msg = str(e)
         logger.warning(error_msg)
         raise ValueError(error_msg)
-        
+
     except psycopg2.Error as pe:
         error_msg = f"Database error: {str(pe)}"
         logger.error(error_msg)
         raise Exception(error_msg)
-        
+
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
         logger.error(error_msg)
         raise Exception(error_msg)
-    
+
     finally:
         if conn:
-            conn.close()
-
-def get_secret(secret_name):
-    """Get secret from AWS Secrets Manager """
-    secret_name = secret_name
-    region_name = os.environ['REGION']
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
-    
-    try:
-        secret_value = client.get_secret_value(SecretId=secret_name)
-        secret = json.loads(secret_value['SecretString'])
-        return secret
-    except ClientError as e:
-        raise Exception(f"Failed to get secret: {str(e)}")
-
-def get_env_secret(environment):
-    ssm_client = boto3.client('ssm')
-    """Retrieve the secret name for the specified environment"""
-    if environment == 'prod':
-        try:
-            # Get the secret name from Parameter Store
-            response = ssm_client.get_parameter(
-                Name=f'/AuroraOps/{environment}'
-            )
-            print(response['Parameter']['Value'])
-            return response['Parameter']['Value']
-        except ssm_client.exceptions.ParameterNotFound:
-            error_message = f"Parameter not found: /AuroraOps/{environment}"
-            print(error_message)
-            raise Exception(error_message)
-    elif environment == 'dev':
-        try:
-            # Get the secret name from Parameter Store
-            response = ssm_client.get_parameter(
-                Name=f'/AuroraOps/{environment}'
-            )
-            return response['Parameter']['Value']
-        except Exception as e:
-            raise Exception(f"Failed to get dev secret name from Parameter Store: {str(e)}")
-    else:
-        print("environement does not exist")
-        raise ValueError(f"Unknown environment: {environment}")
+            release_connection(conn)
 
-def connect_to_db(secret_name):
-    """Establish database connection"""
-    cur_secret = secret_name
-    secret = get_secret(cur_secret)
-    try:
-        conn = psycopg2.connect(
-            host=secret['host'],
-            database=secret['dbname'],
-            user=secret['username'],
-            password=secret['password'],
-            port=secret['port']
-        )
-        return conn
-    except Exception as e:
-        raise Exception(f"Failed to connect to the database: {str(e)}")
 
 # Define the queries dictionary for different object types
 queries = {
-    'table': """
+    "table": """
         WITH RECURSIVE columns AS (
             SELECT 
                 t.schemaname,
@@ -356,8 +467,7 @@ queries = {
         FROM columns col
         WHERE col.tablename ILIKE %s AND col.schemaname = %s
     """,
-
-    'view': """
+    "view": """
         SELECT 
             schemaname || '.' || viewname as object_name,
             'VIEW' as object_type,
@@ -376,8 +486,7 @@ queries = {
         AND schemaname = %s
         AND schemaname NOT IN ('pg_catalog', 'information_schema')
     """,
-
-    'function': """
+    "function": """
         SELECT 
             n.nspname || '.' || p.proname as object_name,
             'FUNCTION' as object_type,
@@ -393,8 +502,7 @@ queries = {
         AND n.nspname NOT IN ('pg_catalog', 'information_schema')
         AND p.prokind = 'f'  -- 'f' for function
     """,
-
-    'procedure': """
+    "procedure": """
         SELECT 
             n.nspname || '.' || p.proname as object_name,
             'PROCEDURE' as object_type,
@@ -407,8 +515,7 @@ queries = {
         AND n.nspname NOT IN ('pg_catalog', 'information_schema')
         AND p.prokind = 'p'  -- 'p' for procedure
     """,
-
-    'trigger': """
+    "trigger": """
         SELECT 
             n.nspname || '.' || t.tgname as object_name,
             'TRIGGER' as object_type,
@@ -422,8 +529,7 @@ queries = {
         AND n.nspname NOT IN ('pg_catalog', 'information_schema')
         AND NOT t.tgisinternal
     """,
-
-    'sequence': """
+    "sequence": """
         SELECT 
             n.nspname || '.' || c.relname as object_name,
             'SEQUENCE' as object_type,
@@ -446,8 +552,7 @@ queries = {
         AND n.nspname = %s
         AND n.nspname NOT IN ('pg_catalog', 'information_schema')
     """,
-
-    'index': """
+    "index": """
         SELECT 
             n.nspname || '.' || c.relname as object_name,
             'INDEX' as object_type,
@@ -459,23 +564,27 @@ queries = {
         WHERE c.relname ILIKE %s
         AND n.nspname = %s
         AND n.nspname NOT IN ('pg_catalog', 'information_schema')
-    """
+    """,
 }
 
-def extract_database_object_ddl(secret_name, object_type, object_name=None, object_schema=None):
+
+def extract_database_object_ddl(
+    secret_name, object_type, object_name=None, object_schema=None
+):
     """
     Extract DDL and description for database objects
-    
+
     Args:
         secret_name (str): The name of the secret containing database credentials
         object_type (str): Type of database object ('table', 'view', 'function', 'procedure', etc.)
         object_name (str, optional): Name of the object to search for
         object_schema (str, optional): Schema name to filter objects
-    
+
     Returns:
         list: List of dictionaries containing object information
         str: Error message if no objects found
     """
+    conn = None
     try:
         # Input validation
         if not object_name or not object_schema:
@@ -484,8 +593,10 @@ def extract_database_object_ddl(secret_name, object_type, object_name=None, obje
         # Validate object_type
         object_type_lower = object_type.lower()
         if object_type_lower not in queries:
-            valid_types = ', '.join(queries.keys())
-            raise ValueError(f"Invalid object_type: {object_type}. Valid types are: {valid_types}")
+            valid_types = ", ".join(queries.keys())
+            raise ValueError(
+                f"Invalid object_type: {object_type}. Valid types are: {valid_types}"
+            )
 
         # Connect to database
         conn = connect_to_db(secret_name)
@@ -503,13 +614,13 @@ def extract_database_object_ddl(secret_name, object_type, object_name=None, obje
                 # Get query and execute
                 query = queries[object_type_lower]
                 params = [object_name, object_schema]
-                
+
                 print("\nExecuting query with parameters:")
                 print(f"Query: {query}")
                 print(f"Parameters: {params}")
 
                 cur.execute(query, params)
-                
+
                 # Fetch results
                 rows = cur.fetchall()
                 if not rows:
@@ -532,20 +643,30 @@ def extract_database_object_ddl(secret_name, object_type, object_name=None, obje
                         result[column] = row[i] if i < len(row) else None
 
                     # Add explanation based on object type
-                    if result.get('definition'):
-                        if object_type_lower == 'table':
-                            result['explanation'] = analyze_table_definition(result['definition'])
-                        elif object_type_lower == 'view':
-                            result['explanation'] = analyze_view_definition(result['definition'])
-                        elif object_type_lower in ('function', 'procedure'):
-                            result['explanation'] = analyze_routine_definition(result['definition'])
-                        elif object_type_lower == 'trigger':
-                            result['explanation'] = analyze_trigger_definition(result['definition'])
+                    if result.get("definition"):
+                        if object_type_lower == "table":
+                            result["explanation"] = analyze_table_definition(
+                                result["definition"]
+                            )
+                        elif object_type_lower == "view":
+                            result["explanation"] = analyze_view_definition(
+                                result["definition"]
+                            )
+                        elif object_type_lower in ("function", "procedure"):
+                            result["explanation"] = analyze_routine_definition(
+                                result["definition"]
+                            )
+                        elif object_type_lower == "trigger":
+                            result["explanation"] = analyze_trigger_definition(
+                                result["definition"]
+                            )
                         else:
-                            result['explanation'] = f"DDL for {object_type_lower}"
+                            result["explanation"] = f"DDL for {object_type_lower}"
 
                     results.append(result)
-                    print(f"\nProcessed {object_type_lower}: {result.get('object_name', 'unknown')}")
+                    print(
+                        f"\nProcessed {object_type_lower}: {result.get('object_name', 'unknown')}"
+                    )
 
             except Exception as e:
                 error_msg = f"Error executing query: {str(e)}"
@@ -570,65 +691,66 @@ def extract_database_object_ddl(secret_name, object_type, object_name=None, obje
     finally:
         if conn:
             try:
-                conn.close()
-                print("\nDatabase connection closed")
+                release_connection(conn)
+                print("\nDatabase connection returned to pool")
             except Exception as e:
-                print(f"\nError closing connection: {str(e)}")
+                print(f"\nError releasing connection: {str(e)}")
 
 
 def analyze_table_definition(definition):
     """Analyze table DDL and return explanatory notes"""
     explanation = ["This table contains the following structure:"]
-    
+
     # Extract column definitions
     columns = []
-    for line in definition.split('\n'):
-        if 'CREATE TABLE' not in line and '(' not in line and ')' not in line:
+    for line in definition.split("\n"):
+        if "CREATE TABLE" not in line and "(" not in line and ")" not in line:
             if line.strip():
                 columns.append(line.strip())
 
     # Analyze columns
     for column in columns:
-        if column.endswith(','):
+        if column.endswith(","):
             column = column[:-1]
         parts = column.split()
         if len(parts) >= 2:
             col_name = parts[0]
             col_type = parts[1]
-            constraints = ' '.join(parts[2:])
+            constraints = " ".join(parts[2:])
             explanation.append(f"- {col_name}: {col_type} {constraints}")
 
-    return '\n'.join(explanation)
+    return "\n".join(explanation)
+
 
 def generate_object_explanation(obj_info):
     """
     Generate a human-readable explanation of the database object
-    
+
     Args:
         obj_info (dict): Dictionary containing object information
-    
+
     Returns:
         str: Human-readable explanation of the object
     """
     try:
-        definition = obj_info.get('definition', '')
-        obj_type = obj_info.get('object_type', '')
+        definition = obj_info.get("definition", "")
+        obj_type = obj_info.get("object_type", "")
         explanation = []
 
         # Add object description if available
-        description = obj_info.get('description', '')
+        description = obj_info.get("description", "")
         if description:
             explanation.append(f"Description: {description}")
 
         # Analyze based on object type
-        if obj_type == 'TABLE':
+        if obj_type == "TABLE":
             explanation.extend(analyze_table_definition(definition))
-        elif obj_type == 'VIEW':
+        elif obj_type == "VIEW":
             explanation.extend(analyze_view_definition(definition))
-        elif obj_type in ('FUNCTION', 'PROCEDURE'):
+        elif obj_type in ("FUNCTION", "PROCEDURE"):
             explanation.extend(analyze_routine_definition(definition))
 
-        return '\n'.join(explanation) if explanation else "No explanation available"
+        return "\n".join(explanation) if explanation else "No explanation available"
 
     except Exception as e:
         print(f"Error generating explanation: {str(e)}")
@@ -638,104 +760,108 @@ def generate_object_explanation(obj_info):
 def analyze_view_definition(definition):
     """Analyze view DDL and return explanatory notes"""
     explanation = ["This view represents the following:"]
-    
+
     # Clean up the definition
-    clean_def = definition.replace('\n', ' ').strip()
-    
+    clean_def = definition.replace("\n", " ").strip()
+
     # Extract main components
-    if 'SELECT' in clean_def:
-        explanation.append("This view performs a SELECT operation with the following characteristics:")
-        
+    if "SELECT" in clean_def:
+        explanation.append(
+            "This view performs a SELECT operation with the following characteristics:"
+        )
+
         # Analyze SELECT clause
-        if 'JOIN' in clean_def:
+        if "JOIN" in clean_def:
             explanation.append("- Joins multiple tables")
-        if 'WHERE' in clean_def:
+        if "WHERE" in clean_def:
             explanation.append("- Applies filtering conditions")
-        if 'GROUP BY' in clean_def:
+        if "GROUP BY" in clean_def:
             explanation.append("- Aggregates data")
-        if 'HAVING' in clean_def:
+        if "HAVING" in clean_def:
             explanation.append("- Applies post-aggregation filters")
-        if 'ORDER BY' in clean_def:
+        if "ORDER BY" in clean_def:
             explanation.append("- Sorts the results")
-        if 'UNION' in clean_def:
+        if "UNION" in clean_def:
             explanation.append("- Combines multiple result sets")
-        if 'WITH' in clean_def:
+        if "WITH" in clean_def:
             explanation.append("- Uses Common Table Expressions (CTEs)")
 
-    return '\n'.join(explanation)
+    return "\n".join(explanation)
+
 
 def analyze_routine_definition(definition):
     """Analyze function/procedure DDL and return explanatory notes"""
     explanation = []
-    
+
     # Determine if it's a function or procedure
-    if 'FUNCTION' in definition:
+    if "FUNCTION" in definition:
         explanation.append("This is a function that:")
     else:
         explanation.append("This is a procedure that:")
 
     # Extract parameters
-    if '(' in definition:
-        param_section = definition[definition.find('(')+1:definition.find(')')]
-        params = param_section.split(',')
+    if "(" in definition:
+        param_section = definition[definition.find("(") + 1 : definition.find(")")]
+        params = param_section.split(",")
         if params and params[0].strip():
             explanation.append("\nParameters:")
             for param in params:
                 explanation.append(f"- {param.strip()}")
 
     # Identify return type for functions
-    if 'RETURNS' in definition:
-        return_type = definition[definition.find('RETURNS')+7:].split()[0]
+    if "RETURNS" in definition:
+        return_type = definition[definition.find("RETURNS") + 7 :].split()[0]
         explanation.append(f"\nReturns: {return_type}")
 
     # Analyze body
-    if 'BEGIN' in definition:
+    if "BEGIN" in definition:
         explanation.append("\nLogic overview:")
-        if 'IF' in definition:
+        if "IF" in definition:
             explanation.append("- Contains conditional logic")
-        if 'LOOP' in definition or 'WHILE' in definition:
+        if "LOOP" in definition or "WHILE" in definition:
             explanation.append("- Contains loops")
-        if 'INSERT' in definition:
+        if "INSERT" in definition:
             explanation.append("- Performs data insertion")
-        if 'UPDATE' in definition:
+        if "UPDATE" in definition:
             explanation.append("- Performs data updates")
-        if 'DELETE' in definition:
+        if "DELETE" in definition:
             explanation.append("- Performs data deletion")
-        if 'SELECT' in definition:
+        if "SELECT" in definition:
             explanation.append("- Retrieves data")
-        if 'EXCEPTION' in definition:
+        if "EXCEPTION" in definition:
             explanation.append("- Includes error handling")
 
-    return '\n'.join(explanation)
+    return "\n".join(explanation)
+
 
 def analyze_trigger_definition(definition):
     """Analyze trigger DDL and return explanatory notes"""
     explanation = ["This trigger:"]
-    
-    if 'BEFORE' in definition:
+
+    if "BEFORE" in definition:
         explanation.append("- Executes BEFORE the event")
-    elif 'AFTER' in definition:
+    elif "AFTER" in definition:
         explanation.append("- Executes AFTER the event")
-    
-    if 'INSERT' in definition:
+
+    if "INSERT" in definition:
         explanation.append("- Fires on INSERT")
-    if 'UPDATE' in definition:
+    if "UPDATE" in definition:
         explanation.append("- Fires on UPDATE")
-    if 'DELETE' in definition:
+    if "DELETE" in definition:
         explanation.append("- Fires on DELETE")
-    
-    if 'FOR EACH ROW' in definition:
+
+    if "FOR EACH ROW" in definition:
         explanation.append("- Executes for each affected row")
-    elif 'FOR EACH STATEMENT' in definition:
+    elif "FOR EACH STATEMENT" in definition:
         explanation.append("- Executes once per statement")
 
-    return '\n'.join(explanation)
+    return "\n".join(explanation)
 
 
 def clean_query_for_explain(query):
     """
     Remove any existing EXPLAIN or EXPLAIN ANALYZE keywords from the query
-    
+
     Parameters:
     - query: Original query string
     Returns:
@@ -743,70 +869,158 @@ def clean_query_for_explain(query):
     """
     # Remove common EXPLAIN variants (case-insensitive)
     patterns = [
-        r'^\s*EXPLAIN\s+ANALYZE\s+',
-        r'^\s*EXPLAIN\s+\(.*?\)\s+',
-        r'^\s*EXPLAIN\s+'
+        r"^\s*EXPLAIN\s+ANALYZE\s+",
+        r"^\s*EXPLAIN\s+\(.*?\)\s+",
+        r"^\s*EXPLAIN\s+",
     ]
-    
+
     cleaned_query = query
     for pattern in patterns:
-        cleaned_query = re.sub(pattern, '', cleaned_query, flags=re.IGNORECASE)
-    
+        cleaned_query = re.sub(pattern, "", cleaned_query, flags=re.IGNORECASE)
+
     return cleaned_query.strip()
 
-def analyze_query_performance(secret_name, query_or_object_name, parameters=None, object_type=None):
+
+def get_statistics_signature(cur, relations):
+    """
+    Build a signature of the planner statistics for the given relations
+
+    The signature changes when a relation is (auto-)analyzed or its size
+    estimates move, which is when a cached plan may no longer be valid.
+    """
+    if not relations:
+        return ""
+    cur.execute(
+        """
+        SELECT c.relname, c.reltuples, c.relpages, s.last_analyze, s.last_autoanalyze
+        FROM pg_catalog.pg_class c
+        LEFT JOIN pg_catalog.pg_stat_all_tables s ON s.relid = c.oid
+        WHERE c.relname = ANY(%s)
+        ORDER BY c.relname, c.oid
+    """,
+        (list(relations),),
+    )
+    return repr(cur.fetchall())
+
+
+def prepare_query_for_explain(query_to_analyze):
+    """
+    Clean a query for EXPLAIN and replace $n placeholders for a generic plan
+
+    Returns:
+        tuple: (query to explain, True if the query is parameterized)
+    """
+    query_to_analyze = clean_query_for_explain(query_to_analyze)
+
+    # Check if the query contains parameter placeholders
+    has_parameters = any(f"${i}" in query_to_analyze for i in range(1, 21))
+    if has_parameters:
+        # Replace $n parameters with dummy placeholders (highest first so $1 does not clobber $10)
+        for i in range(20, 0, -1):
+            query_to_analyze = query_to_analyze.replace(f"${i}", "NULL")
+    return query_to_analyze, has_parameters
+
+
+def analyze_query_performance(
+    secret_name, query_or_object_name, parameters=None, object_type=None, use_cache=True
+):
     """
     Analyze query performance and provide optimization recommendations
-    
+
+    Plans are cached per database and normalized query fingerprint. A cached
+    analysis is reused while it is within the TTL, the literal values match
+    and the planner statistics of the referenced relations are unchanged.
+    When a query is re-analyzed with the same literal values, the new plan is
+    diffed against the previous one and regressions are reported as issues.
+
     Parameters:
     - secret_name: Secret containing database credentials
     - query_or_object_name: SQL query string or object name to analyze
     - parameters: Optional. List of parameter values for parameterized queries
     - object_type: Optional. If provided, will fetch definition from database object
+    - use_cache: Optional. Set to False to always run EXPLAIN
     """
+    plan_cache = get_plan_cache()
     conn = connect_to_db(secret_name)
     try:
         with conn.cursor() as cur:
             # If object_type is provided, fetch the query definition
             if object_type:
-                query_to_analyze = get_object_definition(cur, query_or_object_name, object_type)
+                query_to_analyze = get_object_definition(
+                    cur, query_or_object_name, object_type
+                )
             else:
                 query_to_analyze = query_or_object_name
 
-            # Clean the query before analysis
-            query_to_analyze = clean_query_for_explain(query_to_analyze)
-
-            # Check if the query contains parameter placeholders
-            has_parameters = any(f'${i}' in query_to_analyze for i in range(1, 21))
+            query_to_analyze, has_parameters = prepare_query_for_explain(
+                query_to_analyze
+            )
+            fingerprint, constants_hash = fingerprint_query(query_to_analyze)
+            cache_key = (secret_name, fingerprint, has_parameters)
+
+            previous = None
+            if use_cache:
+                previous, fresh = plan_cache.get(cache_key)
+                if previous and fresh and previous["constants_hash"] == constants_hash:
+                    signature = get_statistics_signature(cur, previous["relations"])
+                    if signature == previous["stats_signature"]:
+                        plan_cache.record("hits")
+                        analysis = copy.deepcopy(previous["analysis"])
+                        analysis["plan_cache"] = {
+                            "status": "hit",
+                            "fingerprint": fingerprint,
+                            "age_seconds": round(
+                                time.monotonic() - previous["cached_at"], 1
+                            ),
+                        }
+                        return analysis
+                if previous:
+                    plan_cache.record("stale")
 
             if has_parameters:
-                # Replace $n parameters with dummy placeholders
-                modified_query = query_to_analyze
-                param_count = 0
-                for i in range(1, 21):
-                    if f'${i}' in modified_query:
-                        param_count = max(param_count, i)
-                        modified_query = modified_query.replace(f'${i}', 'NULL')
-
                 # Use GENERIC_PLAN for parameterized queries
-                cur.execute(f"EXPLAIN (GENERIC_PLAN, BUFFERS, FORMAT JSON) {modified_query}")
-                plan = cur.fetchone()[0]
-
-                cur.execute(f"EXPLAIN (FORMAT JSON) {modified_query}")
-                estimated_plan = cur.fetchone()[0]
-                
-                # Pass True for is_generic_plan
-                analysis = analyze_execution_plan(plan[0], estimated_plan[0], True)
+                cur.execute(
+                    f"EXPLAIN (GENERIC_PLAN, BUFFERS, FORMAT JSON) {query_to_analyze}"
+                )
             else:
                 # For non-parameterized queries, use ANALYZE
-                cur.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query_to_analyze}")
-                plan = cur.fetchone()[0]
-                
-                cur.execute(f"EXPLAIN (FORMAT JSON) {query_to_analyze}")
-                estimated_plan = cur.fetchone()[0]
-                
-                # Pass False for is_generic_plan
-                analysis = analyze_execution_plan(plan[0], estimated_plan[0], False)
+                cur.execute(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query_to_analyze}"
+                )
+            plan = cur.fetchone()[0]
+
+            analysis = analyze_execution_plan(plan[0], has_parameters)
+
+            # Plans built from different literal values can legitimately differ,
+            # so only diff against a baseline for the same query and constants
+            if previous and previous["constants_hash"] == constants_hash:
+                plan_diff = diff_plans(previous["plan"], plan[0]["Plan"])
+                analysis["plan_diff"] = plan_diff
+                for regression in plan_diff["regressions"]:
+                    analysis["issues"].append(
+                        {
+                            "type": "plan_regression",
+                            "description": f"Plan regression since last analysis: {regression}",
+                            "severity": "high",
+                        }
+                    )
+
+            if use_cache:
+                relations = plan_relations(plan[0]["Plan"])
+                plan_cache.put(
+                    cache_key,
+                    {
+                        "plan": plan[0]["Plan"],
+                        "analysis": copy.deepcopy(analysis),
+                        "constants_hash": constants_hash,
+                        "relations": relations,
+                        "stats_signature": get_statistics_signature(cur, relations),
+                    },
+                )
+            analysis["plan_cache"] = {
+                "status": "refreshed" if previous else "miss",
+                "fingerprint": fingerprint,
+            }
 
             return analysis
 
@@ -814,157 +1028,458 @@ def analyze_query_performance(secret_name, query_or_object_name, parameters=None
         raise Exception(f"Failed to analyze query performance: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
+
+def check_plan_regression(secret_name, query):
+    """
+    Compare the current plan of a query with its cached baseline without ANALYZE
 
-def analyze_execution_plan(actual_plan, estimated_plan, is_generic_plan):
+    Runs only a plain EXPLAIN (no execution) and diffs it against the plan cached
+    by a previous explain_query call with the same literal values, so
+    regressions can be spotted without running the query on production again.
+
+    Returns:
+        dict: baseline information and the plan diff, or a message if no baseline exists
+    """
+    query_to_analyze, has_parameters = prepare_query_for_explain(query)
+    fingerprint, constants_hash = fingerprint_query(query_to_analyze)
+    baseline, _ = get_plan_cache().get((secret_name, fingerprint, has_parameters))
+    if not baseline:
+        return {
+            "fingerprint": fingerprint,
+            "baseline_found": False,
+            "message": "No cached plan for this query yet. Run explain_query first to record a baseline.",
+        }
+    if baseline["constants_hash"] != constants_hash:
+        return {
+            "fingerprint": fingerprint,
+            "baseline_found": False,
+            "message": "The cached plan was recorded with different literal values. "
+            "Run explain_query with these values first to record a baseline.",
+        }
+
+    conn = connect_to_db(secret_name)
+    try:
+        with conn.cursor() as cur:
+            options = "GENERIC_PLAN, FORMAT JSON" if has_parameters else "FORMAT JSON"
+            cur.execute(f"EXPLAIN ({options}) {query_to_analyze}")
+            current_plan = cur.fetchone()[0][0]["Plan"]
+            signature = get_statistics_signature(cur, baseline["relations"])
+        return {
+            "fingerprint": fingerprint,
+            "baseline_found": True,
+            "baseline_age_seconds": round(time.monotonic() - baseline["cached_at"], 1),
+            "statistics_changed": signature != baseline["stats_signature"],
+            "plan_diff": diff_plans(baseline["plan"], current_plan),
+        }
+    except Exception as e:
+        raise Exception(f"Failed to check plan regression: {str(e)}")
+    finally:
+        if conn:
+            release_connection(conn)
+
+
+def format_plan_regression_output(results):
+    """Format a plan regression check into human-readable text"""
+    output = ["Plan Regression Check:"]
+    output.append(f"- Query fingerprint: {results['fingerprint']}")
+    if not results["baseline_found"]:
+        output.append(f"- {results['message']}")
+        return "\n".join(output)
+
+    diff = results["plan_diff"]
+    output.append(f"- Baseline age: {results['baseline_age_seconds']} seconds")
+    output.append(
+        f"- Statistics changed since baseline: {'yes' if results['statistics_changed'] else 'no'}"
+    )
+    output.append(
+        f"- Plan shape unchanged: {'yes' if diff['identical_shape'] else 'no'}"
+    )
+    output.append(
+        f"- Estimated cost: {diff['root']['old_total_cost']} -> {diff['root']['new_total_cost']}"
+    )
+    output.append("")
+    output.extend(format_plan_diff_lines(diff))
+    return "\n".join(output)
+
+
+def format_plan_diff_lines(diff):
+    """Render the node changes, drift and regressions of a plan diff"""
+    output = []
+    if diff["node_changes"]:
+        output.append("Plan Node Changes:")
+        for change in diff["node_changes"]:
+            if change["change"] == "changed":
+                output.append(
+                    f"- [{change['path']}] {change['from']} -> {change['to']}"
+                )
+            else:
+                output.append(
+                    f"- [{change['path']}] {change['change']}: {change['node']}"
+                )
+        output.append("")
+    if diff["row_estimate_drift"]:
+        output.append("Row Estimate Drift:")
+        for drift in diff["row_estimate_drift"]:
+            output.append(
+                f"- [{drift['path']}] {drift['node']}: {drift['old_plan_rows']} -> "
+                f"{drift['new_plan_rows']} rows ({drift['factor']}x)"
+            )
+        output.append("")
+    if diff["buffer_deltas"]:
+        output.append("Buffer Deltas:")
+        for delta in diff["buffer_deltas"]:
+            output.append(f"- [{delta['path']}] {delta['node']}: {delta['deltas']}")
+        output.append("")
+    if diff["regressions"]:
+        output.append("Regressions:")
+        for regression in diff["regressions"]:
+            output.append(f"- {regression}")
+        output.append("")
+    elif not diff["node_changes"]:
+        output.append("No plan changes detected.")
+    return output
+
+
+# Plan analysis thresholds
+MAX_PLAN_NODES = 5000
+HOT_NODE_LIMIT = 5
+SEQ_SCAN_ROW_THRESHOLD = 10000
+SEQ_SCAN_TIME_SHARE = 0.05
+ESTIMATE_ERROR_FACTOR = 10
+NESTED_LOOP_ROW_THRESHOLD = 1000
+HASH_JOIN_ROW_THRESHOLD = 10000
+
+
+def analyze_execution_plan(plan, is_generic_plan):
     """
     Analyze execution plan and provide detailed explanations and recommendations
+
+    The JSON plan carries the planner estimates ('Plan Rows') next to the
+    actual figures, so a single EXPLAIN result is enough.
     """
     analysis = {
-        'summary': [],
-        'issues': [],
-        'recommendations': [],
-        'performance_stats': {}
+        "summary": [],
+        "issues": [],
+        "recommendations": [],
+        "performance_stats": {},
     }
 
-    analysis['plan_type'] = 'Generic Plan' if is_generic_plan else 'Analyzed Plan'
+    analysis["plan_type"] = "Generic Plan" if is_generic_plan else "Analyzed Plan"
 
     # Extract key performance metrics
-    total_cost = actual_plan['Plan'].get('Total Cost')
-    rows = actual_plan['Plan'].get('Plan Rows')  # Use Plan Rows for generic plans
-    estimated_rows = estimated_plan['Plan'].get('Plan Rows')
-    
+    total_cost = plan["Plan"].get("Total Cost")
+    rows = plan["Plan"].get("Plan Rows")  # Use Plan Rows for generic plans
+
     # Initialize performance stats
     performance_stats = {
-        'total_cost': total_cost,
-        'estimated_rows': estimated_rows,
-        'plan_rows': rows
+        "total_cost": total_cost,
+        "estimated_rows": rows,
+        "plan_rows": rows,
     }
 
     # Add actual execution metrics only for analyzed plans
     if not is_generic_plan:
-        actual_time = actual_plan['Plan'].get('Actual Total Time')
-        actual_rows = actual_plan['Plan'].get('Actual Rows')
-        performance_stats.update({
-            'execution_time_ms': actual_time,
-            'actual_rows': actual_rows
-        })
-    
-    analysis['performance_stats'] = performance_stats
-
-    # Analyze node types and operations
-    analyze_plan_node(actual_plan['Plan'], analysis, is_generic_plan)
-    
-    # Check for common issues
-    identify_performance_issues(actual_plan['Plan'], estimated_plan['Plan'], analysis, is_generic_plan)
-    
+        actual_time = plan["Plan"].get("Actual Total Time")
+        actual_rows = plan["Plan"].get("Actual Rows")
+        performance_stats.update(
+            {"execution_time_ms": actual_time, "actual_rows": actual_rows}
+        )
+
+    analysis["performance_stats"] = performance_stats
+
+    # Attribute time, buffers and estimate error to every node
+    profiles, truncated = profile_plan_nodes(plan["Plan"], is_generic_plan)
+    analysis["node_profile"] = {
+        "node_count": len(profiles),
+        "truncated": truncated,
+        "metric": "cost" if is_generic_plan else "time_ms",
+        "hot_nodes": rank_hot_nodes(profiles),
+    }
+
+    # Check for common issues, collapsing duplicates across nodes
+    identify_performance_issues(profiles, analysis, is_generic_plan)
+
     # Generate recommendations
     generate_recommendations(analysis)
-    
+
     return analysis
 
-def analyze_plan_node(node, analysis, is_generic_plan):
+
+def _node_label(node):
+    """Short description of a plan node, e.g. 'Seq Scan on orders'"""
+    relation = node.get("Relation Name") or node.get("Index Name")
+    return f"{node['Node Type']} on {relation}" if relation else node["Node Type"]
+
+
+def _node_buffers(node):
+    return (
+        node.get("Shared Hit Blocks", 0)
+        + node.get("Shared Read Blocks", 0)
+        + node.get("Temp Read Blocks", 0)
+        + node.get("Temp Written Blocks", 0)
+    )
+
+
+def profile_plan_nodes(plan, is_generic_plan):
     """
-    Recursively analyze each node in the execution plan
+    Flatten the plan iteratively and compute per-node cost attribution
+
+    For analyzed plans the metric is time in ms (Actual Total Time x loops);
+    for generic plans it is the planner's Total Cost. Exclusive values are the
+    node's inclusive value minus that of its direct children. EXPLAIN reports
+    buffers inclusively as well, so they are attributed the same way.
+
+    Returns:
+        tuple: (list of node profiles in pre-order, True if the plan was truncated)
     """
-    # Analyze current node
-    node_type = node['Node Type']
-    
-    # Check for expensive operations with appropriate metrics based on plan type
-    if node_type == 'Seq Scan':
-        analysis['issues'].append({
-            'type': 'sequential_scan',
-            'description': f"Sequential scan detected on table {node.get('Relation Name')}",
-            'severity': 'high'
-        })
-    
-    elif node_type == 'Nested Loop':
+    flat = flatten_plan(plan, max_nodes=MAX_PLAN_NODES + 1)
+    truncated = len(flat) > MAX_PLAN_NODES
+    if truncated:
+        flat = flat[:MAX_PLAN_NODES]
+
+    profiles = []
+    for item in flat:
+        node = item["node"]
+        loops = node.get("Actual Loops", 1) or 0
         if is_generic_plan:
-            if node.get('Plan Rows', 0) > 1000:
-                analysis['issues'].append({
-                    'type': 'nested_loop_large_dataset',
-                    'description': "Nested loop join planned for large dataset",
-                    'severity': 'medium'
-                })
+            inclusive = node.get("Total Cost", 0)
+            estimate_error = None
         else:
-            if node.get('Actual Rows', 0) > 1000:
-                analysis['issues'].append({
-                    'type': 'nested_loop_large_dataset',
-                    'description': "Nested loop join performed on large dataset",
-                    'severity': 'medium'
-                })
-    
-    elif node_type == 'Hash Join':
-        rows_metric = node.get('Plan Rows' if is_generic_plan else 'Actual Rows', 0)
-        if node.get('Hash Cond') and rows_metric > 10000:
-            analysis['issues'].append({
-                'type': 'large_hash_join',
-                'description': "Large hash join operation detected",
-                'severity': 'medium'
-            })
-
-    # Check for filter conditions
-    if 'Filter' in node:
-        analyze_filter_condition(node['Filter'], analysis)
-
-    # Recursively analyze child nodes
-    for child in node.get('Plans', []):
-        analyze_plan_node(child, analysis, is_generic_plan)
-
-def analyze_filter_condition(filter_condition, analysis):
+            inclusive = node.get("Actual Total Time", 0) * loops
+            actual_rows = node.get("Actual Rows", 0)
+            plan_rows = node.get("Plan Rows", 0)
+            # Rows are per loop for both actual and estimated values
+            estimate_error = max(actual_rows, 1) / max(plan_rows, 1) if loops else None
+        buffers = _node_buffers(node)
+        profiles.append(
+            {
+                "path": item["path"],
+                "depth": item["depth"],
+                "parent": item["parent"],
+                "node": node,
+                "label": _node_label(node),
+                "loops": loops,
+                "rows": node.get("Plan Rows", 0)
+                if is_generic_plan
+                else node.get("Actual Rows", 0) * loops,
+                "inclusive": inclusive,
+                "exclusive": inclusive,
+                "inclusive_buffers": buffers,
+                "exclusive_buffers": buffers,
+                "estimate_error": estimate_error,
+            }
+        )
+
+    for profile in profiles:
+        parent = profile["parent"]
+        if parent is not None:
+            profiles[parent]["exclusive"] -= profile["inclusive"]
+            profiles[parent]["exclusive_buffers"] -= profile["inclusive_buffers"]
+
+    total = profiles[0]["inclusive"] if profiles else 0
+    for profile in profiles:
+        # Parallel workers and CTE scans can make children exceed their parent
+        profile["exclusive"] = max(profile["exclusive"], 0)
+        profile["exclusive_buffers"] = max(profile["exclusive_buffers"], 0)
+        profile["share"] = profile["exclusive"] / total if total else 0
+
+    return profiles, truncated
+
+
+def rank_hot_nodes(profiles, limit=HOT_NODE_LIMIT):
+    """Return the nodes with the largest exclusive cost, with their subtree totals"""
+    ranked = sorted(profiles, key=lambda p: p["exclusive"], reverse=True)[:limit]
+    return [
+        {
+            "path": p["path"],
+            "node": p["label"],
+            "exclusive": round(p["exclusive"], 2),
+            "subtree": round(p["inclusive"], 2),
+            "share_pct": round(p["share"] * 100, 1),
+            "exclusive_buffers": p["exclusive_buffers"],
+            "rows": p["rows"],
+            "estimate_error": round(p["estimate_error"], 2)
+            if p["estimate_error"]
+            else None,
+        }
+        for p in ranked
+        if p["exclusive"] > 0
+    ]
+
+
+def analyze_filter_condition(filter_condition):
     """
     Analyze filter conditions for potential optimization opportunities
+
+    Returns:
+        list: (issue type, description, severity) tuples
     """
+    findings = []
     filter_lower = filter_condition.lower()
-    
+
     # Check for function calls in WHERE clause
-    if '(' in filter_condition and ')' in filter_condition:
-        analysis['issues'].append({
-            'type': 'function_in_filter',
-            'description': "Function call in WHERE clause may prevent index usage",
-            'severity': 'medium'
-        })
-    
+    if "(" in filter_condition and ")" in filter_condition:
+        findings.append(
+            (
+                "function_in_filter",
+                "Function call in WHERE clause may prevent index usage",
+                "medium",
+            )
+        )
+
     # Check for LIKE operations
-    if ' like ' in filter_lower and filter_lower.startswith('%'):
-        analysis['issues'].append({
-            'type': 'leading_wildcard',
-            'description': "Leading wildcard in LIKE clause prevents index usage",
-            'severity': 'medium'
-        })
-
-def identify_performance_issues(actual_node, estimated_node, analysis, is_generic_plan):
+    if " like " in filter_lower and filter_lower.startswith("%"):
+        findings.append(
+            (
+                "leading_wildcard",
+                "Leading wildcard in LIKE clause prevents index usage",
+                "medium",
+            )
+        )
+    return findings
+
+
+def identify_performance_issues(profiles, analysis, is_generic_plan):
     """
-    Identify performance issues by comparing actual vs estimated plans
+    Identify performance issues across all plan nodes
+
+    Findings of the same type on the same relation are collapsed into one
+    issue with an occurrence count, and scans are only reported when they are
+    large or account for a meaningful share of the plan.
     """
-    if not is_generic_plan:
+    findings = {}
+    severity_rank = {"low": 0, "medium": 1, "high": 2}
+
+    def add(issue_type, subject, description, severity, profile):
+        key = (issue_type, subject)
+        finding = findings.get(key)
+        if finding is None:
+            findings[key] = {
+                "type": issue_type,
+                "description": description,
+                "severity": severity,
+                "occurrences": 1,
+                "paths": [profile["path"]],
+                "share": profile["share"],
+            }
+            return
+        finding["occurrences"] += 1
+        finding["paths"].append(profile["path"])
+        finding["share"] += profile["share"]
+        if severity_rank[severity] > severity_rank[finding["severity"]]:
+            finding["severity"] = severity
+
+    for profile in profiles:
+        node = profile["node"]
+        node_type = node["Node Type"]
+        rows = profile["rows"]
+
+        if node_type == "Seq Scan":
+            if (
+                rows >= SEQ_SCAN_ROW_THRESHOLD
+                or profile["share"] >= SEQ_SCAN_TIME_SHARE
+            ):
+                severity = (
+                    "high"
+                    if profile["share"] >= 0.2 or rows >= 10 * SEQ_SCAN_ROW_THRESHOLD
+                    else "medium"
+                )
+                add(
+                    "sequential_scan",
+                    node.get("Relation Name"),
+                    f"Sequential scan detected on table {node.get('Relation Name')}",
+                    severity,
+                    profile,
+                )
+
+        elif node_type == "Nested Loop" and rows > NESTED_LOOP_ROW_THRESHOLD:
+            verb = "planned" if is_generic_plan else "performed"
+            add(
+                "nested_loop_large_dataset",
+                None,
+                f"Nested loop join {verb} for large dataset",
+                "medium",
+                profile,
+            )
+
+        elif (
+            node_type == "Hash Join"
+            and node.get("Hash Cond")
+            and rows > HASH_JOIN_ROW_THRESHOLD
+        ):
+            add(
+                "large_hash_join",
+                None,
+                "Large hash join operation detected",
+                "medium",
+                profile,
+            )
+
+        if "Filter" in node:
+            for issue_type, description, severity in analyze_filter_condition(
+                node["Filter"]
+            ):
+                add(issue_type, None, description, severity, profile)
+
         # Row estimation analysis only for actual execution plans
-        if estimated_node.get('Plan Rows', 0) > 0:
-            estimation_ratio = actual_node.get('Actual Rows', 0) / estimated_node['Plan Rows']
-            if estimation_ratio > 10 or estimation_ratio < 0.1:
-                analysis['issues'].append({
-                    'type': 'poor_statistics',
-                    'description': f"Statistics may be outdated - row estimation is off by factor of {estimation_ratio:.1f}",
-                    'severity': 'high'
-                })
-
-    # Parallel execution analysis (applies to both plan types)
-    if actual_node.get('Workers Planned', 0) > 0 and actual_node.get('Workers Launched', 0) == 0:
-        analysis['issues'].append({
-            'type': 'parallel_execution_failed',
-            'description': "Parallel execution was planned but not executed",
-            'severity': 'medium'
-        })
+        error = profile["estimate_error"]
+        if error is not None and (
+            error > ESTIMATE_ERROR_FACTOR or error < 1 / ESTIMATE_ERROR_FACTOR
+        ):
+            add(
+                "poor_statistics",
+                node.get("Relation Name"),
+                f"Statistics may be outdated - row estimation for {profile['label']} is off by factor of {error:.1f}",
+                "high",
+                profile,
+            )
+
+        # Parallel execution analysis (applies to both plan types)
+        if (
+            node.get("Workers Planned", 0) > 0
+            and node.get("Workers Launched", 0) == 0
+            and not is_generic_plan
+        ):
+            add(
+                "parallel_execution_failed",
+                None,
+                "Parallel execution was planned but not executed",
+                "medium",
+                profile,
+            )
+
+    ordered = sorted(
+        findings.values(),
+        key=lambda f: (severity_rank[f["severity"]], f["share"]),
+        reverse=True,
+    )
+    for finding in ordered:
+        if finding["occurrences"] > 1:
+            finding["description"] += f" ({finding['occurrences']} occurrences)"
+        if finding["share"] >= 0.01:
+            finding["description"] += (
+                f" - {finding['share'] * 100:.0f}% of plan {'cost' if is_generic_plan else 'time'}"
+            )
+        finding["share"] = round(finding["share"], 3)
+        analysis["issues"].append(finding)
+
 
 def generate_recommendations(analysis):
     """
     Generate specific recommendations based on identified issues
     """
-    for issue in analysis['issues']:
-        if issue['type'] == 'sequential_scan':
-            analysis['recommendations'].append({
-                'issue': 'Sequential Scan Detected',
-                'recommendation': """
+    seen_types = set()
+    for issue in analysis["issues"]:
+        if issue["type"] in seen_types:
+            continue
+        seen_types.add(issue["type"])
+        if issue["type"] == "sequential_scan":
+            analysis["recommendations"].append(
+                {
+                    "issue": "Sequential Scan Detected",
+                    "recommendation": """
                 Consider the following solutions:
                 1. Create an index on the commonly queried columns
                 2. Review WHERE clause conditions for index compatibility
@@ -972,25 +1487,29 @@ def generate_recommendations(analysis):
                 
                 Example index creation:
                 CREATE INDEX idx_name ON table_name (column_name);
-                """
-            })
-        
-        elif issue['type'] == 'poor_statistics':
-            analysis['recommendations'].append({
-                'issue': 'Statistics Mismatch',
-                'recommendation': """
+                """,
+                }
+            )
+
+        elif issue["type"] == "poor_statistics":
+            analysis["recommendations"].append(
+                {
+                    "issue": "Statistics Mismatch",
+                    "recommendation": """
                 Update statistics for more accurate query planning:
                 1. Run ANALYZE on the affected tables
                 2. Consider increasing statistics target:
                    ALTER TABLE table_name ALTER COLUMN column_name SET STATISTICS 1000;
                 3. Review and possibly update auto_vacuum settings
-                """
-            })
-        
-        elif issue['type'] == 'function_in_filter':
-            analysis['recommendations'].append({
-                'issue': 'Function in WHERE Clause',
-                'recommendation': """
+                """,
+                }
+            )
+
+        elif issue["type"] == "function_in_filter":
+            analysis["recommendations"].append(
+                {
+                    "issue": "Function in WHERE Clause",
+                    "recommendation": """
                 Optimize filter conditions:
                 1. Remove function calls from WHERE clause
                 2. Consider creating a computed column with an index
@@ -999,92 +1518,136 @@ def generate_recommendations(analysis):
                 Example:
                 Instead of: WHERE UPPER(column) = 'VALUE'
                 Use: WHERE column = LOWER('VALUE')
-                """
-            })
+                """,
+                }
+            )
+
 
 def format_analysis_output(analysis):
     """
     Format the analysis results into human-readable text
     """
     output = []
-    
+
     # Performance Statistics
     output.append("Query Performance Summary:")
-    
+
     # Check if this is a generic plan
-    is_generic_plan = analysis.get('plan_type') == 'Generic Plan'
-    
+    is_generic_plan = analysis.get("plan_type") == "Generic Plan"
+
     if is_generic_plan:
         # For generic plans, show estimated metrics
         output.append(f"- Plan Type: Generic Plan (Parameterized Query)")
-        output.append(f"- Estimated Total Cost: {analysis['performance_stats'].get('total_cost', 'N/A')}")
-        output.append(f"- Estimated Rows: {analysis['performance_stats'].get('estimated_rows', 'N/A')}")
-        output.append(f"- Plan Rows: {analysis['performance_stats'].get('plan_rows', 'N/A')}")
+        output.append(
+            f"- Estimated Total Cost: {analysis['performance_stats'].get('total_cost', 'N/A')}"
+        )
+        output.append(
+            f"- Estimated Rows: {analysis['performance_stats'].get('estimated_rows', 'N/A')}"
+        )
+        output.append(
+            f"- Plan Rows: {analysis['performance_stats'].get('plan_rows', 'N/A')}"
+        )
     else:
         # For actual execution plans, show actual metrics
         output.append(f"- Plan Type: Analyzed Plan")
-        output.append(f"- Execution Time: {analysis['performance_stats'].get('execution_time_ms', 'N/A'):.2f} ms")
-        output.append(f"- Actual Rows: {analysis['performance_stats'].get('actual_rows', 'N/A')}")
-        output.append(f"- Estimated Rows: {analysis['performance_stats'].get('estimated_rows', 'N/A')}")
-    
+        output.append(
+            f"- Execution Time: {analysis['performance_stats'].get('execution_time_ms', 'N/A'):.2f} ms"
+        )
+        output.append(
+            f"- Actual Rows: {analysis['performance_stats'].get('actual_rows', 'N/A')}"
+        )
+        output.append(
+            f"- Estimated Rows: {analysis['performance_stats'].get('estimated_rows', 'N/A')}"
+        )
+
     output.append("")
 
     # Issues
-    if analysis['issues']:
+    if analysis["issues"]:
         output.append("Identified Issues:")
-        for issue in analysis['issues']:
+        for issue in analysis["issues"]:
             output.append(f"- {issue['description']} (Severity: {issue['severity']})")
         output.append("")
 
+    # Where the time (or cost) is actually spent
+    profile = analysis.get("node_profile")
+    if profile and profile["hot_nodes"]:
+        unit = "cost" if profile["metric"] == "cost" else "ms"
+        output.append(f"Hottest Plan Nodes ({profile['node_count']} nodes analyzed):")
+        for hot in profile["hot_nodes"]:
+            line = (
+                f"- [{hot['path']}] {hot['node']}: {hot['exclusive']} {unit} self "
+                f"({hot['share_pct']}%), {hot['subtree']} {unit} subtree, "
+                f"{hot['exclusive_buffers']} buffers"
+            )
+            if hot["estimate_error"] and (
+                hot["estimate_error"] > ESTIMATE_ERROR_FACTOR
+                or hot["estimate_error"] < 1 / ESTIMATE_ERROR_FACTOR
+            ):
+                line += f", row estimate off by {hot['estimate_error']}x"
+            output.append(line)
+        if profile["truncated"]:
+            output.append(f"- Plan truncated to the first {MAX_PLAN_NODES} nodes")
+        output.append("")
+
+    # Plan cache and changes since the previous analysis of this query
+    if analysis.get("plan_cache"):
+        output.append(f"Plan Cache: {analysis['plan_cache']['status']}")
+        output.append("")
+    if analysis.get("plan_diff"):
+        output.append("Changes Since Previous Plan:")
+        output.extend(format_plan_diff_lines(analysis["plan_diff"]))
+
     # Recommendations
-    if analysis['recommendations']:
+    if analysis["recommendations"]:
         output.append("Recommendations:")
-        for rec in analysis['recommendations']:
+        for rec in analysis["recommendations"]:
             output.append(f"Problem: {rec['issue']}")
             output.append(f"Solution: {rec['recommendation']}")
             output.append("")
 
     return "\n".join(output)
 
+
 def monitor_query_performance(query, start_time, rows_returned):
     """
     Monitor query performance and suggest analysis if needed
-    
+
     Args:
         query (str): Executed SQL query
         start_time (float): Query start timestamp
         rows_returned (int): Number of rows returned
-    
+
     Returns:
         dict: Performance metrics and analysis suggestion
     """
     execution_time = time.time() - start_time
     metrics = {
-        'query': query,
-        'execution_time': execution_time,
-        'rows_returned': rows_returned,
-        'timestamp': datetime.utcnow().isoformat(),
-        'needs_analysis': False,
-        'performance_message': ''
+        "query": query,
+        "execution_time": execution_time,
+        "rows_returned": rows_returned,
+        "timestamp": datetime.utcnow().isoformat(),
+        "needs_analysis": False,
+        "performance_message": "",
     }
-    
+
     # Define performance thresholds
     SLOW_QUERY_THRESHOLD = 5  # seconds
     HIGH_ROWS_THRESHOLD = 10000
-    
+
     # Check for performance issues
     performance_issues = []
-    
+
     if execution_time > SLOW_QUERY_THRESHOLD:
         performance_issues.append(f"Query took {execution_time:.2f} seconds to execute")
-        metrics['needs_analysis'] = True
-    
+        metrics["needs_analysis"] = True
+
     if rows_returned > HIGH_ROWS_THRESHOLD:
         performance_issues.append(f"Query returned {rows_returned} rows")
-        metrics['needs_analysis'] = True
-    
-    if metrics['needs_analysis']:
-        metrics['performance_message'] = (
+        metrics["needs_analysis"] = True
+
+    if metrics["needs_analysis"]:
+        metrics["performance_message"] = (
             "⚠️ Performance Warning:\n"
             f"{'; '.join(performance_issues)}.\n"
             "Would you like me to analyze this query for potential optimizations? "
@@ -1092,441 +1655,336 @@ def monitor_query_performance(query, start_time, rows_returned):
         )
         logger.warning(f"Slow query detected: {query}")
     else:
-        metrics['performance_message'] = f"Query executed successfully in {execution_time:.2f} seconds"
-    
+        metrics["performance_message"] = (
+            f"Query executed successfully in {execution_time:.2f} seconds"
+        )
+
     return metrics
 
+
 def validate_query(query):
     """
     Validate query for security concerns and split into statements
-    
+
+    Uses the single-pass lexer in sql_lexer, which understands dollar quoting,
+    E'' strings, nested block comments and quoted identifiers, so validation
+    time grows linearly with the size of the batch.
+
     Args:
         query (str): SQL query to validate
-    
+
     Returns:
-        list: List of validated statements
-        
+        list: SqlStatement objects for the validated statements
+
     Raises:
         ValueError: If query contains prohibited operations
     """
-    if not query or not isinstance(query, str):
-        raise ValueError("Query must be a non-empty string")
-
-    def is_within_quotes(text, position):
-        """Check if a position in text is within quotes"""
-        single_quotes = False
-        double_quotes = False
-        for i in range(position):
-            if text[i] == "'" and not double_quotes:
-                single_quotes = not single_quotes
-            elif text[i] == '"' and not single_quotes:
-                double_quotes = not double_quotes
-        return single_quotes or double_quotes
-
-    def split_statements(query_text):
-        """Split query into individual statements, respecting quotes and comments"""
-        statements = []
-        current_stmt = []
-        i = 0
-        comment_block = False
-        line_comment = False
-        
-        while i < len(query_text):
-            char = query_text[i]
-            
-            # Handle comment blocks
-            if query_text[i:i+2] == '/*' and not line_comment:
-                comment_block = True
-                current_stmt.append(char)
-                i += 1
-            elif query_text[i:i+2] == '*/' and comment_block:
-                comment_block = False
-                current_stmt.append(char)
-                i += 1
-            # Handle line comments
-            elif query_text[i:i+2] == '--' and not comment_block:
-                line_comment = True
-                current_stmt.append(char)
-                i += 1
-            elif char == '\n' and line_comment:
-                line_comment = False
-                current_stmt.append(char)
-            # Handle semicolons
-            elif char == ';' and not comment_block and not line_comment and not is_within_quotes(query_text, i):
-                current_stmt.append(char)
-                stmt = ''.join(current_stmt).strip()
-                if stmt:
-                    statements.append(stmt)
-                current_stmt = []
-            else:
-                current_stmt.append(char)
-            i += 1
-        
-        # Add the last statement if exists
-        last_stmt = ''.join(current_stmt).strip()
-        if last_stmt:
-            statements.append(last_stmt)
-        
-        return [stmt for stmt in statements if stmt]
-
-    # Split into statements
-    statements = split_statements(query)
-    validated_statements = []
-
-    # Validate each statement
-    for stmt in statements:
-        stmt = stmt.strip()
-        if stmt.endswith(';'):
-            stmt = stmt[:-1]
-        
-        stmt_lower = stmt.lower().strip()
-        
-        # Get the command type
-        first_word = stmt_lower.split()[0] if stmt_lower.split() else ''
-        
-        if first_word not in ['select', 'show']:
-            raise ValueError(f"Prohibited operation detected: {first_word}")
-        
-        # For SELECT statements, check for dangerous operations
-        if first_word == 'select':
-            dangerous_operations = [
-                r'\binsert\b', r'\bupdate\b', r'\bdelete\b', r'\bdrop\b', 
-                r'\btruncate\b', r'\balter\b', r'\bcreate\b', r'\bgrant\b', 
-                r'\brevoke\b', r'\bexecute\b', r'\bcopy\b'
-            ]
-            
-            # Remove content within quotes for checking
-            query_for_check = ''
-            in_quote = False
-            quote_char = None
-            
-            for char in stmt:
-                if char in ["'", '"'] and (not quote_char or char == quote_char):
-                    if not in_quote:
-                        quote_char = char
-                        in_quote = True
-                    else:
-                        quote_char = None
-                        in_quote = False
-                elif not in_quote:
-                    query_for_check += char
-            
-            # Check for dangerous operations
-            for operation in dangerous_operations:
-                if re.search(operation, query_for_check.lower()):
-                    raise ValueError(f"Statement contains prohibited operation: {operation}")
-        
-        validated_statements.append(stmt)
-    
-    return validated_statements
-
-def execute_read_query(secret_name, query, max_rows=20):
+    return validate_read_only_statements(query)
+
+
+def execute_read_query(secret_name, query, max_rows=20, summarize=False):
     """
     Execute read-only queries safely and return results with monitoring
-    
+
     Args:
         secret_name (str): Secret containing database credentials
         query (str): SQL query to execute
         max_rows (int): Maximum number of rows to return (only for SELECT queries)
-    
+        summarize (bool): Also stream the full SELECT result to compute column statistics
+
     Returns:
         dict: Query results and metadata
     """
 
     response = {
-        'results': [],
-        'performance_metrics': None,
-        'warnings': [],
-        'optimization_suggestions': []
+        "results": [],
+        "performance_metrics": None,
+        "warnings": [],
+        "optimization_suggestions": [],
     }
-    
+
     start_time = time.time()
     conn = None
-    
+
     try:
         # Validate and split queries
         statements = validate_query(query)
-        
+
         # Connect to database
         conn = connect_to_db(secret_name)
-        
+
         with conn.cursor() as cur:
             # Set session to read-only and timeout
             cur.execute("SET TRANSACTION READ ONLY")
             cur.execute("SET statement_timeout = '30s'")
-            
+
             # Execute each statement
-            for stmt_index, stmt in enumerate(statements, 1):
+            for stmt_index, parsed in enumerate(statements, 1):
+                stmt = parsed.text
                 stmt_response = {
-                    'columns': [],
-                    'rows': [],
-                    'truncated': False,
-                    'message': '',
-                    'row_count': 0,
-                    'query': stmt
+                    "columns": [],
+                    "rows": [],
+                    "truncated": False,
+                    "message": "",
+                    "row_count": 0,
+                    "query": stmt,
                 }
-                
+
                 # Determine if it's a SELECT query
-                stmt_lower = stmt.lower().strip()
-                is_select_query = stmt_lower.lstrip('(').startswith('select')
-                
+                is_select_query = parsed.command == "select"
+
                 # Prepare the final query
                 final_query = stmt
-                if is_select_query and 'limit' not in stmt_lower:
+                if is_select_query and "limit" not in parsed.keywords and not summarize:
                     final_query = f"{stmt} LIMIT {max_rows + 1}"
-                
-                # Execute query
+
+                # Execute query, streaming SELECT results from a server-side cursor
                 try:
-                    cur.execute(final_query)
+                    streamed = stream_statement(
+                        conn,
+                        final_query,
+                        max_rows if is_select_query else MAX_SUMMARY_SCAN_ROWS,
+                        summarize=is_select_query and summarize,
+                        server_side=is_select_query,
+                    )
                 except psycopg2.Error as pe:
                     logger.error(f"Error executing query: {final_query}")
                     logger.error(f"Error details: {str(pe)}")
                     raise
-                
-                # Get column names
-                stmt_response['columns'] = [desc[0] for desc in cur.description]
-                
-                # Fetch results
-                rows = cur.fetchall()
-                total_rows = len(rows)
-                
+
+                stmt_response["columns"] = streamed["columns"]
+                stmt_response["rows"] = streamed["rows"]
+                stmt_response["row_count"] = len(streamed["rows"])
+                if streamed["summary"]:
+                    stmt_response["summary"] = streamed["summary"]
+
                 # Handle row limiting only for SELECT queries
-                if is_select_query and total_rows > max_rows:
-                    stmt_response['truncated'] = True
-                    rows = rows[:max_rows]
-                    stmt_response['message'] = (
+                if is_select_query and streamed["truncated"]:
+                    stmt_response["truncated"] = True
+                    available = (
+                        f"Total rows available: {streamed['rows_read']}"
+                        if streamed["scan_complete"] and summarize
+                        else f"More than {max_rows} rows available"
+                    )
+                    stmt_response["message"] = (
                         f"Results truncated to {max_rows} rows for performance reasons. "
-                        f"Total rows available: {total_rows}"
+                        f"{available}"
                     )
-                    stmt_response['row_count'] = max_rows
-                else:
-                    stmt_response['row_count'] = total_rows
-                
-                # Convert rows to list of dictionaries
-                stmt_response['rows'] = [
-                    dict(zip(stmt_response['columns'], row))
-                    for row in rows
-                ]
-                
+
                 # Add performance monitoring only for SELECT queries
                 if is_select_query:
                     complexity_metrics = analyze_query_complexity(stmt)
-                    stmt_response['complexity_metrics'] = complexity_metrics
-                    
+                    stmt_response["complexity_metrics"] = complexity_metrics
+
                     # Add complexity warnings if any
-                    if complexity_metrics['warnings']:
-                        response['warnings'].extend(
+                    if complexity_metrics["warnings"]:
+                        response["warnings"].extend(
                             f"Statement {stmt_index}: {warning}"
-                            for warning in complexity_metrics['warnings']
+                            for warning in complexity_metrics["warnings"]
                         )
-                
+
                 # Store the original query in the response
-                stmt_response['query'] = f"{stmt};"
-                response['results'].append(stmt_response)
-            
+                stmt_response["query"] = f"{stmt};"
+                response["results"].append(stmt_response)
+
             # Add overall performance metrics
             total_time = time.time() - start_time
-            response['performance_metrics'] = {
-                'execution_time': total_time,
-                'statements_executed': len(statements),
-                'timestamp': datetime.utcnow().isoformat(),
-                'needs_analysis': total_time > 5,
-                'performance_message': (
+            response["performance_metrics"] = {
+                "execution_time": total_time,
+                "statements_executed": len(statements),
+                "timestamp": datetime.utcnow().isoformat(),
+                "needs_analysis": total_time > 5,
+                "performance_message": (
                     f"Executed {len(statements)} statements in {total_time:.2f} seconds"
-                )
+                ),
             }
-            
+
             return response
-                
+
     except ValueError as ve:
         error_msg = f"Query validation failed: {str(ve)}"
         logger.error(error_msg)
         raise ValueError(error_msg)
-        
+
     except psycopg2.Error as pe:
         error_msg = f"Database error: {str(pe)}"
         logger.error(error_msg)
         raise Exception(error_msg)
-        
+
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
         logger.error(error_msg)
         raise Exception(error_msg)
-    
+
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
+
+def append_result_table(formatted_output, columns, rows):
+    """
+    Append a fixed-width table of rows to formatted_output
+
+    Each cell is converted to text once; widths come from those strings.
+    """
+    if not columns:
+        return
+    text_rows = [[str(row[col]) for col in columns] for row in rows]
+    widths = [len(str(col)) for col in columns]
+    for text_row in text_rows:
+        for i, cell in enumerate(text_row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    # Add header
+    header = " | ".join(str(col).ljust(widths[i]) for i, col in enumerate(columns))
+    formatted_output.append(header)
+    formatted_output.append("-" * len(header))
+
+    # Add rows
+    for text_row in text_rows:
+        formatted_output.append(
+            " | ".join(cell.ljust(widths[i]) for i, cell in enumerate(text_row))
+        )
+
+
+def append_result_summary(formatted_output, summary):
+    """Append per-column statistics computed while streaming a result"""
+    if not summary:
+        return
+    scope = (
+        "full result"
+        if summary["scan_complete"]
+        else "first rows only, scan limit reached"
+    )
+    formatted_output.append(
+        f"Column Summary ({summary['rows_scanned']} rows scanned, {scope}):"
+    )
+    for col, stats in summary["columns"].items():
+        line = f"- {col}: {stats['nulls']} nulls ({stats['null_ratio'] * 100:.1f}%)"
+        if "min" in stats:
+            line += f", min {stats['min']}, max {stats['max']}"
+        if "mean" in stats:
+            line += f", mean {stats['mean']:.4g}"
+        formatted_output.append(line)
+
 
 def format_enhanced_results(results):
     """
     Format results with enhanced information
     """
     formatted_output = []
-    
+
     # Add performance summary
-    metrics = results['performance_metrics']
+    metrics = results["performance_metrics"]
     formatted_output.append("Query Execution Summary:")
-    formatted_output.append(f"- Total execution time: {metrics['execution_time']:.2f} seconds")
+    formatted_output.append(
+        f"- Total execution time: {metrics['execution_time']:.2f} seconds"
+    )
     formatted_output.append(f"- Statements executed: {metrics['statements_executed']}")
     formatted_output.append(f"- Total rows returned: {metrics['total_rows']}")
     formatted_output.append("")
-    
+
     # Add warnings if any
-    if results['warnings']:
+    if results["warnings"]:
         formatted_output.append("Warnings:")
-        for warning in results['warnings']:
+        for warning in results["warnings"]:
             formatted_output.append(f"- {warning}")
         formatted_output.append("")
-    
+
     # Add optimization suggestions if any
-    if results['optimization_suggestions']:
+    if results["optimization_suggestions"]:
         formatted_output.append("Optimization Suggestions:")
-        for suggestion in results['optimization_suggestions']:
+        for suggestion in results["optimization_suggestions"]:
             formatted_output.append(f"- {suggestion}")
         formatted_output.append("")
-    
+
     # Format each statement's results
-    for i, result in enumerate(results['results'], 1):
+    for i, result in enumerate(results["results"], 1):
         formatted_output.append(f"Statement {i}:")
         formatted_output.append(f"Query: {result['query']}")
-        
+
         # Add complexity metrics
-        complexity = result['complexity_metrics']
+        complexity = result["complexity_metrics"]
         formatted_output.append("Complexity Analysis:")
         formatted_output.append(f"- Score: {complexity['complexity_score']}")
         formatted_output.append(f"- Joins: {complexity['join_count']}")
         formatted_output.append(f"- Subqueries: {complexity['subquery_count']}")
         formatted_output.append(f"- Aggregations: {complexity['aggregation_count']}")
-        
-        if result['message']:
+
+        if result["message"]:
             formatted_output.append(f"Note: {result['message']}")
-        
-        if result['columns']:
-            # Calculate column widths
-            widths = {
-                col: max(len(str(col)), 
-                        max(len(str(row[col])) for row in result['rows']))
-                for col in result['columns']
-            }
-            
-            # Add header
-            header = " | ".join(
-                str(col).ljust(widths[col])
-                for col in result['columns']
-            )
-            formatted_output.append(header)
-            formatted_output.append("-" * len(header))
-            
-            # Add rows
-            for row in result['rows']:
-                formatted_output.append(" | ".join(
-                    str(row[col]).ljust(widths[col])
-                    for col in result['columns']
-                ))
-            
+
+        append_result_table(formatted_output, result["columns"], result["rows"])
+        append_result_summary(formatted_output, result.get("summary"))
         formatted_output.append(f"Rows returned: {result['row_count']}")
         formatted_output.append("")
-    
+
     return "\n".join(formatted_output)
 
+
 def format_query_results(results):
     """
     Format query results for display
-    
+
     Args:
         results (dict): Query execution results
-        
+
     Returns:
         str: Formatted results string
     """
     formatted_output = []
-    
+
     # Add performance message first
-    if results['performance_metrics'] and results['performance_metrics']['performance_message']:
-        formatted_output.append(results['performance_metrics']['performance_message'] + "\n")
-    
+    if (
+        results["performance_metrics"]
+        and results["performance_metrics"]["performance_message"]
+    ):
+        formatted_output.append(
+            results["performance_metrics"]["performance_message"] + "\n"
+        )
+
     # Add truncation message if applicable
-    if results['message']:
+    if results["message"]:
         formatted_output.append(f"Note: {results['message']}\n")
-    
-    # Add column headers
-    if results['columns']:
-        # Calculate column widths
-        widths = {}
-        for col in results['columns']:
-            widths[col] = len(str(col))
-            for row in results['rows']:
-                widths[col] = max(widths[col], len(str(row[col])))
-        
-        # Create header
-        header = " | ".join(
-            str(col).ljust(widths[col])
-            for col in results['columns']
-        )
-        formatted_output.append(header)
-        
-        # Add separator
-        separator = "-" * len(header)
-        formatted_output.append(separator)
-        
-        # Add rows
-        for row in results['rows']:
-            formatted_row = " | ".join(
-                str(row[col]).ljust(widths[col])
-                for col in results['columns']
-            )
-            formatted_output.append(formatted_row)
-    
+
+    # Add column headers and rows
+    append_result_table(formatted_output, results["columns"], results["rows"])
+    append_result_summary(formatted_output, results.get("summary"))
+
     # Add summary
     formatted_output.append(f"\nTotal rows: {results['row_count']}")
-    
+
     return "\n".join(formatted_output)
 
+
 def format_multi_query_results(results):
     """Format results from multiple statements"""
     formatted_output = []
-    
+
     # Add performance summary
-    metrics = results['performance_metrics']
+    metrics = results["performance_metrics"]
     formatted_output.append(f"Query Execution Summary:")
-    formatted_output.append(f"- Total execution time: {metrics['execution_time']:.2f} seconds")
+    formatted_output.append(
+        f"- Total execution time: {metrics['execution_time']:.2f} seconds"
+    )
     formatted_output.append(f"- Statements executed: {metrics['statements_executed']}")
     formatted_output.append("")
-    
+
     # Format each statement's results
-    for i, result in enumerate(results['results'], 1):
+    for i, result in enumerate(results["results"], 1):
         formatted_output.append(f"Statement {i}: {result['query']}")
-        if result['message']:
+        if result["message"]:
             formatted_output.append(f"Note: {result['message']}")
-        
-        if result['columns']:
-            # Calculate column widths
-            widths = {
-                col: max(len(str(col)), 
-                        max(len(str(row[col])) for row in result['rows']))
-                for col in result['columns']
-            }
-            
-            # Add header
-            header = " | ".join(
-                str(col).ljust(widths[col])
-                for col in result['columns']
-            )
-            formatted_output.append(header)
-            formatted_output.append("-" * len(header))
-            
-            # Add rows
-            for row in result['rows']:
-                formatted_output.append(" | ".join(
-                    str(row[col]).ljust(widths[col])
-                    for col in result['columns']
-                ))
-            
+
+        append_result_table(formatted_output, result["columns"], result["rows"])
+        append_result_summary(formatted_output, result.get("summary"))
         formatted_output.append(f"Rows returned: {result['row_count']}")
         formatted_output.append("")
-    
+
     return "\n".join(formatted_output)
 
+
 def execute_enhanced_query_diagnostics(secret_name, query):
     """
     Execute enhanced query diagnostics based on runbooks.py
@@ -1536,7 +1994,7 @@ def execute_enhanced_query_diagnostics(secret_name, query):
     try:
         conn = connect_to_db(secret_name)
         results = {}
-        
+
         with conn.cursor() as cur:
             # Get current database statistics
             cur.execute("""
@@ -1555,71 +2013,83 @@ def execute_enhanced_query_diagnostics(secret_name, query):
             """)
             db_stats = cur.fetchone()
             if db_stats:
-                results['database_stats'] = {
-                    'database': db_stats[0],
-                    'active_connections': db_stats[1],
-                    'total_commits': db_stats[2],
-                    'total_rollbacks': db_stats[3],
-                    'blocks_read': db_stats[4],
-                    'blocks_hit': db_stats[5],
-                    'cache_hit_ratio': db_stats[6]
+                results["database_stats"] = {
+                    "database": db_stats[0],
+                    "active_connections": db_stats[1],
+                    "total_commits": db_stats[2],
+                    "total_rollbacks": db_stats[3],
+                    "blocks_read": db_stats[4],
+                    "blocks_hit": db_stats[5],
+                    "cache_hit_ratio": db_stats[6],
                 }
-            
+
             # Analyze the query execution plan
             try:
                 cur.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}")
                 plan_result = cur.fetchone()
                 if plan_result:
                     plan = plan_result[0][0]
-                    results['execution_plan'] = {
-                        'total_cost': plan['Plan'].get('Total Cost'),
-                        'execution_time': plan['Plan'].get('Actual Total Time'),
-                        'rows_returned': plan['Plan'].get('Actual Rows'),
-                        'node_type': plan['Plan'].get('Node Type'),
-                        'startup_cost': plan['Plan'].get('Startup Cost')
+                    results["execution_plan"] = {
+                        "total_cost": plan["Plan"].get("Total Cost"),
+                        "execution_time": plan["Plan"].get("Actual Total Time"),
+                        "rows_returned": plan["Plan"].get("Actual Rows"),
+                        "node_type": plan["Plan"].get("Node Type"),
+                        "startup_cost": plan["Plan"].get("Startup Cost"),
                     }
-                    
+
                     # Extract buffer usage if available
-                    if 'Shared Hit Blocks' in plan['Plan']:
-                        results['buffer_usage'] = {
-                            'shared_hit_blocks': plan['Plan'].get('Shared Hit Blocks', 0),
-                            'shared_read_blocks': plan['Plan'].get('Shared Read Blocks', 0),
-                            'shared_dirtied_blocks': plan['Plan'].get('Shared Dirtied Blocks', 0),
-                            'shared_written_blocks': plan['Plan'].get('Shared Written Blocks', 0)
+                    if "Shared Hit Blocks" in plan["Plan"]:
+                        results["buffer_usage"] = {
+                            "shared_hit_blocks": plan["Plan"].get(
+                                "Shared Hit Blocks", 0
+                            ),
+                            "shared_read_blocks": plan["Plan"].get(
+                                "Shared Read Blocks", 0
+                            ),
+                            "shared_dirtied_blocks": plan["Plan"].get(
+                                "Shared Dirtied Blocks", 0
+                            ),
+                            "shared_written_blocks": plan["Plan"].get(
+                                "Shared Written Blocks", 0
+                            ),
                         }
             except Exception as e:
-                results['execution_plan_error'] = str(e)
-            
+                results["execution_plan_error"] = str(e)
+
             # Get query from pg_stat_statements if available
             try:
-                cur.execute("""
+                cur.execute(
+                    """
                     SELECT query, calls, total_exec_time, mean_exec_time, 
                            rows, shared_blks_hit, shared_blks_read
                     FROM pg_stat_statements 
                     WHERE query ILIKE %s
                     LIMIT 1;
-                """, (f"%{query[:50]}%",))
-                
+                """,
+                    (f"%{query[:50]}%",),
+                )
+
                 stmt_stats = cur.fetchone()
                 if stmt_stats:
-                    results['statement_stats'] = {
-                        'calls': stmt_stats[1],
-                        'total_exec_time': stmt_stats[2],
-                        'mean_exec_time': stmt_stats[3],
-                        'rows': stmt_stats[4],
-                        'shared_blks_hit': stmt_stats[5],
-                        'shared_blks_read': stmt_stats[6]
+                    results["statement_stats"] = {
+                        "calls": stmt_stats[1],
+                        "total_exec_time": stmt_stats[2],
+                        "mean_exec_time": stmt_stats[3],
+                        "rows": stmt_stats[4],
+                        "shared_blks_hit": stmt_stats[5],
+                        "shared_blks_read": stmt_stats[6],
                     }
             except Exception as e:
-                results['statement_stats_error'] = str(e)
-        
+                results["statement_stats_error"] = str(e)
+
         return results
-        
+
     except Exception as e:
         raise Exception(f"Failed to execute enhanced query diagnostics: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def execute_performance_insights_analysis(secret_name):
     """
@@ -1630,7 +2100,7 @@ def execute_performance_insights_analysis(secret_name):
     try:
         conn = connect_to_db(secret_name)
         results = {}
-        
+
         with conn.cursor() as cur:
             # Top queries by execution time (similar to Performance Insights)
             cur.execute("""
@@ -1651,11 +2121,11 @@ def execute_performance_insights_analysis(secret_name):
                 ORDER BY total_exec_time DESC
                 LIMIT 10;
             """)
-            
+
             columns = [desc[0] for desc in cur.description]
             rows = cur.fetchall()
-            results['top_queries_by_time'] = [dict(zip(columns, row)) for row in rows]
-            
+            results["top_queries_by_time"] = [dict(zip(columns, row)) for row in rows]
+
             # Wait events analysis (PostgreSQL equivalent)
             cur.execute("""
                 SELECT 
@@ -1669,11 +2139,11 @@ def execute_performance_insights_analysis(secret_name):
                 ORDER BY count DESC
                 LIMIT 10;
             """)
-            
+
             columns = [desc[0] for desc in cur.description]
             rows = cur.fetchall()
-            results['wait_events'] = [dict(zip(columns, row)) for row in rows]
-            
+            results["wait_events"] = [dict(zip(columns, row)) for row in rows]
+
             # Database load metrics
             cur.execute("""
                 SELECT 
@@ -1685,31 +2155,32 @@ def execute_performance_insights_analysis(secret_name):
                 FROM pg_stat_activity
                 WHERE backend_type = 'client backend';
             """)
-            
+
             load_stats = cur.fetchone()
             if load_stats:
-                results['database_load'] = {
-                    'total_connections': load_stats[0],
-                    'active_connections': load_stats[1],
-                    'idle_connections': load_stats[2],
-                    'idle_in_transaction': load_stats[3],
-                    'avg_query_duration_sec': load_stats[4]
+                results["database_load"] = {
+                    "total_connections": load_stats[0],
+                    "active_connections": load_stats[1],
+                    "idle_connections": load_stats[2],
+                    "idle_in_transaction": load_stats[3],
+                    "avg_query_duration_sec": load_stats[4],
                 }
-        
+
         return results
-        
+
     except Exception as e:
         raise Exception(f"Failed to execute performance insights analysis: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def format_enhanced_diagnostics_output(results):
     """Format enhanced diagnostics results for display"""
     output = []
-    
-    if 'database_stats' in results:
-        stats = results['database_stats']
+
+    if "database_stats" in results:
+        stats = results["database_stats"]
         output.append("=== DATABASE STATISTICS ===")
         output.append(f"Database: {stats['database']}")
         output.append(f"Active Connections: {stats['active_connections']}")
@@ -1717,82 +2188,110 @@ def format_enhanced_diagnostics_output(results):
         output.append(f"Total Commits: {stats['total_commits']}")
         output.append(f"Total Rollbacks: {stats['total_rollbacks']}")
         output.append("")
-    
-    if 'execution_plan' in results:
-        plan = results['execution_plan']
+
+    if "execution_plan" in results:
+        plan = results["execution_plan"]
         output.append("=== EXECUTION PLAN SUMMARY ===")
         output.append(f"Node Type: {plan['node_type']}")
         output.append(f"Execution Time: {plan['execution_time']:.2f} ms")
         output.append(f"Rows Returned: {plan['rows_returned']}")
         output.append(f"Total Cost: {plan['total_cost']:.2f}")
         output.append("")
-    
-    if 'buffer_usage' in results:
-        buffer = results['buffer_usage']
+
+    if "buffer_usage" in results:
+        buffer = results["buffer_usage"]
         output.append("=== BUFFER USAGE ===")
         output.append(f"Shared Hit Blocks: {buffer['shared_hit_blocks']}")
         output.append(f"Shared Read Blocks: {buffer['shared_read_blocks']}")
         output.append(f"Shared Dirtied Blocks: {buffer['shared_dirtied_blocks']}")
         output.append("")
-    
-    if 'statement_stats' in results:
-        stats = results['statement_stats']
+
+    if "statement_stats" in results:
+        stats = results["statement_stats"]
         output.append("=== STATEMENT STATISTICS ===")
         output.append(f"Total Calls: {stats['calls']}")
         output.append(f"Mean Execution Time: {stats['mean_exec_time']:.2f} ms")
         output.append(f"Total Execution Time: {stats['total_exec_time']:.2f} ms")
         output.append(f"Average Rows: {stats['rows']}")
         output.append("")
-    
+
     return "\n".join(output)
 
+
 def lambda_handler(event, context):
     try:
         print(f"Received event: {json.dumps(event)}")
-        
+
         # Check if arguments are nested under 'arguments' key
-        if 'arguments' in event:
+        if "arguments" in event:
             # Extract arguments from the nested structure
-            args = event['arguments']
-            environment = args.get('environment')
-            action_type = args.get('action_type')
+            args = event["arguments"]
+            environment = args.get("environment")
+            action_type = args.get("action_type")
         else:
             # Use the flat structure
-            environment = event.get('environment')
-            action_type = event.get('action_type')
-        
+            environment = event.get("environment")
+            action_type = event.get("action_type")
+
         if not environment or not action_type:
             return {
                 "functionResponse": {
                     "content": f"Error: Missing required parameters. Need 'environment' and 'action_type'."
                 }
             }
-            
+
         secret_name = get_env_secret(environment)
         min_exec_time = 1000
 
         # Get explain plan for a query
-        if action_type == 'explain_query':
-            query = event.get('query') if 'arguments' not in event else event['arguments'].get('query')
+        if action_type == "explain_query":
+            query = (
+                event.get("query")
+                if "arguments" not in event
+                else event["arguments"].get("query")
+            )
             print("Executing explain query scripts")
             results = analyze_query_performance(secret_name, query)
             formatted_results = format_analysis_output(results)
-        elif action_type == 'extract_ddl':
-            if 'arguments' in event:
-                object_type = event['arguments'].get('object_type')
-                object_name = event['arguments'].get('object_name')
-                object_schema = event['arguments'].get('object_schema')
+        elif action_type == "check_plan_regression":
+            query = (
+                event.get("query")
+                if "arguments" not in event
+                else event["arguments"].get("query")
+            )
+            print("Checking query plan against cached baseline")
+            results = check_plan_regression(secret_name, query)
+            formatted_results = format_plan_regression_output(results)
+        elif action_type == "extract_ddl":
+            if "arguments" in event:
+                object_type = event["arguments"].get("object_type")
+                object_name = event["arguments"].get("object_name")
+                object_schema = event["arguments"].get("object_schema")
             else:
-                object_type = event.get('object_type')
-                object_name = event.get('object_name')
-                object_schema = event.get('object_schema')
-                
+                object_type = event.get("object_type")
+                object_name = event.get("object_name")
+                object_schema = event.get("object_schema")
+
             print("Generating the DDL scripts for the object")
-            results = extract_database_object_ddl(secret_name, object_type=object_type, object_name=object_name, object_schema=object_schema)
+            results = extract_database_object_ddl(
+                secret_name,
+                object_type=object_type,
+                object_name=object_name,
+                object_schema=object_schema,
+            )
             # Convert results to string if it's not already
             formatted_results = str(results) if results else "No results found"
-        elif action_type == 'execute_query':
-            query = event.get('query') if 'arguments' not in event else event['arguments'].get('query')
+        elif action_type == "execute_query":
+            query = (
+                event.get("query")
+                if "arguments" not in event
+                else event["arguments"].get("query")
+            )
+            summarize = (
+                event.get("summarize")
+                if "arguments" not in event
+                else event["arguments"].get("summarize")
+            )
             print("Executing read-only queries")
             results = validate_and_execute_queries(
                 secret_name,
@@ -1800,15 +2299,20 @@ def lambda_handler(event, context):
                 max_rows=20,
                 max_statements=5,
                 max_total_rows=1000,
-                max_complexity=15
+                max_complexity=15,
+                summarize=str(summarize).lower() == "true",
             )
             formatted_results = format_enhanced_results(results)
-        elif action_type == 'enhanced_query_diagnostics':
-            query = event.get('query') if 'arguments' not in event else event['arguments'].get('query')
+        elif action_type == "enhanced_query_diagnostics":
+            query = (
+                event.get("query")
+                if "arguments" not in event
+                else event["arguments"].get("query")
+            )
             print("Executing enhanced query diagnostics")
             results = execute_enhanced_query_diagnostics(secret_name, query)
             formatted_results = format_enhanced_diagnostics_output(results)
-        elif action_type == 'performance_insights_analysis':
+        elif action_type == "performance_insights_analysis":
             print("Executing performance insights analysis")
             results = execute_performance_insights_analysis(secret_name)
             formatted_results = format_enhanced_results(results)
@@ -1816,23 +2320,15 @@ def lambda_handler(event, context):
             print("I'm inside else condition")
             return {
                 "functionResponse": {
-                    "content": f"Error: Unknown action_type '{action_type}'. Available actions: explain_query, extract_ddl, execute_query, enhanced_query_diagnostics, performance_insights_analysis"
+                    "content": f"Error: Unknown action_type '{action_type}'. Available actions: explain_query, check_plan_regression, extract_ddl, execute_query, enhanced_query_diagnostics, performance_insights_analysis"
                 }
             }
 
         # Format the response properly
-        response_body = {
-            'TEXT': {
-                'body': formatted_results
-            }
-        }
+        response_body = {"TEXT": {"body": formatted_results}}
+
+        function_response = {"functionResponse": {"responseBody": response_body}}
 
-        function_response = {
-            'functionResponse': {
-                'responseBody': response_body
-            }
-        }
-        
         return function_response
 
     except Exception as e:
@@ -1841,4 +2337,4 @@ def lambda_handler(event, context):
             "functionResponse": {
                 "content": f"Error inside the exception block: {str(e)}"
             }
-        }
\ No newline at end of file
+        }
@@ -1,27 +1,45 @@
-
 import json
-import boto3
-import psycopg2
 import os
-from botocore.exceptions import ClientError
-
-def get_secret(secret_name):
-    """Get secret from AWS Secrets Manager """
-    #secret_name = os.environ['SECRET_NAME']
-    region_name = os.environ['REGION']
-    
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
-    
-    try:
-        secret_value = client.get_secret_value(SecretId=secret_name)
-        secret = json.loads(secret_value['SecretString'])
-        return secret
-    except ClientError as e:
-        raise Exception(f"Failed to get secret: {str(e)}")
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from db_connection import (
+    connect_to_db,
+    find_secrets_by_tags,
+    get_env_secret,
+    release_connection,
+    resolve_target_secret,
+    statement_timeout,
+)
+from stat_sampler import (
+    IO_FIELDS,
+    QUERY_TEXT_LIMIT,
+    STATEMENT_FIELDS,
+    compute_io_deltas,
+    compute_statement_deltas,
+    get_snapshot_store,
+    same_server_epoch,
+    statement_key,
+)
+
+MIN_EXEC_TIME = 1000
+SWEEP_MAX_WORKERS = int(os.environ.get("SWEEP_MAX_WORKERS", "4"))
+SWEEP_TIMEOUT_SECONDS = int(os.environ.get("SWEEP_TIMEOUT_SECONDS", "240"))
+SAMPLE_INTERVAL_SECONDS = float(os.environ.get("SAMPLE_INTERVAL_SECONDS", "10"))
+SAMPLE_MAX_WINDOW_SECONDS = float(os.environ.get("SAMPLE_MAX_WINDOW_SECONDS", "120"))
+SAMPLE_MAX_COUNT = 10
+SAMPLE_TOP_QUERIES = 10
+SAMPLE_MAX_STATEMENTS = 5000
+FLEET_MAX_WORKERS = int(os.environ.get("FLEET_MAX_WORKERS", "8"))
+FLEET_TARGET_TIMEOUT_SECONDS = int(os.environ.get("FLEET_TARGET_TIMEOUT_SECONDS", "60"))
+# Kept below the 300 second timeout create_lambda.sh gives the function
+FLEET_TIMEOUT_SECONDS = int(os.environ.get("FLEET_TIMEOUT_SECONDS", "240"))
+# Time left at the end of an invocation for merging and formatting the report
+FLEET_DEADLINE_MARGIN_SECONDS = int(
+    os.environ.get("FLEET_DEADLINE_MARGIN_SECONDS", "15")
+)
+FLEET_MAX_TARGETS = int(os.environ.get("FLEET_MAX_TARGETS", "100"))
+FLEET_TOP_N = 20
+
 
 def execute_slow_query(secret_name, min_exec_time):
     """Execute enhanced slow query analysis based on runbooks.py diagnostics"""
@@ -37,14 +55,14 @@ def execute_slow_query(secret_name, min_exec_time):
         """,
         "top_queries_by_avg_time": """
             -- Top SQL queries by execution time per call (from runbooks.py)
-            SELECT query, total_time, calls, (total_time / calls) AS avg_time 
+            SELECT query, total_exec_time AS total_time, calls, mean_exec_time AS avg_time
             FROM pg_stat_statements 
             ORDER BY avg_time DESC 
             LIMIT 10;
         """,
         "top_queries_by_calls": """
             -- Top SQL queries by number of calls (from runbooks.py)
-            SELECT query, calls, total_time, (total_time / calls) AS avg_time 
+            SELECT query, calls, total_exec_time AS total_time, mean_exec_time AS avg_time
             FROM pg_stat_statements 
             ORDER BY calls DESC 
             LIMIT 10;
@@ -147,53 +165,49 @@ def execute_slow_query(secret_name, min_exec_time):
             JOIN pg_stat_activity blocking ON blocking.pid = ANY(pg_blocking_pids(blocked.pid))
             WHERE NOT blocked.pid = blocking.pid
             LIMIT 3;;
-        """
+        """,
     }
-    
+
     print("Connecting to the database...")
     conn = None
     try:
         conn = connect_to_db(secret_name)
         print("Connected to the database.")
-    
+
         # First, ensure pg_stat_statements is installed
-        print(" I am here 1")
         with conn.cursor() as cur:
-            print(" I am here 2")
             cur.execute("""
                 CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
             """)
             conn.commit()
-        print(" I am here 3") 
-        # Execute the main query
-        
+
+        # Parameters of the queries that take any
+        params = {"slow_queries_detailed": (min_exec_time,)}
+
         results = {}
         # Execute each query and collect results
         for query_name, query in queries.items():
-            print(" I am here 4")
             with conn.cursor() as cur:
-                print(" I am here 5")
-                cur.execute(query)
-                print(" I am here 6")
+                cur.execute(query, params.get(query_name))
                 columns = [desc[0] for desc in cur.description]
                 rows = cur.fetchall()
                 results[query_name] = [dict(zip(columns, row)) for row in rows]
-            print(" I am here 7")
         return results
-            
+
     except Exception as e:
         raise Exception(f"Failed to retrieve slow queries: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def format_results_for_slow_query(results):
     """Format results in a human-readable string"""
     output = "Database Performance Analysis Report\n\n"
     # Format slow queries
     output += "=== TOP 20 SLOW QUERIES ===\n"
-    if results.get("slow_queries"):
-        for idx, query in enumerate(results["slow_queries"], 1):
+    if results.get("slow_queries_detailed"):
+        for idx, query in enumerate(results["slow_queries_detailed"], 1):
             output += f"\nQuery #{idx}:\n"
             output += f"• Username: {query['username']}\n"
             output += f"• Database: {query['database']}\n"
@@ -206,7 +220,7 @@ def format_results_for_slow_query(results):
             output += f"• Query: {query['query']}\n"
     else:
         output += "No slow queries found.\n"
-    
+
     # Format high IO queries
     output += "\n=== TOP 10 HIGH I/O QUERIES ===\n"
     if results.get("high_io_queries"):
@@ -222,7 +236,7 @@ def format_results_for_slow_query(results):
             output += f"• Query: {query['query']}\n"
     else:
         output += "No high I/O queries found.\n"
-    
+
     # Format high temp usage queries
     output += "\n=== TOP 10 HIGH TEMP USAGE QUERIES ===\n"
     if results.get("high_temp_queries"):
@@ -235,7 +249,7 @@ def format_results_for_slow_query(results):
             output += f"• Query: {query['query']}\n"
     else:
         output += "No high temp usage queries found.\n"
-    
+
     # Format blocking queries
     output += "\n=== BLOCKING QUERIES ===\n"
     if results.get("blocking_queries"):
@@ -251,6 +265,7 @@ def format_results_for_slow_query(results):
         output += "No blocking queries found.\n"
     return output
 
+
 def execute_connect_issues(secret_name, min_exec_time):
     """Execute connection management related queries"""
     queries = {
@@ -321,52 +336,51 @@ def execute_connect_issues(secret_name, min_exec_time):
             LEFT JOIN pg_class rel ON rel.oid = locks.relation
             WHERE NOT granted
             ORDER BY pid, query_start;
-        """
+        """,
     }
-    
+
     conn = None
     try:
         conn = connect_to_db(secret_name)
         # First, ensure pg_stat_statements is installed
-        
+
         with conn.cursor() as cur:
             cur.execute("""
                 CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
             """)
             conn.commit()
-            
+
         # Execute the main query
-        
+
         results = {}
-        
+
         # Execute each query and collect results
         for query_name, query in queries.items():
-            
             try:
                 with conn.cursor() as cur:
-                    
                     cur.execute(query)
-                   
+
                     columns = [desc[0] for desc in cur.description]
                     rows = cur.fetchall()
                     results[query_name] = [dict(zip(columns, row)) for row in rows]
-                 
+
             except Exception as e:
                 print(f"Error executing {query_name}: {str(e)}")
                 results[query_name] = []
-                
+
         return results
-            
+
     except Exception as e:
         raise Exception(f"Failed to retrieve connection metrics: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def format_results_for_conn_issues(results):
     """Format connection management results in a human-readable string"""
     output = "Database Connection Management Analysis Report\n\n"
-    
+
     # Format current connections
     output += "=== CURRENT CONNECTIONS ===\n"
     if results.get("current_connections"):
@@ -382,7 +396,7 @@ def format_results_for_conn_issues(results):
             output += f"• Current Query: {conn['query']}\n"
     else:
         output += "No current connections found.\n"
-    
+
     # Format connection stats
     output += "\n=== DATABASE CONNECTION STATISTICS ===\n"
     if results.get("connection_stats"):
@@ -400,7 +414,7 @@ def format_results_for_conn_issues(results):
             output += f"• Tuples Deleted: {stat['tup_deleted']}\n"
     else:
         output += "No connection statistics available.\n"
-    
+
     # Format idle connections
     output += "\n=== IDLE CONNECTIONS ===\n"
     if results.get("idle_connections"):
@@ -415,7 +429,7 @@ def format_results_for_conn_issues(results):
             output += f"• Last Query: {idle['query']}\n"
     else:
         output += "No idle connections found.\n"
-    
+
     # Format locked queries
     output += "\n=== LOCKED QUERIES ===\n"
     if results.get("locked_queries"):
@@ -432,9 +446,10 @@ def format_results_for_conn_issues(results):
             output += f"• Query: {lock['query']}\n"
     else:
         output += "No locked queries found.\n"
-    
+
     return output
 
+
 def execute_index_analysis(secret_name):
     """Execute index-related analysis queries"""
     queries = {
@@ -474,23 +489,23 @@ def execute_index_analysis(secret_name):
             WHERE i.idx_scan > 0
             ORDER BY i.idx_scan::float / NULLIF(pg_relation_size(i.indexrelid), 0)::float ASC
             LIMIT 20;
-        """
+        """,
     }
-    
+
     conn = None
     try:
         conn = connect_to_db(secret_name)
         # First, ensure pg_stat_statements is installed
-        
+
         with conn.cursor() as cur:
             cur.execute("""
                 CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
             """)
             conn.commit()
-            
-        # Execute the main query    
+
+        # Execute the main query
         results = {}
-        
+
         # Execute each query and collect results
         for query_name, query in queries.items():
             try:
@@ -502,19 +517,20 @@ def execute_index_analysis(secret_name):
             except Exception as e:
                 print(f"Error executing {query_name}: {str(e)}")
                 results[query_name] = []
-                
+
         return results
-            
+
     except Exception as e:
         raise Exception(f"Failed to retrieve index metrics: {str(e)}")
     finally:
         if conn:
-            conn.close()
-    
+            release_connection(conn)
+
+
 def format_results_for_index_analysis(results):
     """Format index analysis results in a human-readable string"""
     output = "Database Index Analysis Report\n\n"
-    
+
     # Format unused indexes
     output += "=== UNUSED INDEXES ===\n"
     if results.get("unused_indexes"):
@@ -528,7 +544,7 @@ def format_results_for_index_analysis(results):
         output += "\nRecommendation: Consider removing these unused indexes to reduce maintenance overhead and storage space.\n"
     else:
         output += "No unused indexes found.\n"
-    
+
     # Format missing indexes
     output += "\n=== POTENTIAL MISSING INDEXES (High Sequential Scans) ===\n"
     if results.get("missing_indexes"):
@@ -545,7 +561,7 @@ def format_results_for_index_analysis(results):
         output += "\nRecommendation: Tables with high sequential scan ratios might benefit from additional indexes.\n"
     else:
         output += "No tables with significant sequential scans found.\n"
-    
+
     # Format index efficiency
     output += "\n=== INDEX USAGE EFFICIENCY ===\n"
     if results.get("index_efficiency"):
@@ -559,9 +575,10 @@ def format_results_for_index_analysis(results):
         output += "\nRecommendation: Indexes with very low scans per byte might be candidates for removal or restructuring.\n"
     else:
         output += "No index usage statistics found.\n"
-    
+
     return output
 
+
 def execute_autovacuum_analysis(secret_name):
     """Execute enhanced autovacuum-related analysis queries based on runbooks.py diagnostics"""
     queries = {
@@ -689,23 +706,23 @@ def execute_autovacuum_analysis(secret_name):
             FROM pg_prepared_xacts
             WHERE prepared < now() - interval '15 minutes'
             ORDER BY prepared;
-        """
+        """,
     }
-    
+
     conn = None
     try:
         conn = connect_to_db(secret_name)
         # First, ensure pg_stat_statements is installed
-        
+
         with conn.cursor() as cur:
             cur.execute("""
                 CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
             """)
             conn.commit()
-            
-        # Execute the main query    
+
+        # Execute the main query
         results = {}
-        
+
         # Execute each query and collect results
         for query_name, query in queries.items():
             try:
@@ -717,19 +734,20 @@ def execute_autovacuum_analysis(secret_name):
             except Exception as e:
                 print(f"Error executing {query_name}: {str(e)}")
                 results[query_name] = []
-                
+
         return results
-            
+
     except Exception as e:
         raise Exception(f"Failed to retrieve autovacuum metrics: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def format_results_for_autovacuum_analysis(results):
     """Format autovacuum analysis results in a human-readable string"""
     output = "Database Autovacuum Analysis Report\n\n"
-    
+
     # Format tables needing vacuum
     output += "=== TABLES NEEDING VACUUM ===\n"
     if results.get("tables_needing_vacuum"):
@@ -746,7 +764,7 @@ def format_results_for_autovacuum_analysis(results):
         output += "\nRecommendation: Consider running VACUUM on tables with high dead tuple percentages.\n"
     else:
         output += "No tables with dead tuples found.\n"
-    
+
     # Format current autovacuum activity
     output += "\n=== CURRENT AUTOVACUUM ACTIVITY ===\n"
     if results.get("autovacuum_activity"):
@@ -763,7 +781,7 @@ def format_results_for_autovacuum_analysis(results):
             output += f"• Query: {activity['query']}\n"
     else:
         output += "No active autovacuum processes found.\n"
-    
+
     # Format table bloat information
     output += "\n=== TABLE BLOAT INFORMATION ===\n"
     if results.get("table_bloat"):
@@ -776,7 +794,7 @@ def format_results_for_autovacuum_analysis(results):
             output += f"• Total Size: {bloat['total_size']}\n"
     else:
         output += "No table bloat information available.\n"
-    
+
     # Format transaction wraparound status
     output += "\n=== TRANSACTION WRAPAROUND STATUS ===\n"
     if results.get("wraparound_status"):
@@ -785,15 +803,18 @@ def format_results_for_autovacuum_analysis(results):
             output += f"• XID Age: {status['xid_age']}\n"
             output += f"• Max Age: {status['max_age']}\n"
             output += f"• Percent Towards Wraparound: {status['percent_towards_wraparound']}%\n"
-            
+
             # Add warning if approaching wraparound
-            if status['percent_towards_wraparound'] > 75:
-                output += "⚠️ WARNING: Database is approaching transaction wraparound limit!\n"
+            if status["percent_towards_wraparound"] > 75:
+                output += (
+                    "⚠️ WARNING: Database is approaching transaction wraparound limit!\n"
+                )
     else:
         output += "No wraparound status information available.\n"
-    
+
     return output
 
+
 def execute_io_analysis(secret_name):
     """Execute I/O-related analysis queries"""
     queries = {
@@ -837,21 +858,21 @@ def execute_io_analysis(secret_name):
             ORDER BY (io.heap_blks_read + io.idx_blks_read + 
                      io.toast_blks_read + io.tidx_blks_read) DESC
             LIMIT 20;
-        """
+        """,
     }
-    
+
     conn = connect_to_db(secret_name)
     try:
         # First, ensure pg_stat_statements is installed
-        
+
         with conn.cursor() as cur:
             cur.execute("""
                 CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
             """)
             conn.commit()
-        
+
         results = {}
-        
+
         # Execute each query and collect results
         for query_name, query in queries.items():
             try:
@@ -863,19 +884,20 @@ def execute_io_analysis(secret_name):
             except Exception as e:
                 print(f"Error executing {query_name}: {str(e)}")
                 results[query_name] = []
-                
+
         return results
-            
+
     except Exception as e:
         raise Exception(f"Failed to retrieve I/O metrics: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def format_results_for_io_analysis(results):
     """Format I/O analysis results in a human-readable string"""
     output = "Database I/O Analysis Report\n\n"
-    
+
     # Format buffer usage
     output += "=== BUFFER USAGE BY TABLE ===\n"
     if results.get("buffer_usage"):
@@ -885,13 +907,13 @@ def format_results_for_io_analysis(results):
             output += f"• Blocks Read from Disk: {table['heap_blks_read']}\n"
             output += f"• Blocks Hit in Buffer: {table['heap_blks_hit']}\n"
             output += f"• Buffer Hit Percentage: {table['hit_percentage']}%\n"
-            
+
             # Add recommendations based on hit percentage
-            if table['hit_percentage'] < 90:
+            if table["hit_percentage"] < 90:
                 output += "⚠️ Warning: Low buffer hit ratio. Consider increasing shared_buffers.\n"
     else:
         output += "No buffer usage statistics available.\n"
-    
+
     # Format checkpoint activity
     output += "\n=== CHECKPOINT ACTIVITY ===\n"
     if results.get("checkpoint_activity") and results["checkpoint_activity"]:
@@ -901,18 +923,22 @@ def format_results_for_io_analysis(results):
         output += f"• Checkpoint Write Time: {checkpoint['checkpoint_write_time']} ms\n"
         output += f"• Checkpoint Sync Time: {checkpoint['checkpoint_sync_time']} ms\n"
         output += f"• Buffers Written During Checkpoints: {checkpoint['buffers_checkpoint']}\n"
-        output += f"• Buffers Written by Background Writer: {checkpoint['buffers_clean']}\n"
-        output += f"• Buffers Written by Backend Processes: {checkpoint['buffers_backend']}\n"
+        output += (
+            f"• Buffers Written by Background Writer: {checkpoint['buffers_clean']}\n"
+        )
+        output += (
+            f"• Buffers Written by Backend Processes: {checkpoint['buffers_backend']}\n"
+        )
         output += f"• Backend fsync Calls: {checkpoint['buffers_backend_fsync']}\n"
         output += f"• Buffers Allocated: {checkpoint['buffers_alloc']}\n"
         output += f"• Statistics Reset Time: {checkpoint['stats_reset']}\n"
-        
+
         # Add recommendations based on checkpoint activity
-        if checkpoint['checkpoints_req'] > checkpoint['checkpoints_timed']:
+        if checkpoint["checkpoints_req"] > checkpoint["checkpoints_timed"]:
             output += "\n⚠️ Warning: High number of requested checkpoints. Consider increasing checkpoint_timeout or max_wal_size.\n"
     else:
         output += "No checkpoint activity information available.\n"
-    
+
     # Format I/O statistics
     output += "\n=== DETAILED I/O STATISTICS (TOP 20 TABLES) ===\n"
     if results.get("io_statistics"):
@@ -928,10 +954,10 @@ def format_results_for_io_analysis(results):
             output += f"• Toast Blocks Hit: {stat['toast_blks_hit']}\n"
             output += f"• Toast Index Blocks Read: {stat['tidx_blks_read']}\n"
             output += f"• Toast Index Blocks Hit: {stat['tidx_blks_hit']}\n"
-            
+
             # Calculate and show hit ratios
-            total_reads = stat['heap_blks_read'] + stat['idx_blks_read']
-            total_hits = stat['heap_blks_hit'] + stat['idx_blks_hit']
+            total_reads = stat["heap_blks_read"] + stat["idx_blks_read"]
+            total_hits = stat["heap_blks_hit"] + stat["idx_blks_hit"]
             if total_reads + total_hits > 0:
                 hit_ratio = (total_hits / (total_reads + total_hits)) * 100
                 output += f"• Overall Buffer Hit Ratio: {hit_ratio:.2f}%\n"
@@ -939,9 +965,10 @@ def format_results_for_io_analysis(results):
                     output += "⚠️ Warning: Low buffer hit ratio for this table.\n"
     else:
         output += "No I/O statistics available.\n"
-    
+
     return output
 
+
 def execute_replication_analysis(secret_name):
     """Execute replication-related analysis queries"""
     queries = {
@@ -978,20 +1005,20 @@ def execute_replication_analysis(secret_name):
                    replay_lsn,
                    pg_wal_lsn_diff(sent_lsn, replay_lsn) as lag_bytes
             FROM pg_stat_replication;
-        """
+        """,
     }
-    
+
     conn = connect_to_db(secret_name)
     try:
         # First, ensure pg_stat_statements is installed
-        
+
         with conn.cursor() as cur:
             cur.execute("""
                 CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
             """)
             conn.commit()
         results = {}
-        
+
         # Execute each query and collect results
         for query_name, query in queries.items():
             try:
@@ -1003,19 +1030,20 @@ def execute_replication_analysis(secret_name):
             except Exception as e:
                 print(f"Error executing {query_name}: {str(e)}")
                 results[query_name] = []
-                
+
         return results
-            
+
     except Exception as e:
         raise Exception(f"Failed to retrieve replication metrics: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def format_results_for_replication_analysis(results):
     """Format replication analysis results in a human-readable string"""
     output = "Database Replication Analysis Report\n\n"
-    
+
     # Format Aurora replica status
     output += "=== AURORA REPLICA STATUS ===\n"
     if results.get("aurora_replica_status"):
@@ -1027,13 +1055,13 @@ def format_results_for_replication_analysis(results):
             output += f"• Highest Received LSN: {replica['highest_lsn_rcvd']}\n"
             output += f"• Current Read LSN: {replica['current_read_lsn']}\n"
             output += f"• Last Update: {replica['last_update_timestamp']}\n"
-            
+
             # Add warnings for high lag
-            if float(replica['lag_seconds']) > 30:
+            if float(replica["lag_seconds"]) > 30:
                 output += "⚠️ Warning: High replication lag detected!\n"
     else:
         output += "No Aurora replica status information available.\n"
-    
+
     # Format replication slots
     output += "\n=== REPLICATION SLOTS ===\n"
     if results.get("replication_slots"):
@@ -1044,13 +1072,13 @@ def format_results_for_replication_analysis(results):
             output += f"• Active: {slot['active']}\n"
             output += f"• Confirmed Flush LSN: {slot['confirmed_flush_lsn']}\n"
             output += f"• Lag Size: {slot['lag_size']}\n"
-            
+
             # Add warnings for inactive slots
-            if not slot['active']:
+            if not slot["active"]:
                 output += "⚠️ Warning: Inactive replication slot detected!\n"
     else:
         output += "No replication slots found.\n"
-    
+
     # Format replication connections
     output += "\n=== REPLICATION CONNECTIONS ===\n"
     if results.get("replication_connections"):
@@ -1069,15 +1097,16 @@ def format_results_for_replication_analysis(results):
             output += f"• Flush LSN: {conn['flush_lsn']}\n"
             output += f"• Replay LSN: {conn['replay_lsn']}\n"
             output += f"• Lag Size: {conn['lag_bytes']} bytes\n"
-            
+
             # Add warnings for large lag
-            if conn['lag_bytes'] > 100000000:  # 100MB
+            if conn["lag_bytes"] > 100000000:  # 100MB
                 output += "⚠️ Warning: Large replication lag detected!\n"
     else:
         output += "No replication connections found.\n"
-    
+
     return output
 
+
 def execute_system_health(secret_name):
     """Execute system health-related analysis queries"""
     queries = {
@@ -1128,21 +1157,21 @@ def execute_system_health(secret_name):
             WHERE state != 'idle' 
             AND xact_start < now() - interval '5 minutes'
             ORDER BY xact_start;
-        """
+        """,
     }
-    
+
     conn = connect_to_db(secret_name)
     try:
         # First, ensure pg_stat_statements is installed
-        
+
         with conn.cursor() as cur:
             cur.execute("""
                 CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
             """)
             conn.commit()
-        
+
         results = {}
-        
+
         # Execute each query and collect results
         for query_name, query in queries.items():
             try:
@@ -1154,19 +1183,20 @@ def execute_system_health(secret_name):
             except Exception as e:
                 print(f"Error executing {query_name}: {str(e)}")
                 results[query_name] = []
-                
+
         return results
-            
+
     except Exception as e:
         raise Exception(f"Failed to retrieve system health metrics: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def format_results_for_system_health(results):
     """Format system health analysis results in a human-readable string"""
     output = "Database System Health Report\n\n"
-    
+
     # Format database statistics
     output += "=== DATABASE STATISTICS ===\n"
     if results.get("database_statistics"):
@@ -1177,15 +1207,15 @@ def format_results_for_system_health(results):
             output += f"• Transactions Rolled Back: {stat['xact_rollback']}\n"
             output += f"• Blocks Read: {stat['blks_read']}\n"
             output += f"• Blocks Hit (Cache): {stat['blks_hit']}\n"
-            
+
             # Calculate cache hit ratio
-            total_blocks = stat['blks_read'] + stat['blks_hit']
+            total_blocks = stat["blks_read"] + stat["blks_hit"]
             if total_blocks > 0:
-                cache_hit_ratio = (stat['blks_hit'] / total_blocks) * 100
+                cache_hit_ratio = (stat["blks_hit"] / total_blocks) * 100
                 output += f"• Cache Hit Ratio: {cache_hit_ratio:.2f}%\n"
                 if cache_hit_ratio < 90:
                     output += "⚠️ Warning: Low cache hit ratio. Consider increasing shared_buffers.\n"
-            
+
             output += f"• Tuples Returned: {stat['tup_returned']}\n"
             output += f"• Tuples Fetched: {stat['tup_fetched']}\n"
             output += f"• Tuples Inserted: {stat['tup_inserted']}\n"
@@ -1198,27 +1228,27 @@ def format_results_for_system_health(results):
             output += f"• Block Read Time: {stat['blk_read_time']} ms\n"
             output += f"• Block Write Time: {stat['blk_write_time']} ms\n"
             output += f"• Statistics Reset: {stat['stats_reset']}\n"
-            
+
             # Add warnings for concerning metrics
-            if stat['deadlocks'] > 0:
+            if stat["deadlocks"] > 0:
                 output += "⚠️ Warning: Deadlocks detected!\n"
-            if stat['conflicts'] > 0:
+            if stat["conflicts"] > 0:
                 output += "⚠️ Warning: Conflicts detected!\n"
-            if stat['temp_files'] > 1000:
+            if stat["temp_files"] > 1000:
                 output += "⚠️ Warning: High number of temporary files created!\n"
     else:
         output += "No database statistics available.\n"
-    
+
     # Format lock contention
     output += "\n=== LOCK CONTENTION ===\n"
     if results.get("lock_contention"):
         lock_groups = {}
         for lock in results["lock_contention"]:
-            relation = lock['relation']
+            relation = lock["relation"]
             if relation not in lock_groups:
                 lock_groups[relation] = []
             lock_groups[relation].append(lock)
-        
+
         for relation, locks in lock_groups.items():
             output += f"\nRelation: {relation}\n"
             for idx, lock in enumerate(locks, 1):
@@ -1229,12 +1259,12 @@ def format_results_for_system_health(results):
                 output += f"• Virtual Transaction ID: {lock['vtid']}\n"
                 output += f"• PID: {lock['pid']}\n"
                 output += f"• Granted: {lock['granted']}\n"
-                
-                if not lock['granted']:
+
+                if not lock["granted"]:
                     output += "⚠️ Warning: Lock waiting to be granted!\n"
     else:
         output += "No lock contention found.\n"
-    
+
     # Format long-running transactions
     output += "\n=== LONG-RUNNING TRANSACTIONS (> 5 minutes) ===\n"
     if results.get("long_running_transactions"):
@@ -1246,62 +1276,15 @@ def format_results_for_system_health(results):
             output += f"• Age: {txn['xact_age']}\n"
             output += f"• State: {txn['state']}\n"
             output += f"• Query: {txn['query']}\n"
-            
+
             # Add warning for very long-running transactions
-            if 'hours' in str(txn['xact_age']) or 'days' in str(txn['xact_age']):
+            if "hours" in str(txn["xact_age"]) or "days" in str(txn["xact_age"]):
                 output += "⚠️ Warning: Transaction running for an extended period!\n"
     else:
         output += "No long-running transactions found.\n"
-    
+
     return output
 
-def connect_to_db(secret_name):
-    """Establish database connection"""
-    cur_secret = secret_name
-    secret = get_secret(cur_secret)
-    try:
-        print("in connect_to_db")
-        conn = psycopg2.connect(
-            host=secret['host'],
-            database=secret['dbname'],
-            user=secret['username'],
-            password=secret['password'],
-            port=secret['port']
-        )
-        return conn
-    except Exception as e:
-        raise Exception(f"Failed to connect to the database: {str(e)}")
-
-def get_env_secret(environment):
-    ssm_client = boto3.client('ssm')
-    print("in get_env_secret")
-    """Retrieve the secret name for the specified environment"""
-    if environment == 'prod':
-        print("in get_env_secret1")
-        try:
-            # Get the secret name from Parameter Store
-            print("in get_env_secret-try")
-            response = ssm_client.get_parameter(
-                Name=f'/AuroraOps/{environment}'
-            )
-            print(response['Parameter']['Value'])
-            return response['Parameter']['Value']
-        except ssm_client.exceptions.ParameterNotFound:
-            error_message = f"Parameter not found: /AuroraOps/{environment}"
-            print(error_message)
-            raise Exception(error_message)
-    elif environment == 'dev':
-        try:
-            # Get the secret name from Parameter Store
-            response = ssm_client.get_parameter(
-                Name=f'/AuroraOps/{environment}'
-            )
-            return response['Parameter']['Value']
-        except Exception as e:
-            raise Exception(f"Failed to get dev secret name from Parameter Store: {str(e)}")
-    else:
-        print("environement does not exist")
-        raise ValueError(f"Unknown environment: {environment}")
 
 def execute_vacuum_progress_analysis(secret_name):
     """Execute current vacuum progress analysis based on runbooks.py"""
@@ -1325,7 +1308,7 @@ def execute_vacuum_progress_analysis(secret_name):
         JOIN pg_stat_all_tables s on s.relid = p.relid
         ORDER BY now() - a.xact_start DESC;
     """
-    
+
     conn = None
     try:
         conn = connect_to_db(secret_name)
@@ -1338,7 +1321,8 @@ def execute_vacuum_progress_analysis(secret_name):
         raise Exception(f"Failed to retrieve vacuum progress: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def execute_xid_analysis(secret_name):
     """Execute XID wraparound analysis based on runbooks.py"""
@@ -1376,14 +1360,14 @@ def execute_xid_analysis(secret_name):
             WHERE c.relkind = 'r' AND c.relfrozenxid != 0 
             ORDER BY xid_age DESC 
             LIMIT 10;
-        """
+        """,
     }
-    
+
     conn = None
     try:
         conn = connect_to_db(secret_name)
         results = {}
-        
+
         for query_name, query in queries.items():
             try:
                 with conn.cursor() as cur:
@@ -1394,13 +1378,14 @@ def execute_xid_analysis(secret_name):
             except Exception as e:
                 print(f"Error executing {query_name}: {str(e)}")
                 results[query_name] = []
-                
+
         return results
     except Exception as e:
         raise Exception(f"Failed to retrieve XID analysis: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def execute_bloat_analysis(secret_name):
     """Execute table and index bloat analysis based on runbooks.py"""
@@ -1461,7 +1446,7 @@ def execute_bloat_analysis(secret_name):
         ORDER BY bloat_percentage DESC, bloat_pages DESC
         LIMIT 20;
     """
-    
+
     conn = None
     try:
         conn = connect_to_db(secret_name)
@@ -1474,7 +1459,8 @@ def execute_bloat_analysis(secret_name):
         raise Exception(f"Failed to retrieve bloat analysis: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def execute_long_running_transactions(secret_name):
     """Execute long-running transaction analysis based on runbooks.py"""
@@ -1491,7 +1477,7 @@ def execute_long_running_transactions(secret_name):
         AND EXTRACT(EPOCH FROM (now() - xact_start)) > 3600
         ORDER BY xact_start;
     """
-    
+
     conn = None
     try:
         conn = connect_to_db(secret_name)
@@ -1504,13 +1490,14 @@ def execute_long_running_transactions(secret_name):
         raise Exception(f"Failed to retrieve long-running transactions: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
 
 def format_results_for_vacuum_progress(results):
     """Format vacuum progress results for display"""
     if not results:
         return "No active vacuum operations found."
-    
+
     output = "=== CURRENT VACUUM PROGRESS ===\n"
     for idx, vacuum in enumerate(results, 1):
         output += f"\nVacuum Operation #{idx}:\n"
@@ -1525,18 +1512,19 @@ def format_results_for_vacuum_progress(results):
         output += f"• Vacuumed: {vacuum['vacuumed']} ({vacuum['vacuumed_pct']}%)\n"
         output += f"• Dead Tuples: {vacuum['total_num_dead_tuples']}\n"
         output += f"• Wait Event: {vacuum['wait_event']}\n"
-    
+
     return output
 
+
 def format_results_for_xid_analysis(results):
     """Format XID analysis results for display"""
     output = "=== XID WRAPAROUND ANALYSIS ===\n"
-    
+
     # Oldest XID across all databases
     if results.get("oldest_xid_all_databases"):
         oldest_xid = results["oldest_xid_all_databases"][0]["oldest_xid"]
         output += f"\nOldest XID across all databases: {oldest_xid}\n"
-    
+
     # Percent towards wraparound
     if results.get("percent_towards_wraparound"):
         wraparound_data = results["percent_towards_wraparound"][0]
@@ -1544,26 +1532,29 @@ def format_results_for_xid_analysis(results):
         output += f"• Current oldest XID: {wraparound_data['oldest_current_xid']}\n"
         output += f"• Percent towards wraparound: {wraparound_data['percent_towards_wraparound']}%\n"
         output += f"• Percent towards emergency autovacuum: {wraparound_data['percent_towards_emergency_autovac']}%\n"
-    
+
     # XID age by database
     if results.get("oldest_xid_by_database"):
         output += f"\nXID Age by Database:\n"
         for db in results["oldest_xid_by_database"]:
             output += f"• {db['datname']}: {db['xid_age']}\n"
-    
+
     # Tables with oldest relfrozenxid
     if results.get("tables_with_oldest_relfrozenxid"):
         output += f"\nTables with Oldest relfrozenxid:\n"
         for table in results["tables_with_oldest_relfrozenxid"]:
-            output += f"• {table['schema_name']}.{table['table_name']}: {table['xid_age']}\n"
-    
+            output += (
+                f"• {table['schema_name']}.{table['table_name']}: {table['xid_age']}\n"
+            )
+
     return output
 
+
 def format_results_for_bloat_analysis(results):
     """Format bloat analysis results for display"""
     if not results:
         return "No significant table bloat found."
-    
+
     output = "=== TABLE BLOAT ANALYSIS ===\n"
     for idx, table in enumerate(results, 1):
         output += f"\nBloated Table #{idx}:\n"
@@ -1573,14 +1564,15 @@ def format_results_for_bloat_analysis(results):
         output += f"• Bloat Size: {table['bloat_size']}\n"
         output += f"• Bloat Percentage: {table['bloat_percentage']}%\n"
         output += f"• Bloat Pages: {table['bloat_pages']}\n"
-    
+
     return output
 
+
 def format_results_for_long_running_transactions(results):
     """Format long-running transaction results for display"""
     if not results:
         return "No long-running transactions found."
-    
+
     output = "=== LONG-RUNNING TRANSACTIONS ===\n"
     for idx, txn in enumerate(results, 1):
         output += f"\nLong-Running Transaction #{idx}:\n"
@@ -1593,109 +1585,788 @@ def format_results_for_long_running_transactions(results):
         output += f"• State: {txn['state']}\n"
         output += f"• Wait Event: {txn['wait_event_type']}.{txn['wait_event']}\n"
         output += f"• Query: {txn['query'][:100]}...\n"
-    
+
     return output
 
+
+# Registry of single diagnostics: action_type -> (executor, formatter)
+DIAGNOSTICS = {
+    "slow_query": (
+        lambda secret_name: execute_slow_query(secret_name, MIN_EXEC_TIME),
+        format_results_for_slow_query,
+    ),
+    "connection_management_issues": (
+        lambda secret_name: execute_connect_issues(secret_name, MIN_EXEC_TIME),
+        format_results_for_conn_issues,
+    ),
+    "index_analysis": (execute_index_analysis, format_results_for_index_analysis),
+    "autovacuum_analysis": (
+        execute_autovacuum_analysis,
+        format_results_for_autovacuum_analysis,
+    ),
+    "io_analysis": (execute_io_analysis, format_results_for_io_analysis),
+    "replication_analysis": (
+        execute_replication_analysis,
+        format_results_for_replication_analysis,
+    ),
+    "system_health": (execute_system_health, format_results_for_system_health),
+    "vacuum_progress": (
+        execute_vacuum_progress_analysis,
+        format_results_for_vacuum_progress,
+    ),
+    "xid_analysis": (execute_xid_analysis, format_results_for_xid_analysis),
+    "bloat_analysis": (execute_bloat_analysis, format_results_for_bloat_analysis),
+    "long_running_transactions": (
+        execute_long_running_transactions,
+        format_results_for_long_running_transactions,
+    ),
+}
+
+
+def parse_sweep_sections(sections):
+    """Normalize the requested sweep sections (list or comma-separated string)"""
+    if not sections:
+        return list(DIAGNOSTICS.keys())
+    if isinstance(sections, str):
+        sections = [section.strip() for section in sections.split(",")]
+    selected = []
+    for section in sections:
+        if not section or section in selected:
+            continue
+        if section not in DIAGNOSTICS:
+            raise ValueError(
+                f"Unknown sweep section '{section}'. Available sections: {', '.join(DIAGNOSTICS.keys())}"
+            )
+        selected.append(section)
+    return selected
+
+
+def ensure_pg_stat_statements(secret_name):
+    """Create pg_stat_statements once so concurrent sections do not race on it"""
+    conn = None
+    try:
+        conn = connect_to_db(secret_name)
+        with conn.cursor() as cur:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS pg_stat_statements;")
+            conn.commit()
+    except Exception as e:
+        print(f"Could not ensure pg_stat_statements: {str(e)}")
+    finally:
+        if conn:
+            release_connection(conn)
+
+
+def run_sweep_section(secret_name, section):
+    """Run one diagnostic and capture its result, timing and any error"""
+    executor, formatter = DIAGNOSTICS[section]
+    started = time.monotonic()
+    try:
+        results = executor(secret_name)
+        return {
+            "section": section,
+            "status": "ok",
+            "duration_ms": round((time.monotonic() - started) * 1000, 1),
+            "output": formatter(results),
+            "error": None,
+        }
+    except Exception as e:
+        print(f"Sweep section {section} failed: {str(e)}")
+        return {
+            "section": section,
+            "status": "error",
+            "duration_ms": round((time.monotonic() - started) * 1000, 1),
+            "output": None,
+            "error": str(e),
+        }
+
+
+def execute_full_health_sweep(
+    secret_name, sections=None, max_workers=None, timeout=None
+):
+    """
+    Run several diagnostics concurrently over a bounded set of pooled connections
+
+    Args:
+        secret_name (str): Secret containing database credentials
+        sections (list|str): Diagnostics to run (defaults to every registered diagnostic)
+        max_workers (int): Maximum number of diagnostics running at the same time
+        timeout (int): Seconds to wait for the whole sweep before reporting stragglers
+
+    Returns:
+        dict: Per-section results in request order plus overall timing
+    """
+    selected = parse_sweep_sections(sections)
+    max_workers = max(1, min(int(max_workers or SWEEP_MAX_WORKERS), len(selected)))
+    timeout = timeout or SWEEP_TIMEOUT_SECONDS
+
+    started = time.monotonic()
+    ensure_pg_stat_statements(secret_name)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            section: executor.submit(run_sweep_section, secret_name, section)
+            for section in selected
+        }
+        wait(futures.values(), timeout=timeout)
+    finally:
+        # Do not block on stragglers; they release their connections when done
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    section_results = []
+    for section in selected:
+        future = futures[section]
+        if future.done() and not future.cancelled():
+            section_results.append(future.result())
+        else:
+            section_results.append(
+                {
+                    "section": section,
+                    "status": "timeout",
+                    "duration_ms": None,
+                    "output": None,
+                    "error": f"Section did not finish within {timeout} seconds",
+                }
+            )
+
+    return {
+        "sections": section_results,
+        "total_duration_ms": round((time.monotonic() - started) * 1000, 1),
+        "max_workers": max_workers,
+        "succeeded": sum(1 for r in section_results if r["status"] == "ok"),
+        "failed": sum(1 for r in section_results if r["status"] != "ok"),
+    }
+
+
+def format_results_for_full_health_sweep(results):
+    """Format the full health sweep into a summary followed by each section's report"""
+    output = "Database Full Health Sweep Report\n\n"
+    output += "=== SWEEP SUMMARY ===\n"
+    output += f"Total time: {results['total_duration_ms']} ms with {results['max_workers']} parallel workers\n"
+    output += (
+        f"Sections succeeded: {results['succeeded']}, failed: {results['failed']}\n"
+    )
+    for section in results["sections"]:
+        duration = (
+            f"{section['duration_ms']} ms"
+            if section["duration_ms"] is not None
+            else "n/a"
+        )
+        output += f"• {section['section']}: {section['status']} ({duration})\n"
+
+    for section in results["sections"]:
+        output += f"\n=== {section['section'].upper()} ===\n"
+        if section["status"] == "ok":
+            output += section["output"]
+        else:
+            output += f"⚠️ Section {section['status']}: {section['error']}\n"
+
+    # Machine-readable timings for callers that want to post-process the sweep
+    summary = [
+        {key: section[key] for key in ("section", "status", "duration_ms", "error")}
+        for section in results["sections"]
+    ]
+    output += "\n=== SWEEP TIMINGS (JSON) ===\n"
+    output += json.dumps(
+        {"total_duration_ms": results["total_duration_ms"], "sections": summary},
+        default=str,
+    )
+    return output
+
+
+def collect_stat_snapshot(conn):
+    """
+    Read the cumulative pg_stat_statements and I/O counters into a compact snapshot
+
+    pg_stat_io is used on PostgreSQL 16+, per-table pg_statio_user_tables
+    counters otherwise.
+
+    Returns:
+        tuple: (snapshot dict, {statement key: query text})
+    """
+    snapshot = {"statements": {}, "io": {}}
+    query_texts = {}
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT pg_postmaster_start_time()::text,
+                   current_setting('block_size')::int,
+                   to_regclass('pg_catalog.pg_stat_io') IS NOT NULL,
+                   to_regclass('pg_stat_statements_info') IS NOT NULL
+        """)
+        server_started, block_size, has_stat_io, has_statements_info = cur.fetchone()
+        snapshot["server_started"] = server_started
+        snapshot["block_size"] = block_size
+        snapshot["stats_reset"] = None
+        if has_statements_info:
+            cur.execute("SELECT stats_reset::text FROM pg_stat_statements_info")
+            snapshot["stats_reset"] = cur.fetchone()[0]
+
+        cur.execute(f"""
+            SELECT dbid, userid, queryid, left(query, {QUERY_TEXT_LIMIT}),
+                   {", ".join(f"sum({field})" for field in STATEMENT_FIELDS)}
+            FROM pg_stat_statements
+            WHERE queryid IS NOT NULL
+            GROUP BY dbid, userid, queryid, left(query, {QUERY_TEXT_LIMIT})
+            ORDER BY sum(total_exec_time) DESC
+            LIMIT {SAMPLE_MAX_STATEMENTS}
+        """)
+        # Take the timestamp with the statement counters, they drive the rates
+        snapshot["taken_at"] = time.time()
+        for dbid, userid, queryid, query, *counters in cur.fetchall():
+            key = statement_key(dbid, userid, queryid)
+            snapshot["statements"][key] = [float(value or 0) for value in counters]
+            query_texts[key] = query
+
+        if has_stat_io:
+            snapshot["io_source"] = "pg_stat_io"
+            cur.execute("""
+                SELECT backend_type, object, context,
+                       coalesce(reads, 0), coalesce(writes, 0), coalesce(extends, 0),
+                       coalesce(hits, 0), coalesce(evictions, 0),
+                       coalesce(read_time, 0), coalesce(write_time, 0)
+                FROM pg_stat_io
+            """)
+            for backend_type, io_object, io_context, *counters in cur.fetchall():
+                snapshot["io"][f"{backend_type}/{io_object}/{io_context}"] = [
+                    float(v) for v in counters
+                ]
+        else:
+            snapshot["io_source"] = "pg_statio_user_tables"
+            cur.execute("""
+                SELECT schemaname || '.' || relname,
+                       coalesce(heap_blks_read, 0) + coalesce(idx_blks_read, 0),
+                       coalesce(heap_blks_hit, 0) + coalesce(idx_blks_hit, 0)
+                FROM pg_statio_user_tables
+            """)
+            for table_name, reads, hits in cur.fetchall():
+                counters = dict.fromkeys(IO_FIELDS, 0.0)
+                counters["reads"] = float(reads)
+                counters["hits"] = float(hits)
+                snapshot["io"][table_name] = [counters[field] for field in IO_FIELDS]
+    conn.rollback()
+    return snapshot, query_texts
+
+
+def take_stat_snapshot(secret_name):
+    """Take one snapshot on a pooled connection and record it in the snapshot store"""
+    conn = None
+    try:
+        conn = connect_to_db(secret_name)
+        snapshot, query_texts = collect_stat_snapshot(conn)
+    finally:
+        if conn:
+            release_connection(conn)
+    try:
+        get_snapshot_store().append(secret_name, snapshot, query_texts)
+    except Exception as e:
+        print(f"Could not persist snapshot: {str(e)}")
+    return snapshot, query_texts
+
+
+def execute_load_sample(
+    secret_name, sample_count=None, interval_seconds=None, use_baseline=True
+):
+    """
+    Sample pg_stat_statements and the I/O views to show what is loading the database now
+
+    Takes sample_count snapshots interval_seconds apart. When use_baseline is
+    set and a recent snapshot from an earlier call is in the store, it is used
+    as the first snapshot so a single new sample is enough.
+
+    Args:
+        secret_name (str): Secret containing database credentials
+        sample_count (int): New snapshots to take (at least 2 without a baseline)
+        interval_seconds (float): Seconds between snapshots
+        use_baseline (bool): Whether to build on the last stored snapshot
+
+    Returns:
+        dict: Per-interval totals, ranked statement and I/O deltas over the whole window
+    """
+    interval_seconds = float(interval_seconds or SAMPLE_INTERVAL_SECONDS)
+    if interval_seconds <= 0:
+        raise ValueError("interval_seconds must be positive")
+    sample_count = int(sample_count or 2)
+    sample_count = max(1, min(sample_count, SAMPLE_MAX_COUNT))
+
+    store = get_snapshot_store()
+    baseline = store.latest(secret_name) if use_baseline else None
+    if baseline is None:
+        sample_count = max(sample_count, 2)
+    if (sample_count - 1) * interval_seconds > SAMPLE_MAX_WINDOW_SECONDS:
+        raise ValueError(
+            f"Sampling window of {(sample_count - 1) * interval_seconds:.0f}s exceeds "
+            f"SAMPLE_MAX_WINDOW_SECONDS ({SAMPLE_MAX_WINDOW_SECONDS:.0f}s)"
+        )
+
+    ensure_pg_stat_statements(secret_name)
+    try:
+        snapshots = []
+        query_texts = {}
+        for index in range(sample_count):
+            if index:
+                time.sleep(interval_seconds)
+            snapshot, texts = take_stat_snapshot(secret_name)
+            snapshots.append(snapshot)
+            query_texts.update(texts)
+    except Exception as e:
+        raise Exception(f"Failed to sample database statistics: {str(e)}")
+
+    used_baseline = baseline is not None and same_server_epoch(baseline, snapshots[0])
+    if used_baseline:
+        snapshots.insert(0, baseline)
+        _, stored_texts = store.load(secret_name)
+        query_texts = {**stored_texts, **query_texts}
+    if len(snapshots) < 2 or not same_server_epoch(snapshots[-2], snapshots[-1]):
+        # The stored baseline predates a restart or stats reset, or the stats
+        # were reset while sampling; sample again so the last pair is comparable
+        time.sleep(interval_seconds)
+        snapshot, texts = take_stat_snapshot(secret_name)
+        snapshots.append(snapshot)
+        query_texts.update(texts)
+
+    intervals = []
+    for older, newer in zip(snapshots, snapshots[1:], strict=False):
+        if same_server_epoch(older, newer):
+            delta = compute_statement_deltas(older, newer)
+            intervals.append(
+                {"interval_seconds": delta["interval_seconds"], **delta["totals"]}
+            )
+        else:
+            intervals.append({"interval_seconds": None, "reset": True})
+
+    # Rank over the longest trailing run of snapshots without a reset
+    last = snapshots[-1]
+    first_index = len(snapshots) - 1
+    while first_index > 0 and same_server_epoch(snapshots[first_index - 1], last):
+        first_index -= 1
+    if first_index == len(snapshots) - 1:
+        raise Exception(
+            "Database statistics were reset while sampling; run the sample again"
+        )
+    first = snapshots[first_index]
+    statement_deltas = compute_statement_deltas(first, last)
+    for statement in statement_deltas["statements"]:
+        statement["query"] = query_texts.get(statement["key"], "")
+
+    return {
+        "used_baseline": used_baseline,
+        # Count the extra snapshot taken after a reset, but not the stored baseline
+        "snapshots_taken": len(snapshots) - used_baseline,
+        "window_seconds": statement_deltas["interval_seconds"],
+        "intervals": intervals,
+        "totals": statement_deltas["totals"],
+        "statements": statement_deltas["statements"][:SAMPLE_TOP_QUERIES],
+        "io": compute_io_deltas(first, last),
+    }
+
+
+def format_results_for_load_sample(results):
+    """Format sampled load (rates over the sampling window) in a human-readable string"""
+    output = "Database Current Load Report (sampled)\n\n"
+    output += "=== SAMPLING WINDOW ===\n"
+    output += f"• Window: {results['window_seconds']} s across {len(results['intervals'])} interval(s)\n"
+    if results["used_baseline"]:
+        output += "• Started from the snapshot stored by a previous call\n"
+    totals = results["totals"]
+    output += f"• Calls/s: {totals['calls_per_sec']}\n"
+    output += f"• Execution time: {totals['exec_ms_per_sec']} ms/s "
+    output += f"(≈{totals['exec_ms_per_sec'] / 1000:.2f} busy backends)\n"
+    output += f"• Statements active in window: {totals['active_statements']}\n"
+    for idx, interval in enumerate(results["intervals"], 1):
+        if interval.get("reset"):
+            output += f"  Interval #{idx}: statistics were reset, skipped\n"
+        else:
+            output += (
+                f"  Interval #{idx} ({interval['interval_seconds']} s): "
+                f"{interval['calls_per_sec']} calls/s, {interval['exec_ms_per_sec']} ms/s\n"
+            )
+
+    output += "\n=== TOP QUERIES BY SHARE OF CURRENT LOAD ===\n"
+    if results["statements"]:
+        for idx, stmt in enumerate(results["statements"], 1):
+            output += f"\nQuery #{idx} ({stmt['load_share_pct']}% of execution time):\n"
+            output += f"• Query: {stmt['query']}\n"
+            output += f"• Calls/s: {stmt['calls_per_sec']}\n"
+            if stmt["mean_time_ms"] is not None:
+                output += f"• Mean Time in Window: {stmt['mean_time_ms']} ms\n"
+            output += f"• Busy Backends: {stmt['active_sessions']}\n"
+            output += f"• Shared Blocks Read/s: {stmt['shared_blks_read_per_sec']}\n"
+            output += f"• Temp Bytes/s: {stmt['temp_bytes_per_sec']}\n"
+            if stmt["new_in_interval"]:
+                output += "• First seen in this window\n"
+            if stmt["temp_bytes_per_sec"] > 0:
+                output += "⚠️ Warning: Query is spilling to temp files. Consider increasing work_mem.\n"
+    else:
+        output += "No statements executed during the sampling window.\n"
+
+    io = results["io"]
+    output += f"\n=== I/O RATES ({io['source']}) ===\n"
+    if io["rows"]:
+        for row in io["rows"][:SAMPLE_TOP_QUERIES]:
+            output += f"\n• {row['key']}: {row['reads_per_sec']} reads/s, {row['hits_per_sec']} hits/s"
+            if io["source"] == "pg_stat_io":
+                output += (
+                    f", {row['writes_per_sec']} writes/s, {row['extends_per_sec']} extends/s, "
+                    f"{row['evictions_per_sec']} evictions/s"
+                )
+            output += "\n"
+            if row["hit_ratio_pct"] is not None and row["hit_ratio_pct"] < 90:
+                output += (
+                    f"⚠️ Warning: Hit ratio in window is {row['hit_ratio_pct']}%.\n"
+                )
+    else:
+        output += "No I/O activity during the sampling window.\n"
+    return output
+
+
+# How to pull comparable rows out of a diagnostic's results so they can be
+# merged across databases: (rows extractor, metric to rank by, columns to show)
+FLEET_RANKINGS = {
+    "slow_query": (
+        lambda results: results.get("slow_queries_detailed", []),
+        "avg_time_sec",
+        ("database", "username", "calls", "avg_time_sec", "total_time_sec", "query"),
+    ),
+    "load_sample": (
+        lambda results: results.get("statements", []),
+        "active_sessions",
+        ("calls_per_sec", "mean_time_ms", "active_sessions", "load_share_pct", "query"),
+    ),
+    "bloat_analysis": (
+        lambda results: results,
+        "bloat_percentage",
+        ("schemaname", "tablename", "table_size", "bloat_size", "bloat_percentage"),
+    ),
+    "long_running_transactions": (
+        lambda results: results,
+        "xact_age_hours",
+        ("datname", "usename", "pid", "state", "xact_age_hours", "query"),
+    ),
+}
+
+FLEET_DIAGNOSTICS = {
+    **DIAGNOSTICS,
+    "load_sample": (execute_load_sample, format_results_for_load_sample),
+}
+
+
+def resolve_fleet_targets(targets=None, tags=None):
+    """
+    Build the list of databases to analyze
+
+    Args:
+        targets (list|str): Environment names (dev/prod) or secret names, list or comma-separated
+        tags (dict): Secrets Manager tag selector, e.g. {"team": "payments", "engine": "*"}
+
+    Returns:
+        list: (label, secret name) tuples without duplicates
+    """
+    if isinstance(targets, str):
+        targets = [target.strip() for target in targets.split(",")]
+    resolved = []
+    seen = set()
+    for target in targets or []:
+        if not target:
+            continue
+        secret_name = resolve_target_secret(target)
+        if secret_name not in seen:
+            seen.add(secret_name)
+            resolved.append((target, secret_name))
+    if tags:
+        for secret_name in find_secrets_by_tags(tags):
+            if secret_name not in seen:
+                seen.add(secret_name)
+                resolved.append((secret_name, secret_name))
+    if not resolved:
+        raise ValueError(
+            "No targets selected. Provide 'targets' and/or a 'tags' selector that matches at least one secret"
+        )
+    if len(resolved) > FLEET_MAX_TARGETS:
+        raise ValueError(
+            f"{len(resolved)} targets selected, more than FLEET_MAX_TARGETS ({FLEET_MAX_TARGETS})"
+        )
+    return resolved
+
+
+def run_fleet_target(label, secret_name, diagnostic, target_timeout, started_at):
+    """Run one diagnostic against one database with the per-target statement timeout"""
+    executor, _ = FLEET_DIAGNOSTICS[diagnostic]
+    started_at[label] = time.monotonic()
+    try:
+        with statement_timeout(target_timeout):
+            results = executor(secret_name)
+        return {
+            "target": label,
+            "status": "ok",
+            "duration_ms": round((time.monotonic() - started_at[label]) * 1000, 1),
+            "results": results,
+            "error": None,
+        }
+    except Exception as e:
+        print(f"Fleet target {label} failed: {str(e)}")
+        return {
+            "target": label,
+            "status": "error",
+            "duration_ms": round((time.monotonic() - started_at[label]) * 1000, 1),
+            "results": None,
+            "error": str(e),
+        }
+
+
+def merge_fleet_rankings(diagnostic, target_results, top_n):
+    """Merge comparable rows from every target into one list ranked by the diagnostic's metric"""
+    if diagnostic not in FLEET_RANKINGS:
+        return None
+    extract, metric, _ = FLEET_RANKINGS[diagnostic]
+    merged = []
+    for result in target_results:
+        if result["status"] != "ok":
+            continue
+        for row in extract(result["results"]) or []:
+            if row.get(metric) is not None:
+                merged.append({"target": result["target"], **row})
+    merged.sort(key=lambda row: float(row[metric]), reverse=True)
+    return merged[:top_n]
+
+
+def execute_fleet_analysis(
+    diagnostic,
+    targets=None,
+    tags=None,
+    max_workers=None,
+    target_timeout=None,
+    top_n=None,
+    time_budget=None,
+):
+    """
+    Run one diagnostic against many databases concurrently and merge the results
+
+    Args:
+        diagnostic (str): Diagnostic to run (any single-database action, e.g. slow_query)
+        targets (list|str): Environment names or secret names
+        tags (dict): Secrets Manager tag selector
+        max_workers (int): Maximum number of databases analyzed at the same time
+        target_timeout (int): Seconds allowed per database, also applied as statement_timeout
+        top_n (int): Rows kept in the merged ranking
+        time_budget (float): Optional. Seconds the whole run may take, e.g. the time
+            left in the Lambda invocation; capped at FLEET_TIMEOUT_SECONDS
+
+    Returns:
+        dict: Per-target status and results, plus the merged ranking when the diagnostic has one
+    """
+    if diagnostic not in FLEET_DIAGNOSTICS:
+        raise ValueError(
+            f"Unknown diagnostic '{diagnostic}'. Available diagnostics: {', '.join(FLEET_DIAGNOSTICS.keys())}"
+        )
+    selected = resolve_fleet_targets(targets, tags)
+    max_workers = max(1, min(int(max_workers or FLEET_MAX_WORKERS), len(selected)))
+    target_timeout = int(target_timeout or FLEET_TARGET_TIMEOUT_SECONDS)
+    top_n = int(top_n or FLEET_TOP_N)
+
+    overall_timeout = FLEET_TIMEOUT_SECONDS
+    if time_budget is not None:
+        overall_timeout = max(0, min(overall_timeout, time_budget))
+
+    started = time.monotonic()
+    overall_deadline = started + overall_timeout
+    started_at = {}
+    finished = {}
+    timed_out = {}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(
+                run_fleet_target,
+                label,
+                secret_name,
+                diagnostic,
+                target_timeout,
+                started_at,
+            ): label
+            for label, secret_name in selected
+        }
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            # A target's clock starts when a worker picks it up, not when it is queued
+            for future in list(pending):
+                label = futures[future]
+                if label in started_at and now - started_at[label] > target_timeout:
+                    pending.discard(future)
+                    timed_out[label] = (
+                        f"Target did not finish within {target_timeout} seconds"
+                    )
+            if now > overall_deadline:
+                for future in pending:
+                    timed_out[futures[future]] = (
+                        f"Fleet analysis did not reach this target within {overall_timeout:.0f} seconds"
+                    )
+                break
+            if not pending:
+                break
+            done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished[futures[future]] = future.result()
+    finally:
+        # Stragglers are bounded by statement_timeout and release their connections when done
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    target_results = []
+    for label, _ in selected:
+        if label in finished:
+            target_results.append(finished[label])
+        else:
+            target_results.append(
+                {
+                    "target": label,
+                    "status": "timeout",
+                    "duration_ms": None,
+                    "results": None,
+                    "error": timed_out.get(label, "Target did not finish"),
+                }
+            )
+
+    return {
+        "diagnostic": diagnostic,
+        "targets": target_results,
+        "ranking": merge_fleet_rankings(diagnostic, target_results, top_n),
+        "top_n": top_n,
+        "max_workers": max_workers,
+        "total_duration_ms": round((time.monotonic() - started) * 1000, 1),
+        "succeeded": sum(1 for r in target_results if r["status"] == "ok"),
+        "failed": sum(1 for r in target_results if r["status"] != "ok"),
+    }
+
+
+def format_results_for_fleet_analysis(results, include_details=False):
+    """Format the fleet-wide report: target summary, merged ranking, then per-target reports"""
+    diagnostic = results["diagnostic"]
+    output = f"Fleet {diagnostic} Report\n\n"
+    output += "=== TARGETS ===\n"
+    output += (
+        f"{len(results['targets'])} databases in {results['total_duration_ms']} ms "
+        f"with {results['max_workers']} parallel workers "
+        f"(succeeded: {results['succeeded']}, failed: {results['failed']})\n"
+    )
+    for target in results["targets"]:
+        duration = (
+            f"{target['duration_ms']} ms"
+            if target["duration_ms"] is not None
+            else "n/a"
+        )
+        output += f"• {target['target']}: {target['status']} ({duration})\n"
+        if target["status"] != "ok":
+            output += f"  ⚠️ {target['error']}\n"
+
+    if results["ranking"] is not None:
+        _, metric, columns = FLEET_RANKINGS[diagnostic]
+        output += (
+            f"\n=== TOP {results['top_n']} ACROSS THE FLEET BY {metric.upper()} ===\n"
+        )
+        if results["ranking"]:
+            for idx, row in enumerate(results["ranking"], 1):
+                output += f"\n#{idx} on {row['target']}:\n"
+                for column in columns:
+                    value = row.get(column)
+                    if isinstance(value, float):
+                        value = round(value, 3)
+                    output += f"• {column}: {value}\n"
+        else:
+            output += "No matching rows on any target.\n"
+
+    if include_details or results["ranking"] is None:
+        _, formatter = FLEET_DIAGNOSTICS[diagnostic]
+        for target in results["targets"]:
+            if target["status"] == "ok":
+                output += f"\n=== {target['target']} ===\n"
+                output += formatter(target["results"])
+    return output
+
+
 def lambda_handler(event, context):
     try:
         print(f"Received event: {json.dumps(event)}")
-        
+
         # Check if arguments are nested under 'arguments' key
-        if 'arguments' in event:
+        if "arguments" in event:
             # Extract arguments from the nested structure
-            args = event['arguments']
-            environment = args.get('environment')
-            action_type = args.get('action_type')
+            args = event["arguments"]
         else:
             # Use the flat structure
-            environment = event.get('environment')
-            action_type = event.get('action_type')
-        
-        if not environment or not action_type:
+            args = event
+        environment = args.get("environment")
+        action_type = args.get("action_type")
+
+        if not action_type or (not environment and action_type != "fleet_analysis"):
             return {
                 "functionResponse": {
                     "content": f"Error: Missing required parameters. Need 'environment' and 'action_type'."
                 }
             }
-            
+
         print(f"Environment: {environment}")
-        secret_name = get_env_secret(environment)
-        min_exec_time = 1000
-        # Get slow queries
-        #if tool_name == 'slow_query':
-        if action_type == 'slow_query':
-            print("Executing slow query scripts")
-            results = execute_slow_query(secret_name, min_exec_time)
-            # Format results for Bedrock Agent
-            formatted_output = format_results_for_slow_query(results)
-            print(formatted_output)
-        elif action_type == 'connection_management_issues':
-            print("Executing connection_management_issues")
-            results = execute_connect_issues(secret_name, min_exec_time)
-            # Format results for Bedrock Agent
-            formatted_output = format_results_for_conn_issues(results)
-        elif action_type == 'index_analysis':
-            print("Executing index_analysis")
-            results = execute_index_analysis(secret_name)
-            formatted_output = format_results_for_index_analysis(results)
-        elif action_type == 'autovacuum_analysis':
-            print("Executing autovacuum_analysis")
-            results = execute_autovacuum_analysis(secret_name)
-            formatted_output = format_results_for_autovacuum_analysis(results)
-        elif action_type == 'io_analysis':
-            print("Executing io_analysis")
-            results = execute_io_analysis(secret_name)
-            formatted_output = format_results_for_io_analysis(results)
-        elif action_type == 'replication_analysis':
-            print("Executing replication_analysis")
-            results = execute_replication_analysis(secret_name)
-            formatted_output = format_results_for_replication_analysis(results)
-        elif action_type == 'system_health':
-            print("Executing system_health")
-            results = execute_system_health(secret_name)
-            formatted_output = format_results_for_system_health(results)
-        elif action_type == 'vacuum_progress':
-            print("Executing vacuum_progress analysis")
-            results = execute_vacuum_progress_analysis(secret_name)
-            formatted_output = format_results_for_vacuum_progress(results)
-        elif action_type == 'xid_analysis':
-            print("Executing XID wraparound analysis")
-            results = execute_xid_analysis(secret_name)
-            formatted_output = format_results_for_xid_analysis(results)
-        elif action_type == 'bloat_analysis':
-            print("Executing table bloat analysis")
-            results = execute_bloat_analysis(secret_name)
-            formatted_output = format_results_for_bloat_analysis(results)
-        elif action_type == 'long_running_transactions':
-            print("Executing long-running transactions analysis")
-            results = execute_long_running_transactions(secret_name)
-            formatted_output = format_results_for_long_running_transactions(results)
+        secret_name = (
+            get_env_secret(environment) if action_type != "fleet_analysis" else None
+        )
+        if action_type == "fleet_analysis":
+            print("Executing fleet analysis")
+            # Stop before Lambda does, so finished targets are still reported
+            time_budget = None
+            if context is not None:
+                time_budget = (
+                    context.get_remaining_time_in_millis() / 1000
+                    - FLEET_DEADLINE_MARGIN_SECONDS
+                )
+            results = execute_fleet_analysis(
+                args.get("diagnostic"),
+                targets=args.get("targets") or environment,
+                tags=args.get("tags"),
+                max_workers=args.get("max_workers"),
+                target_timeout=args.get("target_timeout_seconds"),
+                top_n=args.get("top_n"),
+                time_budget=time_budget,
+            )
+            formatted_output = format_results_for_fleet_analysis(
+                results, include_details=args.get("include_details", False)
+            )
+        elif action_type == "full_health_sweep":
+            print("Executing full health sweep")
+            results = execute_full_health_sweep(
+                secret_name,
+                sections=args.get("sections"),
+                max_workers=args.get("max_workers"),
+            )
+            formatted_output = format_results_for_full_health_sweep(results)
+        elif action_type == "load_sample":
+            print("Executing load sample")
+            results = execute_load_sample(
+                secret_name,
+                sample_count=args.get("sample_count"),
+                interval_seconds=args.get("interval_seconds"),
+                use_baseline=str(args.get("use_baseline", True)).lower() == "true",
+            )
+            formatted_output = format_results_for_load_sample(results)
+        elif action_type in DIAGNOSTICS:
+            print(f"Executing {action_type}")
+            executor, formatter = DIAGNOSTICS[action_type]
+            results = executor(secret_name)
+            formatted_output = formatter(results)
         else:
             return {
                 "functionResponse": {
-                    "content": f"Error: Unknown action_type '{action_type}'. Available actions: slow_query, connection_management_issues, index_analysis, autovacuum_analysis, io_analysis, replication_analysis, system_health, vacuum_progress, xid_analysis, bloat_analysis, long_running_transactions"
+                    "content": f"Error: Unknown action_type '{action_type}'. Available actions: {', '.join(DIAGNOSTICS.keys())}, full_health_sweep, load_sample, fleet_analysis"
                 }
             }
 
-        response_body = {
-        'TEXT': {
-            'body': formatted_output
-            }
-        }
+        response_body = {"TEXT": {"body": formatted_output}}
+
+        function_response = {"functionResponse": {"responseBody": response_body}}
 
-        function_response = {
-        'functionResponse': {
-            'responseBody': response_body
-            }
-        }
-       
-        
         return function_response
 
     except Exception as e:
         print(f"Error in lambda_handler: {str(e)}")
         return {
-            "functionResponse": {
-                "content": f"Error analyzing slow queries: {str(e)}"
-            }
-        }
\ No newline at end of file
+            "functionResponse": {"content": f"Error analyzing slow queries: {str(e)}"}
+        }
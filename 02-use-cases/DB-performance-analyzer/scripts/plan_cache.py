@@ -0,0 +1,245 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# EXPLAIN plans cached per (database secret, query fingerprint) for the life of
+# a warm Lambda container, plus a structural diff used to spot plan regressions.
+PLAN_CACHE_TTL = int(os.environ.get("PLAN_CACHE_TTL_SECONDS", "900"))
+PLAN_CACHE_MAX_ENTRIES = int(os.environ.get("PLAN_CACHE_MAX_ENTRIES", "128"))
+
+# Thresholds used when comparing two plans
+ROW_DRIFT_FACTOR = 10.0
+COST_REGRESSION_FACTOR = 1.5
+TIME_REGRESSION_FACTOR = 1.5
+BUFFER_DELTA_BLOCKS = 1000
+
+BUFFER_KEYS = (
+    "Shared Hit Blocks",
+    "Shared Read Blocks",
+    "Temp Read Blocks",
+    "Temp Written Blocks",
+)
+
+
+class PlanCache:
+    """Thread-safe LRU cache of EXPLAIN results with a per-entry TTL"""
+
+    def __init__(self, max_entries=PLAN_CACHE_MAX_ENTRIES, ttl=PLAN_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0}
+
+    def get(self, key):
+        """Return the entry for key (even if expired) and whether it is still fresh"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None, False
+            self._entries.move_to_end(key)
+            fresh = time.monotonic() - entry["cached_at"] < self.ttl
+            return entry, fresh
+
+    def put(self, key, entry):
+        entry["cached_at"] = time.monotonic()
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def record(self, outcome):
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_plan_cache = PlanCache()
+
+
+def get_plan_cache():
+    """Return the container-wide plan cache"""
+    return _plan_cache
+
+
+def flatten_plan(plan, max_nodes=None):
+    """
+    Flatten an EXPLAIN JSON plan tree into a pre-order list without recursion
+
+    Args:
+        plan (dict): The 'Plan' node of EXPLAIN (FORMAT JSON) output
+        max_nodes (int): Optional. Stop after this many nodes
+
+    Returns:
+        list: dicts with 'path' (e.g. '0.1.0'), 'depth', 'parent' index and 'node'
+    """
+    flat = []
+    stack = [(plan, "0", 0, None)]
+    while stack and (max_nodes is None or len(flat) < max_nodes):
+        node, path, depth, parent = stack.pop()
+        index = len(flat)
+        flat.append({"path": path, "depth": depth, "parent": parent, "node": node})
+        children = node.get("Plans", [])
+        # Push in reverse so children come out in their original order
+        for position in range(len(children) - 1, -1, -1):
+            stack.append((children[position], f"{path}.{position}", depth + 1, index))
+    return flat
+
+
+def plan_relations(plan):
+    """Return the sorted relation and index names referenced by a plan"""
+    names = set()
+    for item in flatten_plan(plan):
+        node = item["node"]
+        for key in ("Relation Name", "Index Name"):
+            if node.get(key):
+                names.add(node[key])
+    return sorted(names)
+
+
+def _node_label(node):
+    target = node.get("Relation Name") or node.get("Index Name") or ""
+    return f"{node['Node Type']} on {target}" if target else node["Node Type"]
+
+
+def _ratio(new, old):
+    if not old:
+        return None
+    return new / old
+
+
+def diff_plans(old_plan, new_plan):
+    """
+    Structurally compare two EXPLAIN JSON plans
+
+    Nodes are aligned by their position in the tree. Reports node type or
+    relation changes, added/removed nodes, row-estimate drift, buffer deltas
+    and root cost/time changes, and flags the changes that look like
+    regressions.
+
+    Args:
+        old_plan (dict): Baseline 'Plan' node (usually from the cache)
+        new_plan (dict): New 'Plan' node
+
+    Returns:
+        dict: 'node_changes', 'row_estimate_drift', 'buffer_deltas',
+              'root', 'regressions' and an 'identical_shape' flag
+    """
+    old_nodes = {item["path"]: item["node"] for item in flatten_plan(old_plan)}
+    new_nodes = {item["path"]: item["node"] for item in flatten_plan(new_plan)}
+
+    diff = {
+        "node_changes": [],
+        "row_estimate_drift": [],
+        "buffer_deltas": [],
+        "root": {},
+        "regressions": [],
+        "identical_shape": True,
+    }
+
+    for path in sorted(
+        old_nodes.keys() | new_nodes.keys(),
+        key=lambda p: [int(x) for x in p.split(".")],
+    ):
+        old_node = old_nodes.get(path)
+        new_node = new_nodes.get(path)
+        if old_node is None or new_node is None:
+            diff["identical_shape"] = False
+            diff["node_changes"].append(
+                {
+                    "path": path,
+                    "change": "added" if old_node is None else "removed",
+                    "node": _node_label(new_node or old_node),
+                }
+            )
+            continue
+
+        if (
+            old_node["Node Type"] != new_node["Node Type"]
+            or old_node.get("Relation Name") != new_node.get("Relation Name")
+            or old_node.get("Index Name") != new_node.get("Index Name")
+        ):
+            diff["identical_shape"] = False
+            change = {
+                "path": path,
+                "change": "changed",
+                "from": _node_label(old_node),
+                "to": _node_label(new_node),
+            }
+            diff["node_changes"].append(change)
+            if new_node["Node Type"] == "Seq Scan" and "Index" in old_node["Node Type"]:
+                diff["regressions"].append(
+                    f"{change['from']} became {change['to']} (path {path})"
+                )
+
+        ratio = _ratio(new_node.get("Plan Rows", 0), old_node.get("Plan Rows", 0))
+        if ratio is not None and (
+            ratio > ROW_DRIFT_FACTOR or ratio < 1 / ROW_DRIFT_FACTOR
+        ):
+            diff["row_estimate_drift"].append(
+                {
+                    "path": path,
+                    "node": _node_label(new_node),
+                    "old_plan_rows": old_node.get("Plan Rows"),
+                    "new_plan_rows": new_node.get("Plan Rows"),
+                    "factor": round(ratio, 2),
+                }
+            )
+
+        deltas = {}
+        for key in BUFFER_KEYS:
+            if key in old_node and key in new_node:
+                delta = new_node[key] - old_node[key]
+                if abs(delta) >= BUFFER_DELTA_BLOCKS:
+                    deltas[key] = delta
+        if deltas:
+            diff["buffer_deltas"].append(
+                {"path": path, "node": _node_label(new_node), "deltas": deltas}
+            )
+            if (
+                deltas.get("Shared Read Blocks", 0) > 0
+                or deltas.get("Temp Written Blocks", 0) > 0
+            ):
+                diff["regressions"].append(
+                    f"{_node_label(new_node)} reads/spills more blocks than before (path {path}): {deltas}"
+                )
+
+    old_cost = old_plan.get("Total Cost")
+    new_cost = new_plan.get("Total Cost")
+    cost_ratio = _ratio(new_cost or 0, old_cost)
+    diff["root"] = {
+        "old_total_cost": old_cost,
+        "new_total_cost": new_cost,
+        "cost_ratio": round(cost_ratio, 2) if cost_ratio is not None else None,
+    }
+    if cost_ratio is not None and cost_ratio > COST_REGRESSION_FACTOR:
+        diff["regressions"].append(
+            f"Estimated total cost grew {cost_ratio:.1f}x ({old_cost} -> {new_cost})"
+        )
+
+    if "Actual Total Time" in old_plan and "Actual Total Time" in new_plan:
+        time_ratio = _ratio(
+            new_plan["Actual Total Time"], old_plan["Actual Total Time"]
+        )
+        diff["root"]["old_time_ms"] = old_plan["Actual Total Time"]
+        diff["root"]["new_time_ms"] = new_plan["Actual Total Time"]
+        if time_ratio is not None and time_ratio > TIME_REGRESSION_FACTOR:
+            diff["regressions"].append(
+                f"Execution time grew {time_ratio:.1f}x "
+                f"({old_plan['Actual Total Time']:.2f} ms -> {new_plan['Actual Total Time']:.2f} ms)"
+            )
+
+    return diff
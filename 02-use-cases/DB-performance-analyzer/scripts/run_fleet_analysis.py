@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Run a pgstat diagnostic against several databases from the command line.
+
+Uses the same code path as the fleet_analysis Lambda action. Point it at
+local containers by setting LOCAL_SECRETS_FILE:
+
+    export LOCAL_PG_PASSWORD=<password>
+    docker compose -f scripts/local_fleet/docker-compose.yml up -d
+    LOCAL_SECRETS_FILE=scripts/local_fleet/local_secrets.json \\
+        python3 scripts/run_fleet_analysis.py slow_query --tag fleet=local
+
+Usage:
+    python3 scripts/run_fleet_analysis.py <diagnostic> [--targets t1 t2 ...]
+        [--tag key=value ...] [--max-workers N] [--timeout SECONDS] [--top-n N] [--details]
+"""
+
+import argparse
+import sys
+
+from pgstat_analyse_database import (
+    execute_fleet_analysis,
+    format_results_for_fleet_analysis,
+)
+
+
+def parse_tags(values):
+    tags = {}
+    for value in values or []:
+        key, _, expected = value.partition("=")
+        tags[key] = expected or "*"
+    return tags
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "diagnostic", help="Diagnostic to run, e.g. slow_query or load_sample"
+    )
+    parser.add_argument(
+        "--targets", nargs="*", default=[], help="Environment names or secret names"
+    )
+    parser.add_argument(
+        "--tag", action="append", help="Tag selector as key=value (repeatable)"
+    )
+    parser.add_argument("--max-workers", type=int)
+    parser.add_argument("--timeout", type=int, help="Seconds allowed per target")
+    parser.add_argument("--top-n", type=int)
+    parser.add_argument(
+        "--details", action="store_true", help="Include each target's full report"
+    )
+    args = parser.parse_args()
+
+    try:
+        results = execute_fleet_analysis(
+            args.diagnostic,
+            targets=args.targets,
+            tags=parse_tags(args.tag),
+            max_workers=args.max_workers,
+            target_timeout=args.timeout,
+            top_n=args.top_n,
+        )
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return 1
+
+    print(format_results_for_fleet_analysis(results, include_details=args.details))
+    return 0 if results["succeeded"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import hashlib
+import re
+
+# Single-pass PostgreSQL lexer used to split and validate agent-supplied SQL.
+# Every character is visited once: quoted literals, quoted identifiers,
+# dollar-quoted bodies and comments are skipped with one regex/find call each,
+# so splitting and classification stay linear in the size of the input.
+
+READ_ONLY_COMMANDS = {"select", "show"}
+
+DANGEROUS_KEYWORDS = {
+    "insert",
+    "update",
+    "delete",
+    "drop",
+    "truncate",
+    "alter",
+    "create",
+    "grant",
+    "revoke",
+    "execute",
+    "copy",
+}
+
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<space>\s+)
+    | (?P<line_comment>--[^\n]*)
+    | (?P<block_comment>/\*)
+    | (?P<estring>[Ee]')
+    | (?P<string>')
+    | (?P<ident_quoted>")
+    | (?P<dollar>\$(?:[^\W\d]\w*)?\$)
+    | (?P<param>\$\d+)
+    | (?P<word>[^\W\d][\w$]*)
+    | (?P<semicolon>;)
+    | (?P<number>\d[\w.]*)
+    | (?P<other>[^\s'"$;\w/\-]+|.)
+""",
+    re.VERBOSE | re.DOTALL,
+)
+
+# Unrolled-loop bodies: consume runs of ordinary characters in one step
+_STRING_BODY_RE = re.compile(r"[^']*(?:''[^']*)*'")
+_ESTRING_BODY_RE = re.compile(r"[^'\\]*(?:(?:\\.|'')[^'\\]*)*'", re.DOTALL)
+_IDENT_BODY_RE = re.compile(r'[^"]*(?:""[^"]*)*"')
+_BLOCK_COMMENT_EDGE_RE = re.compile(r"/\*|\*/")
+
+_COMMENT_KINDS = ("line_comment", "block_comment")
+_CONSTANT_KINDS = ("string", "estring", "dollar", "number", "param")
+
+
+class SqlStatement:
+    """A statement found by the lexer, with the keywords seen outside literals"""
+
+    __slots__ = ("text", "command", "keywords")
+
+    def __init__(self, text, command, keywords):
+        self.text = text
+        self.command = command
+        self.keywords = keywords
+
+    def __repr__(self):
+        return f"SqlStatement(command={self.command!r}, text={self.text[:40]!r})"
+
+
+def _skip_block_comment(text, pos):
+    """Return the position after a (possibly nested) block comment starting at pos"""
+    depth = 1
+    pos += 2
+    while depth:
+        match = _BLOCK_COMMENT_EDGE_RE.search(text, pos)
+        if not match:
+            raise ValueError("Unterminated block comment")
+        depth += 1 if match.group() == "/*" else -1
+        pos = match.end()
+    return pos
+
+
+def _skip_with(body_re, text, pos, description):
+    match = body_re.match(text, pos)
+    if not match:
+        raise ValueError(f"Unterminated {description}")
+    return match.end()
+
+
+def iter_tokens(query_text):
+    """
+    Yield (kind, start, end) for each token of query_text in a single pass
+
+    Literal, quoted-identifier, dollar-quoted and comment bodies are returned
+    as one token. Whitespace is skipped.
+
+    Raises:
+        ValueError: If a literal, identifier or comment is not terminated
+    """
+    length = len(query_text)
+    pos = 0
+    token_match = _TOKEN_RE.match
+
+    while pos < length:
+        match = token_match(query_text, pos)
+        kind = match.lastgroup
+        end = match.end()
+
+        if kind == "string":
+            end = _skip_with(_STRING_BODY_RE, query_text, end, "string literal")
+        elif kind == "estring":
+            end = _skip_with(_ESTRING_BODY_RE, query_text, end, "escape string literal")
+        elif kind == "ident_quoted":
+            end = _skip_with(_IDENT_BODY_RE, query_text, end, "quoted identifier")
+        elif kind == "dollar":
+            tag = match.group()
+            close = query_text.find(tag, end)
+            if close == -1:
+                raise ValueError(f"Unterminated dollar-quoted string {tag}")
+            end = close + len(tag)
+        elif kind == "block_comment":
+            end = _skip_block_comment(query_text, pos)
+
+        if kind != "space":
+            yield kind, pos, end
+        pos = end
+
+
+def lex_statements(query_text):
+    """
+    Split SQL into statements in a single pass and classify each one
+
+    Handles standard and E'' strings, quoted identifiers, dollar quoting,
+    line comments and nested block comments. Statements that contain only
+    whitespace or comments are dropped.
+
+    Args:
+        query_text (str): One or more SQL statements
+
+    Returns:
+        list: SqlStatement objects in input order
+
+    Raises:
+        ValueError: If a literal, identifier or comment is not terminated
+    """
+    statements = []
+    stmt_start = 0
+    command = None
+    keywords = set()
+
+    for kind, start, end in iter_tokens(query_text):
+        if kind == "word":
+            word = query_text[start:end].lower()
+            if command is None:
+                command = word
+            keywords.add(word)
+        elif kind == "semicolon":
+            if command is not None:
+                statements.append(
+                    SqlStatement(
+                        query_text[stmt_start:start].strip(), command, keywords
+                    )
+                )
+            stmt_start = end
+            command = None
+            keywords = set()
+        elif command is None and kind not in _COMMENT_KINDS:
+            # Parenthesised queries such as "(SELECT ...) UNION ..." are
+            # classified by the first word inside the parentheses
+            if kind != "other" or query_text[start:end].strip("("):
+                command = ""
+
+    if command is not None:
+        statements.append(
+            SqlStatement(query_text[stmt_start:].strip(), command, keywords)
+        )
+    return statements
+
+
+def fingerprint_query(query_text):
+    """
+    Normalize a query the way pg_stat_statements does and hash it
+
+    Comments and whitespace are dropped, keywords and identifiers are
+    lowercased and constants are replaced with '?', so the same query shape
+    with different literal values shares a fingerprint.
+
+    Returns:
+        tuple: (fingerprint, constants_hash) as hex digests
+    """
+    shape = []
+    constants = []
+    for kind, start, end in iter_tokens(query_text):
+        if kind in _COMMENT_KINDS:
+            continue
+        text = query_text[start:end]
+        if kind in _CONSTANT_KINDS:
+            shape.append("?")
+            constants.append(text)
+        elif kind == "word":
+            shape.append(text.lower())
+        elif kind == "semicolon":
+            continue
+        else:
+            shape.append(text)
+    fingerprint = hashlib.sha1(" ".join(shape).encode("utf-8")).hexdigest()
+    constants_hash = hashlib.sha1("\x00".join(constants).encode("utf-8")).hexdigest()
+    return fingerprint, constants_hash
+
+
+def validate_read_only_statements(query_text):
+    """
+    Split SQL and reject anything that is not a read-only SELECT/SHOW
+
+    Returns:
+        list: SqlStatement objects, texts without trailing semicolons
+
+    Raises:
+        ValueError: If query contains prohibited operations
+    """
+    if not query_text or not isinstance(query_text, str):
+        raise ValueError("Query must be a non-empty string")
+
+    validated = []
+    for stmt in lex_statements(query_text):
+        if stmt.command not in READ_ONLY_COMMANDS:
+            first_word = stmt.command or stmt.text.split()[0].lower()
+            raise ValueError(f"Prohibited operation detected: {first_word}")
+
+        if stmt.command == "select":
+            prohibited = stmt.keywords & DANGEROUS_KEYWORDS
+            if prohibited:
+                raise ValueError(
+                    f"Statement contains prohibited operation: {sorted(prohibited)[0]}"
+                )
+
+        validated.append(stmt)
+    return validated
@@ -0,0 +1,253 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+# Point-in-time snapshots of pg_stat_statements and the I/O views, kept in a
+# small gzip-compressed JSON store so a later call can use the last snapshot
+# as its baseline, plus the delta math that turns two snapshots into rates.
+SNAPSHOT_DIR = os.environ.get(
+    "PGSTAT_SNAPSHOT_DIR", os.path.join(tempfile.gettempdir(), "pgstat_snapshots")
+)
+SNAPSHOT_RETENTION = int(os.environ.get("PGSTAT_SNAPSHOT_RETENTION", "12"))
+SNAPSHOT_BASELINE_MAX_AGE = int(
+    os.environ.get("PGSTAT_SNAPSHOT_BASELINE_MAX_AGE_SECONDS", "900")
+)
+
+# Counter order inside a compact snapshot row
+STATEMENT_FIELDS = (
+    "calls",
+    "total_exec_time",
+    "rows",
+    "shared_blks_hit",
+    "shared_blks_read",
+    "temp_blks_read",
+    "temp_blks_written",
+)
+IO_FIELDS = (
+    "reads",
+    "writes",
+    "extends",
+    "hits",
+    "evictions",
+    "read_time",
+    "write_time",
+)
+
+QUERY_TEXT_LIMIT = 500
+
+
+def statement_key(dbid, userid, queryid):
+    return f"{dbid}:{userid}:{queryid}"
+
+
+class SnapshotStore:
+    """
+    Thread-safe on-disk store of recent snapshots, one gzip file per database secret.
+
+    Query texts are stored once per file rather than once per snapshot, and
+    only the newest SNAPSHOT_RETENTION snapshots are kept.
+    """
+
+    def __init__(self, directory=SNAPSHOT_DIR, retention=SNAPSHOT_RETENTION):
+        self.directory = directory
+        self.retention = retention
+        self._lock = threading.Lock()
+
+    def _path(self, secret_name):
+        digest = hashlib.sha1(secret_name.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{digest}.json.gz")
+
+    def _read(self, secret_name):
+        path = self._path(secret_name)
+        if not os.path.exists(path):
+            return {"snapshots": [], "queries": {}}
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable snapshot store {path}: {str(e)}")
+            return {"snapshots": [], "queries": {}}
+
+    def load(self, secret_name):
+        """Return the stored snapshots (oldest first) and the shared query texts"""
+        with self._lock:
+            store = self._read(secret_name)
+        return store["snapshots"], store["queries"]
+
+    def latest(self, secret_name, max_age=SNAPSHOT_BASELINE_MAX_AGE):
+        """Return the newest stored snapshot if it is younger than max_age seconds"""
+        snapshots, _ = self.load(secret_name)
+        if not snapshots:
+            return None
+        snapshot = snapshots[-1]
+        if time.time() - snapshot["taken_at"] > max_age:
+            return None
+        return snapshot
+
+    def append(self, secret_name, snapshot, query_texts):
+        """Add a snapshot, trim to the retention limit and rewrite the file atomically"""
+        with self._lock:
+            store = self._read(secret_name)
+            store["snapshots"].append(snapshot)
+            store["snapshots"] = store["snapshots"][-self.retention :]
+            store["queries"].update(query_texts)
+            live_keys = set()
+            for kept in store["snapshots"]:
+                live_keys.update(kept["statements"])
+            store["queries"] = {
+                k: v for k, v in store["queries"].items() if k in live_keys
+            }
+
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(secret_name)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with (
+                    os.fdopen(fd, "wb") as raw,
+                    gzip.open(raw, "wt", encoding="utf-8") as f,
+                ):
+                    json.dump(store, f, separators=(",", ":"))
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+
+_snapshot_store = SnapshotStore()
+
+
+def get_snapshot_store():
+    """Return the container-wide snapshot store"""
+    return _snapshot_store
+
+
+def _counter_delta(old_row, new_row):
+    """Per-field deltas; a counter that went backwards was reset, so count from zero"""
+    if old_row is None or new_row[0] < old_row[0]:
+        return list(new_row)
+    return [new - old for new, old in zip(new_row, old_row, strict=True)]
+
+
+def compute_statement_deltas(older, newer):
+    """
+    Turn two pg_stat_statements snapshots into per-query rates
+
+    Args:
+        older (dict): Baseline snapshot
+        newer (dict): Later snapshot of the same server
+
+    Returns:
+        dict: 'interval_seconds', 'totals' and 'statements' ranked by their
+              share of execution time spent during the interval
+    """
+    interval = max(newer["taken_at"] - older["taken_at"], 0.001)
+    block_size = newer.get("block_size", 8192)
+    old_rows = older["statements"]
+
+    statements = []
+    total_exec_ms = 0.0
+    total_calls = 0
+    for key, new_row in newer["statements"].items():
+        delta = dict(
+            zip(
+                STATEMENT_FIELDS,
+                _counter_delta(old_rows.get(key), new_row),
+                strict=True,
+            )
+        )
+        if delta["calls"] <= 0 and delta["total_exec_time"] <= 0:
+            continue
+        total_exec_ms += delta["total_exec_time"]
+        total_calls += delta["calls"]
+        statements.append(
+            {
+                "key": key,
+                "calls": delta["calls"],
+                "calls_per_sec": round(delta["calls"] / interval, 2),
+                "exec_ms": round(delta["total_exec_time"], 2),
+                "mean_time_ms": round(delta["total_exec_time"] / delta["calls"], 3)
+                if delta["calls"]
+                else None,
+                # Average number of backends busy with this query during the interval
+                "active_sessions": round(delta["total_exec_time"] / 1000 / interval, 3),
+                "rows_per_sec": round(delta["rows"] / interval, 2),
+                "shared_blks_read_per_sec": round(
+                    delta["shared_blks_read"] / interval, 2
+                ),
+                "temp_bytes_per_sec": round(
+                    (delta["temp_blks_read"] + delta["temp_blks_written"])
+                    * block_size
+                    / interval,
+                    1,
+                ),
+                "new_in_interval": key not in old_rows,
+            }
+        )
+
+    for statement in statements:
+        statement["load_share_pct"] = (
+            round(statement["exec_ms"] / total_exec_ms * 100, 2)
+            if total_exec_ms
+            else 0.0
+        )
+    statements.sort(key=lambda s: (s["exec_ms"], s["calls"]), reverse=True)
+
+    return {
+        "interval_seconds": round(interval, 3),
+        "totals": {
+            "calls_per_sec": round(total_calls / interval, 2),
+            "exec_ms_per_sec": round(total_exec_ms / interval, 2),
+            "active_statements": len(statements),
+        },
+        "statements": statements,
+    }
+
+
+def compute_io_deltas(older, newer):
+    """
+    Turn two I/O snapshots (pg_stat_io rows or per-table pg_statio counters)
+    into per-second rates, ordered by blocks read
+    """
+    interval = max(newer["taken_at"] - older["taken_at"], 0.001)
+    old_rows = older.get("io", {})
+    rows = []
+    for key, new_row in newer.get("io", {}).items():
+        delta = dict(
+            zip(IO_FIELDS, _counter_delta(old_rows.get(key), new_row), strict=True)
+        )
+        if not any(delta.values()):
+            continue
+        touched = delta["reads"] + delta["hits"]
+        rows.append(
+            {
+                "key": key,
+                "reads_per_sec": round(delta["reads"] / interval, 2),
+                "writes_per_sec": round(delta["writes"] / interval, 2),
+                "extends_per_sec": round(delta["extends"] / interval, 2),
+                "hits_per_sec": round(delta["hits"] / interval, 2),
+                "evictions_per_sec": round(delta["evictions"] / interval, 2),
+                "read_time_ms": round(delta["read_time"], 2),
+                "write_time_ms": round(delta["write_time"], 2),
+                "hit_ratio_pct": round(delta["hits"] / touched * 100, 2)
+                if touched
+                else None,
+            }
+        )
+    rows.sort(key=lambda r: (r["reads_per_sec"], r["writes_per_sec"]), reverse=True)
+    return {
+        "interval_seconds": round(interval, 3),
+        "source": newer.get("io_source"),
+        "rows": rows,
+    }
+
+
+def same_server_epoch(older, newer):
+    """Counters are only comparable while the server and its stats have not been reset"""
+    return older.get("server_started") == newer.get("server_started") and older.get(
+        "stats_reset"
+    ) == newer.get("stats_reset")
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The Lambda sources are flat modules in scripts/, imported by name
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
@@ -0,0 +1,89 @@
+import pytest
+
+pytest.importorskip("boto3")
+pytest.importorskip("psycopg2")
+
+import pg_analyze_performance  # noqa: E402
+
+
+class FakeCursor:
+    def __init__(self, conn, name):
+        self.conn = conn
+        self.name = name
+        self.description = [("value",)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, stmt, params=None):
+        self.conn.executed.append((self.name, stmt))
+
+    def fetchmany(self, size):
+        return []
+
+
+class FakeConnection:
+    def __init__(self):
+        self.executed = []
+
+    def cursor(self, name=None):
+        return FakeCursor(self, name)
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = FakeConnection()
+    monkeypatch.setattr(pg_analyze_performance, "connect_to_db", lambda secret: conn)
+    monkeypatch.setattr(pg_analyze_performance, "release_connection", lambda c: None)
+    monkeypatch.setattr(
+        pg_analyze_performance, "analyze_query_performance", lambda secret, q: []
+    )
+    return conn
+
+
+def streamed_statements(conn):
+    return [(name, stmt) for name, stmt in conn.executed if not stmt.startswith("SET")]
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["/* hint */ SELECT * FROM t", "-- note\nSELECT * FROM t", "(SELECT * FROM t)"],
+)
+def test_execute_read_query_limits_prefixed_selects(conn, query):
+    pg_analyze_performance.execute_read_query("secret", query, max_rows=5)
+
+    ((cursor_name, stmt),) = streamed_statements(conn)
+    assert stmt == f"{query} LIMIT 6"
+    assert cursor_name is not None
+
+
+def test_execute_read_query_keeps_an_existing_limit(conn):
+    pg_analyze_performance.execute_read_query(
+        "secret", "/* hint */ SELECT * FROM t LIMIT 3", max_rows=5
+    )
+
+    ((_, stmt),) = streamed_statements(conn)
+    assert stmt == "/* hint */ SELECT * FROM t LIMIT 3"
+
+
+def test_execute_read_query_does_not_limit_show(conn):
+    pg_analyze_performance.execute_read_query("secret", "SHOW work_mem", max_rows=5)
+
+    ((cursor_name, stmt),) = streamed_statements(conn)
+    assert stmt == "SHOW work_mem"
+    assert cursor_name is None
+
+
+@pytest.mark.parametrize("query", ["/* hint */ SELECT * FROM t", "(SELECT * FROM t)"])
+def test_validate_and_execute_queries_limits_prefixed_selects(conn, query):
+    response = pg_analyze_performance.validate_and_execute_queries(
+        "secret", query, max_rows=5
+    )
+
+    ((cursor_name, stmt),) = streamed_statements(conn)
+    assert stmt == f"{query} LIMIT 6"
+    assert cursor_name is not None
+    assert response["results"][0]["query"] == query
@@ -0,0 +1,95 @@
+import re
+
+import pytest
+
+pytest.importorskip("boto3")
+pytest.importorskip("psycopg2")
+
+import pgstat_analyse_database  # noqa: E402
+
+# References to pg_stat_statements columns renamed in PostgreSQL 13
+REMOVED_COLUMN_RE = re.compile(r"(?<!as )(?<!\w)(?:total|mean|min|max)_time\b")
+
+
+class FakeCursor:
+    def __init__(self, rows_by_database):
+        self.rows_by_database = rows_by_database
+        self.description = None
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query, params=None):
+        # Behave like psycopg2 and PostgreSQL for the mistakes that matter here
+        if "%s" in query and params is None:
+            raise IndexError("tuple index out of range")
+        removed = REMOVED_COLUMN_RE.search(query.lower())
+        if removed:
+            raise RuntimeError(f'column "{removed.group()}" does not exist')
+
+        if "slow query analysis with detailed metrics" in query:
+            columns = ("database", "username", "calls", "avg_time_sec", "query")
+            self.description = [(column,) for column in columns]
+            self.rows = [
+                row for row in self.rows_by_database if row[3] * 1000 >= params[0]
+            ]
+        else:
+            self.description = [("query",)]
+            self.rows = []
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self):
+        return FakeCursor(self.rows)
+
+    def commit(self):
+        pass
+
+
+@pytest.fixture
+def databases(monkeypatch):
+    databases = {
+        "pg-analyzer-orders": FakeConnection(
+            [
+                ("orders", "app", 10, 4.0, "SELECT * FROM orders"),
+                ("orders", "app", 500, 0.5, "SELECT 1"),
+            ]
+        ),
+        "pg-analyzer-billing": FakeConnection(
+            [("billing", "batch", 3, 9.5, "SELECT * FROM invoices")]
+        ),
+    }
+    monkeypatch.setattr(pgstat_analyse_database, "resolve_target_secret", str)
+    monkeypatch.setattr(pgstat_analyse_database, "connect_to_db", databases.get)
+    monkeypatch.setattr(pgstat_analyse_database, "release_connection", lambda c: None)
+    return databases
+
+
+def test_slow_query_passes_the_threshold(databases):
+    results = pgstat_analyse_database.execute_slow_query("pg-analyzer-orders", 1000)
+
+    assert [row["query"] for row in results["slow_queries_detailed"]] == [
+        "SELECT * FROM orders"
+    ]
+
+
+def test_fleet_slow_query_ranking(databases):
+    results = pgstat_analyse_database.execute_fleet_analysis(
+        "slow_query", targets=list(databases)
+    )
+
+    assert [target["status"] for target in results["targets"]] == ["ok", "ok"]
+    assert [(row["target"], row["avg_time_sec"]) for row in results["ranking"]] == [
+        ("pg-analyzer-billing", 9.5),
+        ("pg-analyzer-orders", 4.0),
+    ]
@@ -0,0 +1,171 @@
+import pytest
+
+from sql_lexer import (
+    fingerprint_query,
+    iter_tokens,
+    lex_statements,
+    validate_read_only_statements,
+)
+
+
+def texts(query):
+    return [stmt.text for stmt in lex_statements(query)]
+
+
+def commands(query):
+    return [stmt.command for stmt in lex_statements(query)]
+
+
+class TestSplitting:
+    def test_statements_are_split_on_semicolons(self):
+        assert texts("SELECT 1; SELECT 2;") == ["SELECT 1", "SELECT 2"]
+
+    def test_last_statement_needs_no_semicolon(self):
+        assert texts("SELECT 1;\nSHOW work_mem") == ["SELECT 1", "SHOW work_mem"]
+
+    def test_empty_statements_are_dropped(self):
+        assert texts(";; SELECT 1 ;  ;") == ["SELECT 1"]
+
+    def test_semicolon_inside_string_literal(self):
+        assert texts("SELECT 'a;b'; SELECT 2") == ["SELECT 'a;b'", "SELECT 2"]
+
+    def test_doubled_quote_inside_string_literal(self):
+        assert texts("SELECT 'it''s; here'; SELECT 2") == [
+            "SELECT 'it''s; here'",
+            "SELECT 2",
+        ]
+
+    def test_backslash_escape_inside_escape_string(self):
+        assert texts(r"SELECT E'a\';b'; SELECT 2") == [r"SELECT E'a\';b'", "SELECT 2"]
+
+    def test_semicolon_inside_quoted_identifier(self):
+        assert texts('SELECT 1 AS "x;y"; SELECT 2') == ['SELECT 1 AS "x;y"', "SELECT 2"]
+
+    def test_dollar_quoted_body(self):
+        query = "SELECT $$ a; 'b' $$; SELECT $fn$ c; $$ d $fn$"
+        assert texts(query) == ["SELECT $$ a; 'b' $$", "SELECT $fn$ c; $$ d $fn$"]
+
+    def test_positional_parameter_is_not_a_dollar_quote(self):
+        assert texts("SELECT $1; SELECT 2") == ["SELECT $1", "SELECT 2"]
+
+    def test_semicolon_inside_line_comment(self):
+        assert texts("SELECT 1 -- one; two\n; SELECT 2") == [
+            "SELECT 1 -- one; two",
+            "SELECT 2",
+        ]
+
+    def test_semicolon_inside_nested_block_comment(self):
+        assert texts("SELECT /* a /* b; */ c; */ 1; SELECT 2") == [
+            "SELECT /* a /* b; */ c; */ 1",
+            "SELECT 2",
+        ]
+
+    def test_comment_only_statement_is_dropped(self):
+        assert texts("-- nothing here;\n/* or here */;") == []
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT 'open",
+            "SELECT E'open\\'",
+            'SELECT "open',
+            "SELECT $$ open",
+            "/* open",
+        ],
+    )
+    def test_unterminated_tokens_raise(self, query):
+        with pytest.raises(ValueError, match="Unterminated"):
+            lex_statements(query)
+
+
+class TestCommand:
+    def test_command_is_the_first_word_lowercased(self):
+        assert commands("Select 1; show work_mem; EXPLAIN SELECT 1") == [
+            "select",
+            "show",
+            "explain",
+        ]
+
+    def test_leading_comments_are_skipped(self):
+        assert commands("-- note\n/* hint */ SELECT 1") == ["select"]
+
+    def test_keywords_in_literals_and_comments_are_ignored(self):
+        (stmt,) = lex_statements(
+            "SELECT 'drop table x', $$delete$$, \"update\" -- insert\n/* truncate */"
+        )
+
+        assert stmt.keywords == {"select"}
+
+    def test_parenthesised_query_uses_the_first_inner_word(self):
+        assert commands("((SELECT 1)) UNION (SELECT 2); (VALUES (1))") == [
+            "select",
+            "values",
+        ]
+
+    def test_statement_starting_with_a_symbol_has_an_empty_command(self):
+        assert commands("+ 1") == [""]
+
+
+class TestValidateReadOnlyStatements:
+    def test_read_only_statements_are_returned(self):
+        statements = validate_read_only_statements("SELECT 1; SHOW work_mem;")
+
+        assert [(stmt.command, stmt.text) for stmt in statements] == [
+            ("select", "SELECT 1"),
+            ("show", "SHOW work_mem"),
+        ]
+
+    def test_write_statement_is_rejected(self):
+        with pytest.raises(ValueError, match="Prohibited operation detected: delete"):
+            validate_read_only_statements("SELECT 1; DELETE FROM t")
+
+    def test_dangerous_keyword_inside_select_is_rejected(self):
+        with pytest.raises(ValueError, match="prohibited operation: insert"):
+            validate_read_only_statements(
+                "SELECT * FROM t WHERE x IN (INSERT INTO u VALUES (1))"
+            )
+
+    def test_parenthesised_write_is_rejected(self):
+        with pytest.raises(ValueError, match="Prohibited operation detected: delete"):
+            validate_read_only_statements("(DELETE FROM t)")
+
+    def test_dangerous_words_in_literals_are_allowed(self):
+        (stmt,) = validate_read_only_statements("SELECT 'drop; delete' AS note")
+
+        assert stmt.text == "SELECT 'drop; delete' AS note"
+
+    @pytest.mark.parametrize("query", ["", None])
+    def test_empty_query_is_rejected(self, query):
+        with pytest.raises(ValueError, match="non-empty"):
+            validate_read_only_statements(query)
+
+
+class TestFingerprint:
+    def test_literals_do_not_change_the_fingerprint(self):
+        first = fingerprint_query("SELECT * FROM t WHERE id = 1 AND name = 'a'")
+        second = fingerprint_query("select *  from T where id = 42 and name = 'b' -- x")
+
+        assert first[0] == second[0]
+        assert first[1] != second[1]
+
+    def test_different_shapes_have_different_fingerprints(self):
+        assert (
+            fingerprint_query("SELECT a FROM t")[0]
+            != fingerprint_query("SELECT b FROM t")[0]
+        )
+
+
+def test_tokens_cover_the_input_without_whitespace():
+    query = "SELECT 'x' /* c */ -- d\n, 1;"
+
+    kinds = [kind for kind, _, _ in iter_tokens(query)]
+
+    assert kinds == [
+        "word",
+        "string",
+        "block_comment",
+        "line_comment",
+        "other",
+        "number",
+        "semicolon",
+    ]
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Per-endpoint throughput benchmark for the demo backend servers.
+
+Drives every stub endpoint with concurrent requests for a fixed duration and
+reports requests/second and latency percentiles. Start the servers first
+(`./scripts/start_demo_backend.sh`) and pass the API key they were started
+with.
+
+Usage:
+    python scripts/benchmark_servers.py --api-key <key> [--host localhost]
+        [--https] [--concurrency 32] [--duration 5] [--only logs metrics]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+sys.path.append(str(Path(__file__).parent.parent))
+from config_utils import get_server_ports  # noqa: E402
+
+# config_utils enables INFO logging; per-request client logs would skew timings
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# (server, path, query params) exercised by the benchmark
+ENDPOINTS: List[Tuple[str, str, Dict[str, str]]] = [
+    ("k8s", "/pods/status", {"namespace": "production"}),
+    ("k8s", "/deployments/status", {}),
+    ("k8s", "/events", {"since": "2024-01-15T14:00:00Z", "severity": "Warning"}),
+    ("k8s", "/resource_usage", {"namespace": "production"}),
+    ("k8s", "/nodes/status", {}),
+    (
+        "logs",
+        "/logs/search",
+        {"pattern": "error", "start_time": "2024-01-15T14:00:00Z"},
+    ),
+    ("logs", "/logs/errors", {"since": "2024-01-15T14:00:00Z"}),
+    ("logs", "/logs/patterns", {}),
+    ("logs", "/logs/recent", {"limit": "100"}),
+    ("logs", "/logs/count", {"event_type": "error", "group_by": "service"}),
+    (
+        "metrics",
+        "/metrics/performance",
+        {
+            "metric_type": "response_time",
+            "service": "web-service",
+            "start_time": "2024-01-15T14:20:00Z",
+            "end_time": "2024-01-15T14:30:00Z",
+        },
+    ),
+    ("metrics", "/metrics/errors", {}),
+    ("metrics", "/metrics/resources", {"resource_type": "cpu"}),
+    ("metrics", "/metrics/availability", {}),
+    ("metrics", "/metrics/trends", {"metric_name": "response_time"}),
+    ("runbooks", "/runbooks/search", {"keyword": "memory"}),
+    ("runbooks", "/runbooks/troubleshooting", {"category": "kubernetes"}),
+    ("runbooks", "/runbooks/escalation", {"severity": "high"}),
+    ("runbooks", "/runbooks/resolutions", {"issue": "memory"}),
+]
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Dict[str, str],
+    deadline: float,
+    latencies: List[float],
+    statuses: Dict[int, int],
+) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.get(url, params=params)
+            status = response.status_code
+        except httpx.HTTPError:
+            status = 0
+        latencies.append(time.perf_counter() - started)
+        statuses[status] = statuses.get(status, 0) + 1
+
+
+async def benchmark_endpoint(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Dict[str, str],
+    concurrency: int,
+    duration: float,
+) -> Dict[str, float]:
+    """Hammer one endpoint with `concurrency` workers for `duration` seconds"""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(
+        *(
+            _worker(client, url, params, deadline, latencies, statuses)
+            for _ in range(concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p99_ms": (
+            latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0.0
+        ),
+        "errors": sum(count for status, count in statuses.items() if status != 200),
+    }
+
+
+async def _run(args: argparse.Namespace) -> int:
+    ports = get_server_ports()
+    scheme = "https" if args.https else "http"
+    headers = {"X-API-Key": args.api_key}
+    failures = 0
+
+    print(
+        f"{'endpoint':<34} {'requests':>9} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}"
+    )
+    async with httpx.AsyncClient(
+        headers=headers,
+        verify=not args.insecure,
+        limits=httpx.Limits(max_connections=args.concurrency),
+        timeout=30,
+    ) as client:
+        for server, path, params in ENDPOINTS:
+            if args.only and server not in args.only:
+                continue
+            port: Optional[int] = ports.get(server)
+            if port is None:
+                print(f"{server + path:<34} skipped: no port configured")
+                continue
+            url = f"{scheme}://{args.host}:{port}{path}"
+            # Warm up so the first request's data load is not measured
+            await client.get(url, params=params)
+            result = await benchmark_endpoint(
+                client, url, params, args.concurrency, args.duration
+            )
+            failures += result["errors"]
+            print(
+                f"{server + path:<34} {result['requests']:>9} {result['rps']:>9.1f} "
+                f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['errors']:>7}"
+            )
+    return 1 if failures else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Demo backend throughput benchmark")
+    parser.add_argument("--api-key", default=os.environ.get("BACKEND_API_KEY"))
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--https", action="store_true")
+    parser.add_argument(
+        "--insecure", action="store_true", help="Skip TLS certificate verification"
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--duration", type=float, default=5.0, help="Seconds per endpoint"
+    )
+    parser.add_argument(
+        "--only", nargs="*", choices=["k8s", "logs", "metrics", "runbooks"]
+    )
+    args = parser.parse_args()
+
+    if not args.api_key:
+        parser.error("--api-key (or BACKEND_API_KEY) is required")
+    return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Memory-resident data layer for the stub backend servers.
+
+Each data file is parsed once into an indexed structure and re-parsed only
+when its modification time or size changes, so requests never touch the
+disk or re-parse timestamps. Time-range filters use binary search over
+pre-parsed epoch timestamps and return matches in file order.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# How often (seconds) a data file is stat()ed to detect changes
+RELOAD_CHECK_INTERVAL = float(os.environ.get("STUB_DATA_RELOAD_CHECK_SECONDS", "1.0"))
+
+T = TypeVar("T")
+
+
+def parse_epoch(timestamp_str: Optional[str]) -> Optional[float]:
+    """
+    Parse an ISO timestamp string to epoch seconds.
+
+    Accepts the same formats as the servers' original `_parse_timestamp`:
+    a trailing `Z`, an explicit offset, or a naive timestamp (treated as UTC).
+
+    Args:
+        timestamp_str: ISO 8601 timestamp
+
+    Returns:
+        Epoch seconds, or None if the value is missing or cannot be parsed
+    """
+    if not timestamp_str:
+        return None
+    try:
+        if timestamp_str.endswith("Z"):
+            parsed = datetime.fromisoformat(timestamp_str[:-1] + "+00:00")
+        else:
+            parsed = datetime.fromisoformat(timestamp_str)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    except ValueError:
+        return None
+
+
+def parse_query_epoch(timestamp_str: Optional[str]) -> Optional[float]:
+    """Parse a query parameter, falling back to now like the original servers did"""
+    if not timestamp_str:
+        return None
+    epoch = parse_epoch(timestamp_str)
+    return epoch if epoch is not None else time.time()
+
+
+def _record_timestamp(record: Dict[str, Any]) -> Optional[str]:
+    return record.get("timestamp")
+
+
+@dataclass
+class TimeSeries(Generic[T]):
+    """
+    Items indexed by pre-parsed epoch timestamp, returned in their input order.
+
+    Like the servers' original linear filters, time-filtered results drop
+    items without a timestamp and treat an unparseable timestamp as the
+    current time.
+    """
+
+    ordered: List[T] = field(default_factory=list)
+    epochs: List[float] = field(default_factory=list)
+    positions: List[int] = field(default_factory=list)
+    unparsed: List[int] = field(default_factory=list)
+
+    @classmethod
+    def build(
+        cls,
+        items: Iterable[T],
+        timestamp_of: Callable[[T], Optional[str]] = _record_timestamp,
+    ) -> "TimeSeries[T]":
+        timed = []
+        series = cls(ordered=list(items))
+        for position, item in enumerate(series.ordered):
+            raw = timestamp_of(item)
+            if not raw:
+                continue
+            epoch = parse_epoch(raw)
+            if epoch is None:
+                series.unparsed.append(position)
+            else:
+                timed.append((epoch, position))
+        timed.sort()
+        series.epochs = [epoch for epoch, _ in timed]
+        series.positions = [position for _, position in timed]
+        return series
+
+    def all(self) -> List[T]:
+        """Every item in input order"""
+        return self.ordered
+
+    def between(
+        self, start_epoch: Optional[float] = None, end_epoch: Optional[float] = None
+    ) -> List[T]:
+        """Items with start_epoch <= timestamp <= end_epoch (either bound optional)"""
+        if start_epoch is None and end_epoch is None:
+            return self.all()
+        lo = 0 if start_epoch is None else bisect_left(self.epochs, start_epoch)
+        hi = (
+            len(self.epochs)
+            if end_epoch is None
+            else bisect_right(self.epochs, end_epoch)
+        )
+        selected = self.positions[lo:hi]
+        if self.unparsed and in_window(time.time(), start_epoch, end_epoch):
+            selected = selected + self.unparsed
+        selected.sort()
+        return [self.ordered[position] for position in selected]
+
+    def filter(
+        self, start_time: Optional[str] = None, end_time: Optional[str] = None
+    ) -> List[T]:
+        """Time-range filter taking the raw query-string timestamps"""
+        if not start_time and not end_time:
+            return self.all()
+        return self.between(parse_query_epoch(start_time), parse_query_epoch(end_time))
+
+    def __len__(self) -> int:
+        return len(self.ordered)
+
+
+def in_window(
+    epoch: float, start_epoch: Optional[float], end_epoch: Optional[float]
+) -> bool:
+    """Whether start_epoch <= epoch <= end_epoch (either bound optional)"""
+    if start_epoch is not None and epoch < start_epoch:
+        return False
+    return end_epoch is None or epoch <= end_epoch
+
+
+def group_by(
+    items: Iterable[Dict[str, Any]], key: str
+) -> Dict[Any, List[Dict[str, Any]]]:
+    """Bucket records by the value of one field, keeping their order"""
+    buckets: Dict[Any, List[Dict[str, Any]]] = {}
+    for item in items:
+        buckets.setdefault(item.get(key), []).append(item)
+    return buckets
+
+
+@dataclass
+class GroupedTimeSeries:
+    """A TimeSeries over all records plus one per value of a grouping field"""
+
+    everything: TimeSeries
+    groups: Dict[Any, TimeSeries]
+
+    @classmethod
+    def build(
+        cls, records: List[Dict[str, Any]], group_key: str = "service"
+    ) -> "GroupedTimeSeries":
+        return cls(
+            everything=TimeSeries.build(records),
+            groups={
+                name: TimeSeries.build(items)
+                for name, items in group_by(records, group_key).items()
+            },
+        )
+
+    def select(self, group: Optional[str] = None) -> TimeSeries:
+        """The series for one group, or for every record when group is None"""
+        if group is None:
+            return self.everything
+        return self.groups.get(group, TimeSeries())
+
+
+def load_json(path: Path) -> Any:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+class DataFile(Generic[T]):
+    """
+    A data file parsed once into an in-memory structure.
+
+    The file is stat()ed at most every RELOAD_CHECK_INTERVAL seconds and
+    rebuilt when its modification time or size changes. A failed rebuild
+    keeps serving the last good structure.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        builder: Callable[[Path], T],
+        check_interval: float = RELOAD_CHECK_INTERVAL,
+    ):
+        self.path = path
+        self.builder = builder
+        self.check_interval = check_interval
+        self._value: Optional[T] = None
+        self._signature: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.reloads = 0
+
+    def _current_signature(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self) -> T:
+        """
+        Return the parsed structure, rebuilding it if the file changed.
+
+        Raises:
+            FileNotFoundError: If the file does not exist and was never loaded
+        """
+        now = time.monotonic()
+        if self._value is not None and now - self._checked_at < self.check_interval:
+            return self._value
+
+        with self._lock:
+            if self._value is not None and now - self._checked_at < self.check_interval:
+                return self._value
+            signature = self._current_signature()
+            self._checked_at = now
+            if signature is None:
+                if self._value is None:
+                    raise FileNotFoundError(f"Data file not found: {self.path}")
+                return self._value
+            if signature != self._signature:
+                try:
+                    self._value = self.builder(self.path)
+                    self._signature = signature
+                    self.reloads += 1
+                    logger.info(f"Loaded data file {self.path.name}")
+                except Exception as e:
+                    if self._value is None:
+                        raise
+                    logger.error(f"Keeping previous data for {self.path.name}: {e}")
+            return self._value
+
+    def exists(self) -> bool:
+        return self._value is not None or self.path.exists()
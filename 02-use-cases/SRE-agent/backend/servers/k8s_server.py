@@ -1,9 +1,8 @@
-import json
 import logging
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import (
     Depends,
@@ -12,6 +11,7 @@ from fastapi import (
     HTTPException,
     Query,
 )
+from data_store import DataFile, TimeSeries, load_json
 from pydantic import BaseModel, Field
 from retrieve_api_key import retrieve_api_key
 
@@ -50,46 +50,6 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
     return x_api_key
 
 
-def _parse_timestamp(timestamp_str: str) -> datetime:
-    """Parse ISO timestamp string to datetime object"""
-    try:
-        # Handle both with and without timezone
-        if timestamp_str.endswith("Z"):
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        elif "+" in timestamp_str or timestamp_str.endswith("0"):
-            return datetime.fromisoformat(timestamp_str)
-        else:
-            return datetime.fromisoformat(timestamp_str + "+00:00")
-    except:
-        # Fallback: assume current time if parsing fails
-        return datetime.now(timezone.utc)
-
-
-def _filter_events_by_time(events: list, since: Optional[str] = None) -> list:
-    """Filter events by since timestamp"""
-    if not since:
-        return events
-
-    filtered_events = []
-    since_dt = _parse_timestamp(since)
-
-    for event in events:
-        event_timestamp = event.get("timestamp")
-        if not event_timestamp:
-            continue
-
-        try:
-            event_dt = _parse_timestamp(event_timestamp)
-
-            if event_dt >= since_dt:
-                filtered_events.append(event)
-        except:
-            # Include events with unparseable timestamps
-            filtered_events.append(event)
-
-    return filtered_events
-
-
 # Pydantic Models
 class PodStatus(str, Enum):
     """Pod status enumeration"""
@@ -221,6 +181,88 @@ class ErrorResponse(BaseModel):
     detail: Optional[str] = Field(None, description="Detailed error information")
 
 
+@dataclass
+class NamedIndex:
+    """Validated objects in file order, indexed by namespace and by name"""
+
+    items: List[Any] = field(default_factory=list)
+    by_namespace: Dict[str, List[Any]] = field(default_factory=dict)
+    by_name: Dict[str, List[Any]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, items: List[Any]) -> "NamedIndex":
+        index = cls(items=items)
+        for item in items:
+            namespace = _field(item, "namespace")
+            if namespace is not None:
+                index.by_namespace.setdefault(namespace, []).append(item)
+            index.by_name.setdefault(_field(item, "name"), []).append(item)
+        return index
+
+    def select(
+        self, namespace: Optional[str] = None, name: Optional[str] = None
+    ) -> List[Any]:
+        """Objects matching the namespace and/or name filters"""
+        if name:
+            items = self.by_name.get(name, [])
+            if namespace:
+                items = [i for i in items if _field(i, "namespace") == namespace]
+            return items
+        if namespace:
+            return self.by_namespace.get(namespace, [])
+        return self.items
+
+
+@dataclass
+class ClusterEvents:
+    """Validated events as time series, overall and per event type"""
+
+    everything: TimeSeries
+    by_type: Dict[str, TimeSeries]
+
+
+def _field(item: Any, name: str) -> Any:
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def _load_pods(file_path: Path) -> NamedIndex:
+    pods = [Pod.model_validate(p) for p in load_json(file_path).get("pods", [])]
+    return NamedIndex.build(pods)
+
+
+def _load_deployments(file_path: Path) -> NamedIndex:
+    deployments = [
+        Deployment.model_validate(d)
+        for d in load_json(file_path).get("deployments", [])
+    ]
+    return NamedIndex.build(deployments)
+
+
+def _load_events(file_path: Path) -> ClusterEvents:
+    events = [Event.model_validate(e) for e in load_json(file_path).get("events", [])]
+    by_type: Dict[str, List[Event]] = {}
+    for event in events:
+        by_type.setdefault(event.type.value, []).append(event)
+    return ClusterEvents(
+        everything=TimeSeries.build(events, lambda event: event.timestamp),
+        by_type={
+            event_type: TimeSeries.build(items, lambda event: event.timestamp)
+            for event_type, items in by_type.items()
+        },
+    )
+
+
+def _load_nodes(file_path: Path) -> NamedIndex:
+    return NamedIndex.build(load_json(file_path).get("nodes", []))
+
+
+PODS = DataFile(DATA_PATH / "pods.json", _load_pods)
+DEPLOYMENTS = DataFile(DATA_PATH / "deployments.json", _load_deployments)
+EVENTS = DataFile(DATA_PATH / "events.json", _load_events)
+NODES = DataFile(DATA_PATH / "nodes.json", _load_nodes)
+RESOURCE_USAGE = DataFile(DATA_PATH / "resource_usage.json", load_json)
+
+
 @app.get("/pods/status", response_model=PodStatusResponse)
 async def get_pod_status(
     namespace: Optional[str] = Query(
@@ -249,18 +291,8 @@ async def get_pod_status(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "pods.json", "r") as f:
-            data = json.load(f)
-
-        pods = data.get("pods", [])
-
-        # Filter by namespace if provided
-        if namespace:
-            pods = [p for p in pods if p.get("namespace") == namespace]
-
-        # Filter by pod name if provided
-        if pod_name:
-            pods = [p for p in pods if p.get("name") == pod_name]
+        # Filter by namespace and/or pod name if provided
+        pods = PODS.get().select(namespace=namespace, name=pod_name)
 
         return PodStatusResponse(pods=pods)
     except Exception as e:
@@ -296,16 +328,9 @@ async def get_deployment_status(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "deployments.json", "r") as f:
-            data = json.load(f)
-
-        deployments = data.get("deployments", [])
-
-        if namespace:
-            deployments = [d for d in deployments if d.get("namespace") == namespace]
-
-        if deployment_name:
-            deployments = [d for d in deployments if d.get("name") == deployment_name]
+        deployments = DEPLOYMENTS.get().select(
+            namespace=namespace, name=deployment_name
+        )
 
         return DeploymentStatusResponse(deployments=deployments)
     except Exception as e:
@@ -345,16 +370,14 @@ async def get_cluster_events(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "events.json", "r") as f:
-            data = json.load(f)
-
-        events = data.get("events", [])
-
+        cluster_events = EVENTS.get()
         if severity:
-            events = [e for e in events if e.get("type") == severity]
+            series = cluster_events.by_type.get(severity, TimeSeries())
+        else:
+            series = cluster_events.everything
 
         # Filter by since timestamp
-        events = _filter_events_by_time(events, since)
+        events = series.filter(start_time=since)
 
         return EventsResponse(events=events)
     except Exception as e:
@@ -390,8 +413,7 @@ async def get_resource_usage(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "resource_usage.json", "r") as f:
-            data = json.load(f)
+        data = RESOURCE_USAGE.get()
 
         resource_usage = data.get("resource_usage", {})
 
@@ -434,13 +456,7 @@ async def get_node_status(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "nodes.json", "r") as f:
-            data = json.load(f)
-
-        nodes = data.get("nodes", [])
-
-        if node_name:
-            nodes = [n for n in nodes if n.get("name") == node_name]
+        nodes = NODES.get().select(name=node_name)
 
         return {"nodes": nodes}
     except Exception as e:
@@ -1,8 +1,10 @@
-import json
 import logging
-from datetime import datetime, timezone
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import (
     Depends,
@@ -11,8 +13,18 @@ from fastapi import (
     HTTPException,
     Query,
 )
+from data_store import (
+    DataFile,
+    GroupedTimeSeries,
+    TimeSeries,
+    in_window,
+    load_json,
+    parse_epoch,
+    parse_query_epoch,
+)
 from fastapi.responses import JSONResponse
 from retrieve_api_key import retrieve_api_key
+from search_index import SearchIndex, quoted_phrases
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -21,7 +33,18 @@ logging.basicConfig(
     format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
 )
 
-app = FastAPI(title="Application Logs API", version="1.0.0")
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Build the log search index before the first request arrives
+    try:
+        APPLICATION_LOGS.get()
+    except Exception as e:
+        logging.error(f"Could not build log search index at startup: {e}")
+    yield
+
+
+app = FastAPI(title="Application Logs API", version="1.0.0", lifespan=_lifespan)
 
 DATA_PATH = Path(__file__).parent.parent / "data" / "logs_data"
 
@@ -48,100 +71,126 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
     return x_api_key
 
 
-def _parse_timestamp(timestamp_str: str) -> datetime:
-    """Parse ISO timestamp string to datetime object"""
-    try:
-        # Handle both with and without timezone
-        if timestamp_str.endswith("Z"):
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        elif "+" in timestamp_str or timestamp_str.endswith("0"):
-            return datetime.fromisoformat(timestamp_str)
-        else:
-            return datetime.fromisoformat(timestamp_str + "+00:00")
-    except:
-        # Fallback: assume current time if parsing fails
-        return datetime.now(timezone.utc)
+@dataclass
+class LogEntry:
+    """A parsed log line with its lowercased text kept for pattern matching"""
 
+    record: Dict[str, Any]
+    text: str
+    epoch: Optional[float] = None
 
-def _filter_by_time(
-    logs: list, start_time: Optional[str] = None, end_time: Optional[str] = None
-) -> list:
-    """Filter logs by time range"""
-    if not start_time and not end_time:
-        return logs
+    def in_window(
+        self, start_epoch: Optional[float], end_epoch: Optional[float]
+    ) -> bool:
+        """Same inclusion rules as TimeSeries.between for a single entry"""
+        if not self.record.get("timestamp"):
+            return False
+        epoch = time.time() if self.epoch is None else self.epoch
+        return in_window(epoch, start_epoch, end_epoch)
 
-    filtered_logs = []
-    start_dt = _parse_timestamp(start_time) if start_time else None
-    end_dt = _parse_timestamp(end_time) if end_time else None
 
-    for log in logs:
-        log_timestamp = log.get("timestamp")
-        if not log_timestamp:
-            continue
+@dataclass
+class ApplicationLogs:
+    """Application log entries in file order plus a time index over them"""
 
-        try:
-            log_dt = _parse_timestamp(log_timestamp)
+    entries: List[LogEntry] = field(default_factory=list)
+    by_time: TimeSeries = field(default_factory=TimeSeries)
 
-            if start_dt and log_dt < start_dt:
-                continue
-            if end_dt and log_dt > end_dt:
-                continue
 
-            filtered_logs.append(log)
-        except:
-            # Include logs with unparseable timestamps
-            filtered_logs.append(log)
+def _parse_log_line(line: str) -> Dict[str, Any]:
+    """Parse a text log line into timestamp, level, service and message"""
+    parts = line.strip().split(" ", 3)
+    if len(parts) < 4:
+        return {"message": line.strip()}
+
+    timestamp, level_part, service, message = parts
+    # Extract log level from [LEVEL] format
+    level = "INFO"
+    if "[" in level_part and "]" in level_part:
+        level = level_part.strip("[]")
+    return {
+        "timestamp": timestamp,
+        "level": level,
+        "service": service,
+        "message": message,
+    }
+
+
+# Field boosts for pattern search: a service-name match outranks a message match
+LOG_SEARCH_FIELDS = {"message": 1.0, "service": 2.0}
+
+LOG_INDEX = SearchIndex(LOG_SEARCH_FIELDS)
 
-    return filtered_logs
 
+def _log_search_fields(entry: LogEntry) -> Dict[str, Any]:
+    record = entry.record
+    return {
+        "message": record.get("message") or entry.text,
+        "service": record.get("service"),
+    }
 
-def _parse_log_file(file_path: Path, pattern: Optional[str] = None):
-    """Parse log file and filter by pattern"""
-    logs = []
 
+def _pattern_terms(pattern: str) -> List[str]:
+    """
+    Lowercased substrings a matching entry must contain.
+
+    Without double quotes the whole pattern is one substring, as in the
+    original scan; with them, each quoted phrase and each word outside the
+    quotes must appear.
+    """
+    phrases = quoted_phrases(pattern)
+    if not phrases:
+        return [pattern.lower()]
+    outside = re.sub(r'"[^"]*"', " ", pattern).split()
+    return [term.lower() for term in phrases + outside]
+
+
+def _parse_log_file(file_path: Path) -> ApplicationLogs:
+    """Parse a JSON or text log file once into searchable entries"""
+    entries = []
     if file_path.suffix == ".json":
-        with open(file_path, "r") as f:
-            data = json.load(f)
-            # Handle both array and object with array
-            if isinstance(data, list):
-                logs = data
-            elif isinstance(data, dict):
-                # Get the first array value in the dict
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        logs = value
-                        break
+        data = load_json(file_path)
+        # Handle both array and object with array
+        logs = []
+        if isinstance(data, list):
+            logs = data
+        elif isinstance(data, dict):
+            # Get the first array value in the dict
+            for value in data.values():
+                if isinstance(value, list):
+                    logs = value
+                    break
+        entries = [LogEntry(log, str(log).lower()) for log in logs]
     else:
-        # Parse text log files
         with open(file_path, "r") as f:
-            for line in f:
-                if pattern and pattern.lower() not in line.lower():
-                    continue
-                # Parse log line to extract timestamp, level, and message
-                parts = line.strip().split(" ", 3)
-                if len(parts) >= 4:
-                    timestamp = parts[0]
-                    level_part = parts[1]
-                    service = parts[2]
-                    message = parts[3] if len(parts) > 3 else ""
-
-                    # Extract log level from [LEVEL] format
-                    level = "INFO"
-                    if "[" in level_part and "]" in level_part:
-                        level = level_part.strip("[]")
-
-                    logs.append(
-                        {
-                            "timestamp": timestamp,
-                            "level": level,
-                            "service": service,
-                            "message": message,
-                        }
-                    )
-                else:
-                    logs.append({"message": line.strip()})
-
-    return logs
+            entries = [LogEntry(_parse_log_line(line), line.lower()) for line in f]
+
+    for entry in entries:
+        entry.epoch = parse_epoch(entry.record.get("timestamp"))
+
+    # Entries are keyed by line position, so appended lines are the only ones
+    # indexed when the file grows
+    added, removed = LOG_INDEX.sync(
+        (position, _log_search_fields(entry)) for position, entry in enumerate(entries)
+    )
+    logging.info(
+        f"Log search index updated - {added} indexed, {removed} removed, {len(LOG_INDEX)} total"
+    )
+
+    return ApplicationLogs(
+        entries=entries,
+        by_time=TimeSeries.build(entries, lambda entry: entry.record.get("timestamp")),
+    )
+
+
+def _load_error_logs(file_path: Path) -> GroupedTimeSeries:
+    return GroupedTimeSeries.build(load_json(file_path))
+
+
+APPLICATION_LOGS = DataFile(DATA_PATH / "application.log", _parse_log_file)
+ERROR_LOGS = DataFile(DATA_PATH / "error.log", _load_error_logs)
+LOG_PATTERNS = DataFile(DATA_PATH / "log_patterns.json", load_json)
+LOG_COUNTS = DataFile(DATA_PATH / "log_counts.json", load_json)
 
 
 @app.get("/logs/search")
@@ -156,18 +205,50 @@ async def search_logs(
 ):
     """Search logs by pattern/timeframe"""
     try:
-        application_logs = _parse_log_file(DATA_PATH / "application.log", pattern)
-
-        # Filter by log level if provided
-        if log_level:
-            application_logs = [
-                log for log in application_logs if log.get("level") == log_level
-            ]
+        application_logs = APPLICATION_LOGS.get()
+        entries = application_logs.entries
+        time_filtered = bool(start_time or end_time)
+        start_epoch = parse_query_epoch(start_time)
+        end_epoch = parse_query_epoch(end_time)
+
+        terms = _pattern_terms(pattern)
+
+        def _matches(entry: LogEntry) -> bool:
+            if log_level and entry.record.get("level") != log_level:
+                return False
+            return all(term in entry.text for term in terms)
+
+        def _accept(position: int) -> bool:
+            if position >= len(entries):
+                # Indexed by a newer reload than the entries this request holds
+                return False
+            entry = entries[position]
+            if time_filtered and not entry.in_window(start_epoch, end_epoch):
+                return False
+            return _matches(entry)
+
+        # Ranked by relevance, best 100 matches
+        ranked = LOG_INDEX.search(pattern, limit=100, accept=_accept)
+        if ranked:
+            return {"logs": [entries[position].record for position, _ in ranked]}
+
+        # The index only covers message and service words; matches elsewhere in
+        # the entry, inside words or without searchable words (e.g. "->") are
+        # found by a substring scan in file order
+        if time_filtered:
+            candidates = application_logs.by_time.filter(start_time, end_time)
+        else:
+            candidates = application_logs.entries
 
-        # Filter by time range
-        application_logs = _filter_by_time(application_logs, start_time, end_time)
+        matches = []
+        for entry in candidates:
+            if not _matches(entry):
+                continue
+            matches.append(entry.record)
+            if len(matches) >= 100:  # Limit results
+                break
 
-        return {"logs": application_logs[:100]}  # Limit results
+        return {"logs": matches}
     except Exception as e:
         logging.error(f"Error searching logs: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -181,17 +262,10 @@ async def get_error_logs(
 ):
     """Retrieve error-specific entries"""
     try:
-        with open(DATA_PATH / "error.log", "r") as f:
-            error_logs = json.load(f)
-
-        if service:
-            error_logs = [log for log in error_logs if log.get("service") == service]
+        error_logs = ERROR_LOGS.get().select(service or None)
 
         # Filter by since timestamp
-        if since:
-            error_logs = _filter_by_time(error_logs, start_time=since)
-
-        return {"errors": error_logs}
+        return {"errors": error_logs.filter(start_time=since)}
     except Exception as e:
         logging.error(f"Error retrieving error logs: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -212,14 +286,10 @@ async def analyze_log_patterns(
     """Identify recurring issues"""
     try:
         # Read patterns from actual data file
-        patterns_file = DATA_PATH / "log_patterns.json"
-        if not patterns_file.exists():
+        if not LOG_PATTERNS.exists():
             return {"patterns": []}
 
-        with open(patterns_file, "r") as f:
-            data = json.load(f)
-
-        patterns = data.get("patterns", [])
+        patterns = LOG_PATTERNS.get().get("patterns", [])
 
         # Filter by min_occurrences
         patterns = [p for p in patterns if p["count"] >= min_occurrences]
@@ -240,14 +310,16 @@ async def get_recent_logs(
 ):
     """Fetch latest log entries"""
     try:
-        all_logs = _parse_log_file(DATA_PATH / "application.log")
+        entries = APPLICATION_LOGS.get().entries
 
-        if service:
-            all_logs = [log for log in all_logs if service in log.get("service", "")]
-
-        # Return the most recent logs (last N entries)
-        recent_logs = all_logs[-limit:] if len(all_logs) > limit else all_logs
-        recent_logs.reverse()  # Most recent first
+        # Walk back from the most recent entry and stop after N matches
+        recent_logs = []
+        for entry in reversed(entries):
+            if service and service not in entry.record.get("service", ""):
+                continue
+            recent_logs.append(entry.record)
+            if len(recent_logs) >= limit:
+                break
 
         return {"logs": recent_logs}
     except Exception as e:
@@ -271,12 +343,10 @@ async def count_log_events(
     """Count occurrences of specific events"""
     try:
         # Read counts from actual data file
-        counts_file = DATA_PATH / "log_counts.json"
-        if not counts_file.exists():
+        if not LOG_COUNTS.exists():
             return {"total_count": 0, "counts": []}
 
-        with open(counts_file, "r") as f:
-            data = json.load(f)
+        data = LOG_COUNTS.get()
 
         if event_type.lower() == "error":
             error_data = data.get("error_counts", {})
@@ -1,8 +1,7 @@
-import json
 import logging
-from datetime import datetime, timezone
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import (
     Depends,
@@ -11,6 +10,7 @@ from fastapi import (
     HTTPException,
     Query,
 )
+from data_store import DataFile, GroupedTimeSeries, group_by, load_json
 from fastapi.responses import JSONResponse
 from retrieve_api_key import retrieve_api_key
 
@@ -48,51 +48,94 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
     return x_api_key
 
 
-def _parse_timestamp(timestamp_str: str) -> datetime:
-    """Parse ISO timestamp string to datetime object"""
-    try:
-        # Handle both with and without timezone
-        if timestamp_str.endswith("Z"):
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        elif "+" in timestamp_str or timestamp_str.endswith("0"):
-            return datetime.fromisoformat(timestamp_str)
-        else:
-            return datetime.fromisoformat(timestamp_str + "+00:00")
-    except:
-        # Fallback: assume current time if parsing fails
-        return datetime.now(timezone.utc)
+# Fields kept for each resource_type of /metrics/resources
+RESOURCE_FIELDS = {
+    "cpu": ("cpu_usage_percent",),
+    "memory": ("memory_usage_mb", "memory_usage_percent"),
+    "disk": ("disk_io_read_mb", "disk_io_write_mb"),
+    "network": ("network_in_mb", "network_out_mb"),
+}
+
+
+@dataclass
+class ResourceMetrics:
+    """resource_usage.json pre-shaped for every endpoint that reads it"""
+
+    raw: GroupedTimeSeries
+    cpu_usage: GroupedTimeSeries
+    memory_usage: GroupedTimeSeries
+    # resource_type (None for all fields) -> service (None for all) -> metrics
+    projections: Dict[Optional[str], Dict[Optional[str], List[Dict[str, Any]]]]
+
 
+def _load_metric_series(file_path: Path) -> GroupedTimeSeries:
+    return GroupedTimeSeries.build(load_json(file_path).get("metrics", []))
 
-def _filter_metrics_by_time(
-    metrics: list, start_time: Optional[str] = None, end_time: Optional[str] = None
-) -> list:
-    """Filter metrics by time range"""
-    if not start_time and not end_time:
-        return metrics
 
-    filtered_metrics = []
-    start_dt = _parse_timestamp(start_time) if start_time else None
-    end_dt = _parse_timestamp(end_time) if end_time else None
+def _project_resource(metric: Dict[str, Any], resource_type: str) -> Dict[str, Any]:
+    projected = {"timestamp": metric["timestamp"], "service": metric["service"]}
+    for field_name in RESOURCE_FIELDS[resource_type]:
+        projected[field_name] = metric.get(field_name)
+    return projected
+
+
+def _with_services(
+    metrics: List[Dict[str, Any]],
+) -> Dict[Optional[str], List[Dict[str, Any]]]:
+    by_service = group_by(metrics, "service")
+    by_service[None] = metrics
+    return by_service
+
+
+def _load_resource_metrics(file_path: Path) -> ResourceMetrics:
+    raw_metrics = load_json(file_path).get("metrics", [])
+    # Transform resource metrics to match the performance metric format
+    cpu_usage = [
+        {
+            "timestamp": m["timestamp"],
+            "service": m["service"],
+            "value": m["cpu_usage_percent"],
+            "unit": "percent",
+        }
+        for m in raw_metrics
+    ]
+    memory_usage = [
+        {
+            "timestamp": m["timestamp"],
+            "service": m["service"],
+            "value": m["memory_usage_mb"],
+            "unit": "MB",
+        }
+        for m in raw_metrics
+    ]
+    projections = {None: _with_services(raw_metrics)}
+    for resource_type in RESOURCE_FIELDS:
+        projections[resource_type] = _with_services(
+            [_project_resource(m, resource_type) for m in raw_metrics]
+        )
+    return ResourceMetrics(
+        raw=GroupedTimeSeries.build(raw_metrics),
+        cpu_usage=GroupedTimeSeries.build(cpu_usage),
+        memory_usage=GroupedTimeSeries.build(memory_usage),
+        projections=projections,
+    )
 
-    for metric in metrics:
-        metric_timestamp = metric.get("timestamp")
-        if not metric_timestamp:
-            continue
 
-        try:
-            metric_dt = _parse_timestamp(metric_timestamp)
+def _load_by_service(key: str):
+    def builder(file_path: Path) -> Dict[Optional[str], List[Dict[str, Any]]]:
+        return _with_services(load_json(file_path).get(key, []))
 
-            if start_dt and metric_dt < start_dt:
-                continue
-            if end_dt and metric_dt > end_dt:
-                continue
+    return builder
 
-            filtered_metrics.append(metric)
-        except:
-            # Include metrics with unparseable timestamps
-            filtered_metrics.append(metric)
 
-    return filtered_metrics
+RESPONSE_TIMES = DataFile(DATA_PATH / "response_times.json", _load_metric_series)
+THROUGHPUT = DataFile(DATA_PATH / "throughput.json", _load_metric_series)
+RESOURCE_USAGE = DataFile(DATA_PATH / "resource_usage.json", _load_resource_metrics)
+ERROR_RATES = DataFile(DATA_PATH / "error_rates.json", _load_by_service("error_rates"))
+AVAILABILITY = DataFile(
+    DATA_PATH / "availability.json", _load_by_service("availability_metrics")
+)
+TRENDS = DataFile(DATA_PATH / "trends.json", load_json)
 
 
 @app.get("/metrics/performance")
@@ -109,52 +152,20 @@ async def get_performance_metrics(
 ):
     """Retrieve performance data"""
     try:
-        metrics = []
-
         if metric_type == "response_time":
-            with open(DATA_PATH / "response_times.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
+            series = RESPONSE_TIMES.get()
         elif metric_type == "throughput":
-            with open(DATA_PATH / "throughput.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
-        elif metric_type in ["cpu_usage", "memory_usage"]:
-            with open(DATA_PATH / "resource_usage.json", "r") as f:
-                data = json.load(f)
-                raw_metrics = data.get("metrics", [])
-                # Transform resource metrics to match expected format
-                metrics = []
-                for m in raw_metrics:
-                    if metric_type == "cpu_usage":
-                        metrics.append(
-                            {
-                                "timestamp": m["timestamp"],
-                                "service": m["service"],
-                                "value": m["cpu_usage_percent"],
-                                "unit": "percent",
-                            }
-                        )
-                    else:  # memory_usage
-                        metrics.append(
-                            {
-                                "timestamp": m["timestamp"],
-                                "service": m["service"],
-                                "value": m["memory_usage_mb"],
-                                "unit": "MB",
-                            }
-                        )
+            series = THROUGHPUT.get()
+        elif metric_type == "cpu_usage":
+            series = RESOURCE_USAGE.get().cpu_usage
+        elif metric_type == "memory_usage":
+            series = RESOURCE_USAGE.get().memory_usage
         else:
             # Return combined metrics for demo
-            with open(DATA_PATH / "resource_usage.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
-
-        if service:
-            metrics = [m for m in metrics if m.get("service") == service]
+            series = RESOURCE_USAGE.get().raw
 
-        # Filter by time range
-        metrics = _filter_metrics_by_time(metrics, start_time, end_time)
+        # Filter by service, then by time range
+        metrics = series.select(service or None).filter(start_time, end_time)
 
         return {"metrics": metrics}
     except Exception as e:
@@ -172,13 +183,7 @@ async def get_error_rates(
 ):
     """Fetch error rate statistics"""
     try:
-        with open(DATA_PATH / "error_rates.json", "r") as f:
-            data = json.load(f)
-
-        error_rates = data.get("error_rates", [])
-
-        if service:
-            error_rates = [e for e in error_rates if e.get("service") == service]
+        error_rates = ERROR_RATES.get().get(service or None, [])
 
         # TODO: In real implementation, would filter by time window
 
@@ -203,32 +208,12 @@ async def get_resource_metrics(
 ):
     """Monitor resource utilization"""
     try:
-        with open(DATA_PATH / "resource_usage.json", "r") as f:
-            data = json.load(f)
-
-        metrics = data.get("metrics", [])
-
-        if service:
-            metrics = [m for m in metrics if m.get("service") == service]
-
-        # Filter by resource type if specified
-        if resource_type:
-            filtered_metrics = []
-            for m in metrics:
-                filtered = {"timestamp": m["timestamp"], "service": m["service"]}
-                if resource_type == "cpu":
-                    filtered["cpu_usage_percent"] = m.get("cpu_usage_percent")
-                elif resource_type == "memory":
-                    filtered["memory_usage_mb"] = m.get("memory_usage_mb")
-                    filtered["memory_usage_percent"] = m.get("memory_usage_percent")
-                elif resource_type == "disk":
-                    filtered["disk_io_read_mb"] = m.get("disk_io_read_mb")
-                    filtered["disk_io_write_mb"] = m.get("disk_io_write_mb")
-                elif resource_type == "network":
-                    filtered["network_in_mb"] = m.get("network_in_mb")
-                    filtered["network_out_mb"] = m.get("network_out_mb")
-                filtered_metrics.append(filtered)
-            metrics = filtered_metrics
+        # Projections per resource type and service are built when the file loads
+        metrics = (
+            RESOURCE_USAGE.get()
+            .projections.get(resource_type or None, {})
+            .get(service or None, [])
+        )
 
         return {"metrics": metrics}
     except Exception as e:
@@ -248,15 +233,7 @@ async def get_availability_metrics(
 ):
     """Check service availability"""
     try:
-        with open(DATA_PATH / "availability.json", "r") as f:
-            data = json.load(f)
-
-        availability_metrics = data.get("availability_metrics", [])
-
-        if service:
-            availability_metrics = [
-                a for a in availability_metrics if a.get("service") == service
-            ]
+        availability_metrics = AVAILABILITY.get().get(service or None, [])
 
         # TODO: In real implementation, would calculate based on time window
 
@@ -283,8 +260,7 @@ async def analyze_trends(
     """Identify metric trends and anomalies"""
     try:
         # Read trends from actual data file
-        trends_file = DATA_PATH / "trends.json"
-        if not trends_file.exists():
+        if not TRENDS.exists():
             return {
                 "trend": "no_data",
                 "average_value": 0,
@@ -292,8 +268,7 @@ async def analyze_trends(
                 "anomalies": [],
             }
 
-        with open(trends_file, "r") as f:
-            data = json.load(f)
+        data = TRENDS.get()
 
         # Determine which trend data to use based on metric name
         if "response" in metric_name.lower():
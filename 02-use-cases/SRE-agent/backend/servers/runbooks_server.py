@@ -1,8 +1,10 @@
 import json
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from data_store import DataFile, load_json
 from fastapi import (
     Depends,
     FastAPI,
@@ -15,6 +17,7 @@ from fastapi import (
 )
 from fastapi.responses import JSONResponse
 from retrieve_api_key import retrieve_api_key
+from search_index import SearchIndex, quoted_phrases
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -23,7 +26,18 @@ logging.basicConfig(
     format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
 )
 
-app = FastAPI(title="DevOps Runbooks API", version="1.0.0")
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Build the runbook search index before the first request arrives
+    try:
+        PLAYBOOKS.get()
+    except Exception as e:
+        logging.error(f"❌ RUNBOOKS API: Could not build search index at startup: {e}")
+    yield
+
+
+app = FastAPI(title="DevOps Runbooks API", version="1.0.0", lifespan=_lifespan)
 
 DATA_PATH = Path(__file__).parent.parent / "data" / "runbooks_data"
 
@@ -50,6 +64,66 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
     return x_api_key
 
 
+# Field boosts for keyword search: a match in the title outweighs one in the steps
+RUNBOOK_SEARCH_FIELDS = {
+    "title": 3.0,
+    "service": 2.0,
+    "description": 1.5,
+    "triggers": 1.0,
+    "steps": 1.0,
+}
+
+RUNBOOK_INDEX = SearchIndex(RUNBOOK_SEARCH_FIELDS)
+
+# Most runbooks returned by one search, like the logs search
+MAX_SEARCH_RESULTS = 100
+
+
+def _runbook_search_fields(runbook: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: runbook.get(name) for name in RUNBOOK_SEARCH_FIELDS}
+
+
+def _contains_text(runbook: Dict[str, Any], text: str) -> bool:
+    """Case-insensitive substring match on the title, description or a step"""
+    text = text.lower()
+    return (
+        text in runbook.get("title", "").lower()
+        or text in runbook.get("description", "").lower()
+        or any(text in step.lower() for step in runbook.get("steps", []))
+    )
+
+
+def _load_playbooks(file_path: Path) -> Dict[str, Any]:
+    playbooks = load_json(file_path).get("playbooks", [])
+
+    # Key documents by playbook id so an edited file only re-indexes what changed
+    documents = {}
+    for position, playbook in enumerate(playbooks):
+        doc_id = playbook.get("id") or f"#{position}"
+        if doc_id in documents:
+            doc_id = f"{doc_id}#{position}"
+        documents[doc_id] = playbook
+    added, removed = RUNBOOK_INDEX.sync(
+        (doc_id, _runbook_search_fields(playbook))
+        for doc_id, playbook in documents.items()
+    )
+    logging.info(
+        f"📚 RUNBOOKS API: Search index updated - {added} indexed, {removed} removed, {len(RUNBOOK_INDEX)} total"
+    )
+
+    return {
+        "playbooks": playbooks,
+        "by_id": {playbook.get("id"): playbook for playbook in reversed(playbooks)},
+        "documents": documents,
+    }
+
+
+PLAYBOOKS = DataFile(DATA_PATH / "incident_playbooks.json", _load_playbooks)
+TROUBLESHOOTING_GUIDES = DataFile(DATA_PATH / "troubleshooting_guides.json", load_json)
+ESCALATION_PROCEDURES = DataFile(DATA_PATH / "escalation_procedures.json", load_json)
+COMMON_RESOLUTIONS = DataFile(DATA_PATH / "common_resolutions.json", load_json)
+
+
 @app.get("/runbooks/search")
 async def search_runbooks(
     incident_type: Optional[str] = Query(
@@ -58,7 +132,12 @@ async def search_runbooks(
         description="Type of incident",
     ),
     keyword: Optional[str] = Query(
-        None, description="Search keyword in runbook content"
+        None,
+        description=(
+            "Search keywords in runbook content. Results contain every word "
+            "(partial words match as prefixes) and are ranked by relevance; "
+            'wrap words in double quotes to require an exact phrase, e.g. "out of memory"'
+        ),
     ),
     severity: Optional[str] = Query(
         None,
@@ -73,57 +152,62 @@ async def search_runbooks(
             f"🔍 RUNBOOKS API: search_runbooks called - incident_type={incident_type}, keyword={keyword}, severity={severity}"
         )
 
-        with open(DATA_PATH / "incident_playbooks.json", "r") as f:
-            data = json.load(f)
+        data = PLAYBOOKS.get()
+        original_count = len(data["playbooks"])
 
-        runbooks = data.get("playbooks", [])
-        original_count = len(runbooks)
+        def _matches_filters(runbook: Dict[str, Any]) -> bool:
+            if incident_type and runbook.get("incident_type") != incident_type:
+                return False
+            if severity and runbook.get("severity") != severity:
+                return False
+            return True
 
-        if incident_type:
-            runbooks = [r for r in runbooks if r.get("incident_type") == incident_type]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by incident_type '{incident_type}': {len(runbooks)} runbooks"
-            )
+        runbooks = []
+        if keyword:
+            # Ranked by relevance rather than file order
+            documents = data["documents"]
+            phrases = quoted_phrases(keyword)
+
+            def _accept(doc_id: str) -> bool:
+                runbook = documents.get(doc_id)
+                if runbook is None:
+                    # Indexed by a newer reload than the documents this request holds
+                    return False
+                return _matches_filters(runbook) and all(
+                    _contains_text(runbook, phrase) for phrase in phrases
+                )
 
-        if severity:
-            runbooks = [r for r in runbooks if r.get("severity") == severity]
+            ranked = RUNBOOK_INDEX.search(
+                keyword, limit=MAX_SEARCH_RESULTS, accept=_accept
+            )
+            runbooks = [documents[doc_id] for doc_id, _ in ranked]
             logging.info(
-                f"📋 RUNBOOKS API: Filtered by severity '{severity}': {len(runbooks)} runbooks"
+                f"📋 RUNBOOKS API: Ranked by keyword '{keyword}' (incident_type={incident_type}, severity={severity}): {len(runbooks)} runbooks"
             )
 
-        if keyword:
+        if keyword and not runbooks:
+            # Keywords the index cannot match (e.g. "->" or part of a word) fall
+            # back to a substring scan
             runbooks = [
                 r
-                for r in runbooks
-                if keyword.lower() in r.get("title", "").lower()
-                or keyword.lower() in r.get("description", "").lower()
-                or any(keyword.lower() in step.lower() for step in r.get("steps", []))
-            ]
+                for r in data["playbooks"]
+                if _matches_filters(r) and _contains_text(r, keyword)
+            ][:MAX_SEARCH_RESULTS]
             logging.info(
-                f"📋 RUNBOOKS API: Filtered by keyword '{keyword}': {len(runbooks)} runbooks"
+                f"📋 RUNBOOKS API: Filtered by keyword substring '{keyword}': {len(runbooks)} runbooks"
             )
-
-        response_data = {"runbooks": runbooks}
-
-        # Log detailed response
-        logging.info(
-            f"📤 RUNBOOKS API: Returning {len(runbooks)} runbooks out of {original_count} total"
-        )
-        for i, runbook in enumerate(runbooks):
+        elif not keyword:
+            runbooks = [r for r in data["playbooks"] if _matches_filters(r)][
+                :MAX_SEARCH_RESULTS
+            ]
             logging.info(
-                f"  📖 Runbook {i + 1}: {runbook.get('title', 'No title')} (ID: {runbook.get('id', 'No ID')})"
+                f"📋 RUNBOOKS API: Filtered by incident_type={incident_type}, severity={severity}: {len(runbooks)} runbooks"
             )
-            steps = runbook.get("steps", [])
-            logging.info(f"     Steps count: {len(steps)}")
-            for j, step in enumerate(steps[:3]):  # Show first 3 steps for brevity
-                logging.info(f"     Step {j + 1}: {step}")
-            if len(steps) > 3:
-                logging.info(f"     ... and {len(steps) - 3} more steps")
 
         logging.info(
-            f"📋 RUNBOOKS API: Full response data: {json.dumps(response_data, indent=2)}"
+            f"📤 RUNBOOKS API: Returning {len(runbooks)} runbooks out of {original_count} total"
         )
-        return response_data
+        return {"runbooks": runbooks}
     except Exception as e:
         logging.error(f"❌ Error searching runbooks: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -140,25 +224,20 @@ async def get_incident_playbook(
             f"🔍 RUNBOOKS API: get_incident_playbook called for playbook_id='{playbook_id}'"
         )
 
-        with open(DATA_PATH / "incident_playbooks.json", "r") as f:
-            data = json.load(f)
-
-        playbooks = data.get("playbooks", [])
-
-        for playbook in playbooks:
-            if playbook.get("id") == playbook_id:
-                logging.info(
-                    f"📖 RUNBOOKS API: Found playbook '{playbook.get('title', 'No title')}'"
-                )
-                steps = playbook.get("steps", [])
-                logging.info(f"📝 RUNBOOKS API: Playbook has {len(steps)} steps:")
-                for i, step in enumerate(steps):
-                    logging.info(f"   Step {i + 1}: {step}")
+        playbook = PLAYBOOKS.get()["by_id"].get(playbook_id)
+        if playbook is not None:
+            logging.info(
+                f"📖 RUNBOOKS API: Found playbook '{playbook.get('title', 'No title')}'"
+            )
+            steps = playbook.get("steps", [])
+            logging.info(f"📝 RUNBOOKS API: Playbook has {len(steps)} steps:")
+            for i, step in enumerate(steps):
+                logging.info(f"   Step {i + 1}: {step}")
 
-                logging.info(
-                    f"📤 RUNBOOKS API: Returning complete playbook data: {json.dumps(playbook, indent=2)}"
-                )
-                return playbook
+            logging.info(
+                f"📤 RUNBOOKS API: Returning complete playbook data: {json.dumps(playbook, indent=2)}"
+            )
+            return playbook
 
         logging.warning(f"❌ RUNBOOKS API: Playbook '{playbook_id}' not found")
         return JSONResponse(status_code=404, content={"error": "Playbook not found"})
@@ -183,8 +262,7 @@ async def get_troubleshooting_guide(
             f"🔍 RUNBOOKS API: get_troubleshooting_guide called - category={category}, issue_type={issue_type}"
         )
 
-        with open(DATA_PATH / "troubleshooting_guides.json", "r") as f:
-            data = json.load(f)
+        data = TROUBLESHOOTING_GUIDES.get()
 
         guides = data.get("guides", [])
         original_count = len(guides)
@@ -244,8 +322,7 @@ async def get_escalation_procedures(
 ):
     """Retrieve escalation procedures"""
     try:
-        with open(DATA_PATH / "escalation_procedures.json", "r") as f:
-            data = json.load(f)
+        data = ESCALATION_PROCEDURES.get()
 
         procedures = data.get("escalation_procedures", [])
 
@@ -281,8 +358,7 @@ async def get_common_resolutions(
             f"🔍 RUNBOOKS API: get_common_resolutions called - issue='{issue}', service={service}"
         )
 
-        with open(DATA_PATH / "common_resolutions.json", "r") as f:
-            data = json.load(f)
+        data = COMMON_RESOLUTIONS.get()
 
         resolutions = data.get("resolutions", [])
         original_count = len(resolutions)
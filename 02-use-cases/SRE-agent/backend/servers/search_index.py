@@ -0,0 +1,294 @@
+"""
+In-memory inverted index with BM25 ranking for the stub backend servers.
+
+Documents are split into weighted fields (for example a runbook's title,
+steps and service) and scored with a field-weighted BM25 variant: each
+field's term frequency is length-normalised against that field's average
+length, multiplied by the field boost, and the weighted sum is saturated
+once per term. Query cost depends on the postings of the query terms, not
+on the size of the corpus.
+
+The index is updated incrementally: `sync` compares a fresh set of
+documents against what is already indexed and only adds, replaces or
+removes the documents that changed.
+"""
+
+import hashlib
+import heapq
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+FieldValue = Union[str, Sequence[str], None]
+
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+_PHRASE_RE = re.compile(r'"([^"]*)"')
+_CAMEL_PART_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+# Upper bound on vocabulary terms a single unmatched query term expands to
+MAX_PREFIX_EXPANSIONS = 50
+
+
+def tokenize(text: str, split_compound: bool = True) -> List[str]:
+    """
+    Split text into lowercase alphanumeric tokens.
+
+    With split_compound, identifiers such as `OutOfMemoryError` also emit
+    their parts (`out`, `of`, `memory`, `error`) so a query for one part
+    still matches.
+    """
+    tokens = []
+    for word in _WORD_RE.findall(text):
+        tokens.append(word.lower())
+        if split_compound and not word.islower() and not word.isupper():
+            parts = _CAMEL_PART_RE.findall(word)
+            if len(parts) > 1:
+                tokens.extend(part.lower() for part in parts)
+    return tokens
+
+
+def quoted_phrases(query: str) -> List[str]:
+    """
+    Return the double-quoted phrases in a query.
+
+    The index matches single terms, so callers check phrases against the
+    document text themselves, e.g. through search()'s accept predicate.
+    """
+    return [phrase.strip() for phrase in _PHRASE_RE.findall(query) if phrase.strip()]
+
+
+def _field_text(value: FieldValue) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return "\n".join(str(item) for item in value)
+
+
+class SearchIndex:
+    """
+    Inverted index over documents made of named, boosted text fields.
+
+    Args:
+        field_boosts: Field name to boost; only these fields are indexed
+        k1: BM25 term-frequency saturation
+        b: BM25 length normalisation (0 disables it)
+    """
+
+    def __init__(
+        self, field_boosts: Dict[str, float], k1: float = 1.2, b: float = 0.75
+    ):
+        self.fields = list(field_boosts)
+        self.boosts = [field_boosts[name] for name in self.fields]
+        self.k1 = k1
+        self.b = b
+        # term -> doc_id -> per-field term frequencies
+        self._postings: Dict[str, Dict[Hashable, List[int]]] = {}
+        self._doc_lengths: Dict[Hashable, List[int]] = {}
+        self._doc_terms: Dict[Hashable, Tuple[str, ...]] = {}
+        self._doc_signatures: Dict[Hashable, str] = {}
+        # Insertion sequence, used to break score ties in a stable order
+        self._doc_sequence: Dict[Hashable, int] = {}
+        self._next_sequence = 0
+        self._field_totals = [0] * len(self.fields)
+        # Sorted terms for prefix lookups, rebuilt lazily after the vocabulary changes
+        self._vocabulary: List[str] = []
+        self._vocabulary_stale = False
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._doc_lengths
+
+    @staticmethod
+    def _signature(texts: List[str]) -> str:
+        return hashlib.sha1("\x1f".join(texts).encode("utf-8")).hexdigest()
+
+    def _texts(self, fields: Dict[str, FieldValue]) -> List[str]:
+        return [_field_text(fields.get(name)) for name in self.fields]
+
+    def add(self, doc_id: Hashable, fields: Dict[str, FieldValue]) -> None:
+        """Index a document, replacing any previous version with the same id"""
+        texts = self._texts(fields)
+        with self._lock:
+            self._add(doc_id, texts, self._signature(texts))
+
+    def _add(self, doc_id: Hashable, texts: List[str], signature: str) -> None:
+        sequence = self._doc_sequence.get(doc_id)
+        if doc_id in self._doc_lengths:
+            self._remove(doc_id)
+        if sequence is None:
+            sequence = self._next_sequence
+            self._next_sequence += 1
+
+        lengths = []
+        frequencies: Dict[str, List[int]] = {}
+        for position, text in enumerate(texts):
+            tokens = tokenize(text)
+            lengths.append(len(tokens))
+            self._field_totals[position] += len(tokens)
+            for token, count in Counter(tokens).items():
+                counts = frequencies.get(token)
+                if counts is None:
+                    counts = frequencies[token] = [0] * len(self.fields)
+                counts[position] = count
+
+        for term, counts in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary_stale = True
+            postings[doc_id] = counts
+
+        self._doc_lengths[doc_id] = lengths
+        self._doc_terms[doc_id] = tuple(frequencies)
+        self._doc_signatures[doc_id] = signature
+        self._doc_sequence[doc_id] = sequence
+
+    def remove(self, doc_id: Hashable) -> None:
+        """Drop a document from the index if it is present"""
+        with self._lock:
+            if doc_id in self._doc_lengths:
+                self._remove(doc_id)
+
+    def _remove(self, doc_id: Hashable) -> None:
+        for position, length in enumerate(self._doc_lengths.pop(doc_id)):
+            self._field_totals[position] -= length
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_stale = True
+        del self._doc_signatures[doc_id]
+        del self._doc_sequence[doc_id]
+
+    def sync(
+        self, documents: Iterable[Tuple[Hashable, Dict[str, FieldValue]]]
+    ) -> Tuple[int, int]:
+        """
+        Make the index contain exactly `documents`, touching only what changed.
+
+        Returns:
+            (documents added or replaced, documents removed)
+        """
+        with self._lock:
+            seen = set()
+            changed = 0
+            for doc_id, fields in documents:
+                seen.add(doc_id)
+                texts = self._texts(fields)
+                signature = self._signature(texts)
+                if self._doc_signatures.get(doc_id) != signature:
+                    self._add(doc_id, texts, signature)
+                    changed += 1
+            stale = [doc_id for doc_id in self._doc_lengths if doc_id not in seen]
+            for doc_id in stale:
+                self._remove(doc_id)
+            return changed, len(stale)
+
+    def _expand(self, term: str) -> List[str]:
+        """The term itself if indexed, otherwise indexed terms it is a prefix of"""
+        if term in self._postings:
+            return [term]
+        if self._vocabulary_stale:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_stale = False
+        start = bisect_left(self._vocabulary, term)
+        expansions = []
+        for candidate in self._vocabulary[start : start + MAX_PREFIX_EXPANSIONS]:
+            if not candidate.startswith(term):
+                break
+            expansions.append(candidate)
+        return expansions
+
+    def _term_scores(self, term: str) -> Dict[Hashable, float]:
+        postings = self._postings[term]
+        doc_count = len(self._doc_lengths)
+        idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+        averages = [
+            total / doc_count if doc_count else 0.0 for total in self._field_totals
+        ]
+
+        scores = {}
+        for doc_id, counts in postings.items():
+            lengths = self._doc_lengths[doc_id]
+            weighted_tf = 0.0
+            for position, count in enumerate(counts):
+                if not count:
+                    continue
+                norm = 1.0
+                if averages[position]:
+                    norm = 1 - self.b + self.b * lengths[position] / averages[position]
+                weighted_tf += self.boosts[position] * count / norm
+            scores[doc_id] = idf * weighted_tf / (self.k1 + weighted_tf)
+        return scores
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        accept: Optional[Callable[[Hashable], bool]] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Rank documents containing every query term.
+
+        A query term that is not in the vocabulary matches the indexed terms
+        it is a prefix of, so partial words still find results.
+
+        Args:
+            query: Free-text query
+            limit: Maximum results to return (all matches when None)
+            accept: Optional predicate on doc_id applied before ranking
+
+        Returns:
+            (doc_id, score) pairs, best first; ties keep insertion order
+        """
+        terms = list(dict.fromkeys(tokenize(query, split_compound=False)))
+        if not terms:
+            return []
+
+        with self._lock:
+            per_term = []
+            for term in terms:
+                combined: Dict[Hashable, float] = {}
+                for expansion in self._expand(term):
+                    for doc_id, score in self._term_scores(expansion).items():
+                        combined[doc_id] = combined.get(doc_id, 0.0) + score
+                if not combined:
+                    return []
+                per_term.append(combined)
+            order = self._doc_sequence
+
+        # Intersect starting from the rarest term
+        per_term.sort(key=len)
+        totals = {
+            doc_id: score
+            for doc_id, score in per_term[0].items()
+            if accept is None or accept(doc_id)
+        }
+        for scores in per_term[1:]:
+            totals = {
+                doc_id: total + scores[doc_id]
+                for doc_id, total in totals.items()
+                if doc_id in scores
+            }
+
+        ranked = ((-score, order[doc_id], doc_id) for doc_id, score in totals.items())
+        best = heapq.nsmallest(limit, ranked) if limit is not None else sorted(ranked)
+        return [(doc_id, -neg_score) for neg_score, _, doc_id in best]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark conversation-state persistence for long interactive sessions.
+
+Compares the previous approach (re-serializing the whole history and
+rewriting an indented JSON file on every save) with the append-only
+conversation journal, for one save after a turn and for resuming a session.
+
+Usage:
+    uv run python scripts/benchmark_conversation_state.py [--messages 10000] [--turns 20]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+# Add the project root to path so we can import sre_agent
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sre_agent.conversation_journal import ConversationJournal  # noqa: E402
+
+
+def _turn(index: int) -> list:
+    return [
+        HumanMessage(content=f"Why is the payment-service pod restarting? ({index})"),
+        AIMessage(
+            content=f"Investigation {index}: the pod was OOMKilled after memory "
+            "usage grew past its 512Mi limit. " * 8
+        ),
+    ]
+
+
+def _legacy_save(messages: list, path: Path) -> None:
+    """The previous _save_conversation_state: full model_dump and indented rewrite."""
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "messages": [message.model_dump() for message in messages],
+                "state": {},
+                "timestamp": time.time(),
+            },
+            f,
+            indent=2,
+        )
+
+
+def _legacy_load(path: Path) -> list:
+    with open(path) as f:
+        return json.load(f)["messages"]
+
+
+def _timed(func, *args) -> float:
+    started = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Conversation state benchmark")
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument(
+        "--turns", type=int, default=20, help="Turns saved and timed after the session"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / "state.json"
+        journal_path = Path(tmp) / "state.jsonl"
+
+        # Build the journal the way a session does: one append per turn
+        journal = ConversationJournal(str(journal_path))
+        history = []
+        started = time.perf_counter()
+        for index in range(args.messages // 2):
+            history.extend(_turn(index))
+            journal.save(history, {})
+        build_seconds = time.perf_counter() - started
+        _legacy_save(history, legacy_path)
+
+        legacy_saves, journal_saves = [], []
+        messages = list(history)
+        for index in range(args.turns):
+            messages.extend(_turn(args.messages + index))
+            legacy_saves.append(_timed(_legacy_save, messages, legacy_path))
+            journal_saves.append(_timed(journal.save, messages, {}))
+
+        legacy_resume = _timed(_legacy_load, legacy_path)
+        resumed = ConversationJournal(str(journal_path))
+        journal_resume = _timed(resumed.load)
+
+        print(f"Session of {len(messages)} messages")
+        print(
+            f"  journal built turn by turn in {build_seconds:.2f}s "
+            f"({build_seconds / (len(history) // 2) * 1000:.3f} ms/turn)"
+        )
+        print(
+            f"  file size: legacy {legacy_path.stat().st_size / 1e6:.1f} MB, "
+            f"journal {journal_path.stat().st_size / 1e6:.1f} MB"
+        )
+        print(f"{'':<24} {'legacy ms':>10} {'journal ms':>11}")
+        print(
+            f"{'save one turn (median)':<24} {statistics.median(legacy_saves):>10.2f} "
+            f"{statistics.median(journal_saves):>11.2f}"
+        )
+        print(f"{'resume':<24} {legacy_resume:>10.2f} {journal_resume:>11.2f}")
+        print(
+            f"  journal resumed the latest {resumed.resume_messages} messages; "
+            "the full history stays on disk"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
@@ -154,7 +155,13 @@ class BaseAgentNode:
             return "unknown"
 
     async def __call__(self, state: AgentState) -> Dict[str, Any]:
-        """Process the current state and return updated state."""
+        """Process the current state and return updated state.
+
+        Only this agent's own entries are returned for agent_results,
+        agents_invoked and metadata; the state reducers merge them, which lets
+        the supervisor run independent agents in parallel.
+        """
+        started = time.monotonic()
         try:
             # Get the last user message
             messages = state["messages"]
@@ -178,7 +185,11 @@ class BaseAgentNode:
             if user_id:
                 try:
                     # Get region from llm_kwargs if available
-                    region = self.llm_kwargs.get("region_name", "us-east-1") if self.llm_provider == "bedrock" else "us-east-1"
+                    region = (
+                        self.llm_kwargs.get("region_name", "us-east-1")
+                        if self.llm_provider == "bedrock"
+                        else "us-east-1"
+                    )
                     memory_client = SREMemoryClient(region=region)
                     conversation_manager = create_conversation_memory_manager(
                         memory_client
@@ -378,7 +389,11 @@ class BaseAgentNode:
 
                     # Use the SREMemoryClient that's already imported at the top
                     # Get region from llm_kwargs if available
-                    region = self.llm_kwargs.get("region_name", "us-east-1") if self.llm_provider == "bedrock" else "us-east-1"
+                    region = (
+                        self.llm_kwargs.get("region_name", "us-east-1")
+                        if self.llm_provider == "bedrock"
+                        else "us-east-1"
+                    )
                     memory_client = SREMemoryClient(region=region)
                     memory_hooks = MemoryHookProvider(memory_client)
 
@@ -395,9 +410,13 @@ class BaseAgentNode:
                         ],
                     }
 
-                    # Call on_agent_response hook to extract patterns
-                    memory_hooks.on_agent_response(
-                        agent_name=self.name, response=response_obj, state=state
+                    # Call on_agent_response hook to extract patterns; it saves
+                    # events through the blocking memory API, so run it off the loop
+                    await asyncio.to_thread(
+                        memory_hooks.on_agent_response,
+                        agent_name=self.name,
+                        response=response_obj,
+                        state=state,
                     )
 
                     logger.info(
@@ -409,16 +428,19 @@ class BaseAgentNode:
                         f"{self.name} - Failed to process agent response for memory patterns: {e}"
                     )
 
+            elapsed = time.monotonic() - started
+            logger.info(f"{self.name} - Finished in {elapsed:.2f}s")
+            # A plan may invoke the same agent more than once
+            previous = state.get("agent_timings", {}).get(self.name, 0.0)
+            total_elapsed = previous + elapsed
+
             # Update state with streaming info
             return {
-                "agent_results": {
-                    **state.get("agent_results", {}),
-                    self.name: agent_response,
-                },
-                "agents_invoked": state.get("agents_invoked", []) + [self.name],
+                "agent_results": {self.name: agent_response},
+                "agents_invoked": [self.name],
+                "agent_timings": {self.name: round(total_elapsed, 3)},
                 "messages": messages + all_messages,
                 "metadata": {
-                    **state.get("metadata", {}),
                     f"{self.name.replace(' ', '_')}_trace": all_messages,
                 },
             }
@@ -426,11 +448,9 @@ class BaseAgentNode:
         except Exception as e:
             logger.error(f"Error in {self.name}: {e}")
             return {
-                "agent_results": {
-                    **state.get("agent_results", {}),
-                    self.name: f"Error: {str(e)}",
-                },
-                "agents_invoked": state.get("agents_invoked", []) + [self.name],
+                "agent_results": {self.name: f"Error: {str(e)}"},
+                "agents_invoked": [self.name],
+                "agent_timings": {self.name: round(time.monotonic() - started, 3)},
             }
 
 
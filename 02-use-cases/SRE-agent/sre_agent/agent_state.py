@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import logging
+import operator
 from typing import Annotated, Any, Dict, List, Literal, Optional, TypedDict
 
 from langchain_core.messages import BaseMessage
@@ -16,6 +17,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _merge_dicts(
+    left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Merge a node's dict update into the state.
+
+    Agents dispatched in parallel each return only their own entries, so
+    updates are merged key by key instead of replacing the whole dict.
+    """
+    return {**(left or {}), **(right or {})}
+
+
 class AgentState(TypedDict):
     """State shared across all agents in the multi-agent system.
 
@@ -29,20 +41,26 @@ class AgentState(TypedDict):
     # Which agent should act next (set by supervisor)
     next: Literal["kubernetes", "logs", "metrics", "runbooks", "FINISH"]
 
+    # Agents to run concurrently in the next step (parallel plan execution only)
+    next_agents: Optional[List[str]]
+
     # Intermediate results from each agent
-    agent_results: Dict[str, Any]
+    agent_results: Annotated[Dict[str, Any], _merge_dicts]
 
     # Current query being processed
     current_query: Optional[str]
 
     # Metadata about the conversation
-    metadata: Dict[str, Any]
+    metadata: Annotated[Dict[str, Any], _merge_dicts]
 
     # Flag to indicate if we need multiple agents
     requires_collaboration: bool
 
     # List of agents that have already responded
-    agents_invoked: List[str]
+    agents_invoked: Annotated[List[str], operator.add]
+
+    # Seconds each agent spent on its LLM and tool calls
+    agent_timings: Annotated[Dict[str, float], _merge_dicts]
 
     # Final aggregated response (set by supervisor)
     final_response: Optional[str]
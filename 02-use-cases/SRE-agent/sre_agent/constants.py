@@ -151,8 +151,20 @@ class ApplicationConfig(BaseModel):
     )
 
     conversation_state_file: str = Field(
-        default=".multi_agent_conversation_state.json",
-        description="Filename for saving conversation state",
+        default=".multi_agent_conversation_state.jsonl",
+        description="Filename for saving conversation state (append-only JSON Lines journal)",
+    )
+
+    conversation_resume_messages: int = Field(
+        default=200,
+        ge=1,
+        description="Most recent messages restored when resuming a saved conversation",
+    )
+
+    conversation_compact_min_bytes: int = Field(
+        default=1_000_000,
+        ge=0,
+        description="Bytes of cleared conversation history in the journal before it is compacted",
     )
 
     spinner_chars: list[str] = Field(
@@ -161,6 +173,42 @@ class ApplicationConfig(BaseModel):
     )
 
 
+class PlanExecutionConfig(BaseModel):
+    """Investigation plan execution constants."""
+
+    parallel_execution: bool = Field(
+        default=False,
+        description="Run plan steps with no dependency on each other concurrently",
+    )
+
+    max_parallel_agents: int = Field(
+        default=4,
+        ge=1,
+        le=4,
+        description="Maximum number of agents dispatched at the same time",
+    )
+
+    follow_up_agents: list[str] = Field(
+        default=["runbooks_agent"],
+        description="Agents that build on the findings of every earlier plan step",
+    )
+
+    dependency_markers: list[str] = Field(
+        default=[
+            "based on",
+            "findings",
+            "identified",
+            "previous",
+            "results from",
+            "correlate",
+            "root cause",
+            "after ",
+            "then ",
+        ],
+        description="Phrases in a step description that make it wait for earlier steps",
+    )
+
+
 class AgentMetadata(BaseModel):
     """Metadata for a single agent."""
 
@@ -201,6 +249,19 @@ class MemoryConfig(BaseModel):
         description="Maximum number of past investigation memories to retrieve",
     )
 
+    # Retrieval cache (per memory client, i.e. per interactive session)
+    retrieval_cache_ttl_seconds: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds a retrieve_memories result is reused for the same actor, namespace and query (0 disables the cache)",
+    )
+
+    retrieval_cache_max_entries: int = Field(
+        default=256,
+        ge=0,
+        description="Maximum number of cached memory retrievals per session",
+    )
+
     # Content length limits for memory storage
     max_content_length: int = Field(
         default=9000,
@@ -300,6 +361,9 @@ class SREConstants:
 
         # Access application configuration
         output_dir = SREConstants.app.default_output_dir
+
+        # Access plan execution configuration
+        parallel = SREConstants.plan_execution.parallel_execution
     """
 
     model: ModelConfig = ModelConfig()
@@ -309,6 +373,7 @@ class SREConstants:
     app: ApplicationConfig = ApplicationConfig()
     agents: AgentsConstant = AgentsConstant()
     memory: MemoryConfig = MemoryConfig()
+    plan_execution: PlanExecutionConfig = PlanExecutionConfig()
 
     @classmethod
     def get_model_config(cls, provider: str, **kwargs) -> dict:
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Append-only journal for interactive conversation state.
+
+The journal is a JSON Lines file. Each save appends only the messages added
+since the previous save (and the session state when it changed) instead of
+rewriting the whole history. Three record types are used:
+
+    {"type": "reset", "state": {...}, "timestamp": "..."}   start of a conversation
+    {"type": "message", "role": "user", "content": "..."}
+    {"type": "state", "state": {...}}                       replaces the state
+
+Resuming reads the file backwards from the end and stops once it has the most
+recent `resume_messages` messages and the current state, so resume time does
+not depend on how long the session has been running. Records before the last
+`reset` (left by /clear) are dropped by compaction.
+
+A `.json` state file written before the journal existed is migrated into the
+journal the first time it is loaded.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .constants import SREConstants
+
+logger = logging.getLogger(__name__)
+
+_READ_BLOCK_SIZE = 64 * 1024
+
+# LangChain message types and the roles the interactive session restores
+_ROLE_BY_MESSAGE_TYPE = {"human": "user", "ai": "assistant"}
+
+
+def _message_record(message: Any) -> Dict[str, Any]:
+    """Serialize a LangChain message (or a role/content dict) to a journal record."""
+    if isinstance(message, dict):
+        role = message.get("role") or _ROLE_BY_MESSAGE_TYPE.get(
+            message.get("type"), "unknown"
+        )
+        content = message.get("content", "")
+    elif hasattr(message, "content"):
+        message_type = getattr(message, "type", None)
+        role = _ROLE_BY_MESSAGE_TYPE.get(message_type) or getattr(
+            message, "role", message_type or "unknown"
+        )
+        content = message.content
+    else:
+        role, content = "unknown", str(message)
+    return {"type": "message", "role": role, "content": content}
+
+
+def _serializable_state(state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Keep JSON-friendly state values, stringifying the rest."""
+    serializable = {}
+    if isinstance(state, dict):
+        for key, value in state.items():
+            if key == "messages":
+                continue  # Journaled as message records
+            if isinstance(value, (str, int, float, bool, list, dict, type(None))):
+                serializable[key] = value
+            else:
+                serializable[key] = str(value)
+    return serializable
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _reverse_lines(f, file_size: int) -> Iterator[Tuple[int, bytes]]:
+    """Yield (offset, line) pairs from the end of a binary file backwards."""
+    position = file_size
+    remainder = b""
+    while position > 0:
+        read = min(_READ_BLOCK_SIZE, position)
+        position -= read
+        f.seek(position)
+        block = f.read(read) + remainder
+        lines = block.split(b"\n")
+        # The first piece may continue in the previous block
+        remainder = lines.pop(0)
+        offset = position + len(remainder) + 1
+        starts = []
+        for line in lines:
+            starts.append(offset)
+            offset += len(line) + 1
+        for start, line in zip(reversed(starts), reversed(lines)):
+            yield start, line
+    if remainder:
+        yield 0, remainder
+
+
+class ConversationJournal:
+    """Incrementally persisted conversation history for one state file.
+
+    Args:
+        path: Journal file
+        resume_messages: Most recent messages restored by load()
+        compact_min_bytes: Dead bytes (before the last reset) that trigger compaction
+    """
+
+    def __init__(
+        self,
+        path: str,
+        resume_messages: int = SREConstants.app.conversation_resume_messages,
+        compact_min_bytes: int = SREConstants.app.conversation_compact_min_bytes,
+    ):
+        self.path = Path(path)
+        self.resume_messages = resume_messages
+        self.compact_min_bytes = compact_min_bytes
+        # Whether this process knows which messages of the live list are on disk
+        self._synced = False
+        self._persisted = 0
+        self._last_message: Optional[Dict[str, Any]] = None
+        self._state: Dict[str, Any] = {}
+        self._reset_offset: Optional[int] = None
+        self._size = 0
+        # Records since the last full state, bounding how far load() reads back
+        self._records_since_state = 0
+        self._tail_checked = False
+
+    def _file_size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def load(self) -> Tuple[Optional[List[Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        """Load the most recent messages and the current state.
+
+        Returns:
+            (messages as role/content dicts, state), or (None, None) if there
+            is no journal
+        """
+        if not self.path.exists() and not self._migrate_legacy_state():
+            return None, None
+
+        size = self._file_size()
+        newest_first: List[Dict[str, Any]] = []
+        state: Optional[Dict[str, Any]] = None
+        reset_offset = None
+        records_after_state = 0
+        truncated = False
+        with open(self.path, "rb") as f:
+            for offset, line in _reverse_lines(f, size):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final line from an interrupted write
+                    logger.warning(
+                        f"Skipping unreadable record at byte {offset} of {self.path}"
+                    )
+                    continue
+                kind = record.get("type")
+                if kind == "message":
+                    if len(newest_first) >= self.resume_messages:
+                        truncated = True
+                    else:
+                        newest_first.append(
+                            {
+                                "role": record.get("role"),
+                                "content": record.get("content", ""),
+                            }
+                        )
+                    if state is None:
+                        records_after_state += 1
+                elif kind == "state" and state is None:
+                    state = record.get("state", {})
+                elif kind == "reset":
+                    if state is None:
+                        state = record.get("state", {})
+                    reset_offset = offset
+                    break
+                if state is not None and truncated:
+                    break
+
+        messages = list(reversed(newest_first))
+        self._synced = True
+        self._persisted = len(messages)
+        self._last_message = _message_record(messages[-1]) if messages else None
+        self._state = state or {}
+        self._reset_offset = reset_offset
+        self._size = size
+        self._records_since_state = records_after_state
+        if truncated:
+            logger.info(
+                f"Conversation journal {self.path} has more than {self.resume_messages} "
+                f"messages; resuming with the most recent {self.resume_messages}"
+            )
+        logger.info(
+            f"Loaded {len(messages)} most recent messages from conversation journal {self.path}"
+        )
+        self._maybe_compact()
+        return messages, self._state
+
+    def _migrate_legacy_state(self) -> bool:
+        """Convert the JSON state file used before the journal, if there is one.
+
+        The legacy file is left in place; once the journal exists it is no
+        longer read.
+
+        Returns:
+            True if a journal was written
+        """
+        legacy_path = self.path.with_suffix(".json")
+        if self.path.suffix != ".jsonl" or not legacy_path.exists():
+            return False
+        try:
+            with open(legacy_path, "r") as f:
+                data = json.load(f)
+            messages = data.get("messages") or []
+            records = [
+                {
+                    "type": "reset",
+                    "state": _serializable_state(data.get("state")),
+                    "timestamp": data.get("timestamp") or datetime.now().isoformat(),
+                }
+            ]
+            records.extend(_message_record(message) for message in messages)
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(
+                f"Could not migrate legacy conversation state {legacy_path}: {e}"
+            )
+            return False
+
+        temp_path = self.path.with_name(self.path.name + ".migrate")
+        with open(temp_path, "wb") as f:
+            f.writelines(_encode(record) for record in records)
+        os.replace(temp_path, self.path)
+        logger.info(
+            f"Migrated {len(messages)} messages from {legacy_path} to conversation journal {self.path}"
+        )
+        return True
+
+    def save(self, messages: List[Any], state: Optional[Dict[str, Any]] = None) -> int:
+        """Append whatever changed since the last save or load.
+
+        If `messages` no longer extends what was persisted (after /clear, or
+        on the first save in a process that did not load the journal) a reset
+        record starts a new conversation and the whole list is written.
+
+        Returns:
+            Number of records appended
+        """
+        serializable_state = _serializable_state(state)
+        persisted = self._persisted
+        diverged = (
+            not self._synced
+            or len(messages) < persisted
+            or (
+                persisted
+                and _message_record(messages[persisted - 1]) != self._last_message
+            )
+        )
+
+        records = []
+        if diverged:
+            records.append(
+                {
+                    "type": "reset",
+                    "state": serializable_state,
+                    "timestamp": datetime.now().isoformat(),
+                }
+            )
+            new_messages = messages
+        else:
+            new_messages = messages[persisted:]
+            if (
+                serializable_state != self._state
+                or self._records_since_state + len(new_messages) >= self.resume_messages
+            ):
+                # Re-emitting the state keeps load() from reading far back for it
+                records.append({"type": "state", "state": serializable_state})
+        message_records = [_message_record(message) for message in new_messages]
+        records.extend(message_records)
+
+        if not records:
+            return 0
+
+        if not self._synced:
+            self._size = self._file_size()
+        payload = b"".join(_encode(record) for record in records)
+        with open(self.path, "ab") as f:
+            if not self._tail_checked:
+                self._tail_checked = True
+                if self._size and not self._ends_with_newline():
+                    # Don't glue the first record onto a torn line
+                    f.write(b"\n")
+                    self._size += 1
+            f.write(payload)
+
+        if diverged:
+            self._reset_offset = self._size
+        if records[0]["type"] != "message":
+            self._records_since_state = len(message_records)
+        else:
+            self._records_since_state += len(message_records)
+        self._size += len(payload)
+        self._synced = True
+        self._persisted = len(messages)
+        if message_records:
+            self._last_message = message_records[-1]
+        self._state = serializable_state
+        logger.debug(f"Appended {len(records)} records to {self.path}")
+
+        self._maybe_compact()
+        return len(records)
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _maybe_compact(self) -> None:
+        dead_bytes = self._reset_offset or 0
+        if (
+            dead_bytes >= self.compact_min_bytes
+            and dead_bytes >= self._size - dead_bytes
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the journal as one reset record plus the live messages.
+
+        Drops conversations cleared before the last reset and superseded state
+        records. The new file replaces the old one atomically.
+        """
+        if not self.path.exists():
+            return
+        if self._reset_offset is None:
+            # Locate the last reset with a full forward pass
+            self._reset_offset = 0
+            with open(self.path, "rb") as f:
+                offset = 0
+                for line in f:
+                    if line.startswith(b'{"type": "reset"'):
+                        self._reset_offset = offset
+                    offset += len(line)
+
+        temp_path = self.path.with_name(self.path.name + ".compact")
+        state: Dict[str, Any] = {}
+        message_count = 0
+        with open(self.path, "rb") as source, open(temp_path, "wb") as target:
+            source.seek(self._reset_offset)
+            message_lines = []
+            for line in source:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("type") in ("reset", "state"):
+                    state = record.get("state", {})
+                elif record.get("type") == "message":
+                    message_lines.append(line if line.endswith(b"\n") else line + b"\n")
+            target.write(
+                _encode(
+                    {
+                        "type": "reset",
+                        "state": state,
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                )
+            )
+            target.writelines(message_lines)
+            message_count = len(message_lines)
+            if message_count >= self.resume_messages:
+                # Keep the state within load()'s backwards read
+                target.write(_encode({"type": "state", "state": state}))
+                message_count = 0
+        old_size = self._file_size()
+        os.replace(temp_path, self.path)
+
+        self._size = self._file_size()
+        self._reset_offset = 0
+        self._records_since_state = message_count
+        logger.info(
+            f"Compacted conversation journal {self.path}: {old_size} -> {self._size} bytes"
+        )
+
+
+_journals: Dict[str, ConversationJournal] = {}
+
+
+def get_conversation_journal(path: str) -> ConversationJournal:
+    """Journal for a state file, shared across saves and loads in this process."""
+    journal = _journals.get(path)
+    if journal is None:
+        journal = _journals[path] = ConversationJournal(path)
+    return journal
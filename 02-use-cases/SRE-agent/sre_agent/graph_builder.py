@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
 import logging
-from typing import Any, Dict, List, Literal
+import time
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from langchain_core.messages import HumanMessage
 from langchain_core.tools import BaseTool
@@ -43,8 +44,13 @@ def _should_continue(state: AgentState) -> Literal["supervisor", "FINISH"]:
     return "supervisor"
 
 
-def _route_supervisor(state: AgentState) -> str:
-    """Route from supervisor to the appropriate agent or finish."""
+def _route_supervisor(state: AgentState) -> Union[str, List[str]]:
+    """Route from supervisor to the appropriate agent(s) or finish.
+
+    When the supervisor dispatches a wave of independent agents, a list of
+    nodes is returned and LangGraph runs them concurrently; they all route
+    back to the supervisor, which runs again once every one has finished.
+    """
     next_agent = state.get("next", "FINISH")
 
     if next_agent == "FINISH":
@@ -63,6 +69,10 @@ def _route_supervisor(state: AgentState) -> str:
         "runbooks_agent": "runbooks_agent",
     }
 
+    next_agents = state.get("next_agents")
+    if next_agents and len(next_agents) > 1:
+        return [agent_map.get(agent, "aggregate") for agent in next_agents]
+
     return agent_map.get(next_agent, "aggregate")
 
 
@@ -82,7 +92,7 @@ async def _prepare_initial_state(state: AgentState) -> Dict[str, Any]:
         "agent_results": {},
         "agents_invoked": [],
         "requires_collaboration": False,
-        "metadata": {},
+        "metadata": {"investigation_started_at": time.monotonic()},
     }
 
 
@@ -92,6 +102,7 @@ def build_multi_agent_graph(
     force_delete_memory: bool = False,
     export_graph: bool = False,
     graph_output_path: str = "./docs/sre_agent_architecture.md",
+    parallel_execution: Optional[bool] = None,
     **llm_kwargs,
 ) -> StateGraph:
     """Build the multi-agent collaboration graph.
@@ -102,6 +113,7 @@ def build_multi_agent_graph(
         force_delete_memory: Whether to force delete existing memory
         export_graph: Whether to export the graph as a Mermaid diagram
         graph_output_path: Path to save the exported Mermaid diagram (default: ./docs/sre_agent_architecture.md)
+        parallel_execution: Run independent plan steps concurrently (default from SREConstants.plan_execution)
         **llm_kwargs: Additional arguments for LLM
 
     Returns:
@@ -114,7 +126,10 @@ def build_multi_agent_graph(
 
     # Create supervisor
     supervisor = SupervisorAgent(
-        llm_provider=llm_provider, force_delete_memory=force_delete_memory, **llm_kwargs
+        llm_provider=llm_provider,
+        force_delete_memory=force_delete_memory,
+        parallel_execution=parallel_execution,
+        **llm_kwargs,
     )
 
     # Create agent nodes with filtered tools and metadata from constants
@@ -171,7 +186,8 @@ def build_multi_agent_graph(
         },
     )
 
-    # Add edges from agents back to supervisor
+    # Add edges from agents back to supervisor (also the fan-in point for
+    # agents dispatched in parallel)
     workflow.add_edge("kubernetes_agent", "supervisor")
     workflow.add_edge("logs_agent", "supervisor")
     workflow.add_edge("metrics_agent", "supervisor")
@@ -188,21 +204,26 @@ def build_multi_agent_graph(
         try:
             # Create docs directory if it doesn't exist
             from pathlib import Path
+
             output_path = Path(graph_output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            
+
             # Get the Mermaid representation of the graph
             mermaid_diagram = compiled_graph.get_graph().draw_mermaid()
-            
+
             # Save to file
             with open(graph_output_path, "w") as f:
                 f.write("# SRE Agent Architecture\n\n")
                 f.write("```mermaid\n")
                 f.write(mermaid_diagram)
                 f.write("\n```\n")
-            
-            logger.info(f"Graph architecture (Mermaid) exported to: {graph_output_path}")
-            print(f"✅ Graph architecture (Mermaid diagram) exported to: {graph_output_path}")
+
+            logger.info(
+                f"Graph architecture (Mermaid) exported to: {graph_output_path}"
+            )
+            print(
+                f"✅ Graph architecture (Mermaid diagram) exported to: {graph_output_path}"
+            )
         except Exception as e:
             logger.error(f"Failed to export graph: {e}")
             print(f"❌ Failed to export graph: {e}")
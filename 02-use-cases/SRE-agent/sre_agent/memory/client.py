@@ -1,9 +1,12 @@
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from bedrock_agentcore.memory import MemoryClient
 
+from ..constants import SREConstants
+from .cache import MemoryRetrievalCache
 from .config import _load_memory_config
 
 # Configure logging with basicConfig
@@ -30,6 +33,10 @@ class SREMemoryClient:
         self.config = _load_memory_config()
         self.memory_ids = {}
         self.force_delete = force_delete
+        self.retrieval_cache = MemoryRetrievalCache(
+            ttl_seconds=SREConstants.memory.retrieval_cache_ttl_seconds,
+            max_entries=SREConstants.memory.retrieval_cache_max_entries,
+        )
         self._initialize_memories()
 
     def _initialize_memories(self):
@@ -228,6 +235,8 @@ class SREMemoryClient:
                 f"Saved {memory_type} event for {actor_id} (event_id: {event_id})"
             )
             logger.info(f"Event data size: {len(str(event_data))} characters")
+            # Don't keep serving results that predate this event
+            self.retrieval_cache.invalidate_actor(actor_id)
             return True
 
         except Exception as e:
@@ -243,8 +252,15 @@ class SREMemoryClient:
         query: str,
         max_results: int = 10,
         session_id: Optional[str] = None,
+        use_cache: bool = True,
     ) -> List[Dict[str, Any]]:
-        """Retrieve memories using the retrieve_memories API."""
+        """Retrieve memories using the retrieve_memories API.
+
+        Results are cached per (actor_id, namespace, query, max_results) for
+        SREConstants.memory.retrieval_cache_ttl_seconds, so repeated lookups
+        within a session don't call AgentCore Memory again. Pass
+        use_cache=False to always query the service.
+        """
         if not self.memory_id:
             logger.warning("Memory system not initialized, returning empty results")
             return []
@@ -253,6 +269,15 @@ class SREMemoryClient:
             # Get appropriate namespace (session_id only needed for infrastructure/investigations)
             namespace = self._get_namespace(memory_type, actor_id, session_id)
 
+            cache_key = (actor_id, namespace, query, max_results)
+            if use_cache:
+                cached = self.retrieval_cache.get(cache_key)
+                if cached is not None:
+                    logger.info(
+                        f"Using cached {memory_type} memories: actor_id={actor_id}, namespace={namespace}, query='{query}' ({len(cached)} records)"
+                    )
+                    return cached
+
             logger.info(
                 f"Retrieving {memory_type} memories: actor_id={actor_id}, namespace={namespace}, query='{query}'"
             )
@@ -282,6 +307,7 @@ class SREMemoryClient:
                     else:
                         logger.debug(f"Memory {i + 1} has no 'content' field")
 
+            self.retrieval_cache.put(cache_key, result)
             return result
 
         except Exception as e:
@@ -291,6 +317,34 @@ class SREMemoryClient:
             )
             return []
 
+    async def aretrieve_memories(
+        self,
+        memory_type: str,
+        actor_id: str,
+        query: str,
+        max_results: int = 10,
+        session_id: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Async retrieve_memories that runs the blocking API call in a worker thread.
+
+        Lets callers on the event loop issue several retrievals concurrently
+        with asyncio.gather instead of blocking on each one in turn.
+        """
+        return await asyncio.to_thread(
+            self.retrieve_memories,
+            memory_type,
+            actor_id,
+            query,
+            max_results,
+            session_id,
+            use_cache,
+        )
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the retrieval cache."""
+        return self.retrieval_cache.stats()
+
     def _get_namespace(
         self, memory_type: str, actor_id: str, session_id: Optional[str] = None
     ) -> str:
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import re
@@ -31,7 +32,7 @@ class MemoryHookProvider:
     def __init__(self, memory_client: SREMemoryClient):
         self.memory_client = memory_client
 
-    def on_investigation_start(
+    async def on_investigation_start(
         self,
         query: str,
         user_id: str,
@@ -39,27 +40,39 @@ class MemoryHookProvider:
         session_id: str,
         incident_id: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Hook called when investigation starts."""
-        try:
-            # Retrieve relevant memories to provide context
-            # Use comprehensive query to get all user preference types
-            preferences = self.memory_client.retrieve_memories(
-                memory_type="preferences",
-                actor_id=user_id,
-                query=SREConstants.memory.user_preferences_query,
-                max_results=SREConstants.memory.max_preferences_results,
-            )
+        """Hook called when investigation starts.
 
-            # Get infrastructure knowledge for specific user only
+        The preference, infrastructure and investigation lookups are independent,
+        so they are issued concurrently instead of one after another.
+        """
+        try:
             logger.info(
-                f"Retrieving infrastructure knowledge for user '{user_id}' for query: '{query}'"
+                f"Retrieving preferences, infrastructure knowledge and investigation summaries for user '{user_id}' for query: '{query}'"
             )
-            all_knowledge = self.memory_client.retrieve_memories(
-                memory_type="infrastructure",
-                actor_id=user_id,  # Only retrieve memories for the current user
-                query=query,
-                max_results=SREConstants.memory.max_infrastructure_results,
-                session_id=None,  # Cross-session search for planning purposes
+            preferences, all_knowledge, investigations = await asyncio.gather(
+                # Use comprehensive query to get all user preference types
+                self.memory_client.aretrieve_memories(
+                    memory_type="preferences",
+                    actor_id=user_id,
+                    query=SREConstants.memory.user_preferences_query,
+                    max_results=SREConstants.memory.max_preferences_results,
+                ),
+                # Get infrastructure knowledge for specific user only
+                self.memory_client.aretrieve_memories(
+                    memory_type="infrastructure",
+                    actor_id=user_id,  # Only retrieve memories for the current user
+                    query=query,
+                    max_results=SREConstants.memory.max_infrastructure_results,
+                    session_id=None,  # Cross-session search for planning purposes
+                ),
+                # Get past investigation summaries for similar issues (cross-session search for planning)
+                self.memory_client.aretrieve_memories(
+                    memory_type="investigations",
+                    actor_id=user_id,  # Use user_id to retrieve only user-specific investigations
+                    query=query,
+                    max_results=SREConstants.memory.max_investigation_results,
+                    session_id=None,  # Cross-session search for planning purposes
+                ),
             )
 
             # Organize knowledge by agent for later distribution
@@ -78,18 +91,6 @@ class MemoryHookProvider:
             else:
                 logger.info(f"No infrastructure knowledge found for user '{user_id}'")
 
-            # Get past investigation summaries for similar issues (cross-session search for planning)
-            logger.info(
-                f"Retrieving investigation summaries for user '{user_id}' for query: '{query}'"
-            )
-            investigations = self.memory_client.retrieve_memories(
-                memory_type="investigations",
-                actor_id=user_id,  # Use user_id to retrieve only user-specific investigations
-                query=query,
-                max_results=SREConstants.memory.max_investigation_results,
-                session_id=None,  # Cross-session search for planning purposes
-            )
-
             if investigations:
                 logger.info(
                     f"Retrieved {len(investigations)} past investigation summaries for user '{user_id}'"
@@ -124,6 +125,7 @@ class MemoryHookProvider:
             logger.info(
                 f"Retrieved memory context for investigation: {len(preference_contents)} preference contents (from {len(preferences)} records), {total_knowledge} knowledge items from {len(knowledge_by_agent)} agents, {len(investigations)} past investigations"
             )
+            logger.info(f"Memory retrieval cache: {self.memory_client.cache_stats()}")
 
             return memory_context
 
@@ -151,21 +153,13 @@ class MemoryHookProvider:
             )
 
             # Extract and save user preferences
-            pref_count_before = len(
-                self.memory_client.retrieve_memories(
-                    "preferences", user_id, "recent", max_results=100
-                )
-            )
-            self._extract_user_preferences(response_text, user_id, agent_name)
-            pref_count_after = len(
-                self.memory_client.retrieve_memories(
-                    "preferences", user_id, "recent", max_results=100
-                )
+            new_preferences = self._extract_user_preferences(
+                response_text, user_id, agent_name
             )
 
-            if pref_count_after > pref_count_before:
+            if new_preferences:
                 logger.info(
-                    f"Extracted {pref_count_after - pref_count_before} new user preferences from {agent_name} response"
+                    f"Extracted {new_preferences} new user preferences from {agent_name} response"
                 )
 
             # Extract infrastructure knowledge
@@ -247,8 +241,14 @@ class MemoryHookProvider:
         except Exception as e:
             logger.error(f"Failed to save investigation summary: {e}")
 
-    def _extract_user_preferences(self, response_text: str, user_id: str, context: str):
-        """Extract user preferences from response text."""
+    def _extract_user_preferences(
+        self, response_text: str, user_id: str, context: str
+    ) -> int:
+        """Extract user preferences from response text.
+
+        Returns:
+            Number of preferences saved
+        """
         logger.info(
             f"Extracting user preferences from {context} response for user {user_id}"
         )
@@ -326,6 +326,7 @@ class MemoryHookProvider:
         logger.info(
             f"Preference extraction complete: {escalation_found} escalations, {channels_found} channels"
         )
+        return escalation_found + channels_found
 
     def _extract_infrastructure_knowledge(
         self, response_text: str, agent_name: str, user_id: str, state: Dict[str, Any]
@@ -24,6 +24,7 @@ from langgraph.errors import GraphRecursionError
 
 from .agent_state import AgentState
 from .constants import SREConstants
+from .conversation_journal import get_conversation_journal
 from .graph_builder import build_multi_agent_graph
 from .logging_config import configure_logging, should_show_debug_traces
 
@@ -133,6 +134,30 @@ class Spinner:
             i += 1
 
 
+def _parallel_execution_from_env() -> bool:
+    """Whether SRE_PARALLEL_EXECUTION enables parallel plan execution."""
+    value = os.getenv("SRE_PARALLEL_EXECUTION")
+    if value is None:
+        return SREConstants.plan_execution.parallel_execution
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _format_investigation_timing(timing: Dict[str, Any]) -> str:
+    """One-line summary of how long an investigation took."""
+    summary = (
+        f"⏱️  Investigation time: {timing.get('wall_clock_seconds', 0):.1f}s wall-clock"
+    )
+    summary += f" ({timing.get('execution_mode', 'sequential')}"
+    if timing.get("waves"):
+        summary += f", {timing['waves']} waves"
+    summary += f"); agents worked {timing.get('agent_seconds', 0):.1f}s"
+    if timing.get("agent_phase_seconds") is not None:
+        summary += f" within {timing['agent_phase_seconds']:.1f}s"
+    if timing.get("concurrency"):
+        summary += f" ({timing['concurrency']:.2f}x concurrency)"
+    return summary
+
+
 def _archive_old_reports(output_dir: str) -> None:
     """Archive reports from previous days into date-based folders."""
     try:
@@ -325,7 +350,9 @@ def _read_gateway_config() -> tuple[str, str]:
 
         # Handle case where 'gateway' key might be None
         gateway_config = config.get("gateway") or {}
-        gateway_uri = gateway_config.get("uri") if isinstance(gateway_config, dict) else None
+        gateway_uri = (
+            gateway_config.get("uri") if isinstance(gateway_config, dict) else None
+        )
         if not gateway_uri:
             raise ValueError(
                 "Gateway URI not found in agent_config.yaml under 'gateway.uri'"
@@ -374,10 +401,16 @@ async def create_multi_agent_system(
     export_graph: bool = False,
     graph_output_path: str = "./docs/sre_agent_architecture.md",
     region_name: str = None,
+    parallel_execution: Optional[bool] = None,
     **llm_kwargs,
 ):
     """Create multi-agent system with MCP tools."""
     logger.info(f"Creating multi-agent system with provider: {provider}")
+    if parallel_execution is None:
+        parallel_execution = _parallel_execution_from_env()
+    logger.info(
+        f"Plan execution mode: {'parallel' if parallel_execution else 'sequential'}"
+    )
 
     # Get Anthropic API key if needed
     if provider == "anthropic" and not llm_kwargs.get("api_key"):
@@ -577,6 +610,7 @@ async def create_multi_agent_system(
         force_delete_memory=force_delete_memory,
         export_graph=export_graph,
         graph_output_path=graph_output_path,
+        parallel_execution=parallel_execution,
         **llm_kwargs,
     )
 
@@ -588,45 +622,10 @@ def _save_conversation_state(
     state: Dict[str, Any],
     filename: str = SREConstants.app.conversation_state_file,
 ):
-    """Save conversation state to a file."""
+    """Save conversation state, appending only what changed since the last save."""
     try:
-        # Convert messages to serializable format
-        serializable_messages = []
-        for msg in messages:
-            if hasattr(msg, "model_dump"):
-                serializable_messages.append(msg.model_dump())
-            elif hasattr(msg, "dict"):
-                serializable_messages.append(msg.dict())
-            elif hasattr(msg, "content"):
-                serializable_messages.append(
-                    {"role": getattr(msg, "role", "unknown"), "content": msg.content}
-                )
-            else:
-                serializable_messages.append(str(msg))
-
-        # Convert state to serializable format
-        serializable_state = {}
-        if isinstance(state, dict):
-            # Filter out non-serializable items
-            for k, v in state.items():
-                if k == "messages":
-                    continue  # Already handled above
-                elif isinstance(v, (str, int, float, bool, list, dict, type(None))):
-                    serializable_state[k] = v
-                else:
-                    serializable_state[k] = str(v)
-
-        with open(filename, "w") as f:
-            json.dump(
-                {
-                    "messages": serializable_messages,
-                    "state": serializable_state,
-                    "timestamp": datetime.now().isoformat(),
-                },
-                f,
-                indent=2,
-            )
-        logger.debug(f"Saved conversation state to {filename}")
+        appended = get_conversation_journal(filename).save(messages, state)
+        logger.debug(f"Saved conversation state to {filename} ({appended} records)")
     except Exception as e:
         logger.error(f"Failed to save conversation state: {e}")
 
@@ -634,13 +633,12 @@ def _save_conversation_state(
 def _load_conversation_state(
     filename: str = SREConstants.app.conversation_state_file,
 ) -> tuple[Optional[list], Optional[Dict[str, Any]]]:
-    """Load conversation state from a file."""
+    """Load the most recent messages and state from the conversation journal."""
     try:
-        if Path(filename).exists():
-            with open(filename, "r") as f:
-                data = json.load(f)
-                logger.info(f"Loaded conversation state from {filename}")
-                return data.get("messages", []), data.get("state", {})
+        messages, state = get_conversation_journal(filename).load()
+        if messages is not None:
+            logger.info(f"Loaded conversation state from {filename}")
+            return messages, state
     except Exception as e:
         logger.error(f"Failed to load conversation state: {e}")
     return None, None
@@ -653,10 +651,10 @@ async def _run_interactive_session(
     save_markdown: bool = True,
     force_delete_memory: bool = False,
     region_name: str = "us-east-1",
+    parallel_execution: Optional[bool] = None,
 ):
     """Run an interactive multi-turn conversation session."""
     # Buffer to store last query and response for /savereport command
-    last_query = None
     last_response = None
     # Track the original query for report naming (resets after each /savereport)
     original_query = None
@@ -690,6 +688,7 @@ async def _run_interactive_session(
         force_delete_memory=force_delete_memory,
         export_graph=False,  # Don't export in interactive mode each time
         region_name=region_name,
+        parallel_execution=parallel_execution,
     )
 
     # Initialize conversation state
@@ -717,7 +716,6 @@ async def _run_interactive_session(
 
             elif user_input.lower() == "/clear":
                 messages = []
-                last_query = None
                 last_response = None
                 original_query = None
                 print("✨ Conversation history and report buffer cleared.")
@@ -759,7 +757,6 @@ async def _run_interactive_session(
                     if filepath:
                         print(f"📄 Investigation report saved to: {filepath}")
                         # Clear the buffer after saving and reset for next investigation
-                        last_query = None
                         last_response = None
                         original_query = None
                         # Generate new session ID for next conversation
@@ -894,6 +891,10 @@ async def _run_interactive_session(
                     for node_name, node_output in event.items():
                         if node_name == "supervisor":
                             next_agent = node_output.get("next", "unknown")
+                            next_agents = node_output.get("next_agents") or []
+                            if len(next_agents) > 1:
+                                # Independent plan steps dispatched in parallel
+                                next_agent = " + ".join(next_agents)
                             metadata = node_output.get("metadata", {})
                             reasoning = metadata.get("routing_reasoning", "")
 
@@ -1053,6 +1054,15 @@ async def _run_interactive_session(
                             if final_response:
                                 print(f"\n💬 Final Response:\n{final_response}")
                                 logger.info(f"💬 Final Response: {final_response}")
+                                timing = node_output.get("metadata", {}).get(
+                                    "investigation_timing"
+                                )
+                                if timing:
+                                    timing_summary = _format_investigation_timing(
+                                        timing
+                                    )
+                                    print(f"\n{timing_summary}")
+                                    logger.info(timing_summary)
                                 # Add assistant message to history
                                 messages.append(AIMessage(content=final_response))
                                 # Store for /savereport command instead of auto-saving
@@ -1152,6 +1162,11 @@ async def main():
         action="store_true",
         help="Export the agent architecture as a Mermaid diagram",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run independent investigation plan steps concurrently (or set SRE_PARALLEL_EXECUTION=true)",
+    )
     parser.add_argument(
         "--graph-output",
         default="./docs/sre_agent_architecture.md",
@@ -1180,7 +1195,9 @@ async def main():
             # Fallback to AWS_REGION environment variable
             aws_region = os.environ.get("AWS_REGION")
             if aws_region:
-                logger.info(f"Using AWS region from AWS_REGION environment variable: {aws_region}")
+                logger.info(
+                    f"Using AWS region from AWS_REGION environment variable: {aws_region}"
+                )
             else:
                 # Final fallback to us-east-1
                 aws_region = "us-east-1"
@@ -1222,6 +1239,7 @@ async def main():
                 save_markdown=not args.no_markdown,
                 force_delete_memory=args.force_delete_memory,
                 region_name=aws_region,
+                parallel_execution=args.parallel or None,
             )
         # Single prompt mode
         else:
@@ -1232,6 +1250,7 @@ async def main():
                     export_graph=args.export_graph,
                     graph_output_path=args.graph_output,
                     region_name=aws_region,
+                    parallel_execution=args.parallel or None,
                 )
                 logger.info("Multi-agent system created successfully")
             except Exception as e:
@@ -1309,6 +1328,10 @@ async def main():
                     for node_name, node_output in event.items():
                         if node_name == "supervisor":
                             next_agent = node_output.get("next", "unknown")
+                            next_agents = node_output.get("next_agents") or []
+                            if len(next_agents) > 1:
+                                # Independent plan steps dispatched in parallel
+                                next_agent = " + ".join(next_agents)
                             metadata = node_output.get("metadata", {})
                             reasoning = metadata.get("routing_reasoning", "")
 
@@ -1468,6 +1491,15 @@ async def main():
                             if final_response:
                                 print(f"\n💬 Final Response:\n{final_response}")
                                 logger.info(f"💬 Final Response: {final_response}")
+                                timing = node_output.get("metadata", {}).get(
+                                    "investigation_timing"
+                                )
+                                if timing:
+                                    timing_summary = _format_investigation_timing(
+                                        timing
+                                    )
+                                    print(f"\n{timing_summary}")
+                                    logger.info(timing_summary)
                                 # Save final response to markdown file (auto-save in single query mode)
                                 if not args.no_markdown:
                                     _save_final_response_to_markdown(
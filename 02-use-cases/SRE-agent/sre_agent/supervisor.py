@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
+import asyncio
 import json
 import logging
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
@@ -141,6 +143,50 @@ class RouteDecision(BaseModel):
     )
 
 
+def plan_execution_waves(plan: InvestigationPlan) -> List[List[int]]:
+    """Group plan steps into waves of agents that can run concurrently.
+
+    Steps are taken in plan order. A step starts a new wave when it depends
+    on earlier results (a follow-up agent such as runbooks, or a description
+    like "based on the findings"), when its agent already runs in the current
+    wave, or when the wave is full. Independent steps such as logs and
+    metrics for the same service share a wave.
+
+    Args:
+        plan: Investigation plan created by the supervisor
+
+    Returns:
+        Lists of indexes into plan.agents_sequence, in execution order
+    """
+    config = SREConstants.plan_execution
+    waves: List[List[int]] = []
+    current: List[int] = []
+    for index, agent in enumerate(plan.agents_sequence):
+        step = plan.steps[index].lower() if index < len(plan.steps) else ""
+        depends_on_earlier = agent in config.follow_up_agents or any(
+            marker in step for marker in config.dependency_markers
+        )
+        if current and (
+            depends_on_earlier
+            or agent in (plan.agents_sequence[i] for i in current)
+            or len(current) >= config.max_parallel_agents
+        ):
+            waves.append(current)
+            current = []
+        current.append(index)
+    if current:
+        waves.append(current)
+    return waves
+
+
+def _agent_plan_name(agent_name: str) -> str:
+    """Map an agent display name (as used in agent_results) to its plan name."""
+    for key, agent_metadata in SREConstants.agents.agents.items():
+        if agent_metadata.display_name == agent_name:
+            return f"{key}_agent"
+    return agent_name
+
+
 def _read_supervisor_prompt() -> str:
     """Read supervisor system prompt from file."""
     try:
@@ -205,9 +251,15 @@ class SupervisorAgent:
         self,
         llm_provider: str = "bedrock",
         force_delete_memory: bool = False,
+        parallel_execution: Optional[bool] = None,
         **llm_kwargs,
     ):
         self.llm_provider = llm_provider
+        self.parallel_execution = (
+            SREConstants.plan_execution.parallel_execution
+            if parallel_execution is None
+            else parallel_execution
+        )
         self.llm = self._create_llm(**llm_kwargs)
         self.system_prompt = _read_supervisor_prompt()
         self.formatter = create_formatter(llm_provider=llm_provider)
@@ -216,7 +268,11 @@ class SupervisorAgent:
         self.memory_config = _load_memory_config()
         if self.memory_config.enabled:
             # Use region from llm_kwargs if provided for bedrock
-            memory_region = llm_kwargs.get("region_name", self.memory_config.region) if llm_provider == "bedrock" else self.memory_config.region
+            memory_region = (
+                llm_kwargs.get("region_name", self.memory_config.region)
+                if llm_provider == "bedrock"
+                else self.memory_config.region
+            )
             self.memory_client = SREMemoryClient(
                 memory_name=self.memory_config.memory_name,
                 region=memory_region,
@@ -273,7 +329,9 @@ class SupervisorAgent:
             logger.info(
                 f"Supervisor using retrieve_memory tool: type={memory_type}, query='{query}', actor_id={actor_id}"
             )
-            result = retrieve_tool._run(
+            # The tool calls the blocking memory API; keep it off the event loop
+            result = await asyncio.to_thread(
+                retrieve_tool._run,
                 memory_type=memory_type,
                 query=query,
                 actor_id=actor_id,
@@ -317,7 +375,7 @@ class SupervisorAgent:
                         "session_id is required for memory retrieval but not found in state"
                     )
 
-                memory_context = self.memory_hooks.on_investigation_start(
+                memory_context = await self.memory_hooks.on_investigation_start(
                     query=current_query,
                     user_id=user_id,
                     actor_id=actor_id,
@@ -615,6 +673,24 @@ User's query: {current_query}
                     # Preserve memory context in state
                     "memory_context": state.get("memory_context", {}),
                 }
+            elif self.parallel_execution:
+                # Simple plan - start execution, independent steps concurrently
+                waves = plan_execution_waves(plan)
+                logger.info(
+                    f"Parallel plan execution: {len(plan.agents_sequence)} steps in {len(waves)} waves {waves}"
+                )
+                return self._route_wave(
+                    plan,
+                    waves,
+                    0,
+                    state,
+                    {
+                        "investigation_plan": plan.model_dump(),
+                        "plan_text": self._format_plan_markdown(plan),
+                        "show_plan": True,
+                        "agents_started_at": time.monotonic(),
+                    },
+                )
             else:
                 # Simple plan - start execution
                 next_agent = (
@@ -630,6 +706,7 @@ User's query: {current_query}
                         "plan_step": 0,
                         "plan_text": plan_text,
                         "show_plan": True,
+                        "agents_started_at": time.monotonic(),
                     },
                     # Preserve memory context in state
                     "memory_context": state.get("memory_context", {}),
@@ -637,6 +714,13 @@ User's query: {current_query}
         else:
             # Continue executing existing plan
             plan = InvestigationPlan(**existing_plan)
+            waves = state.get("metadata", {}).get("plan_waves")
+            if waves:
+                # Every agent of the previous wave has finished (fan-in)
+                current_wave = state.get("metadata", {}).get("plan_wave", 0)
+                next_wave = current_wave + 1 if agents_invoked else current_wave
+                return self._route_wave(plan, waves, next_wave, state)
+
             current_step = state.get("metadata", {}).get("plan_step", 0)
 
             # Check if plan is complete
@@ -653,6 +737,7 @@ User's query: {current_query}
                         **state.get("metadata", {}),
                         "routing_reasoning": "Investigation plan completed. Presenting results.",
                         "plan_step": next_step,
+                        "agents_finished_at": time.monotonic(),
                     },
                     # Preserve memory context in state
                     "memory_context": state.get("memory_context", {}),
@@ -677,6 +762,109 @@ User's query: {current_query}
                     "memory_context": state.get("memory_context", {}),
                 }
 
+    def _route_wave(
+        self,
+        plan: InvestigationPlan,
+        waves: List[List[int]],
+        wave_index: int,
+        state: AgentState,
+        plan_metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Dispatch every agent of one wave at once, or finish after the last wave."""
+        metadata = {**state.get("metadata", {}), **(plan_metadata or {})}
+
+        if wave_index >= len(waves):
+            return {
+                "next": "FINISH",
+                "next_agents": [],
+                "metadata": {
+                    **metadata,
+                    "routing_reasoning": "Investigation plan completed. Presenting results.",
+                    "plan_wave": wave_index,
+                    "plan_step": len(plan.agents_sequence),
+                    "agents_finished_at": time.monotonic(),
+                },
+                # Preserve memory context in state
+                "memory_context": state.get("memory_context", {}),
+            }
+
+        wave = waves[wave_index]
+        agents = [plan.agents_sequence[index] for index in wave]
+        descriptions = [
+            plan.steps[index]
+            if index < len(plan.steps)
+            else f"Execute {plan.agents_sequence[index]}"
+            for index in wave
+        ]
+        if len(wave) == 1:
+            reasoning = f"Executing plan step {wave[0] + 1}: {descriptions[0]}"
+        else:
+            step_numbers = ", ".join(str(index + 1) for index in wave)
+            reasoning = (
+                f"Executing plan steps {step_numbers} in parallel: "
+                + "; ".join(descriptions)
+            )
+
+        return {
+            "next": agents[0],
+            "next_agents": agents,
+            "metadata": {
+                **metadata,
+                "routing_reasoning": reasoning,
+                "plan_waves": waves,
+                "plan_wave": wave_index,
+                "plan_step": wave[-1],
+            },
+            # Preserve memory context in state
+            "memory_context": state.get("memory_context", {}),
+        }
+
+    def _ordered_agent_results(
+        self, agent_results: Dict[str, Any], plan: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Order agent results by plan position so parallel runs merge deterministically."""
+        sequence = (plan or {}).get("agents_sequence", [])
+
+        def _position(agent_name: str) -> tuple:
+            plan_name = _agent_plan_name(agent_name)
+            index = (
+                sequence.index(plan_name) if plan_name in sequence else len(sequence)
+            )
+            return (index, agent_name)
+
+        return {
+            name: agent_results[name] for name in sorted(agent_results, key=_position)
+        }
+
+    def _investigation_timing(self, state: AgentState) -> Dict[str, Any]:
+        """Wall-clock timing of the investigation, for comparing execution modes."""
+        metadata = state.get("metadata", {})
+        agent_timings = state.get("agent_timings") or {}
+        agent_seconds = sum(agent_timings.values())
+        timing = {
+            "execution_mode": "parallel"
+            if metadata.get("plan_waves")
+            else "sequential",
+            "agent_seconds": round(agent_seconds, 3),
+            "agents": dict(agent_timings),
+        }
+        if metadata.get("plan_waves"):
+            timing["waves"] = len(metadata["plan_waves"])
+
+        started = metadata.get("investigation_started_at")
+        if started is not None:
+            timing["wall_clock_seconds"] = round(time.monotonic() - started, 3)
+
+        agents_started = metadata.get("agents_started_at")
+        agents_finished = metadata.get("agents_finished_at")
+        if agents_started is not None and agents_finished is not None:
+            agent_phase = agents_finished - agents_started
+            timing["agent_phase_seconds"] = round(agent_phase, 3)
+            if agent_phase > 0:
+                # Average number of agents working at once; 1.0 when sequential
+                timing["concurrency"] = round(agent_seconds / agent_phase, 2)
+        return timing
+
     async def aggregate_responses(self, state: AgentState) -> Dict[str, Any]:
         """Aggregate responses from multiple agents into a final response."""
         agent_results = state.get("agent_results", {})
@@ -719,6 +907,7 @@ You can:
         # Use enhanced formatting for investigation results
         query = state.get("current_query", "Investigation") or "Investigation"
         plan = metadata.get("investigation_plan")
+        agent_results = self._ordered_agent_results(agent_results, plan)
 
         # Get user preferences from memory_context (not directly from state)
         user_preferences = []
@@ -894,4 +1083,19 @@ You can:
                     f"Failed to save investigation summary: {e}", exc_info=True
                 )
 
-        return {"final_response": final_response, "next": "FINISH"}
+        timing = self._investigation_timing(state)
+        logger.info(
+            f"Investigation finished in {timing.get('wall_clock_seconds', 0):.2f}s wall-clock "
+            f"({timing['execution_mode']}, {timing['agent_seconds']:.2f}s of agent time)"
+        )
+
+        metadata = {"investigation_timing": timing}
+        if self.memory_client:
+            metadata["memory_cache"] = self.memory_client.cache_stats()
+            logger.info(f"Memory retrieval cache: {metadata['memory_cache']}")
+
+        return {
+            "final_response": final_response,
+            "next": "FINISH",
+            "metadata": metadata,
+        }
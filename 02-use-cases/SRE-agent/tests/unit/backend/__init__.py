@@ -0,0 +1 @@
+"""Tests for the stub backend servers."""
@@ -0,0 +1,24 @@
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+SERVERS_DIR = Path(__file__).resolve().parents[3] / "backend" / "servers"
+API_KEY = "test-api-key"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def servers_on_path():
+    """Import the servers the way run_all_servers does, without the credential provider."""
+    sys.path.insert(0, str(SERVERS_DIR))
+    stub = types.ModuleType("retrieve_api_key")
+    stub.retrieve_api_key = lambda name: API_KEY
+    previous = sys.modules.get("retrieve_api_key")
+    sys.modules["retrieve_api_key"] = stub
+    yield
+    sys.path.remove(str(SERVERS_DIR))
+    if previous is None:
+        sys.modules.pop("retrieve_api_key", None)
+    else:
+        sys.modules["retrieve_api_key"] = previous
@@ -0,0 +1,68 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def data_store():
+    import data_store
+
+    return data_store
+
+
+@pytest.fixture
+def series(data_store):
+    """Create a series whose file order differs from its time order."""
+    return data_store.TimeSeries.build(
+        [
+            {"id": "late", "timestamp": "2024-01-01T12:00:00Z"},
+            {"id": "untimed"},
+            {"id": "early", "timestamp": "2024-01-01T08:00:00Z"},
+            {"id": "garbled", "timestamp": "yesterday"},
+            {"id": "middle", "timestamp": "2024-01-01T10:00:00+00:00"},
+        ]
+    )
+
+
+def ids(records):
+    return [record["id"] for record in records]
+
+
+class TestTimeSeries:
+    """Tests for TimeSeries."""
+
+    def test_unfiltered_keeps_file_order(self, series):
+        """Test every record is returned in file order without a time range."""
+        assert ids(series.filter()) == [
+            "late",
+            "untimed",
+            "early",
+            "garbled",
+            "middle",
+        ]
+
+    def test_filter_keeps_file_order(self, series):
+        """Test time-filtered records come back in file order, not time order."""
+        assert ids(series.filter(start_time="2024-01-01T09:00:00Z")) == [
+            "late",
+            "garbled",
+            "middle",
+        ]
+
+    def test_bounds_are_inclusive(self, series):
+        """Test records on either bound are included."""
+        assert ids(series.filter("2024-01-01T08:00:00Z", "2024-01-01T10:00:00Z")) == [
+            "early",
+            "middle",
+        ]
+
+    def test_naive_timestamps_are_utc(self, series):
+        """Test query timestamps without an offset are read as UTC."""
+        assert ids(series.filter(end_time="2024-01-01T08:00:00")) == ["early"]
+
+    def test_unparseable_timestamp_counts_as_now(self, series):
+        """Test an unparseable record timestamp only matches ranges containing now."""
+        assert "garbled" in ids(series.filter(start_time="2024-01-01T00:00:00Z"))
+        assert "garbled" not in ids(series.filter(end_time="2024-01-02T00:00:00Z"))
+
+    def test_unparseable_query_time_means_now(self, series):
+        """Test an unparseable query timestamp falls back to the current time."""
+        assert ids(series.filter(start_time="soon")) == ["garbled"]
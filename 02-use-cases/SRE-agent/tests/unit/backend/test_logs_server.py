@@ -0,0 +1,108 @@
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from .conftest import API_KEY
+
+APPLICATION_LOG = """\
+2024-01-01T08:00:00Z [INFO] web-service Request served in 12ms
+2024-01-01T09:00:00Z [ERROR] database-service Connection pool exhausted
+2024-01-01T10:00:00Z [WARN] web-service Slow response -> retrying upstream
+2024-01-01T11:00:00Z [ERROR] web-service Upstream timeout, pool exhausted on retry
+2024-01-01T12:00:00Z [ERROR] api-gateway Out of memory while buffering response
+"""
+
+
+@pytest.fixture(scope="module")
+def logs_server():
+    return importlib.import_module("logs_server")
+
+
+@pytest.fixture
+def client(logs_server, tmp_path, monkeypatch):
+    """Create a client for the logs server reading a temporary application.log."""
+    log_file = tmp_path / "application.log"
+    log_file.write_text(APPLICATION_LOG)
+    monkeypatch.setattr(
+        logs_server,
+        "APPLICATION_LOGS",
+        logs_server.DataFile(log_file, logs_server._parse_log_file),
+    )
+    return TestClient(logs_server.app, headers={"X-API-Key": API_KEY})
+
+
+def _messages(response):
+    assert response.status_code == 200
+    return [log["message"] for log in response.json()["logs"]]
+
+
+class TestLogSearch:
+    """Tests for GET /logs/search."""
+
+    def test_word_search(self, client):
+        """Test entries containing the word are returned."""
+        messages = _messages(client.get("/logs/search", params={"pattern": "pool"}))
+
+        assert sorted(messages) == [
+            "Connection pool exhausted",
+            "Upstream timeout, pool exhausted on retry",
+        ]
+
+    def test_pattern_is_matched_as_a_substring(self, client):
+        """Test a multi-word pattern only matches entries containing it verbatim."""
+        messages = _messages(
+            client.get("/logs/search", params={"pattern": "exhausted on"})
+        )
+        reordered = _messages(
+            client.get("/logs/search", params={"pattern": "exhausted pool"})
+        )
+
+        assert messages == ["Upstream timeout, pool exhausted on retry"]
+        assert reordered == []
+
+    def test_quoted_phrase_must_match_verbatim(self, client):
+        """Test quoted phrases must appear as written, other words anywhere."""
+        matching = _messages(
+            client.get("/logs/search", params={"pattern": '"out of memory" gateway'})
+        )
+        reordered = _messages(
+            client.get("/logs/search", params={"pattern": '"memory of out"'})
+        )
+
+        assert matching == ["Out of memory while buffering response"]
+        assert reordered == []
+
+    def test_fields_outside_the_index_use_substring_match(self, client):
+        """Test matches on the timestamp or inside a word fall back to a scan."""
+        by_time = _messages(client.get("/logs/search", params={"pattern": "T09:00"}))
+        inside_word = _messages(
+            client.get("/logs/search", params={"pattern": "xhaust"})
+        )
+
+        assert by_time == ["Connection pool exhausted"]
+        assert inside_word == [
+            "Connection pool exhausted",
+            "Upstream timeout, pool exhausted on retry",
+        ]
+
+    def test_pattern_without_words(self, client):
+        """Test patterns with no letters or digits are matched as substrings."""
+        messages = _messages(client.get("/logs/search", params={"pattern": "->"}))
+
+        assert messages == ["Slow response -> retrying upstream"]
+
+    def test_level_and_time_filters(self, client):
+        """Test log level and time range apply to ranked results."""
+        messages = _messages(
+            client.get(
+                "/logs/search",
+                params={
+                    "pattern": "exhausted",
+                    "log_level": "ERROR",
+                    "start_time": "2024-01-01T10:00:00Z",
+                },
+            )
+        )
+
+        assert messages == ["Upstream timeout, pool exhausted on retry"]
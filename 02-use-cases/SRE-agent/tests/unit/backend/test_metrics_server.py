@@ -0,0 +1,76 @@
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from .conftest import API_KEY
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create a client for the metrics server."""
+    metrics_server = importlib.import_module("metrics_server")
+    return TestClient(metrics_server.app, headers={"X-API-Key": API_KEY})
+
+
+class TestResourceMetrics:
+    """Tests for GET /metrics/resources."""
+
+    def test_all_resources(self, client):
+        """Test all fields are returned without a resource_type."""
+        response = client.get("/metrics/resources")
+
+        assert response.status_code == 200
+        metrics = response.json()["metrics"]
+        assert metrics
+        assert "cpu_usage_percent" in metrics[0]
+        assert "network_in_mb" in metrics[0]
+
+    def test_resource_type_projection(self, client):
+        """Test only the fields of the requested resource type are returned."""
+        response = client.get("/metrics/resources", params={"resource_type": "disk"})
+
+        assert response.status_code == 200
+        metrics = response.json()["metrics"]
+        assert metrics
+        assert set(metrics[0]) == {
+            "timestamp",
+            "service",
+            "disk_io_read_mb",
+            "disk_io_write_mb",
+        }
+
+    def test_service_filter(self, client):
+        """Test metrics are filtered by service."""
+        response = client.get(
+            "/metrics/resources",
+            params={"resource_type": "cpu", "service": "web-service"},
+        )
+
+        assert response.status_code == 200
+        metrics = response.json()["metrics"]
+        assert metrics
+        assert {m["service"] for m in metrics} == {"web-service"}
+
+    def test_unknown_resource_type(self, client):
+        """Test an unknown resource type returns no metrics instead of an error."""
+        response = client.get("/metrics/resources", params={"resource_type": "gpu"})
+
+        assert response.status_code == 200
+        assert response.json() == {"metrics": []}
+
+    def test_unknown_service(self, client):
+        """Test an unknown service returns no metrics instead of an error."""
+        response = client.get(
+            "/metrics/resources",
+            params={"resource_type": "cpu", "service": "no-such-service"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"metrics": []}
+
+    def test_missing_api_key(self, client):
+        """Test requests without the API key are rejected."""
+        response = client.get("/metrics/resources", headers={"X-API-Key": ""})
+
+        assert response.status_code == 401
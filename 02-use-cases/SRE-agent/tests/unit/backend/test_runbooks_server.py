@@ -0,0 +1,89 @@
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from .conftest import API_KEY
+
+
+@pytest.fixture(scope="module")
+def runbooks_server():
+    return importlib.import_module("runbooks_server")
+
+
+@pytest.fixture(scope="module")
+def client(runbooks_server):
+    """Create a client for the runbooks server."""
+    return TestClient(runbooks_server.app, headers={"X-API-Key": API_KEY})
+
+
+def _ids(response):
+    assert response.status_code == 200
+    return [runbook["id"] for runbook in response.json()["runbooks"]]
+
+
+class TestRunbookSearch:
+    """Tests for GET /runbooks/search."""
+
+    def test_keyword_ranked_by_relevance(self, client):
+        """Test a title match ranks first."""
+        ids = _ids(client.get("/runbooks/search", params={"keyword": "memory"}))
+
+        assert ids[0] == "memory-pressure-playbook"
+
+    def test_keyword_with_filters(self, client):
+        """Test keyword results still honour incident_type and severity."""
+        ids = _ids(
+            client.get(
+                "/runbooks/search",
+                params={"keyword": "database", "severity": "critical"},
+            )
+        )
+
+        assert ids
+        assert "high-error-rate-response" not in ids
+
+    def test_quoted_phrase_must_match_verbatim(self, client):
+        """Test a quoted phrase only matches runbooks containing it."""
+        words = _ids(
+            client.get("/runbooks/search", params={"keyword": "connection failure"})
+        )
+        phrase = _ids(
+            client.get("/runbooks/search", params={"keyword": '"failure connection"'})
+        )
+
+        assert "database-connection-failure" in words
+        assert phrase == []
+
+    def test_keyword_without_words_uses_substring_match(self, client):
+        """Test keywords with no letters or digits are matched as substrings."""
+        ids = _ids(client.get("/runbooks/search", params={"keyword": "<"}))
+
+        assert ids == ["pod-startup-failure"]
+
+    def test_partial_word_uses_substring_match(self, client):
+        """Test keywords the index cannot match fall back to a substring scan."""
+        ids = _ids(client.get("/runbooks/search", params={"keyword": "emory"}))
+
+        assert "memory-pressure-playbook" in ids
+
+    def test_results_are_capped(self, client, runbooks_server, monkeypatch):
+        """Test ranked, substring and filter-only searches are all capped."""
+        monkeypatch.setattr(runbooks_server, "MAX_SEARCH_RESULTS", 1)
+
+        for params in ({"keyword": "failure"}, {"keyword": "-"}, {}):
+            assert len(_ids(client.get("/runbooks/search", params=params))) == 1
+
+    def test_document_indexed_by_newer_reload_is_skipped(self, client, runbooks_server):
+        """Test index entries missing from the request's snapshot are ignored."""
+        runbooks_server.PLAYBOOKS.get()
+        runbooks_server.RUNBOOK_INDEX.add(
+            "from-newer-reload", {"title": "High Memory Usage"}
+        )
+        try:
+            ids = _ids(client.get("/runbooks/search", params={"keyword": "memory"}))
+        finally:
+            runbooks_server.RUNBOOK_INDEX.remove("from-newer-reload")
+
+        assert "from-newer-reload" not in ids
+        assert "memory-pressure-playbook" in ids
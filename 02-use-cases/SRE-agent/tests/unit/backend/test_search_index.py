@@ -0,0 +1,133 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def search_index():
+    import search_index
+
+    return search_index
+
+
+@pytest.fixture
+def index(search_index):
+    """Create an index with a few runbook-like documents."""
+    index = search_index.SearchIndex({"title": 3.0, "steps": 1.0})
+    index.add(
+        "memory",
+        {"title": "High Memory Usage", "steps": ["Check memory limits", "Restart pod"]},
+    )
+    index.add(
+        "database",
+        {"title": "Database Connection Failure", "steps": ["Check memory of the pool"]},
+    )
+    index.add(
+        "crashloop",
+        {"title": "Pod CrashLoopBackOff", "steps": ["Inspect OutOfMemoryError logs"]},
+    )
+    return index
+
+
+class TestTokenize:
+    """Tests for tokenize."""
+
+    def test_lowercases_and_splits_on_punctuation(self, search_index):
+        """Test text is split into lowercase alphanumeric tokens."""
+        assert search_index.tokenize("Pod-Restart: 5xx") == ["pod", "restart", "5xx"]
+
+    def test_splits_compound_identifiers(self, search_index):
+        """Test camel-case identifiers also emit their parts."""
+        assert search_index.tokenize("OutOfMemoryError") == [
+            "outofmemoryerror",
+            "out",
+            "of",
+            "memory",
+            "error",
+        ]
+
+    def test_compound_split_can_be_disabled(self, search_index):
+        """Test split_compound=False keeps identifiers whole."""
+        assert search_index.tokenize("OutOfMemoryError", split_compound=False) == [
+            "outofmemoryerror"
+        ]
+
+
+class TestQuotedPhrases:
+    """Tests for quoted_phrases."""
+
+    def test_extracts_phrases(self, search_index):
+        """Test double-quoted phrases are returned without the quotes."""
+        assert search_index.quoted_phrases('pod "out of memory" "restart "') == [
+            "out of memory",
+            "restart",
+        ]
+
+    def test_ignores_empty_and_unbalanced_quotes(self, search_index):
+        """Test empty quotes and a lone quote yield no phrases."""
+        assert search_index.quoted_phrases('"" memory "restart') == []
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex."""
+
+    def test_title_match_outranks_body_match(self, index):
+        """Test a boosted field scores higher than a body match."""
+        ranked = [doc_id for doc_id, _ in index.search("memory")]
+
+        assert ranked[0] == "memory"
+        assert set(ranked) == {"memory", "database", "crashloop"}
+
+    def test_all_terms_required(self, index):
+        """Test documents must contain every query term."""
+        assert [doc_id for doc_id, _ in index.search("memory restart")] == ["memory"]
+        assert index.search("memory unknownterm") == []
+
+    def test_prefix_expansion(self, index):
+        """Test a term missing from the vocabulary matches as a prefix."""
+        assert [doc_id for doc_id, _ in index.search("datab")] == ["database"]
+
+    def test_query_without_words(self, index):
+        """Test a query with no alphanumeric characters matches nothing."""
+        assert index.search("->") == []
+
+    def test_limit_and_accept(self, index):
+        """Test results honour the limit and accept predicate."""
+        assert len(index.search("memory", limit=1)) == 1
+        ranked = index.search("memory", accept=lambda doc_id: doc_id != "memory")
+        assert "memory" not in [doc_id for doc_id, _ in ranked]
+
+    def test_ties_keep_insertion_order(self, search_index):
+        """Test equal scores are returned in insertion order."""
+        index = search_index.SearchIndex({"title": 1.0})
+        for doc_id in ("b", "a", "c"):
+            index.add(doc_id, {"title": "same text"})
+
+        assert [doc_id for doc_id, _ in index.search("same")] == ["b", "a", "c"]
+
+    def test_sync_only_touches_changed_documents(self, index):
+        """Test sync adds, replaces and removes just the changed documents."""
+        added, removed = index.sync(
+            [
+                (
+                    "memory",
+                    {
+                        "title": "High Memory Usage",
+                        "steps": ["Check memory limits", "Restart pod"],
+                    },
+                ),
+                ("database", {"title": "Database Timeout", "steps": []}),
+                ("new", {"title": "Disk Full", "steps": []}),
+            ]
+        )
+
+        assert (added, removed) == (2, 1)
+        assert len(index) == 3
+        assert "crashloop" not in index
+        assert [doc_id for doc_id, _ in index.search("timeout")] == ["database"]
+        assert index.search("connection") == []
+
+    def test_remove(self, index):
+        """Test removed documents no longer match."""
+        index.remove("memory")
+
+        assert "memory" not in [doc_id for doc_id, _ in index.search("memory")]
+        assert "memory" not in index
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+from sre_agent.memory.cache import MemoryRetrievalCache
+from sre_agent.memory.client import SREMemoryClient
+from sre_agent.memory.hooks import MemoryHookProvider
+
+
+class TestMemoryRetrievalCache:
+    """Tests for MemoryRetrievalCache."""
+
+    def test_miss_then_hit(self):
+        """Test a stored entry is served from the cache."""
+        cache = MemoryRetrievalCache(ttl_seconds=60)
+        key = ("user123", "/sre/users/user123/preferences", "query", 10)
+
+        assert cache.get(key) is None
+        cache.put(key, [{"content": {"text": "pref"}}])
+
+        assert cache.get(key) == [{"content": {"text": "pref"}}]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entry_expires(self):
+        """Test entries are not served after their TTL."""
+        cache = MemoryRetrievalCache(ttl_seconds=60)
+        key = ("user123", "/sre/investigations/user123", "pod failing", 5)
+        cache.put(key, [])
+        later = time.monotonic() + 61
+
+        with patch("sre_agent.memory.cache.time.monotonic", return_value=later):
+            assert cache.get(key) is None
+
+        assert cache.stats()["entries"] == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the cache stays within max_entries."""
+        cache = MemoryRetrievalCache(ttl_seconds=60, max_entries=2)
+        first = ("user123", "ns", "first", 10)
+        second = ("user123", "ns", "second", 10)
+        third = ("user123", "ns", "third", 10)
+
+        cache.put(first, [])
+        cache.put(second, [])
+        cache.get(first)
+        cache.put(third, [])
+
+        assert cache.get(second) is None
+        assert cache.get(first) == []
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_actor(self):
+        """Test invalidation only drops the given actor's entries."""
+        cache = MemoryRetrievalCache(ttl_seconds=60)
+        cache.put(("user123", "ns", "query", 10), [])
+        cache.put(("other-user", "ns", "query", 10), [])
+
+        assert cache.invalidate_actor("user123") == 1
+        assert cache.get(("user123", "ns", "query", 10)) is None
+        assert cache.get(("other-user", "ns", "query", 10)) == []
+
+    def test_zero_ttl_disables_cache(self):
+        """Test a TTL of 0 turns caching off."""
+        cache = MemoryRetrievalCache(ttl_seconds=0)
+        key = ("user123", "ns", "query", 10)
+        cache.put(key, [])
+
+        assert cache.get(key) is None
+        assert cache.stats()["entries"] == 0
+
+
+class TestSREMemoryClientCache:
+    """Tests for cached retrieval in SREMemoryClient."""
+
+    def _client(self):
+        with patch.object(SREMemoryClient, "_initialize_memories"):
+            with patch("sre_agent.memory.client.MemoryClient"):
+                client = SREMemoryClient()
+        client.memory_id = "memory-123"
+        client.client = Mock()
+        client.client.retrieve_memories.return_value = [{"content": {"text": "x"}}]
+        client.client.create_event.return_value = {"eventId": "event-1"}
+        return client
+
+    def test_repeated_retrieval_uses_cache(self):
+        """Test the same actor/namespace/query only calls the API once."""
+        client = self._client()
+
+        client.retrieve_memories("preferences", "user123", "escalation")
+        client.retrieve_memories("preferences", "user123", "escalation")
+
+        assert client.client.retrieve_memories.call_count == 1
+        assert client.cache_stats()["hits"] == 1
+        assert client.cache_stats()["misses"] == 1
+
+    def test_different_namespace_is_not_shared(self):
+        """Test cache entries are scoped to the namespace."""
+        client = self._client()
+
+        client.retrieve_memories("infrastructure", "user123", "database")
+        client.retrieve_memories(
+            "infrastructure", "user123", "database", session_id="session-1"
+        )
+
+        assert client.client.retrieve_memories.call_count == 2
+
+    def test_save_event_invalidates_actor(self):
+        """Test saving an event forces the next retrieval to hit the API."""
+        client = self._client()
+
+        client.retrieve_memories("preferences", "user123", "escalation")
+        client.save_event("preferences", "user123", {"preference_type": "escalation"})
+        client.retrieve_memories("preferences", "user123", "escalation")
+
+        assert client.client.retrieve_memories.call_count == 2
+
+    def test_use_cache_false_bypasses_cache(self):
+        """Test use_cache=False always queries the service."""
+        client = self._client()
+
+        client.retrieve_memories("preferences", "user123", "escalation")
+        client.retrieve_memories(
+            "preferences", "user123", "escalation", use_cache=False
+        )
+
+        assert client.client.retrieve_memories.call_count == 2
+
+
+class TestInvestigationStartRetrieval:
+    """Tests for concurrent retrieval in MemoryHookProvider.on_investigation_start."""
+
+    def test_lookups_run_concurrently(self):
+        """Test the three memory lookups overlap instead of running in turn."""
+        memory_client = Mock(spec=SREMemoryClient)
+        in_flight = 0
+        peak = 0
+
+        async def slow_retrieve(memory_type, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        memory_client.aretrieve_memories.side_effect = slow_retrieve
+        memory_client.cache_stats.return_value = {}
+        hooks = MemoryHookProvider(memory_client)
+
+        context = asyncio.run(
+            hooks.on_investigation_start(
+                query="Why is my pod failing?",
+                user_id="user123",
+                actor_id="sre-agent",
+                session_id="session-1",
+            )
+        )
+
+        assert memory_client.aretrieve_memories.call_count == 3
+        assert peak == 3
+        assert context["user_preferences"] == []
+        assert context["past_investigations"] == []
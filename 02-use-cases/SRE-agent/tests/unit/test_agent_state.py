@@ -0,0 +1,92 @@
+from langgraph.graph import END, START, StateGraph
+
+from sre_agent.agent_state import AgentState, _merge_dicts
+
+
+def _agent_node(name: str, seconds: float):
+    """Build a node that returns only its own entries, like the agent nodes."""
+
+    def node(state: AgentState) -> dict:
+        return {
+            "agent_results": {name: f"{name} findings"},
+            "metadata": {f"{name}_trace": [name]},
+            "agents_invoked": [name],
+            "agent_timings": {name: seconds},
+        }
+
+    return node
+
+
+class TestMergeDicts:
+    """Tests for the dict reducer used by AgentState."""
+
+    def test_entries_from_both_sides_are_kept(self):
+        """Test an update adds its keys without dropping existing ones."""
+        assert _merge_dicts({"a": 1}, {"b": 2}) == {"a": 1, "b": 2}
+
+    def test_update_wins_for_the_same_key(self):
+        """Test a repeated key takes the value from the update."""
+        assert _merge_dicts({"a": 1, "b": 2}, {"a": 3}) == {"a": 3, "b": 2}
+
+    def test_missing_sides_are_treated_as_empty(self):
+        """Test None on either side does not raise."""
+        assert _merge_dicts(None, {"a": 1}) == {"a": 1}
+        assert _merge_dicts({"a": 1}, None) == {"a": 1}
+        assert _merge_dicts(None, None) == {}
+
+    def test_inputs_are_not_modified(self):
+        """Test the reducer returns a new dict."""
+        left = {"a": 1}
+        right = {"b": 2}
+
+        _merge_dicts(left, right)
+
+        assert left == {"a": 1}
+        assert right == {"b": 2}
+
+
+class TestParallelAgentResults:
+    """Tests for merging results of agents that run in the same step."""
+
+    def _run(self, agents):
+        graph = StateGraph(AgentState)
+        for name in agents:
+            graph.add_node(name, _agent_node(name, 1.0))
+            graph.add_edge(START, name)
+            graph.add_edge(name, END)
+        return graph.compile().invoke(
+            {
+                "messages": [],
+                "agent_results": {"Earlier Agent": "earlier findings"},
+                "metadata": {"plan": "kept"},
+                "agents_invoked": ["Earlier Agent"],
+                "agent_timings": {"Earlier Agent": 2.0},
+            }
+        )
+
+    def test_parallel_updates_are_merged(self):
+        """Test every agent's entries survive a fan-out to several agents."""
+        state = self._run(["Logs Agent", "Metrics Agent"])
+
+        assert state["agent_results"] == {
+            "Earlier Agent": "earlier findings",
+            "Logs Agent": "Logs Agent findings",
+            "Metrics Agent": "Metrics Agent findings",
+        }
+        assert state["metadata"] == {
+            "plan": "kept",
+            "Logs Agent_trace": ["Logs Agent"],
+            "Metrics Agent_trace": ["Metrics Agent"],
+        }
+        assert state["agent_timings"] == {
+            "Earlier Agent": 2.0,
+            "Logs Agent": 1.0,
+            "Metrics Agent": 1.0,
+        }
+
+    def test_agents_invoked_is_appended(self):
+        """Test invoked agents are appended rather than replaced."""
+        state = self._run(["Logs Agent", "Metrics Agent"])
+
+        assert state["agents_invoked"][0] == "Earlier Agent"
+        assert sorted(state["agents_invoked"][1:]) == ["Logs Agent", "Metrics Agent"]
@@ -0,0 +1,232 @@
+import json
+import logging
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from sre_agent.conversation_journal import ConversationJournal
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def _conversation(turns: int) -> list:
+    messages = []
+    for turn in range(turns):
+        messages.append(HumanMessage(content=f"question {turn}"))
+        messages.append(AIMessage(content=f"answer {turn}"))
+    return messages
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "state.jsonl"
+
+
+class TestSaveAndLoad:
+    """Tests for the save/load round trip."""
+
+    def test_round_trip(self, path):
+        """Test saved messages and state are restored by a new journal."""
+        ConversationJournal(str(path)).save(_conversation(2), {"current_query": "q"})
+
+        messages, state = ConversationJournal(str(path)).load()
+
+        assert messages == [
+            {"role": "user", "content": "question 0"},
+            {"role": "assistant", "content": "answer 0"},
+            {"role": "user", "content": "question 1"},
+            {"role": "assistant", "content": "answer 1"},
+        ]
+        assert state == {"current_query": "q"}
+
+    def test_missing_journal(self, path):
+        """Test loading without a journal returns nothing."""
+        assert ConversationJournal(str(path)).load() == (None, None)
+
+    def test_save_appends_only_new_messages(self, path):
+        """Test a later save appends the new messages without rewriting the file."""
+        journal = ConversationJournal(str(path))
+        messages = _conversation(1)
+        journal.save(messages, {})
+        before = path.read_bytes()
+
+        messages.append(HumanMessage(content="follow up"))
+        assert journal.save(messages, {}) == 1
+
+        assert path.read_bytes().startswith(before)
+        assert _records(path)[-1] == {
+            "type": "message",
+            "role": "user",
+            "content": "follow up",
+        }
+
+    def test_state_change_is_recorded(self, path):
+        """Test a changed state is written and wins on load."""
+        journal = ConversationJournal(str(path))
+        messages = _conversation(1)
+        journal.save(messages, {"step": 1})
+        journal.save(messages, {"step": 2})
+
+        _, state = ConversationJournal(str(path)).load()
+
+        assert state == {"step": 2}
+
+    def test_resume_is_limited_and_logged(self, path, caplog):
+        """Test only the most recent messages are resumed, with a log line."""
+        ConversationJournal(str(path)).save(_conversation(5), {})
+
+        with caplog.at_level(logging.INFO, logger="sre_agent.conversation_journal"):
+            messages, _ = ConversationJournal(str(path), resume_messages=3).load()
+
+        assert [m["content"] for m in messages] == [
+            "answer 3",
+            "question 4",
+            "answer 4",
+        ]
+        assert "resuming with the most recent 3" in caplog.text
+
+    def test_full_resume_is_not_logged_as_truncated(self, path, caplog):
+        """Test no truncation is logged when every message fits."""
+        ConversationJournal(str(path)).save(_conversation(2), {})
+
+        with caplog.at_level(logging.INFO, logger="sre_agent.conversation_journal"):
+            ConversationJournal(str(path), resume_messages=4).load()
+
+        assert "resuming with the most recent" not in caplog.text
+
+
+class TestClear:
+    """Tests for the reset record written after /clear."""
+
+    def test_clear_writes_reset(self, path):
+        """Test a history that no longer extends the saved one starts a new conversation."""
+        journal = ConversationJournal(str(path))
+        journal.save(_conversation(2), {"step": 1})
+
+        journal.save([HumanMessage(content="fresh start")], {"step": 0})
+
+        records = _records(path)
+        assert records[-2]["type"] == "reset"
+        assert records[-2]["state"] == {"step": 0}
+        messages, state = ConversationJournal(str(path)).load()
+        assert messages == [{"role": "user", "content": "fresh start"}]
+        assert state == {"step": 0}
+
+    def test_empty_history_after_clear(self, path):
+        """Test clearing to an empty history resumes nothing."""
+        journal = ConversationJournal(str(path))
+        journal.save(_conversation(1), {})
+
+        journal.save([], {})
+
+        assert ConversationJournal(str(path)).load() == ([], {})
+
+
+class TestCompaction:
+    """Tests for compaction."""
+
+    def test_compact_drops_cleared_conversations(self, path):
+        """Test compaction keeps only the live conversation."""
+        journal = ConversationJournal(str(path), compact_min_bytes=10**9)
+        journal.save(_conversation(20), {"step": 1})
+        journal.save([HumanMessage(content="after clear")], {"step": 2})
+        size = path.stat().st_size
+
+        journal.compact()
+
+        assert path.stat().st_size < size
+        assert [record["type"] for record in _records(path)] == ["reset", "message"]
+        assert ConversationJournal(str(path)).load() == (
+            [{"role": "user", "content": "after clear"}],
+            {"step": 2},
+        )
+
+    def test_compaction_runs_automatically(self, path):
+        """Test dead bytes past the threshold trigger compaction on save."""
+        journal = ConversationJournal(str(path), compact_min_bytes=1)
+        journal.save(_conversation(20), {})
+
+        journal.save([HumanMessage(content="after clear")], {})
+
+        assert [record["type"] for record in _records(path)] == ["reset", "message"]
+
+    def test_saves_continue_after_compaction(self, path):
+        """Test appends after compaction extend the compacted journal."""
+        journal = ConversationJournal(str(path), compact_min_bytes=1)
+        journal.save(_conversation(20), {})
+        messages = [HumanMessage(content="after clear")]
+        journal.save(messages, {})
+
+        messages.append(AIMessage(content="reply"))
+        journal.save(messages, {})
+
+        loaded, _ = ConversationJournal(str(path)).load()
+        assert [m["content"] for m in loaded] == ["after clear", "reply"]
+
+
+class TestTornLine:
+    """Tests for a torn last line left by an interrupted write."""
+
+    def test_torn_line_is_skipped(self, path):
+        """Test loading ignores a partial final record."""
+        ConversationJournal(str(path)).save(_conversation(1), {})
+        with open(path, "ab") as f:
+            f.write(b'{"type": "message", "role": "user", "cont')
+
+        messages, _ = ConversationJournal(str(path)).load()
+
+        assert [m["content"] for m in messages] == ["question 0", "answer 0"]
+
+    def test_save_after_torn_line_starts_on_a_new_line(self, path):
+        """Test the next append is not glued onto the torn record."""
+        ConversationJournal(str(path)).save(_conversation(1), {})
+        with open(path, "ab") as f:
+            f.write(b'{"type": "message", "role": "user", "cont')
+
+        journal = ConversationJournal(str(path))
+        messages = [HumanMessage(content="question 0"), AIMessage(content="answer 0")]
+        journal.load()
+        messages.append(HumanMessage(content="next"))
+        journal.save(messages, {})
+
+        loaded, _ = ConversationJournal(str(path)).load()
+        assert [m["content"] for m in loaded] == ["question 0", "answer 0", "next"]
+
+
+class TestLegacyMigration:
+    """Tests for migrating the JSON state file used before the journal."""
+
+    def test_legacy_state_is_migrated(self, path):
+        """Test the old .json file is converted into the journal on first load."""
+        legacy = path.with_suffix(".json")
+        legacy.write_text(
+            json.dumps(
+                {
+                    "messages": [
+                        HumanMessage(content="old question").model_dump(),
+                        AIMessage(content="old answer").model_dump(),
+                    ],
+                    "state": {"current_query": "old question"},
+                    "timestamp": "2025-01-01T00:00:00",
+                }
+            )
+        )
+
+        messages, state = ConversationJournal(str(path)).load()
+
+        assert messages == [
+            {"role": "user", "content": "old question"},
+            {"role": "assistant", "content": "old answer"},
+        ]
+        assert state == {"current_query": "old question"}
+        assert path.exists()
+        assert legacy.exists()
+
+    def test_unreadable_legacy_state_is_ignored(self, path):
+        """Test a corrupt legacy file leaves no journal behind."""
+        path.with_suffix(".json").write_text("{not json")
+
+        assert ConversationJournal(str(path)).load() == (None, None)
+        assert not path.exists()
@@ -0,0 +1,123 @@
+from sre_agent.constants import SREConstants
+from sre_agent.supervisor import InvestigationPlan, plan_execution_waves
+
+
+def _plan(steps, agents_sequence):
+    return InvestigationPlan(
+        steps=steps,
+        agents_sequence=agents_sequence,
+        complexity="simple",
+        auto_execute=True,
+        reasoning="test plan",
+    )
+
+
+class TestPlanExecutionWaves:
+    """Tests for grouping plan steps into concurrent waves."""
+
+    def test_independent_steps_share_a_wave(self):
+        """Test steps with no dependency on each other run together."""
+        plan = _plan(
+            [
+                "Check pod status for the payment service",
+                "Search payment service logs for errors",
+                "Review payment service latency metrics",
+            ],
+            ["kubernetes_agent", "logs_agent", "metrics_agent"],
+        )
+
+        assert plan_execution_waves(plan) == [[0, 1, 2]]
+
+    def test_follow_up_agent_waits_for_earlier_steps(self):
+        """Test the runbooks agent starts a new wave."""
+        plan = _plan(
+            [
+                "Check pod status for the payment service",
+                "Search payment service logs for errors",
+                "Find a runbook for the payment service",
+            ],
+            ["kubernetes_agent", "logs_agent", "runbooks_agent"],
+        )
+
+        assert plan_execution_waves(plan) == [[0, 1], [2]]
+
+    def test_dependency_marker_waits_for_earlier_steps(self):
+        """Test a step that builds on earlier findings starts a new wave."""
+        plan = _plan(
+            [
+                "Check pod status for the payment service",
+                "Review metrics based on the pods identified above",
+            ],
+            ["kubernetes_agent", "metrics_agent"],
+        )
+
+        assert plan_execution_waves(plan) == [[0], [1]]
+
+    def test_dependency_marker_is_case_insensitive(self):
+        """Test markers match regardless of the step's capitalisation."""
+        plan = _plan(
+            ["Check pod status", "Correlate errors with the pod restarts"],
+            ["kubernetes_agent", "logs_agent"],
+        )
+
+        assert plan_execution_waves(plan) == [[0], [1]]
+
+    def test_repeated_agent_starts_a_new_wave(self):
+        """Test the same agent never runs twice in one wave."""
+        plan = _plan(
+            [
+                "Search payment service logs for errors",
+                "Review payment service latency metrics",
+                "Search database logs for slow queries",
+            ],
+            ["logs_agent", "metrics_agent", "logs_agent"],
+        )
+
+        assert plan_execution_waves(plan) == [[0, 1], [2]]
+
+    def test_wave_is_limited_to_max_parallel_agents(self, monkeypatch):
+        """Test a full wave is closed before the next step is added."""
+        monkeypatch.setattr(SREConstants.plan_execution, "max_parallel_agents", 2)
+        plan = _plan(
+            ["Check pods", "Search logs", "Review metrics"],
+            ["kubernetes_agent", "logs_agent", "metrics_agent"],
+        )
+
+        assert plan_execution_waves(plan) == [[0, 1], [2]]
+
+    def test_missing_step_descriptions_do_not_add_dependencies(self):
+        """Test agents without a matching step are grouped by agent only."""
+        plan = _plan(
+            ["Check pods"],
+            ["kubernetes_agent", "logs_agent", "metrics_agent"],
+        )
+
+        assert plan_execution_waves(plan) == [[0, 1, 2]]
+
+    def test_every_step_runs_once_in_plan_order(self):
+        """Test flattening the waves gives back the plan order."""
+        plan = _plan(
+            [
+                "Check pods",
+                "Search logs",
+                "Search logs again after the restart",
+                "Review metrics",
+                "Find a runbook",
+            ],
+            [
+                "kubernetes_agent",
+                "logs_agent",
+                "logs_agent",
+                "metrics_agent",
+                "runbooks_agent",
+            ],
+        )
+
+        waves = plan_execution_waves(plan)
+
+        assert [index for wave in waves for index in wave] == list(range(5))
+        assert waves == [[0, 1], [2, 3], [4]]
+
+    def test_empty_plan_has_no_waves(self):
+        """Test a plan without agents produces no waves."""
+        assert plan_execution_waves(_plan([], [])) == []
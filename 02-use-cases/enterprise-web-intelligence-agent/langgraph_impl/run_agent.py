@@ -13,6 +13,7 @@ sys.path.append(parent_dir)
 
 # Use our own utils.imports module
 from utils.imports import setup_interactive_tools_import
+
 paths = setup_interactive_tools_import()
 
 from rich.console import Console
@@ -23,7 +24,9 @@ from rich.panel import Panel
 from config import AgentConfig
 from agent import CompetitiveIntelligenceAgent
 from shared.utils.s3_datasource import UnifiedS3DataSource
-from interactive_tools.live_view_sessionreplay.session_replay_viewer import SessionReplayViewer
+from interactive_tools.live_view_sessionreplay.session_replay_viewer import (
+    SessionReplayViewer,
+)
 
 console = Console()
 
@@ -34,7 +37,7 @@ def get_bedrock_agentcore_single() -> List[Dict]:
         {
             "name": "AWS Bedrock AgentCore",
             "url": "https://aws.amazon.com/bedrock/agentcore/pricing/",
-            "analyze": ["pricing", "features", "models", "regions"]
+            "analyze": ["pricing", "features", "models", "regions"],
         }
     ]
 
@@ -45,30 +48,30 @@ def get_bedrock_vs_vertex() -> List[Dict]:
         {
             "name": "AWS Bedrock AgentCore",
             "url": "https://aws.amazon.com/bedrock/agentcore/pricing/",
-            "analyze": ["pricing", "features", "models", "regions"]
+            "analyze": ["pricing", "features", "models", "regions"],
         },
         {
             "name": "Google Vertex AI",
             "url": "https://cloud.google.com/vertex-ai/pricing",
-            "analyze": ["pricing", "features", "models", "apis"]
-        }
+            "analyze": ["pricing", "features", "models", "apis"],
+        },
     ]
 
 
 def get_custom_competitors() -> List[Dict]:
     """Get custom competitors from user input with explicit analysis options."""
     competitors = []
-    
+
     console.print("\n[bold]Enter competitors to analyze:[/bold]")
     console.print("[dim]Press Enter with empty name to finish[/dim]\n")
-    
+
     while True:
         name = Prompt.ask("Competitor name", default="")
         if not name:
             break
-            
+
         url = Prompt.ask(f"URL for {name}")
-        
+
         # Let user specify what to analyze
         console.print("\n[cyan]What would you like to analyze?[/cyan]")
         console.print("1. Pricing information")
@@ -76,12 +79,11 @@ def get_custom_competitors() -> List[Dict]:
         console.print("3. API documentation")
         console.print("4. Company/About information")
         console.print("5. All of the above")
-        
+
         analysis_choice = Prompt.ask(
-            "Select options (comma-separated, e.g., 1,2,3)",
-            default="1,2"
+            "Select options (comma-separated, e.g., 1,2,3)", default="1,2"
         )
-        
+
         analyze = []
         if "1" in analysis_choice:
             analyze.extend(["pricing", "tiers"])
@@ -92,12 +94,22 @@ def get_custom_competitors() -> List[Dict]:
         if "4" in analysis_choice:
             analyze.extend(["about", "company", "team"])
         if "5" in analysis_choice:
-            analyze = ["pricing", "tiers", "features", "capabilities", 
-                      "api", "docs", "about", "company"]
-        
+            analyze = [
+                "pricing",
+                "tiers",
+                "features",
+                "capabilities",
+                "api",
+                "docs",
+                "about",
+                "company",
+            ]
+
         # Ask for specific URLs (optional)
         additional_urls = {}
-        if Confirm.ask("Do you have specific URLs for pricing/docs pages?", default=False):
+        if Confirm.ask(
+            "Do you have specific URLs for pricing/docs pages?", default=False
+        ):
             if "pricing" in analyze:
                 pricing_url = Prompt.ask("Pricing page URL (optional)", default="")
                 if pricing_url:
@@ -106,17 +118,21 @@ def get_custom_competitors() -> List[Dict]:
                 docs_url = Prompt.ask("API/Docs URL (optional)", default="")
                 if docs_url:
                     additional_urls["docs_url"] = docs_url
-        
-        competitors.append({
-            "name": name,
-            "url": url,
-            "analyze": analyze,
-            "additional_urls": additional_urls,
-            "auto_discover": True
-        })
-        
-        console.print(f"[green]✓ Added {name} - will analyze: {', '.join(analyze)}[/green]\n")
-    
+
+        competitors.append(
+            {
+                "name": name,
+                "url": url,
+                "analyze": analyze,
+                "additional_urls": additional_urls,
+                "auto_discover": True,
+            }
+        )
+
+        console.print(
+            f"[green]✓ Added {name} - will analyze: {', '.join(analyze)}[/green]\n"
+        )
+
     return competitors
 
 
@@ -127,46 +143,45 @@ def show_competitors_table(competitors: List[Dict]):
     table.add_column("Name", style="magenta")
     table.add_column("URL", style="blue")
     table.add_column("Analysis Focus", style="green")
-    
+
     for i, comp in enumerate(competitors, 1):
         table.add_row(
             str(i),
-            comp['name'],
-            comp['url'][:50] + "..." if len(comp['url']) > 50 else comp['url'],
-            ", ".join(comp.get('analyze', []))
+            comp["name"],
+            comp["url"][:50] + "..." if len(comp["url"]) > 50 else comp["url"],
+            ", ".join(comp.get("analyze", [])),
         )
-    
-    console.print(table)
 
+    console.print(table)
 
 
 async def view_replay(recording_config: Any, config: AgentConfig):
     """
     Start the session replay viewer using the recording configuration.
-    
+
     Args:
         recording_config: Either a dict with S3Location or a string path
         config: Agent configuration
     """
     try:
         console.print("\n[cyan]🎭 Starting session replay viewer...[/cyan]")
-        
+
         # Handle both structured config and legacy string format
         if isinstance(recording_config, dict):
             # New structured format from API
-            if 's3Location' in recording_config:
-                s3_location = recording_config['s3Location']
-                bucket = s3_location.get('bucket')
-                prefix = s3_location.get('prefix', '').rstrip('/')
+            if "s3Location" in recording_config:
+                s3_location = recording_config["s3Location"]
+                bucket = s3_location.get("bucket")
+                prefix = s3_location.get("prefix", "").rstrip("/")
             else:
                 # Direct dict with bucket and prefix
-                bucket = recording_config.get('bucket')
-                prefix = recording_config.get('prefix', '').rstrip('/')
-            
+                bucket = recording_config.get("bucket")
+                prefix = recording_config.get("prefix", "").rstrip("/")
+
             # Extract session ID from prefix
-            prefix_parts = prefix.split('/')
-            session_id = prefix_parts[-1] if prefix_parts else 'unknown'
-            
+            prefix_parts = prefix.split("/")
+            session_id = prefix_parts[-1] if prefix_parts else "unknown"
+
         elif isinstance(recording_config, str):
             # Legacy string format (s3://bucket/prefix/session_id/)
             console.print("[yellow]⚠️ Using legacy S3 path format[/yellow]")
@@ -175,86 +190,96 @@ async def view_replay(recording_config: Any, config: AgentConfig):
             prefix = "/".join(parts[1:-1]) if len(parts) > 2 else ""
             session_id = parts[-1] if len(parts) > 1 else "unknown"
         else:
-            raise ValueError(f"Invalid recording configuration format: {type(recording_config)}")
-        
+            raise ValueError(
+                f"Invalid recording configuration format: {type(recording_config)}"
+            )
+
         console.print(f"[dim]Bucket: {bucket}[/dim]")
         console.print(f"[dim]Prefix: {prefix}[/dim]")
         console.print(f"[dim]Session: {session_id}[/dim]")
-        
+
         # Wait for recordings to be uploaded
         console.print("⏳ Waiting for recordings to be uploaded to S3 (30 seconds)...")
         await asyncio.sleep(30)
-        
+
         # Use the unified S3 data source
         data_source = UnifiedS3DataSource(
-            bucket=bucket,
-            prefix=prefix,
-            session_id=session_id
+            bucket=bucket, prefix=prefix, session_id=session_id
         )
-        
+
         # Start replay viewer
         console.print(f"🎬 Starting session replay viewer for: {session_id}")
         viewer = SessionReplayViewer(
-            data_source=data_source,
-            port=config.replay_viewer_port
+            data_source=data_source, port=config.replay_viewer_port
         )
         viewer.start()
-        
+
     except Exception as e:
         console.print(f"[red]❌ Error starting replay viewer: {e}[/red]")
         import traceback
+
         traceback.print_exc()
 
-async def choose_session_to_replay(results: Dict):
-    """Allow user to choose which session to replay when multiple are available."""
-    if not results.get("parallel_sessions"):
-        # Only one session, use the default
+
+async def choose_session_to_replay(results: Dict) -> Optional[str]:
+    """Let the user pick a competitor's recording after a parallel run.
+
+    Returns the chosen recording path, or None when there was a single session.
+    """
+    sessions = [
+        s for s in results.get("parallel_sessions", []) if s.get("recording_path")
+    ]
+    if not sessions:
         return None
-    
+
     console.print("\n[bold cyan]Multiple browser sessions available:[/bold cyan]")
     console.print("Choose which competitor session to replay:")
-    
-    sessions = results.get("parallel_sessions", [])
+
     for i, session in enumerate(sessions):
-        console.print(f"{i+1}. {session.get('name', 'Unknown')} - {session.get('session_id', 'Unknown')}")
-    
+        console.print(
+            f"{i + 1}. {session.get('name', 'Unknown')} - {session.get('session_id', 'Unknown')}"
+        )
+
     choice = Prompt.ask(
-        "Select session to replay", 
-        choices=[str(i+1) for i in range(len(sessions))],
-        default="1"
+        "Select session to replay",
+        choices=[str(i + 1) for i in range(len(sessions))],
+        default="1",
     )
-    
+
     selected_index = int(choice) - 1
     selected_session = sessions[selected_index]
     console.print(f"[cyan]Selected: {selected_session.get('name', 'Unknown')}[/cyan]")
-    
-    return selected_session.get("session_id")
+
+    return selected_session["recording_path"]
+
 
 async def main():
     """Main function to run the agent."""
-    console.print(Panel(
-        "[bold cyan]🎯 Competitive Intelligence Agent[/bold cyan]\n\n"
-        "[bold]Powered by Amazon Bedrock AgentCore[/bold]\n\n"
-        "Enhanced Features:\n"
-        "• 🔍 Automated browser navigation with CDP\n"
-        "• 📊 Intelligent content extraction with LLM\n"
-        "• 📸 Screenshot capture with annotations\n"
-        "• 📹 Full session recording to S3\n"
-        "• 🎭 Session replay capability\n"
-        "• 🤖 Claude 3.5 Sonnet for analysis\n"
-        "• 🔄 Multi-tool orchestration\n"
-        "• ⚡ Parallel processing support\n"
-        "• 💾 Session persistence & resume\n"
-        "• ☁️ AWS CLI integration\n"
-        "• 📝 Advanced form analysis\n"
-        "• 🌐 Multi-page workflows",
-        title="Welcome",
-        border_style="blue"
-    ))
-    
+    console.print(
+        Panel(
+            "[bold cyan]🎯 Competitive Intelligence Agent[/bold cyan]\n\n"
+            "[bold]Powered by Amazon Bedrock AgentCore[/bold]\n\n"
+            "Enhanced Features:\n"
+            "• 🔍 Automated browser navigation with CDP\n"
+            "• 📊 Intelligent content extraction with LLM\n"
+            "• 📸 Screenshot capture with annotations\n"
+            "• 📹 Full session recording to S3\n"
+            "• 🎭 Session replay capability\n"
+            "• 🤖 Claude 3.5 Sonnet for analysis\n"
+            "• 🔄 Multi-tool orchestration\n"
+            "• ⚡ Parallel processing support\n"
+            "• 💾 Session persistence & resume\n"
+            "• ☁️ AWS CLI integration\n"
+            "• 📝 Advanced form analysis\n"
+            "• 🌐 Multi-page workflows",
+            title="Welcome",
+            border_style="blue",
+        )
+    )
+
     # Load configuration
     config = AgentConfig()
-    
+
     # Validate configuration
     if not config.validate():
         console.print("[red]❌ Configuration validation failed[/red]")
@@ -264,7 +289,7 @@ async def main():
         console.print("  - S3_RECORDING_BUCKET (optional)")
         console.print("  - S3_RECORDING_PREFIX (optional)")
         return
-    
+
     # Show configuration
     console.print("\n[bold]Configuration:[/bold]")
     console.print(f"  Region: {config.region}")
@@ -273,20 +298,20 @@ async def main():
     console.print(f"  S3 Prefix: {config.s3_prefix}")
     console.print(f"  Role ARN: {config.recording_role_arn}")
     console.print()
-    
+
     # Check for resume option
     resume_session = None
     if Confirm.ask("Do you want to resume a previous session?", default=False):
         resume_session = Prompt.ask("Enter session ID to resume")
-    
+
     # Get competitors
     console.print("\n[bold]Select analysis option:[/bold]")
     console.print("1. 🎯 AWS Bedrock AgentCore Pricing Only")
     console.print("2. 🆚 Compare Bedrock AgentCore vs Vertex AI")
     console.print("3. ✏️  Custom competitors")
-    
+
     choice = Prompt.ask("Select option", choices=["1", "2", "3"], default="1")
-    
+
     if choice == "1":
         competitors = get_bedrock_agentcore_single()
     elif choice == "2":
@@ -296,22 +321,23 @@ async def main():
         if not competitors:
             console.print("[yellow]No competitors entered. Exiting.[/yellow]")
             return
-    
+
     # Show competitors
     show_competitors_table(competitors)
-    
+
     # Ask for processing mode
     parallel_mode = False
-    force_parallel = False
     if len(competitors) > 1:
         parallel_mode = Confirm.ask(
             f"\n⚡ Use parallel processing for {len(competitors)} competitors?",
-            default=False
+            default=False,
         )
-        
+
         if parallel_mode:
-            console.print("[yellow]Note: Parallel processing will limit live view visibility[/yellow]")
-            console.print("[yellow]⚠️ Session replay will not be available in parallel mode[/yellow]")
+            console.print(
+                f"[yellow]Note: Up to {config.max_parallel_browsers} competitors run at once in their own browser sessions; "
+                "the live viewer shows the main session only[/yellow]"
+            )
 
     if not Confirm.ask("\nProceed with analysis?", default=True):
         console.print("[yellow]Analysis cancelled.[/yellow]")
@@ -323,7 +349,7 @@ async def main():
     try:
         # Initialize with optional session resume
         await agent.initialize(resume_session_id=resume_session)
-        
+
         # Show what to watch for
         watch_panel = Panel(
             "[bold yellow]👁️  Watch the Live Browser Viewer![/bold yellow]\n\n"
@@ -336,21 +362,23 @@ async def main():
             "• Take annotated screenshots\n"
             "• Track API endpoints\n"
             "• Generate a comprehensive report\n\n"
-            f"[bold]Mode:[/bold] {'⚡ Parallel' if parallel_mode else '🔄 Sequential'}" +
-            (f" (forced)" if force_parallel else "") + "\n\n"
+            f"[bold]Mode:[/bold] {'⚡ Parallel' if parallel_mode else '🔄 Sequential'}\n\n"
             "[dim]You can take manual control at any time using the viewer controls[/dim]",
-            border_style="yellow"
+            border_style="yellow",
         )
         console.print(watch_panel)
-        
+
         console.print("\n[cyan]Starting automated analysis in 5 seconds...[/cyan]")
-        console.print("[dim]Open the browser viewer link above to watch the automation![/dim]")
+        console.print(
+            "[dim]Open the browser viewer link above to watch the automation![/dim]"
+        )
         await asyncio.sleep(5)
-        
+
         # Run analysis
-        results = await agent.run(competitors, parallel=parallel_mode, force_parallel=False)
-        
+        results = await agent.run(competitors, parallel=parallel_mode)
+
         if results["success"]:
+            stats = results.get("execution_stats", {})
             # Show results summary
             results_panel = Panel(
                 f"[bold green]✅ Analysis Complete![/bold green]\n\n"
@@ -361,32 +389,47 @@ async def main():
                 f"📄 Report generated: Yes\n"
                 f"📹 Session recorded: Yes\n"
                 f"💾 Session ID: {results.get('session_id', 'N/A')}\n"
-                f"⚡ Processing mode: {'Parallel' if parallel_mode else 'Sequential'}",
-                border_style="green"
+                f"⚡ Processing mode: {'Parallel' if parallel_mode else 'Sequential'}\n"
+                f"⏱️ Analysis time: {stats.get('total_duration', 0):.1f}s"
+                + (
+                    f" (sequential baseline {stats.get('sequential_duration', 0):.1f}s, "
+                    f"{stats.get('speedup', 1):.1f}x faster)"
+                    if stats.get("mode") == "parallel"
+                    else ""
+                ),
+                border_style="green",
             )
             console.print(results_panel)
-            
+
             # Show report preview
             if results.get("report"):
                 console.print("\n[bold]Report Preview:[/bold]")
                 console.print("-" * 60)
-                preview = results['report'][:1500]
-                console.print(preview + "..." if len(results['report']) > 1500 else preview)
+                preview = results["report"][:1500]
+                console.print(
+                    preview + "..." if len(results["report"]) > 1500 else preview
+                )
                 console.print("-" * 60)
-            
+
             # Show discovered APIs if any
             if results.get("apis_discovered"):
                 console.print("\n[bold]Discovered API Endpoints:[/bold]")
                 for api in results["apis_discovered"][:5]:  # Show first 5
                     console.print(f"  • {api['url'][:80]}...")
                 if len(results["apis_discovered"]) > 5:
-                    console.print(f"  ... and {len(results['apis_discovered']) - 5} more")
-            
+                    console.print(
+                        f"  ... and {len(results['apis_discovered']) - 5} more"
+                    )
+
             # Save session info
             if results.get("session_id"):
-                console.print(f"\n[cyan]💾 Session saved with ID: {results['session_id']}[/cyan]")
-                console.print("[dim]You can resume this session later using this ID[/dim]")
-            
+                console.print(
+                    f"\n[cyan]💾 Session saved with ID: {results['session_id']}[/cyan]"
+                )
+                console.print(
+                    "[dim]You can resume this session later using this ID[/dim]"
+                )
+
             # Ask about replay
             if results.get("recording_config") or results.get("recording_path"):
                 replay_prompt = Panel(
@@ -397,22 +440,29 @@ async def main():
                     "• Share findings with stakeholders\n"
                     "• Debug any issues\n"
                     "• Create training materials",
-                    border_style="cyan"
+                    border_style="cyan",
                 )
                 console.print(replay_prompt)
-                
+
                 if Confirm.ask("\nView session replay?", default=True):
                     # Use recording_config if available, fallback to recording_path
-                    recording_data = results.get("recording_config") or results.get("recording_path")
+                    recording_data = (
+                        await choose_session_to_replay(results)
+                        or results.get("recording_config")
+                        or results.get("recording_path")
+                    )
                     await view_replay(recording_data, config)
         else:
-            console.print(f"\n[red]Analysis failed: {results.get('error', 'Unknown error')}[/red]")
-    
+            console.print(
+                f"\n[red]Analysis failed: {results.get('error', 'Unknown error')}[/red]"
+            )
+
     except KeyboardInterrupt:
         console.print("\n[yellow]Analysis interrupted by user[/yellow]")
     except Exception as e:
         console.print(f"\n[red]Unexpected error: {e}[/red]")
         import traceback
+
         traceback.print_exc()
     finally:
         # Always cleanup
@@ -428,4 +478,5 @@ if __name__ == "__main__":
     except Exception as e:
         console.print(f"\n[red]Unexpected error: {e}[/red]")
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+
+        traceback.print_exc()
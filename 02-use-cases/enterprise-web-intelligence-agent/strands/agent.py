@@ -2,6 +2,8 @@
 
 import asyncio
 import json
+import re
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -11,6 +13,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.imports import setup_interactive_tools_import
+
 paths = setup_interactive_tools_import()
 
 from strands import Agent, tool
@@ -35,7 +38,7 @@ console = Console()
 
 class CompetitiveIntelligenceAgent:
     """Strands agent for competitive intelligence gathering."""
-    
+
     def __init__(self, config: AgentConfig):
         self.config = config
         self.browser_tools = BrowserTools(config)
@@ -45,7 +48,7 @@ class CompetitiveIntelligenceAgent:
         self.parallel_browser_sessions = []
         # Store the event loop
         self.loop = None
-    
+
     def _safe_state_get(self, key: str, default: Any = None) -> Any:
         """Safely get state value with default."""
         try:
@@ -53,30 +56,32 @@ class CompetitiveIntelligenceAgent:
             return value if value is not None else default
         except:
             return default
-    
+
     async def initialize(self, resume_session_id: Optional[str] = None):
         """Initialize the agent and its tools with optional session resume."""
-        console.print(Panel(
-            "[bold cyan]🎯 Competitive Intelligence Agent[/bold cyan]\n\n"
-            "[bold]Powered by Amazon Bedrock and Strands Framework[/bold]\n\n"
-            "Features:\n"
-            "• 🌐 Automated browser navigation\n"
-            "• 📊 Real-time API and network analysis\n"
-            "• 🎯 Intelligent content extraction\n"
-            "• 📸 Screenshot capture\n"
-            "• 📹 Full session recording to S3\n"
-            "• 🔄 Multi-tool orchestration\n"
-            "• ⚡ Parallel processing support\n",
-            title="Initializing",
-            border_style="blue"
-        ))
-        
+        console.print(
+            Panel(
+                "[bold cyan]🎯 Competitive Intelligence Agent[/bold cyan]\n\n"
+                "[bold]Powered by Amazon Bedrock and Strands Framework[/bold]\n\n"
+                "Features:\n"
+                "• 🌐 Automated browser navigation\n"
+                "• 📊 Real-time API and network analysis\n"
+                "• 🎯 Intelligent content extraction\n"
+                "• 📸 Screenshot capture\n"
+                "• 📹 Full session recording to S3\n"
+                "• 🔄 Multi-tool orchestration\n"
+                "• ⚡ Parallel processing support\n",
+                title="Initializing",
+                border_style="blue",
+            )
+        )
+
         # Store the current event loop
         self.loop = asyncio.get_event_loop()
-        
+
         # Initialize browser with recording
         self.browser_tools.create_browser_with_recording()
-        
+
         # Set up session manager for persistence
         session_manager = None
         if resume_session_id:
@@ -85,30 +90,29 @@ class CompetitiveIntelligenceAgent:
                 session_id=resume_session_id,
                 bucket=self.config.s3_bucket,
                 prefix=f"{self.config.s3_prefix}sessions/",
-                region_name=self.config.region
+                region_name=self.config.region,
             )
-        
+
         # Initialize Bedrock model
         bedrock_model = BedrockModel(
-            model_id=self.config.llm_model_id,
-            region_name=self.config.region
+            model_id=self.config.llm_model_id, region_name=self.config.region
         )
-        
+
         # Initialize browser session with CDP - IMPORTANT: Do this before creating agent
         await self.browser_tools.initialize_browser_session(bedrock_model)
-        
+
         # Initialize code interpreter
         self.analysis_tools.initialize()
-        
+
         # Create the main Strands agent with all tools
         self.agent = Agent(
             model=bedrock_model,
             system_prompt=self._get_system_prompt(),
             tools=self._create_agent_tools(),
             session_manager=session_manager,
-            callback_handler=self._create_callback_handler()
+            callback_handler=self._create_callback_handler(),
         )
-        
+
         # Initialize state if starting fresh
         if not resume_session_id:
             self.agent.state.set("competitors", [])
@@ -120,21 +124,22 @@ class CompetitiveIntelligenceAgent:
             self.agent.state.set("parallel_mode", False)
         else:
             console.print("[green]✅ Previous session data loaded[/green]")
-        
+
         # Start browser live viewer
         if self.browser_tools.browser_client:
             console.print("\n[cyan]🖥️ Starting live browser viewer...[/cyan]")
             self.browser_viewer = BrowserViewerServer(
-                self.browser_tools.browser_client, 
-                port=self.config.live_view_port
+                self.browser_tools.browser_client, port=self.config.live_view_port
             )
             viewer_url = self.browser_viewer.start(open_browser=True)
             console.print(f"[green]✅ Live viewer: {viewer_url}[/green]")
             console.print("[dim]You can take/release control in the viewer[/dim]")
-        
+
         console.print("\n[green]✅ Agent initialized successfully![/green]")
-        console.print(f"[cyan]📹 Recording to: {self.browser_tools.recording_path}[/cyan]")
-    
+        console.print(
+            f"[cyan]📹 Recording to: {self.browser_tools.recording_path}[/cyan]"
+        )
+
     def _get_system_prompt(self) -> str:
         """Get the system prompt for the agent."""
         return """You are a competitive intelligence analysis agent. When asked to analyze competitors:
@@ -143,19 +148,19 @@ class CompetitiveIntelligenceAgent:
         3. Use the generate_report tool to create the final report
         
         Always use these tools in sequence to complete the analysis."""
-    
+
     def _create_agent_tools(self) -> List:
         """Create all agent tools."""
         tools = []
-        
+
         # Store reference to self for use in tools
         agent_instance = self
-        
+
         @tool
         def analyze_website(competitor_name: str, competitor_url: str) -> str:
             """
             Analyze a competitor website to extract pricing, features, and other intelligence.
-            
+
             Args:
                 competitor_name: Name of the competitor company
                 competitor_url: URL of the competitor website to analyze
@@ -164,236 +169,446 @@ class CompetitiveIntelligenceAgent:
             if agent_instance.loop and agent_instance.loop.is_running():
                 # We're already in an async context, create a task
                 future = asyncio.ensure_future(
-                    agent_instance._analyze_website_impl(competitor_name, competitor_url),
-                    loop=agent_instance.loop
+                    agent_instance._analyze_website_impl(
+                        competitor_name, competitor_url
+                    ),
+                    loop=agent_instance.loop,
                 )
-                
+
                 # Use nest_asyncio to handle the nested loop
                 return agent_instance.loop.run_until_complete(future)
             else:
                 # No running loop, use asyncio.run
-                return asyncio.run(agent_instance._analyze_website_impl(competitor_name, competitor_url))
-        
+                return asyncio.run(
+                    agent_instance._analyze_website_impl(
+                        competitor_name, competitor_url
+                    )
+                )
+
         @tool
         def perform_analysis() -> str:
             """
             Analyze all collected competitor data to identify patterns and insights.
             """
-            console.print("\n[bold yellow]📊 Analyzing all competitor data...[/bold yellow]")
-            
+            console.print(
+                "\n[bold yellow]📊 Analyzing all competitor data...[/bold yellow]"
+            )
+
             competitor_data = agent_instance._safe_state_get("competitor_data", {})
-            
+
             if not competitor_data:
                 return "No competitor data to analyze yet"
-            
+
             # Analyze each competitor
             for competitor_name, data in competitor_data.items():
                 console.print(f"[cyan]Analyzing {competitor_name}...[/cyan]")
                 analysis_result = agent_instance.analysis_tools.analyze_competitor_data(
                     competitor_name, data
                 )
-                
+
                 # Store analysis results
-                analysis_results = agent_instance._safe_state_get("analysis_results", {})
+                analysis_results = agent_instance._safe_state_get(
+                    "analysis_results", {}
+                )
                 analysis_results[competitor_name] = analysis_result
                 agent_instance.agent.state.set("analysis_results", analysis_results)
-            
+
             # Create visualizations
             console.print("[cyan]Creating comparison visualizations...[/cyan]")
-            viz_result = agent_instance.analysis_tools.create_comparison_visualization(competitor_data)
-            
+            viz_result = agent_instance.analysis_tools.create_comparison_visualization(
+                competitor_data
+            )
+
             analysis_results = agent_instance._safe_state_get("analysis_results", {})
             analysis_results["visualizations"] = viz_result
             agent_instance.agent.state.set("analysis_results", analysis_results)
-            
+
             return "Analysis completed successfully"
-        
+
         @tool
         def generate_report() -> str:
             """
             Generate the final competitive intelligence report from analyzed data.
             """
             console.print("\n[bold green]📄 Generating final report...[/bold green]")
-            
+
             competitor_data = agent_instance._safe_state_get("competitor_data", {})
             analysis_results = agent_instance._safe_state_get("analysis_results", {})
-            
+
             if not competitor_data:
                 return "No data to generate report from"
-            
+
             # Generate report
             report_result = agent_instance.analysis_tools.generate_final_report(
                 competitor_data, analysis_results
             )
-            
-            agent_instance.agent.state.set("report", report_result.get("report_content", ""))
-            agent_instance.agent.state.set("recording_path", agent_instance.browser_tools.recording_path)
-            
+
+            agent_instance.agent.state.set(
+                "report", report_result.get("report_content", "")
+            )
+            agent_instance.agent.state.set(
+                "recording_path", agent_instance.browser_tools.recording_path
+            )
+
             return "Report generated successfully"
-        
+
         # Add tools to list
-        tools.extend([
-            analyze_website,
-            perform_analysis,
-            generate_report
-        ])
-        
+        tools.extend([analyze_website, perform_analysis, generate_report])
+
         return tools
-    
-    async def _analyze_website_impl(self, competitor_name: str, competitor_url: str) -> str:
+
+    async def _analyze_website_impl(
+        self, competitor_name: str, competitor_url: str
+    ) -> str:
         """Implementation of website analysis."""
         console.print(f"\n[bold blue]🔍 Analyzing: {competitor_name}[/bold blue]")
         console.print(f"[cyan]URL: {competitor_url}[/cyan]")
-        
-        competitor_data = {}
-        
+
+        started = time.perf_counter()
+        screenshots_before = len(self.browser_tools._screenshots_taken)
+        apis_before = len(self.browser_tools._discovered_apis)
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
-            console=console
+            console=console,
         ) as progress:
             task = progress.add_task(f"Analyzing {competitor_name}...", total=10)
-            
+
             try:
-                # Navigate to website
-                progress.update(task, description="Navigating to website...", advance=1)
-                nav_result = await self.browser_tools.navigate_to_url(competitor_url)
-                competitor_data['navigation'] = nav_result
-                
-                if nav_result.get('status') != 'success':
-                    console.print(f"[yellow]⚠️ Navigation failed: {nav_result.get('error')}[/yellow]")
-                    # Continue anyway to try to get some data
-                
-                # Take screenshot
-                progress.update(task, description="Taking homepage screenshot...", advance=1)
-                await self.browser_tools.take_annotated_screenshot(f"{competitor_name} - Homepage")
-                
-                # Discover sections
-                progress.update(task, description="Discovering page sections...", advance=1)
-                discovered_sections = await self.browser_tools.intelligent_scroll_and_discover()
-                competitor_data['discovered_sections'] = discovered_sections
-                console.print(f"[green]Found {len(discovered_sections)} key sections[/green]")
-                
-                # Try to find pricing page
-                progress.update(task, description="Looking for pricing page...", advance=1)
-                found_pricing = await self.browser_tools.smart_navigation("pricing")
-                if found_pricing:
-                    await asyncio.sleep(3)
-                    await self.browser_tools.take_annotated_screenshot(f"{competitor_name} - Pricing")
-                
-                # Analyze forms
-                progress.update(task, description="Checking interactive elements...", advance=1)
-                form_data = await self.browser_tools.analyze_forms_and_inputs()
-                competitor_data['interactive_elements'] = form_data
-                
-                # Extract pricing
-                progress.update(task, description="Extracting pricing...", advance=1)
-                pricing_result = await self.browser_tools.extract_pricing_info()
-                competitor_data['pricing'] = pricing_result
-                
-                # Extract features
-                progress.update(task, description="Extracting features...", advance=1)
-                features_result = await self.browser_tools.extract_product_features()
-                competitor_data['features'] = features_result
-                
-                # Explore additional pages
-                progress.update(task, description="Exploring additional pages...", advance=1)
-                additional_pages = await self.browser_tools.explore_multi_page_workflow(
-                    ["features", "docs", "api", "about"]
+                competitor_data = await self._collect_competitor_data(
+                    self.browser_tools,
+                    competitor_name,
+                    competitor_url,
+                    step=lambda description: progress.update(
+                        task, description=description, advance=1
+                    ),
                 )
-                competitor_data['additional_pages'] = additional_pages
-                
-                # Capture metrics
-                progress.update(task, description="Capturing metrics...", advance=1)
-                metrics = await self.browser_tools.capture_performance_metrics()
-                competitor_data['performance_metrics'] = metrics
-                
-                # Save to state
-                progress.update(task, description="Saving data...", advance=1)
-                all_competitor_data = self._safe_state_get("competitor_data", {})
-                all_competitor_data[competitor_name] = {
-                    "url": competitor_url,
-                    "timestamp": datetime.now().isoformat(),
-                    **competitor_data,
-                    "status": "success"
-                }
-                self.agent.state.set("competitor_data", all_competitor_data)
-                
-                # Update metrics in state
-                total_screenshots = self._safe_state_get("total_screenshots", 0)
-                self.agent.state.set("total_screenshots", total_screenshots + len(self.browser_tools._screenshots_taken))
-                
-                discovered_apis = self._safe_state_get("discovered_apis", [])
-                discovered_apis.extend(self.browser_tools._discovered_apis)
-                self.agent.state.set("discovered_apis", discovered_apis)
-                
             except Exception as e:
                 console.print(f"[red]❌ Error analyzing {competitor_name}: {e}[/red]")
                 import traceback
+
                 traceback.print_exc()
-                
-                competitor_data = {"status": "error", "error": str(e)}
-                
-                all_competitor_data = self._safe_state_get("competitor_data", {})
-                all_competitor_data[competitor_name] = competitor_data
-                self.agent.state.set("competitor_data", all_competitor_data)
-                
+
+                self._store_competitor_result(
+                    competitor_name,
+                    {
+                        "status": "error",
+                        "error": str(e),
+                        "duration_seconds": time.perf_counter() - started,
+                    },
+                )
                 return f"Error analyzing {competitor_name}: {str(e)}"
-        
+
+            # Save to state
+            progress.update(task, description="Saving data...", advance=1)
+            competitor_data["duration_seconds"] = time.perf_counter() - started
+            self._store_competitor_result(
+                competitor_name,
+                competitor_data,
+                self.browser_tools._screenshots_taken[screenshots_before:],
+                self.browser_tools._discovered_apis[apis_before:],
+            )
+
         console.print(f"[green]✅ Completed: {competitor_name}[/green]")
-        return f"Successfully analyzed {competitor_name} - found {len(discovered_sections)} sections, extracted pricing and features"
-    
+        return f"Successfully analyzed {competitor_name} - found {len(competitor_data['discovered_sections'])} sections, extracted pricing and features"
+
+    async def _collect_competitor_data(
+        self,
+        browser_tools: BrowserTools,
+        competitor_name: str,
+        competitor_url: str,
+        step=None,
+    ) -> Dict:
+        """Run every analysis step for one competitor on the given browser session.
+
+        Args:
+            browser_tools: Browser session to use; each parallel analysis has its own
+            competitor_name: Name of the competitor company
+            competitor_url: URL of the competitor website
+            step: Optional callback receiving a description as each step starts
+        """
+        step = step or (lambda description: None)
+        competitor_data = {}
+        readiness_mark = browser_tools.readiness_mark()
+
+        # Navigate to website
+        step("Navigating to website...")
+        nav_result = await browser_tools.navigate_to_url(competitor_url)
+        competitor_data["navigation"] = nav_result
+
+        if nav_result.get("status") != "success":
+            console.print(
+                f"[yellow]⚠️ {competitor_name}: navigation failed: {nav_result.get('error')}[/yellow]"
+            )
+            # Continue anyway to try to get some data
+
+        # Take screenshot
+        step("Taking homepage screenshot...")
+        await browser_tools.take_annotated_screenshot(f"{competitor_name} - Homepage")
+
+        # Discover sections
+        step("Discovering page sections...")
+        discovered_sections = await browser_tools.intelligent_scroll_and_discover()
+        competitor_data["discovered_sections"] = discovered_sections
+        console.print(
+            f"[green]{competitor_name}: found {len(discovered_sections)} key sections[/green]"
+        )
+
+        # Try to find pricing page
+        step("Looking for pricing page...")
+        found_pricing = await browser_tools.smart_navigation("pricing")
+        if found_pricing:
+            await browser_tools.take_annotated_screenshot(
+                f"{competitor_name} - Pricing"
+            )
+
+        # Analyze forms
+        step("Checking interactive elements...")
+        form_data = await browser_tools.analyze_forms_and_inputs()
+        competitor_data["interactive_elements"] = form_data
+
+        # Extract pricing
+        step("Extracting pricing...")
+        pricing_result = await browser_tools.extract_pricing_info()
+        competitor_data["pricing"] = pricing_result
+
+        # Extract features
+        step("Extracting features...")
+        features_result = await browser_tools.extract_product_features()
+        competitor_data["features"] = features_result
+
+        # Explore additional pages
+        step("Exploring additional pages...")
+        additional_pages = await browser_tools.explore_multi_page_workflow(
+            ["features", "docs", "api", "about"]
+        )
+        competitor_data["additional_pages"] = additional_pages
+
+        # Capture metrics
+        step("Capturing metrics...")
+        metrics = await browser_tools.capture_performance_metrics()
+        competitor_data["performance_metrics"] = metrics
+        readiness = browser_tools.readiness_report(since=readiness_mark)
+        competitor_data["page_readiness"] = readiness
+        if readiness:
+            console.print(
+                f"[dim]⏱️ {competitor_name}: waited {readiness['waited_seconds']:.1f}s for pages to settle, "
+                f"saved {readiness['saved_seconds']:.1f}s over fixed delays across {len(readiness['pages'])} pages[/dim]"
+            )
+
+        return {
+            "url": competitor_url,
+            "timestamp": datetime.now().isoformat(),
+            **competitor_data,
+            "status": "success",
+        }
+
+    def _store_competitor_result(
+        self,
+        competitor_name: str,
+        competitor_data: Dict,
+        screenshots: Optional[List] = None,
+        apis: Optional[List] = None,
+    ):
+        """Merge one competitor's results into the shared agent state."""
+        all_competitor_data = self._safe_state_get("competitor_data", {})
+        all_competitor_data[competitor_name] = competitor_data
+        self.agent.state.set("competitor_data", all_competitor_data)
+
+        total_screenshots = self._safe_state_get("total_screenshots", 0)
+        self.agent.state.set(
+            "total_screenshots", total_screenshots + len(screenshots or [])
+        )
+
+        discovered_apis = self._safe_state_get("discovered_apis", [])
+        discovered_apis.extend(apis or [])
+        self.agent.state.set("discovered_apis", discovered_apis)
+
+    async def _analyze_competitors_parallel(
+        self, competitors: List[Dict]
+    ) -> List[Dict]:
+        """Analyze competitors concurrently, each in its own browser session.
+
+        At most config.max_parallel_browsers sessions run at once. Returns the
+        name, session ID and recording path of every parallel session.
+        """
+        limit = asyncio.Semaphore(self.config.max_parallel_browsers)
+
+        async def analyze(competitor: Dict) -> Dict:
+            async with limit:
+                return await self._analyze_in_own_session(competitor)
+
+        return await asyncio.gather(
+            *(analyze(competitor) for competitor in competitors)
+        )
+
+    async def _analyze_in_own_session(self, competitor: Dict) -> Dict:
+        """Analyze one competitor in a new browser session that records to its own S3 prefix."""
+        competitor_name, competitor_url = competitor["name"], competitor["url"]
+        console.print(
+            f"[cyan]🔄 Starting parallel analysis for {competitor_name}...[/cyan]"
+        )
+        started = time.perf_counter()
+
+        browser_tools = BrowserTools(self.config)
+        self.parallel_browser_sessions.append(browser_tools)
+        slug = (
+            re.sub(r"[^a-z0-9]+", "-", competitor_name.lower()).strip("-")
+            or "competitor"
+        )
+        session_id = None
+
+        try:
+            await asyncio.to_thread(
+                browser_tools.create_browser_with_recording,
+                f"{self.config.s3_prefix}{slug}/",
+            )
+
+            async def analyze() -> Dict:
+                await browser_tools.initialize_browser_session(self.browser_tools.llm)
+                return await self._collect_competitor_data(
+                    browser_tools, competitor_name, competitor_url
+                )
+
+            competitor_data = await asyncio.wait_for(
+                analyze(), timeout=self.config.site_timeout_seconds
+            )
+            console.print(
+                f"[green]✅ Completed parallel analysis for {competitor_name}[/green]"
+            )
+        except asyncio.TimeoutError:
+            console.print(
+                f"[red]⏱️ {competitor_name} timed out after {self.config.site_timeout_seconds}s[/red]"
+            )
+            competitor_data = {
+                "url": competitor_url,
+                "status": "error",
+                "error": f"Timed out after {self.config.site_timeout_seconds} seconds",
+            }
+        except Exception as e:
+            console.print(f"[red]❌ Error analyzing {competitor_name}: {e}[/red]")
+            competitor_data = {
+                "url": competitor_url,
+                "status": "error",
+                "error": str(e),
+            }
+        finally:
+            if browser_tools.browser_client:
+                session_id = browser_tools.browser_client.session_id
+            # Free the session for the next competitor waiting on the concurrency limit
+            try:
+                await browser_tools.cleanup()
+            except Exception as e:
+                console.print(
+                    f"[yellow]⚠️ Cleanup error for {competitor_name}: {e}[/yellow]"
+                )
+
+        competitor_data["duration_seconds"] = time.perf_counter() - started
+        competitor_data["recording_path"] = browser_tools.recording_path
+        self._store_competitor_result(
+            competitor_name,
+            competitor_data,
+            browser_tools._screenshots_taken,
+            browser_tools._discovered_apis,
+        )
+
+        return {
+            "name": competitor_name,
+            "session_id": session_id,
+            "recording_path": browser_tools.recording_path,
+        }
+
     def _create_callback_handler(self):
         """Create a callback handler for progress tracking."""
+
         def callback_handler(**kwargs):
             # Track tool usage
             if "current_tool_use" in kwargs and kwargs["current_tool_use"].get("name"):
                 tool_name = kwargs["current_tool_use"]["name"]
                 console.print(f"[cyan]🔧 Using tool: {tool_name}[/cyan]")
-            
+
             # Show text output
             if "data" in kwargs:
                 # Don't print full LLM reasoning, just tool calls
                 pass
-        
+
         return callback_handler
-    
 
     async def run(self, competitors: List[Dict], parallel: bool = False) -> Dict:
-        """Run the competitive intelligence analysis."""
+        """Run the competitive intelligence analysis.
+
+        Args:
+            competitors: Competitors as {"name", "url"} dicts
+            parallel: Analyze competitors concurrently, each in its own browser session
+        """
         try:
+            parallel = parallel and len(competitors) > 1
+            parallel_sessions = []
+
             # Store competitors in state
             self.agent.state.set("competitors", competitors)
-            
+            self.agent.state.set("parallel_mode", parallel)
+
             console.print("\n[cyan]🤖 Starting competitive analysis workflow...[/cyan]")
             console.print(f"[bold]Analyzing {len(competitors)} competitors[/bold]")
-            
-            # Analyze each competitor sequentially
-            for i, competitor in enumerate(competitors, 1):
-                console.print(f"\n[bold yellow]📊 Competitor {i}/{len(competitors)}: {competitor['name']}[/bold yellow]")
-                
-                try:
-                    # Directly invoke the tool
-                    result = self.agent.tool.analyze_website(
-                        competitor_name=competitor['name'],
-                        competitor_url=competitor['url']
+
+            started = time.perf_counter()
+            if parallel:
+                console.print(
+                    f"\n[bold cyan]⚡ Parallel mode: up to {self.config.max_parallel_browsers} browser sessions, "
+                    f"{self.config.site_timeout_seconds}s per competitor[/bold cyan]"
+                )
+                console.print(
+                    "[dim]The live viewer keeps showing the main session; each competitor is recorded separately[/dim]"
+                )
+                parallel_sessions = await self._analyze_competitors_parallel(
+                    competitors
+                )
+            else:
+                # Analyze each competitor sequentially
+                for i, competitor in enumerate(competitors, 1):
+                    console.print(
+                        f"\n[bold yellow]📊 Competitor {i}/{len(competitors)}: {competitor['name']}[/bold yellow]"
                     )
-                    console.print(f"[green]✓ {competitor['name']} analysis complete[/green]")
-                    console.print(f"[dim]Result: {result[:200]}...[/dim]" if len(result) > 200 else f"[dim]Result: {result}[/dim]")
-                    
-                    # Add a small delay between competitors to avoid overwhelming
-                    if i < len(competitors):
-                        console.print(f"[dim]Waiting 2 seconds before next competitor...[/dim]")
-                        await asyncio.sleep(2)
-                        
-                except Exception as comp_error:
-                    console.print(f"[red]❌ Error analyzing {competitor['name']}: {comp_error}[/red]")
-                    # Continue with next competitor even if one fails
-                    continue
-            
-            console.print("\n[bold cyan]All competitors analyzed, generating insights...[/bold cyan]")
-            
+
+                    try:
+                        # Directly invoke the tool
+                        result = self.agent.tool.analyze_website(
+                            competitor_name=competitor["name"],
+                            competitor_url=competitor["url"],
+                        )
+                        console.print(
+                            f"[green]✓ {competitor['name']} analysis complete[/green]"
+                        )
+                        console.print(
+                            f"[dim]Result: {result[:200]}...[/dim]"
+                            if len(result) > 200
+                            else f"[dim]Result: {result}[/dim]"
+                        )
+
+                        # Add a small delay between competitors to avoid overwhelming
+                        if i < len(competitors):
+                            console.print(
+                                f"[dim]Waiting 2 seconds before next competitor...[/dim]"
+                            )
+                            await asyncio.sleep(2)
+
+                    except Exception as comp_error:
+                        console.print(
+                            f"[red]❌ Error analyzing {competitor['name']}: {comp_error}[/red]"
+                        )
+                        # Continue with next competitor even if one fails
+                        continue
+
+            execution_stats = self._execution_stats(
+                time.perf_counter() - started, parallel
+            )
+            console.print(
+                "\n[bold cyan]All competitors analyzed, generating insights...[/bold cyan]"
+            )
+
             # Perform analysis
             console.print("\n[yellow]Running data analysis...[/yellow]")
             try:
@@ -402,7 +617,7 @@ class CompetitiveIntelligenceAgent:
             except Exception as e:
                 console.print(f"[red]Analysis error: {e}[/red]")
                 analysis_result = "Analysis failed"
-            
+
             # Generate report
             console.print("\n[yellow]Generating report...[/yellow]")
             try:
@@ -411,66 +626,114 @@ class CompetitiveIntelligenceAgent:
             except Exception as e:
                 console.print(f"[red]Report generation error: {e}[/red]")
                 report_result = "Report generation failed"
-            
+
             # Get final state
             report = self._safe_state_get("report")
-            recording_path = self._safe_state_get("recording_path") or self.browser_tools.recording_path
+            recording_path = (
+                self._safe_state_get("recording_path")
+                or self.browser_tools.recording_path
+            )
             analysis_results = self._safe_state_get("analysis_results", {})
             apis_discovered = self._safe_state_get("discovered_apis", [])
             total_screenshots = self._safe_state_get("total_screenshots", 0)
             competitor_data = self._safe_state_get("competitor_data", {})
-            
+
             # Display summary
-            console.print("\n" + "="*60)
-            console.print(Panel(
-                f"[bold green]✅ Analysis Complete![/bold green]\n\n"
-                f"📊 Competitors requested: {len(competitors)}\n"
-                f"✓ Successfully analyzed: {len([c for c in competitor_data.values() if c.get('status') == 'success'])}\n"
-                f"✗ Failed: {len([c for c in competitor_data.values() if c.get('status') == 'error'])}\n"
-                f"📸 Screenshots taken: {total_screenshots}\n"
-                f"🔍 APIs discovered: {len(apis_discovered)}\n"
-                f"📄 Report generated: {'Yes' if report else 'No'}\n"
-                f"📹 Recording: {recording_path}\n\n"
-                f"[bold]Analyzed:[/bold]\n" + 
-                "\n".join([f"  • {name}: {data.get('status', 'unknown')}" 
-                        for name, data in competitor_data.items()]),
-                title="Summary",
-                border_style="green"
-            ))
-            console.print("="*60)
-            
+            console.print("\n" + "=" * 60)
+            console.print(
+                Panel(
+                    f"[bold green]✅ Analysis Complete![/bold green]\n\n"
+                    f"📊 Competitors requested: {len(competitors)}\n"
+                    f"✓ Successfully analyzed: {len([c for c in competitor_data.values() if c.get('status') == 'success'])}\n"
+                    f"✗ Failed: {len([c for c in competitor_data.values() if c.get('status') == 'error'])}\n"
+                    f"📸 Screenshots taken: {total_screenshots}\n"
+                    f"🔍 APIs discovered: {len(apis_discovered)}\n"
+                    f"📄 Report generated: {'Yes' if report else 'No'}\n"
+                    f"📹 Recording: {recording_path}\n"
+                    f"⚡ Mode: {'Parallel' if parallel else 'Sequential'}\n"
+                    f"⏱️ Analysis time: {self._format_execution_stats(execution_stats)}\n\n"
+                    f"[bold]Analyzed:[/bold]\n"
+                    + "\n".join(
+                        [
+                            f"  • {name}: {data.get('status', 'unknown')}"
+                            for name, data in competitor_data.items()
+                        ]
+                    ),
+                    title="Summary",
+                    border_style="green",
+                )
+            )
+            console.print("=" * 60)
+
             return {
                 "success": True,
                 "report": self._safe_state_get("report"),
-                "recording_path": self.browser_tools.recording_path if self.browser_tools else None,
-                "recording_config": self.browser_tools.recording_config if self.browser_tools else None,  # NEW
+                "recording_path": self.browser_tools.recording_path
+                if self.browser_tools
+                else None,
+                "recording_config": self.browser_tools.recording_config
+                if self.browser_tools
+                else None,  # NEW
                 "analysis_results": self._safe_state_get("analysis_results", {}),
                 "apis_discovered": self._safe_state_get("discovered_apis", []),
                 "session_id": datetime.now().strftime("%Y%m%d_%H%M%S"),
-                "parallel_mode": self._safe_state_get("parallel_mode", False)
+                "parallel_mode": self._safe_state_get("parallel_mode", False),
+                "parallel_sessions": parallel_sessions,
+                "execution_stats": execution_stats,
             }
-            
+
         except Exception as e:
             console.print(f"[red]❌ Agent error: {e}[/red]")
             import traceback
+
             traceback.print_exc()
             return {"success": False, "error": str(e)}
-    
+
+    def _execution_stats(self, elapsed: float, parallel: bool) -> Dict:
+        """Wall-clock analysis time next to the sequential baseline (sum of per-site times)."""
+        competitor_data = self._safe_state_get("competitor_data", {})
+        sequential = sum(
+            data.get("duration_seconds", 0) for data in competitor_data.values()
+        )
+        execution_stats = {
+            "mode": "parallel" if parallel else "sequential",
+            "total_duration": elapsed,
+            "sequential_duration": sequential,
+            "speedup": sequential / elapsed if elapsed else 1.0,
+            "concurrent_sessions": min(
+                self.config.max_parallel_browsers, len(competitor_data)
+            )
+            if parallel
+            else 1,
+        }
+        self.agent.state.set("execution_stats", execution_stats)
+        return execution_stats
+
+    @staticmethod
+    def _format_execution_stats(execution_stats: Dict) -> str:
+        text = f"{execution_stats['total_duration']:.1f}s"
+        if execution_stats["mode"] == "parallel":
+            text += (
+                f" (sequential baseline {execution_stats['sequential_duration']:.1f}s, "
+                f"{execution_stats['speedup']:.1f}x faster)"
+            )
+        return text
+
     async def cleanup(self):
         """Clean up agent resources."""
         console.print("\n[yellow]🧹 Cleaning up...[/yellow]")
-        
+
         # Cleanup browser
         await self.browser_tools.cleanup()
-        
+
         # Cleanup parallel sessions
         for session in self.parallel_browser_sessions:
             try:
                 await session.cleanup()
             except:
                 pass
-        
+
         # Cleanup code interpreter
         self.analysis_tools.cleanup()
-        
-        console.print("[green]✅ Cleanup complete[/green]")
\ No newline at end of file
+
+        console.print("[green]✅ Cleanup complete[/green]")
@@ -0,0 +1,215 @@
+"""Event-driven page readiness for BrowserTools.
+
+Instead of sleeping for a fixed time after navigating, clicking or scrolling,
+BrowserTools waits for signals that the page has settled:
+
+- Network idle: no more than a few requests in flight for a short window,
+  tracked through the CDP Network domain.
+- DOM quiescence: no DOM mutations for a short window, observed in the page
+  with a MutationObserver.
+- Selector appearance: an element the next step needs is attached.
+
+Every wait is bounded by the fixed delay it replaces, so it is never slower
+than the old sleep, and the difference is recorded as time saved per page.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+# Requests that never finish and must not keep the network busy
+LONG_LIVED_TYPES = {"WebSocket", "EventSource"}
+
+DOM_QUIET_SCRIPT = """
+({quietMs, timeoutMs}) => new Promise(resolve => {
+    const start = performance.now();
+    let last = start;
+    const observer = new MutationObserver(() => { last = performance.now(); });
+    observer.observe(document.documentElement || document, {
+        childList: true, subtree: true, characterData: true
+    });
+    const check = () => {
+        const now = performance.now();
+        if (now - last >= quietMs || now - start >= timeoutMs) {
+            observer.disconnect();
+            resolve(now - last >= quietMs);
+        } else {
+            setTimeout(check, 50);
+        }
+    };
+    setTimeout(check, 50);
+})
+"""
+
+
+class PageReadiness:
+    """Waits for a page to settle and records how long each wait took.
+
+    Args:
+        page: Playwright page to watch
+        cdp_session: CDP session with the Network domain enabled; without one
+            network idle falls back to Playwright's "networkidle" load state
+        idle_ms: How long the network must stay idle
+        max_inflight: Requests allowed in flight while still counting as idle
+        quiet_ms: How long the DOM must go without mutations
+        stale_after: Seconds after which an unfinished request is ignored
+            (long polls, requests orphaned by a navigation)
+    """
+
+    def __init__(
+        self,
+        page,
+        cdp_session=None,
+        idle_ms: int = 500,
+        max_inflight: int = 2,
+        quiet_ms: int = 300,
+        stale_after: float = 5.0,
+    ):
+        self.page = page
+        self.cdp_session = cdp_session
+        self.idle_ms = idle_ms
+        self.max_inflight = max_inflight
+        self.quiet_ms = quiet_ms
+        self.stale_after = stale_after
+        self._inflight: Dict[str, float] = {}  # requestId -> start time
+        self._last_activity = time.monotonic()
+        self.timings: List[Dict] = []
+        if cdp_session:
+            cdp_session.on("Network.requestWillBeSent", self._on_request)
+            cdp_session.on("Network.loadingFinished", self._on_done)
+            cdp_session.on("Network.loadingFailed", self._on_done)
+
+    def _on_request(self, event: Dict):
+        if event.get("type") not in LONG_LIVED_TYPES:
+            self._inflight[event["requestId"]] = time.monotonic()
+            self._last_activity = time.monotonic()
+
+    def _on_done(self, event: Dict):
+        if self._inflight.pop(event.get("requestId"), None) is not None:
+            self._last_activity = time.monotonic()
+
+    def reset(self):
+        """Forget requests in flight, e.g. before leaving the current document"""
+        self._inflight.clear()
+        self._last_activity = time.monotonic()
+
+    def _busy(self) -> bool:
+        now = time.monotonic()
+        for request_id, started in list(self._inflight.items()):
+            if now - started > self.stale_after:
+                del self._inflight[request_id]
+        return (
+            len(self._inflight) > self.max_inflight
+            or (now - self._last_activity) * 1000 < self.idle_ms
+        )
+
+    # Signals, each returning whether it was met within the timeout
+
+    async def wait_for_network_idle(self, timeout: float) -> bool:
+        if not self.cdp_session:
+            try:
+                await self.page.wait_for_load_state(
+                    "networkidle", timeout=timeout * 1000
+                )
+                return True
+            except Exception:
+                return False
+        deadline = time.monotonic() + timeout
+        while self._busy():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+        return True
+
+    async def wait_for_dom_quiet(self, timeout: float) -> bool:
+        try:
+            return bool(
+                await self.page.evaluate(
+                    DOM_QUIET_SCRIPT,
+                    {"quietMs": self.quiet_ms, "timeoutMs": timeout * 1000},
+                )
+            )
+        except Exception:
+            # The document was replaced while observing; give the new one a chance to load
+            try:
+                await self.page.wait_for_load_state(
+                    "domcontentloaded", timeout=timeout * 1000
+                )
+            except Exception:
+                pass
+            return False
+
+    async def wait_for_selector(self, selector: str, timeout: float) -> bool:
+        try:
+            await self.page.wait_for_selector(
+                selector, state="attached", timeout=timeout * 1000
+            )
+            return True
+        except Exception:
+            return False
+
+    async def wait_until_ready(
+        self, label: str, fixed_delay: float, selectors: Optional[List[str]] = None
+    ) -> Dict:
+        """Wait until the network is idle, the DOM is quiet and any selector is attached.
+
+        Args:
+            label: What is being waited for, used in the timings
+            fixed_delay: Sleep this wait replaces; also its upper bound in seconds
+            selectors: CSS selectors, any of which marks the content as present
+        """
+        started = time.monotonic()
+        waits = {
+            "network_idle": self.wait_for_network_idle(fixed_delay),
+            "dom_quiet": self.wait_for_dom_quiet(fixed_delay),
+        }
+        if selectors:
+            waits["selector"] = self.wait_for_selector(
+                ", ".join(selectors), fixed_delay
+            )
+        results = await asyncio.gather(*waits.values())
+        return self.record(
+            label, fixed_delay, time.monotonic() - started, dict(zip(waits, results))
+        )
+
+    def record(
+        self,
+        label: str,
+        fixed_delay: float,
+        waited: float,
+        signals: Optional[Dict[str, bool]] = None,
+    ) -> Dict:
+        """Add a wait to the timings, with time saved against the fixed delay"""
+        try:
+            url = self.page.url
+        except Exception:
+            url = None
+        timing = {
+            "label": label,
+            "url": url,
+            "waited": round(waited, 3),
+            "fixed_delay": fixed_delay,
+            "saved": round(max(0.0, fixed_delay - waited), 3),
+            "signals": signals or {},
+        }
+        self.timings.append(timing)
+        return timing
+
+    def report(self, since: int = 0) -> Dict:
+        """Time waited and saved in total and per page, for the waits from index `since` on"""
+        timings = self.timings[since:]
+        pages: Dict[str, Dict] = {}
+        for timing in timings:
+            page = pages.setdefault(
+                timing["url"] or "unknown", {"waits": 0, "waited": 0.0, "saved": 0.0}
+            )
+            page["waits"] += 1
+            page["waited"] = round(page["waited"] + timing["waited"], 3)
+            page["saved"] = round(page["saved"] + timing["saved"], 3)
+        return {
+            "waits": len(timings),
+            "waited_seconds": round(sum(t["waited"] for t in timings), 3),
+            "fixed_delay_seconds": round(sum(t["fixed_delay"] for t in timings), 3),
+            "saved_seconds": round(sum(t["saved"] for t in timings), 3),
+            "pages": pages,
+        }
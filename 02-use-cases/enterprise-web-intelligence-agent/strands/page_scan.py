@@ -0,0 +1,99 @@
+"""Single-pass DOM scan shared by BrowserTools' discovery and extractors.
+
+One injected script walks the DOM once and classifies every element against
+all section heuristics. It returns a compact JSON summary with counts,
+bounding boxes and short texts, plus the visible page text. This replaces
+one query_selector_all per heuristic and pulling element handles back to
+Python, so scanning a page costs a single CDP round trip.
+"""
+
+# (selector, label) heuristics for page sections
+SECTION_RULES = [
+    ('[class*="pric"]', "Pricing"),
+    ('[class*="tier"]', "Tiers"),
+    ('[class*="plan"]', "Plans"),
+    ('[class*="feature"]', "Features"),
+    ("table", "Table"),
+    ("form", "Form"),
+    ('[class*="testimonial"]', "Testimonials"),
+    ('[class*="faq"]', "FAQ"),
+]
+
+# Elements whose text is sent to the LLM as pricing hints
+PRICING_TEXT_SELECTORS = [
+    '[class*="price"], [class*="Price"]',
+    '[class*="pricing"], [class*="Pricing"]',
+    '[class*="tier"], [class*="Tier"]',
+    '[class*="plan"], [class*="Plan"]',
+]
+
+PAGE_SCAN_SCRIPT = """
+({sectionRules, textSelectors, maxBoxes, maxTextElements, maxTextChars, maxPageChars}) => {
+    const root = document.body || document.documentElement;
+    const pageHeight = Math.max(root.scrollHeight, document.documentElement.scrollHeight, 1);
+    const sections = sectionRules.map(([selector, label]) => ({selector, label, count: 0, boxes: []}));
+    const texts = textSelectors.map(selector => ({selector, seen: 0, texts: []}));
+
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+    for (let el = walker.currentNode; el; el = walker.nextNode()) {
+        let rect = null;
+        for (const section of sections) {
+            if (!el.matches(section.selector)) continue;
+            section.count++;
+            if (section.boxes.length < maxBoxes) {
+                rect = rect || el.getBoundingClientRect();
+                const y = Math.round(rect.top + window.scrollY);
+                section.boxes.push({
+                    x: Math.round(rect.left + window.scrollX), y,
+                    width: Math.round(rect.width), height: Math.round(rect.height),
+                    position: Math.round(y / pageHeight * 100) / 100
+                });
+            }
+        }
+        for (const entry of texts) {
+            // Like taking the first few matches of querySelectorAll
+            if (entry.seen >= maxTextElements || !el.matches(entry.selector)) continue;
+            entry.seen++;
+            const text = (el.textContent || '').trim();
+            if (text) entry.texts.push(text.slice(0, maxTextChars));
+        }
+    }
+
+    const pageText = root.innerText || '';
+    return {
+        url: location.href,
+        pageHeight,
+        viewportHeight: window.innerHeight,
+        sections: sections.filter(section => section.count > 0),
+        texts: texts.map(entry => entry.texts),
+        text: pageText.slice(0, maxPageChars),
+        textLength: pageText.length
+    };
+}
+"""
+
+
+def scan_arguments(max_page_chars: int = 10000) -> dict:
+    """Arguments for PAGE_SCAN_SCRIPT."""
+    return {
+        "sectionRules": [list(rule) for rule in SECTION_RULES],
+        "textSelectors": PRICING_TEXT_SELECTORS,
+        "maxBoxes": 5,
+        "maxTextElements": 5,
+        "maxTextChars": 300,
+        "maxPageChars": max_page_chars,
+    }
+
+
+def discovered_sections(scan: dict) -> list:
+    """Sections found by a scan, in the format intelligent_scroll_and_discover returns."""
+    return [
+        {
+            "selector": section["selector"],
+            "label": section["label"],
+            "count": section["count"],
+            "position": section["boxes"][0]["position"] if section["boxes"] else None,
+            "boxes": section["boxes"],
+        }
+        for section in scan.get("sections", [])
+    ]
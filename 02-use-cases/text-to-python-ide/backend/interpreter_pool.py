@@ -0,0 +1,335 @@
+"""Pool of warm AgentCore Code Interpreter sessions bound to IDE sessions.
+
+Starting a Code Interpreter sandbox dominates the latency of a short run, so
+sandboxes are started ahead of time and kept alive between runs:
+
+- Each IDE session_id is bound to one sandbox, which keeps its Python state
+  and uploaded files between runs.
+- A few unbound "spare" sandboxes are kept started so a new IDE session does
+  not wait for startup either.
+- Sandboxes idle longer than the idle timeout are stopped, and the least
+  recently used bound sandbox is stopped once the pool is full.
+- Files are re-uploaded only when their content hash changes.
+"""
+
+import hashlib
+import statistics
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bedrock_agentcore.tools.code_interpreter_client import CodeInterpreter
+
+
+class SandboxFileError(Exception):
+    """writeFiles reported an error for an upload."""
+
+
+def _error_text(result: dict) -> str:
+    error_content = result.get("content", [{}])
+    return (
+        error_content[0].get("text", "Unknown error")
+        if error_content
+        else "Unknown error"
+    )
+
+
+class PooledSandbox:
+    """A started Code Interpreter session plus the files known to be in it."""
+
+    def __init__(self, client):
+        self.client = client
+        self.files: Dict[str, str] = {}  # path -> sha256 of uploaded text
+        self.lock = threading.Lock()
+        # Leases checked out and not yet checked in, guarded by the pool lock, so
+        # a sandbox is never stopped between checkout and acquiring its lock
+        self.leases = 0
+        self.last_used = time.monotonic()
+
+    def sync_files(self, files: List[dict]) -> int:
+        """Upload files ({"path", "text"}) whose content changed; returns the number uploaded"""
+        changed = []
+        for file_data in files:
+            digest = hashlib.sha256(file_data["text"].encode("utf-8")).hexdigest()
+            if self.files.get(file_data["path"]) != digest:
+                changed.append((file_data, digest))
+        if not changed:
+            return 0
+
+        response = self.client.invoke(
+            "writeFiles", {"content": [f for f, _ in changed]}
+        )
+        for event in response["stream"]:
+            result = event.get("result", {})
+            if result.get("isError", False):
+                raise SandboxFileError(_error_text(result))
+            for item in result.get("content", []):
+                if item.get("type") == "text":
+                    print(f"✅ File upload: {item.get('text', '')}")
+        for file_data, digest in changed:
+            self.files[file_data["path"]] = digest
+        return len(changed)
+
+    def execute(self, code: str) -> list:
+        """Run code, keeping the sandbox's Python state; returns the stream events"""
+        response = self.client.invoke(
+            "executeCode", {"code": code, "language": "python", "clearContext": False}
+        )
+        return list(response["stream"])
+
+
+class CodeInterpreterPool:
+    """Warm, bounded pool of Code Interpreter sandboxes keyed by IDE session_id.
+
+    Args:
+        region: AWS region for new sandboxes
+        max_sessions: Most sandboxes (bound and spare) kept running
+        warm_spares: Unbound sandboxes kept started for new IDE sessions
+        idle_timeout: Seconds a sandbox may sit unused before it is stopped;
+            keep it below the AgentCore session timeout
+        session_timeout: AgentCore session timeout passed to new sandboxes
+        client_factory: Creates an unstarted client (tests, benchmarks)
+    """
+
+    def __init__(
+        self,
+        region: str,
+        max_sessions: int = 20,
+        warm_spares: int = 2,
+        idle_timeout: float = 600,
+        session_timeout: int = 1800,
+        client_factory: Optional[Callable[[str], object]] = None,
+    ):
+        self.region = region
+        self.max_sessions = max_sessions
+        self.warm_spares = min(warm_spares, max_sessions)
+        self.idle_timeout = idle_timeout
+        self.session_timeout = session_timeout
+        self._client_factory = client_factory or CodeInterpreter
+        self._lock = threading.Lock()
+        self._bound: "OrderedDict[str, PooledSandbox]" = OrderedDict()
+        self._spares: List[PooledSandbox] = []
+        self._starting = 0
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._maintainer: Optional[threading.Thread] = None
+        self._last_run: Dict[str, dict] = {}
+        self._latencies = {"cold": deque(maxlen=200), "warm": deque(maxlen=200)}
+        self.evictions = 0
+
+    # Lifecycle
+
+    def start(self):
+        """Start the background thread that pre-warms spares and stops idle sandboxes"""
+        if self._maintainer is None:
+            self._maintainer = threading.Thread(
+                target=self._maintain, name="code-interpreter-pool", daemon=True
+            )
+            self._maintainer.start()
+
+    def shutdown(self):
+        """Stop every sandbox in the pool"""
+        self._stopped.set()
+        self._wake.set()
+        with self._lock:
+            sandboxes = list(self._bound.values()) + self._spares
+            self._bound.clear()
+            self._spares = []
+        for sandbox in sandboxes:
+            self._stop(sandbox)
+
+    def _start_sandbox(self) -> PooledSandbox:
+        client = self._client_factory(self.region)
+        client.start(session_timeout_seconds=self.session_timeout)
+        return PooledSandbox(client)
+
+    def _stop(self, sandbox: PooledSandbox):
+        try:
+            sandbox.client.stop()
+        except Exception as e:
+            print(f"⚠️  Failed to stop Code Interpreter session: {e}")
+
+    def _stop_later(self, sandboxes: List[PooledSandbox]):
+        if sandboxes:
+            threading.Thread(
+                target=lambda: [self._stop(s) for s in sandboxes], daemon=True
+            ).start()
+
+    # Leasing
+
+    @contextmanager
+    def lease(self, ide_session_id: Optional[str] = None):
+        """Yield the sandbox bound to an IDE session, binding a warm one if needed.
+
+        Without an ide_session_id the sandbox is used once and then stopped.
+        A sandbox whose run raised is assumed broken and replaced next time.
+        """
+        started = time.perf_counter()
+        sandbox, cold = self._checkout(ide_session_id)
+        healthy = False
+        try:
+            with sandbox.lock:
+                yield sandbox
+            healthy = True
+        finally:
+            elapsed = time.perf_counter() - started
+            self._checkin(ide_session_id, sandbox, healthy)
+            kind = "cold" if cold else "warm"
+            self._latencies[kind].append(elapsed)
+            if ide_session_id:
+                self._last_run[ide_session_id] = {
+                    "sandbox": kind,
+                    "duration": elapsed,
+                    "finished_at": time.time(),
+                }
+            print(f"⏱️  {kind.title()} sandbox run took {elapsed * 1000:.0f} ms")
+
+    def _checkout(self, ide_session_id: Optional[str]) -> Tuple[PooledSandbox, bool]:
+        with self._lock:
+            if ide_session_id in self._bound:
+                self._bound.move_to_end(ide_session_id)
+                existing = self._bound[ide_session_id]
+                existing.leases += 1
+                return existing, False
+            sandbox = self._spares.pop() if self._spares else None
+
+        cold = sandbox is None
+        if cold:
+            print("🧊 No warm Code Interpreter session available, starting one")
+            sandbox = self._start_sandbox()
+
+        evicted = []
+        with self._lock:
+            if ide_session_id:
+                existing = self._bound.get(ide_session_id)
+                if existing is not None:
+                    # A concurrent request bound one first; keep ours as a spare
+                    self._spares.append(sandbox)
+                    self._bound.move_to_end(ide_session_id)
+                    existing.leases += 1
+                    return existing, False
+            sandbox.leases += 1
+            if ide_session_id:
+                self._bound[ide_session_id] = sandbox
+                evicted = self._evict_over_limit()
+        self._stop_later(evicted)
+        self._wake.set()  # Top up the spares
+        return sandbox, cold
+
+    def _checkin(
+        self, ide_session_id: Optional[str], sandbox: PooledSandbox, healthy: bool
+    ):
+        with self._lock:
+            sandbox.leases -= 1
+            sandbox.last_used = time.monotonic()
+            if ide_session_id and healthy:
+                return
+            if ide_session_id and self._bound.get(ide_session_id) is sandbox:
+                del self._bound[ide_session_id]
+        self._stop_later([sandbox])
+
+    def _evict_over_limit(self) -> List[PooledSandbox]:
+        """Drop spares, then least recently used idle bound sandboxes, beyond max_sessions"""
+        evicted = []
+        while self._spares and len(self._bound) + len(self._spares) > self.max_sessions:
+            evicted.append(self._spares.pop(0))
+        for session_id, sandbox in list(self._bound.items()):
+            if len(self._bound) + len(self._spares) <= self.max_sessions:
+                break
+            if not sandbox.leases:
+                del self._bound[session_id]
+                self._last_run.pop(session_id, None)
+                evicted.append(sandbox)
+                self.evictions += 1
+                print(
+                    f"♻️  Evicted Code Interpreter session of IDE session {session_id}"
+                )
+        return evicted
+
+    def discard(self, ide_session_id: str):
+        """Stop the sandbox bound to an IDE session so its next run starts clean"""
+        with self._lock:
+            sandbox = self._bound.pop(ide_session_id, None)
+            self._last_run.pop(ide_session_id, None)
+        if sandbox is not None:
+            self._stop_later([sandbox])
+
+    # Maintenance
+
+    def _maintain(self):
+        interval = max(1.0, min(30.0, self.idle_timeout / 4))
+        while not self._stopped.is_set():
+            self._stop_idle()
+            self._top_up()
+            self._wake.wait(interval)
+            self._wake.clear()
+
+    def _stop_idle(self):
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = []
+        with self._lock:
+            for session_id, sandbox in list(self._bound.items()):
+                if sandbox.last_used < cutoff and not sandbox.leases:
+                    del self._bound[session_id]
+                    self._last_run.pop(session_id, None)
+                    idle.append(sandbox)
+            # Spares also age out so they never outlive the AgentCore session timeout
+            fresh = [s for s in self._spares if s.last_used >= cutoff]
+            idle.extend(s for s in self._spares if s.last_used < cutoff)
+            self._spares = fresh
+        if idle:
+            print(f"💤 Stopping {len(idle)} idle Code Interpreter sessions")
+        for sandbox in idle:
+            self._stop(sandbox)
+
+    def _top_up(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                in_use = len(self._bound) + len(self._spares) + self._starting
+                if (
+                    len(self._spares) + self._starting >= self.warm_spares
+                    or in_use >= self.max_sessions
+                ):
+                    return
+                self._starting += 1
+            try:
+                sandbox = self._start_sandbox()
+            except Exception as e:
+                print(f"⚠️  Failed to pre-warm Code Interpreter session: {e}")
+                return
+            finally:
+                with self._lock:
+                    self._starting -= 1
+            with self._lock:
+                self._spares.append(sandbox)
+            print("🔥 Pre-warmed a Code Interpreter session")
+
+    # Reporting
+
+    def last_run(self, ide_session_id: str) -> Optional[dict]:
+        """Sandbox kind ("cold"/"warm") and duration of an IDE session's last run"""
+        return self._last_run.get(ide_session_id)
+
+    def stats(self) -> dict:
+        def summary(samples):
+            if not samples:
+                return {"runs": 0, "p50_ms": None, "max_ms": None}
+            return {
+                "runs": len(samples),
+                "p50_ms": round(statistics.median(samples) * 1000, 1),
+                "max_ms": round(max(samples) * 1000, 1),
+            }
+
+        with self._lock:
+            bound, spares = len(self._bound), len(self._spares)
+        return {
+            "bound_sessions": bound,
+            "warm_spares": spares,
+            "max_sessions": self.max_sessions,
+            "idle_timeout": self.idle_timeout,
+            "evictions": self.evictions,
+            "cold": summary(list(self._latencies["cold"])),
+            "warm": summary(list(self._latencies["warm"])),
+        }
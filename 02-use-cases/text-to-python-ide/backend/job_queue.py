@@ -0,0 +1,205 @@
+"""Queue for blocking agent and Code Interpreter work.
+
+Strands agents and Code Interpreter calls block for seconds to minutes, so
+endpoints submit them here instead of running them on the event loop. Jobs
+run on a bounded worker thread pool. Each user (IDE session) has a limit on
+concurrently running jobs, and the total number of waiting jobs is capped.
+Every job has an ID whose status can be polled or followed as server-sent
+events.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+
+class QueueFullError(Exception):
+    """Too many jobs are already waiting."""
+
+
+class Job:
+    """One unit of blocking work and its progress"""
+
+    def __init__(self, kind: str, user: str):
+        self.id = str(uuid.uuid4())
+        self.kind = kind
+        self.user = user
+        self.status = "queued"
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.events: List[dict] = []
+        self._changed = asyncio.Condition()
+        self._done = asyncio.Event()
+
+    async def _update(self, status: str, **details):
+        self.status = status
+        event = {"status": status, "time": time.time(), **details}
+        async with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+
+    async def wait(self) -> Any:
+        """Result of the job; re-raises its exception"""
+        await self._done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    async def follow(self) -> AsyncIterator[dict]:
+        """Yield progress events as they happen, ending once the job finishes"""
+        sent = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self.events) > sent)
+                pending = self.events[sent:]
+            sent += len(pending)
+            for event in pending:
+                yield event
+                if event["status"] in ("succeeded", "failed"):
+                    return
+
+    def to_dict(self, include_result: bool = True) -> dict:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "queue_seconds": (self.started_at or time.time()) - self.created_at,
+            "run_seconds": (self.finished_at or time.time()) - self.started_at
+            if self.started_at
+            else None,
+        }
+        if include_result and self.status == "succeeded":
+            data["result"] = self.result
+        if self.status == "failed":
+            data["error"] = getattr(self.error, "detail", None) or str(self.error)
+        return data
+
+
+class JobQueue:
+    """Runs blocking callables on `workers` threads, at most `per_user` at once per user.
+
+    Args:
+        workers: Worker threads, i.e. jobs running at the same time
+        per_user: Jobs one user may have running at the same time
+        max_queued: Jobs allowed to wait for a worker before submit() refuses more
+        retention_seconds: How long finished jobs stay available for polling
+    """
+
+    def __init__(
+        self,
+        workers: int = 8,
+        per_user: int = 2,
+        max_queued: int = 100,
+        retention_seconds: float = 600,
+    ):
+        self.workers = workers
+        self.per_user = per_user
+        self.max_queued = max_queued
+        self.retention_seconds = retention_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ide-worker"
+        )
+        self._worker_slots: Optional[asyncio.Semaphore] = None
+        self._user_slots: Dict[str, asyncio.Semaphore] = {}
+        self._user_jobs: Dict[str, int] = {}
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+
+    def submit(
+        self, user: str, func: Callable[..., Any], *args, kind: str = "job"
+    ) -> Job:
+        """Queue func(*args) for a worker; must be called from the event loop"""
+        if self.queued >= self.max_queued:
+            raise QueueFullError(
+                f"{self.queued} jobs already waiting, try again shortly"
+            )
+        if self._worker_slots is None:
+            self._worker_slots = asyncio.Semaphore(self.workers)
+        self._forget_finished()
+
+        job = Job(kind, user)
+        self._jobs[job.id] = job
+        self.queued += 1
+        self._user_jobs[user] = self._user_jobs.get(user, 0) + 1
+        job.events.append({"status": "queued", "time": job.created_at})
+        asyncio.get_running_loop().create_task(self._run(job, func, args))
+        return job
+
+    async def _run(self, job: Job, func: Callable[..., Any], args: tuple):
+        user_slots = self._user_slots.setdefault(
+            job.user, asyncio.Semaphore(self.per_user)
+        )
+        dequeued = False
+        try:
+            async with user_slots, self._worker_slots:
+                self.queued -= 1
+                dequeued = True
+                self.running += 1
+                job.started_at = time.time()
+                await job._update("running")
+                try:
+                    job.result = await asyncio.get_running_loop().run_in_executor(
+                        self._executor, func, *args
+                    )
+                finally:
+                    self.running -= 1
+                    job.finished_at = time.time()
+            self.completed += 1
+            await job._update("succeeded")
+        except BaseException as e:
+            job.error = e
+            job.finished_at = job.finished_at or time.time()
+            self.failed += 1
+            await job._update("failed", error=getattr(e, "detail", None) or str(e))
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            if not dequeued:
+                self.queued -= 1
+            self._user_jobs[job.user] -= 1
+            if not self._user_jobs[job.user]:
+                # Nobody is waiting on this user's semaphore any more
+                del self._user_jobs[job.user]
+                self._user_slots.pop(job.user, None)
+            job._done.set()
+
+    async def run(
+        self, user: str, func: Callable[..., Any], *args, kind: str = "job"
+    ) -> Any:
+        """Submit a job and wait for its result"""
+        return await self.submit(user, func, *args, kind=kind).wait()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def _forget_finished(self):
+        cutoff = time.time() - self.retention_seconds
+        for job_id, job in list(self._jobs.items()):
+            if job.finished_at and job.finished_at < cutoff:
+                del self._jobs[job_id]
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "per_user_limit": self.per_user,
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "max_queued": self.max_queued,
+        }
@@ -0,0 +1,358 @@
+"""Bounded store for IDE sessions.
+
+Sessions expire after a TTL, and the least recently used ones are evicted once
+their estimated in-memory size exceeds a budget. Large values (CSV bodies,
+uploaded file contents, chart images) are spilled to a content-addressed blob
+store on disk, so a session holds only references to them, and per-session
+history is capped.
+
+Other backends, such as a store shared by several instances behind a load
+balancer, implement SessionStore and are selected with SESSION_STORE_CLASS.
+"""
+
+import abc
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+# Strings at least this long are kept in the blob store instead of the session
+SPILL_MIN_CHARS = 4096
+
+
+class BlobStore:
+    """Text blobs on disk, named by the sha256 of their content"""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def put(self, text: str) -> str:
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if os.path.exists(path):
+            os.utime(path)  # Keep referenced blobs from being pruned
+            return digest
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        return digest
+
+    def touch(self, digest: str):
+        try:
+            os.utime(self._path(digest))
+        except FileNotFoundError:
+            pass
+
+    def get(self, digest: str) -> Optional[str]:
+        path = self._path(digest)
+        try:
+            with open(path, "rb") as f:
+                text = f.read().decode("utf-8")
+            os.utime(path)
+            return text
+        except FileNotFoundError:
+            return None
+
+    def prune(self, max_age: float, keep: frozenset = frozenset()) -> int:
+        """Delete blobs not written or read for max_age seconds, except those in keep"""
+        cutoff = time.time() - max_age
+        removed = 0
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename in keep:
+                    continue
+                path = os.path.join(directory, filename)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+        return removed
+
+
+class CodeInterpreterSession:
+    """One IDE session's history and uploaded files.
+
+    Hold lock while changing a session and saving it: jobs for the same
+    session run on different workers.
+    """
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.lock = threading.RLock()
+        self.conversation_history = []
+        self.code_history = []
+        self.execution_results = []
+        self.interactive_sessions = {}  # Track interactive execution sessions
+        self._uploaded_csv = None  # Uploaded CSV file data; content may be spilled
+        self.blobs: Optional[BlobStore] = None  # Set by the store
+        self.last_access = time.time()
+
+    @property
+    def uploaded_csv(self) -> Optional[dict]:
+        """Uploaded CSV as {"filename", "content", "timestamp"}, content loaded from the blob store if spilled"""
+        csv = self._uploaded_csv
+        if csv and "content_ref" in csv:
+            csv = dict(csv)
+            csv["content"] = self._load(csv.pop("content_ref"))
+        return csv
+
+    @uploaded_csv.setter
+    def uploaded_csv(self, value: Optional[dict]):
+        self._uploaded_csv = value
+
+    def _load(self, digest: str) -> str:
+        text = self.blobs.get(digest) if self.blobs else None
+        return text if text is not None else ""
+
+    def blob_refs(self) -> List[str]:
+        """Digests of every value spilled to the blob store"""
+        with self.lock:
+            containers = [(self._uploaded_csv or {}, "content")]
+            containers += [(entry, "content") for entry in self.conversation_history]
+            for result in self.execution_results:
+                containers += [(image, "data") for image in result.get("images") or []]
+            return [
+                container[key + "_ref"]
+                for container, key in containers
+                if key + "_ref" in container
+            ]
+
+    def compact(self, blobs: BlobStore, max_history: int):
+        """Spill large values to the blob store and cap history lengths"""
+        with self.lock:
+            self.blobs = blobs
+
+            def spill(container: dict, key: str):
+                value = container.get(key)
+                if isinstance(value, str) and len(value) >= SPILL_MIN_CHARS:
+                    container[key + "_ref"] = blobs.put(value)
+                    del container[key]
+                elif key + "_ref" in container:
+                    blobs.touch(container[key + "_ref"])  # Still referenced
+
+            if self._uploaded_csv:
+                spill(self._uploaded_csv, "content")
+            for entry in self.conversation_history:
+                spill(entry, "content")
+            for result in self.execution_results:
+                for image in result.get("images") or []:
+                    spill(image, "data")
+
+            for history in (
+                self.conversation_history,
+                self.code_history,
+                self.execution_results,
+            ):
+                if len(history) > max_history:
+                    del history[:-max_history]
+
+    def resolved_history(self) -> dict:
+        """conversation_history and execution_results with spilled values loaded back"""
+
+        def resolve(container: dict, key: str) -> dict:
+            if key + "_ref" in container:
+                container = dict(container)
+                container[key] = self._load(container.pop(key + "_ref"))
+            return container
+
+        with self.lock:
+            conversation_history = [
+                resolve(entry, "content") for entry in self.conversation_history
+            ]
+            execution_results = []
+            for result in self.execution_results:
+                if result.get("images"):
+                    result = dict(result)
+                    result["images"] = [
+                        resolve(image, "data") for image in result["images"]
+                    ]
+                execution_results.append(result)
+        return {
+            "conversation_history": conversation_history,
+            "execution_results": execution_results,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "session_id": self.session_id,
+            "conversation_history": self.conversation_history,
+            "code_history": self.code_history,
+            "execution_results": self.execution_results,
+            "uploaded_csv": self._uploaded_csv,
+            "last_access": self.last_access,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CodeInterpreterSession":
+        session = cls(data["session_id"])
+        session.conversation_history = data.get("conversation_history", [])
+        session.code_history = data.get("code_history", [])
+        session.execution_results = data.get("execution_results", [])
+        session._uploaded_csv = data.get("uploaded_csv")
+        session.last_access = data.get("last_access", time.time())
+        return session
+
+    def estimated_size(self) -> int:
+        with self.lock:
+            return len(json.dumps(self.to_dict(), default=str))
+
+
+class SessionStore(abc.ABC):
+    """Where IDE sessions live between requests.
+
+    Callers save() a session after changing it. Implementations for external
+    stores serialize with CodeInterpreterSession.to_dict()/from_dict() and
+    take the same keyword arguments as InMemorySessionStore.
+    """
+
+    @abc.abstractmethod
+    def get(self, session_id: str) -> Optional[CodeInterpreterSession]: ...
+
+    @abc.abstractmethod
+    def save(self, session: CodeInterpreterSession): ...
+
+    @abc.abstractmethod
+    def delete(self, session_id: str): ...
+
+    def stats(self) -> dict:
+        return {}
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local sessions bounded by a TTL and a memory budget.
+
+    Args:
+        blobs: Blob store for spilled values
+        ttl_seconds: Sessions not accessed for this long are dropped
+        max_bytes: Budget for the estimated size of all sessions
+        max_history: Most entries kept per history list
+        on_evict: Called with the session_id of each expired or evicted session
+    """
+
+    def __init__(
+        self,
+        blobs: BlobStore,
+        ttl_seconds: float = 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_history: int = 50,
+        on_evict: Optional[Callable[[str], None]] = None,
+    ):
+        self.blobs = blobs
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_history = max_history
+        self.on_evict = on_evict
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, tuple]" = (
+            OrderedDict()
+        )  # id -> (session, size)
+        self.total_bytes = 0
+        self.expired = 0
+        self.evicted = 0
+        self._last_prune = time.time()
+
+    def get(self, session_id: str) -> Optional[CodeInterpreterSession]:
+        self._expire()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            self._sessions.move_to_end(session_id)
+        session = entry[0]
+        session.last_access = time.time()
+        return session
+
+    def save(self, session: CodeInterpreterSession):
+        with session.lock:
+            session.compact(self.blobs, self.max_history)
+            session.last_access = time.time()
+            size = session.estimated_size()
+        dropped = []
+        with self._lock:
+            previous = self._sessions.pop(session.session_id, None)
+            if previous:
+                self.total_bytes -= previous[1]
+            self._sessions[session.session_id] = (session, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and len(self._sessions) > 1:
+                session_id, (_, dropped_size) = self._sessions.popitem(last=False)
+                self.total_bytes -= dropped_size
+                self.evicted += 1
+                dropped.append(session_id)
+        for session_id in dropped:
+            print(f"♻️  Evicted session {session_id} (session memory budget reached)")
+            self._notify(session_id)
+
+    def delete(self, session_id: str):
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            if entry:
+                self.total_bytes -= entry[1]
+        if entry:
+            self._notify(session_id)
+
+    def _expire(self):
+        cutoff = time.time() - self.ttl_seconds
+        expired = []
+        with self._lock:
+            # Oldest access first, so stop at the first live session
+            while self._sessions:
+                session_id, (session, size) = next(iter(self._sessions.items()))
+                if session.last_access >= cutoff:
+                    break
+                del self._sessions[session_id]
+                self.total_bytes -= size
+                self.expired += 1
+                expired.append(session_id)
+            prune = time.time() - self._last_prune > self.ttl_seconds / 4
+            if prune:
+                self._last_prune = time.time()
+                live = [session for session, _ in self._sessions.values()]
+        for session_id in expired:
+            print(f"⌛ Session {session_id} expired")
+            self._notify(session_id)
+        if prune:
+            threading.Thread(
+                target=self._prune_blobs, args=(live,), daemon=True
+            ).start()
+
+    def _prune_blobs(self, sessions: List[CodeInterpreterSession]):
+        # A blob can go unread for a TTL while a live session still refers to
+        # it (a CSV uploaded once and only read by later requests), so keep
+        # everything the sessions reference and prune the rest by age
+        keep = frozenset(
+            digest for session in sessions for digest in session.blob_refs()
+        )
+        self.blobs.prune(self.ttl_seconds, keep)
+
+    def _notify(self, session_id: str):
+        if self.on_evict:
+            try:
+                self.on_evict(session_id)
+            except Exception as e:
+                print(f"⚠️  Session eviction callback failed for {session_id}: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "expired": self.expired,
+                "evicted": self.evicted,
+                "blob_dir": self.blobs.root,
+            }
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the backend job queue
+Runs blocking jobs that stand in for agent and Code Interpreter calls, so no
+AWS access is needed, and reports how throughput scales with worker count
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "backend"))
+
+from job_queue import JobQueue  # noqa: E402
+
+
+def blocking_job(seconds):
+    """Stand-in for a Strands agent or Code Interpreter call"""
+    time.sleep(seconds)
+    return seconds
+
+
+async def run_load(workers, jobs, users, job_seconds, per_user):
+    queue = JobQueue(workers=workers, per_user=per_user, max_queued=jobs)
+    started = time.perf_counter()
+    submitted = [
+        queue.submit(f"user-{i % users}", blocking_job, job_seconds)
+        for i in range(jobs)
+    ]
+    await asyncio.gather(*(job.wait() for job in submitted))
+    elapsed = time.perf_counter() - started
+    queue.shutdown()
+    queue_waits = sorted(job.started_at - job.created_at for job in submitted)
+    return {
+        "workers": workers,
+        "elapsed": elapsed,
+        "throughput": jobs / elapsed,
+        "p50_wait": queue_waits[len(queue_waits) // 2],
+        "max_wait": queue_waits[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Job queue throughput benchmark")
+    parser.add_argument(
+        "--workers", default="1,2,4,8,16", help="Comma-separated worker counts"
+    )
+    parser.add_argument("--jobs", type=int, default=64, help="Jobs per run")
+    parser.add_argument(
+        "--users", type=int, default=32, help="Distinct users submitting jobs"
+    )
+    parser.add_argument(
+        "--per-user", type=int, default=2, help="Concurrent jobs allowed per user"
+    )
+    parser.add_argument(
+        "--job-seconds", type=float, default=0.25, help="Duration of each blocking job"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"🏁 {args.jobs} jobs of {args.job_seconds}s from {args.users} users "
+        f"(per-user limit {args.per_user})"
+    )
+    print(
+        f"{'workers':>8} {'elapsed s':>10} {'jobs/s':>8} {'p50 wait s':>11} {'max wait s':>11}"
+    )
+    baseline = None
+    for workers in [int(w) for w in args.workers.split(",")]:
+        result = asyncio.run(
+            run_load(workers, args.jobs, args.users, args.job_seconds, args.per_user)
+        )
+        baseline = baseline or result["throughput"]
+        print(
+            f"{workers:>8} {result['elapsed']:>10.2f} {result['throughput']:>8.1f} "
+            f"{result['p50_wait']:>11.2f} {result['max_wait']:>11.2f}"
+            f"   ({result['throughput'] / baseline:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()